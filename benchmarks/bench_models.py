@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+"""
+Name :          benchmarks/bench_models.py
+Created :       Oct 17, 2026
+Author :        Will Pittman
+Contact :       willjpittman@gmail.com
+________________________________________________________________________________
+Description :   Benchmarks for `qconcurrency.models.DictModel` ,
+                and `qconcurrency.models.ColumnarDictModel` .
+
+                Prints the average cost of key-lookups, and removals
+                of nested rows at increasing table sizes. Lookups should
+                remain flat as the table grows (removals grow slightly,
+                Qt's own bookkeeping of row-positions is not constant-time).
+
+                `*_populate` compares the time to fill each model
+                with rows using `add_rows()` , `dictmodel_add_row` adds
+                them one-at-a-time.
+
+                    QT_QPA_PLATFORM=offscreen python benchmarks/bench_models.py
+________________________________________________________________________________
+"""
+#builtin
+from   __future__    import unicode_literals
+from   __future__    import absolute_import
+from   __future__    import division
+from   __future__    import print_function
+import os
+import sys
+import time
+#external
+#internal
+qconcurrency_path = '/'.join(os.path.realpath(__file__).replace('\\','/').split('/')[:-2])
+sys.path.insert(0, qconcurrency_path )
+from   qconcurrency.models import DictModel, ColumnarDictModel
+
+
+def build_model( nrows ):
+    """
+    Returns a :py:obj:`DictModel` with a single toplevel row (key ``0``)
+    that has `nrows` child rows.
+    """
+    model = DictModel( columns=['name','path'] )
+    root  = model.add_row( 0 )
+    for key in range(nrows):
+        root.add_child( key, {'name':'item %s' % key, 'path':'/tmp/%s' % key} )
+    return model
+
+
+def bench_lookup( nrows, nlookups=1000 ):
+    """
+    Returns the average number of seconds to retrieve a nested row
+    ( ``model[0][key]`` ) from a table of `nrows` rows.
+    """
+    model = build_model( nrows )
+    step  = max( 1, nrows // nlookups )
+    keys  = list(range( nrows-1, -1, -step ))[:nlookups]
+
+    start = time.time()
+    for key in keys:
+        model[0][key]
+    return (time.time() - start) / len(keys)
+
+
+def bench_remove( nrows, nremovals=1000 ):
+    """
+    Returns the average number of seconds to remove a nested row
+    ( ``model[0][key].delete()`` ) from a table of `nrows` rows.
+    """
+    model     = build_model( nrows )
+    nremovals = min( nremovals, nrows )
+    keys      = list(range( nrows-1, nrows-1-nremovals, -1 ))
+
+    start = time.time()
+    for key in keys:
+        model[0][key].delete()
+    return (time.time() - start) / len(keys)
+
+
+def bench_insert( nrows, bulk=False ):
+    """
+    Returns the average number of seconds to add a toplevel row
+    to a :py:obj:`DictModel` with a :py:obj:`qconcurrency.widgets.DictModelQComboBox`
+    attached, when adding `nrows` rows one-at-a-time, or all at once (`bulk`).
+    """
+    from qconcurrency.widgets import DictModelQComboBox
+
+    model = DictModel( columns=['name','path'] )
+    combo = DictModelQComboBox( model, indexinfo={'id':'_id','name':'name'} )
+    rows  = [ (key, {'name':'item %s' % key, 'path':'/tmp/%s' % key}) for key in range(nrows) ]
+
+    start = time.time()
+    if bulk:
+        model.add_rows( rows )
+    else:
+        for (key, columnvals) in rows:
+            model.add_row( key, columnvals )
+    return (time.time() - start) / nrows
+
+
+def bench_add_row( nrows ):
+    """
+    Returns the average number of seconds to add a toplevel row
+    ( ``model.add_row()`` ) to a :py:obj:`DictModel` (without attached views),
+    when adding `nrows` rows one-at-a-time.
+    """
+    model = DictModel( columns=['name','path'] )
+    rows  = [ (key, {'name':'item %s' % key, 'path':'/tmp/%s' % key}) for key in range(nrows) ]
+
+    start = time.time()
+    for (key, columnvals) in rows:
+        model.add_row( key, columnvals )
+    return (time.time() - start) / nrows
+
+
+def bench_populate( nrows, modelcls=DictModel ):
+    """
+    Returns the average number of seconds per row to populate
+    a new `modelcls` with `nrows` toplevel rows using ``add_rows()`` .
+    """
+    model = modelcls( columns=['name','path','size'] )
+    rows  = [ (key, {'name':'item %s' % key, 'path':'/tmp/%s' % key, 'size':key}) for key in range(nrows) ]
+
+    start = time.time()
+    model.add_rows( rows )
+    return (time.time() - start) / nrows
+
+
+def run( sizes=(1000, 5000, 20000, 50000) ):
+    """
+    Runs all benchmarks in this module, returning a
+    dictionary of results.
+
+    Returns:
+
+        .. code-block:: python
+
+            {
+                'dictmodel_lookup': { 1000: 0.0000031, 5000: 0.0000030, ... },
+                'dictmodel_remove': { 1000: 0.0000120, 5000: 0.0000125, ... },
+                ...
+            }
+    """
+    results = {
+        'dictmodel_lookup':   {},
+        'dictmodel_add_row':  {},
+        'dictmodel_remove':   {},
+        'dictmodel_add_rows': {},
+        'dictmodel_populate': {},
+        'columnar_populate':  {},
+    }
+    for nrows in sizes:
+        results['dictmodel_lookup'][ nrows ]   = bench_lookup( nrows )
+        results['dictmodel_add_row'][ nrows ]  = bench_add_row( nrows )
+        results['dictmodel_remove'][ nrows ]   = bench_remove( nrows )
+        results['dictmodel_add_rows'][ nrows ] = bench_insert( nrows, bulk=True )
+        results['dictmodel_populate'][ nrows ] = bench_populate( nrows, DictModel )
+        results['columnar_populate'][ nrows ]  = bench_populate( nrows, ColumnarDictModel )
+    return results
+
+
+
+if __name__ == '__main__':
+    from qconcurrency import QApplication
+    qapp = QApplication()
+
+    results = run()
+    for name in sorted(results):
+        for nrows in sorted(results[name]):
+            print( '%-20s %8s rows   %10.2f us/op' % (name, nrows, results[name][nrows] * 1000000) )
@@ -0,0 +1,336 @@
+#!/usr/bin/env python
+"""
+Name :          benchmarks/bench_threading.py
+Created :       Oct 17, 2026
+Author :        Will Pittman
+Contact :       willjpittman@gmail.com
+________________________________________________________________________________
+Description :   Benchmarks for `qconcurrency.threading_` .
+
+                `stream_*` measures the time (in the UI thread) to receive
+                items emitted by a `ThreadedTask`, one queued signal per-item,
+                or in batches using `SignalManager.batch()` .
+
+                `solo_restart_*` measures the time from the last of several
+                rapid `SoloThreadedTask.start()` calls (ex: typing in a filter)
+                until it's callback completes, with and without superseded
+                tasks being withdrawn from the threadpool.
+
+                `micro_*` measures the time (per job) to run many tiny jobs,
+                one `ThreadedTask` per job, or fused using `TaskFuser` .
+
+                `task_throughput` measures the time (per task) to start
+                many `ThreadedTask` s and receive their `returned` signals.
+
+                `signal_roundtrip` measures the time for a request sent from
+                the UI thread to a running task, to be answered by a signal.
+
+                `solo_first_result` measures the time from the last of several
+                rapid `SoloThreadedTask.start()` calls until the UI receives
+                the first item emitted by it's callback.
+
+                    QT_QPA_PLATFORM=offscreen python benchmarks/bench_threading.py
+________________________________________________________________________________
+"""
+#builtin
+from   __future__    import unicode_literals
+from   __future__    import absolute_import
+from   __future__    import division
+from   __future__    import print_function
+import logging
+import os
+import sys
+import time
+#external
+#internal
+qconcurrency_path = '/'.join(os.path.realpath(__file__).replace('\\','/').split('/')[:-2])
+sys.path.insert(0, qconcurrency_path )
+from   qconcurrency.threading_ import ThreadedTask, SoloThreadedTask
+from   qconcurrency.parallel   import TaskFuser
+from   qconcurrency.testutils  import mock
+from   Qt                      import QtCore
+from   six.moves               import queue
+
+
+def bench_stream( nitems, batch_size=None ):
+    """
+    Returns the average number of seconds per item to stream `nitems`
+    items from a :py:obj:`ThreadedTask` to a slot in the UI thread.
+
+    Args:
+        nitems (int):
+            number of items to emit
+
+        batch_size (int, optional):
+            If provided, items are emitted using ``signalmgr.batch()``
+            and received per-batch.
+    """
+    received = []
+
+    def stream_items( signalmgr=None ):
+        if batch_size:
+            emit = signalmgr.batch( 'add_item', size=batch_size ).emit
+        else:
+            emit = signalmgr.add_item.emit
+
+        for i in range(nitems):
+            emit( i )
+
+    task = ThreadedTask(
+        callback = stream_items,
+        signals  = {'add_item':int},
+    )
+    if batch_size:
+        task.connect_batch( 'add_item', lambda items: received.extend( items ) )
+    else:
+        task.signal('add_item').connect( received.append )
+
+    threadpool = QtCore.QThreadPool()
+    app        = QtCore.QCoreApplication.instance()
+
+    start = time.time()
+    task.start( threadpool=threadpool )
+    while len(received) < nitems:
+        app.processEvents()
+    return (time.time() - start) / nitems
+
+
+def bench_solo_restart( nrestarts, withdraw=True, nthreads=2 ):
+    """
+    Returns the number of seconds between the last of `nrestarts`
+    consecutive :py:meth:`SoloThreadedTask.start` calls, and the
+    completion of it's callback.
+
+    Args:
+        nrestarts (int):
+            number of times the task is restarted
+
+        withdraw (bool, optional):
+            If ``False``, superseded tasks are left in the threadpool
+            (they start, and exit immediately).
+
+        nthreads (int, optional):
+            maxThreadCount of the threadpool.
+    """
+    finished = []
+
+    def filter_items( i, signalmgr=None ):
+        for step in range(10):
+            signalmgr.handle_if_abort()
+            time.sleep(0.002)
+        finished.append( (i, time.time()) )
+
+    threadpool = QtCore.QThreadPool()
+    threadpool.setMaxThreadCount( nthreads )
+    task       = SoloThreadedTask( callback=filter_items )
+
+    with mock.patch.object( ThreadedTask, 'withdraw', return_value=False ) if not withdraw else _nullcontext():
+        for i in range(nrestarts):
+            start = time.time()
+            task.start( threadpool=threadpool, i=i )
+        threadpool.waitForDone()
+
+    completed = [ t for (i, t) in finished if i == nrestarts-1 ]
+    return completed[0] - start
+
+
+def bench_micro_jobs( njobs, fused=False ):
+    """
+    Returns the average number of seconds per job to run `njobs` tiny
+    jobs, and receive their results in the UI thread.
+
+    Args:
+        njobs (int):
+            number of jobs to run
+
+        fused (bool, optional):
+            If ``True`` , jobs are submitted to a :py:obj:`TaskFuser` ,
+            instead of each job being a :py:obj:`ThreadedTask` .
+    """
+    received   = []
+    threadpool = QtCore.QThreadPool()
+    app        = QtCore.QCoreApplication.instance()
+
+    start = time.time()
+    if fused:
+        fuser = TaskFuser( size=500, threadpool=threadpool )
+        fuser.results_ready.connect( received.extend )
+        for i in range(njobs):
+            fuser.submit( abs, -i )
+        fuser.flush()
+    else:
+        for i in range(njobs):
+            task = ThreadedTask( lambda i, signalmgr=None: abs(-i), {'returned':int}, i=i )
+            task.signal('returned').connect( lambda value: received.append(value) )
+            task.start( threadpool=threadpool )
+
+    while len(received) < njobs:
+        app.processEvents()
+    return (time.time() - start) / njobs
+
+
+def bench_task_throughput( ntasks ):
+    """
+    Returns the average number of seconds per task to start `ntasks`
+    :py:obj:`ThreadedTask` s (each doing no work), and receive
+    their `returned` signals in the UI thread.
+    """
+    received   = [0]
+    threadpool = QtCore.QThreadPool()
+    app        = QtCore.QCoreApplication.instance()
+
+    def handle_returned():
+        received[0] += 1
+
+    start = time.time()
+    for i in range(ntasks):
+        task = ThreadedTask( lambda signalmgr=None: None )
+        task.signal('returned').connect( lambda: handle_returned() )
+        task.start( threadpool=threadpool )
+
+    while received[0] < ntasks:
+        app.processEvents()
+    return (time.time() - start) / ntasks
+
+
+def bench_signal_roundtrip( nroundtrips ):
+    """
+    Returns the average number of seconds between the UI thread sending
+    a request to a running :py:obj:`ThreadedTask` , and receiving it's
+    reply (a queued signal).
+    """
+    requests = queue.Queue()
+    received = []
+    app      = QtCore.QCoreApplication.instance()
+
+    def serve( signalmgr=None ):
+        while True:
+            request = requests.get()
+            if request is None:
+                return
+            signalmgr.reply.emit( request )
+
+    task = ThreadedTask( serve, {'reply':int} )
+    task.signal('reply').connect( received.append )
+    threadpool = QtCore.QThreadPool()
+    task.start( threadpool=threadpool )
+
+    total = 0.0
+    for i in range(nroundtrips):
+        start = time.time()
+        requests.put( i )
+        while len(received) <= i:
+            app.processEvents()
+        total += time.time() - start
+
+    requests.put( None )
+    threadpool.waitForDone()
+    return total / nroundtrips
+
+
+def bench_solo_first_result( nrestarts, nthreads=2 ):
+    """
+    Returns the number of seconds between the last of `nrestarts`
+    consecutive :py:meth:`SoloThreadedTask.start` calls, and the UI thread
+    receiving the first item emitted by that start's callback.
+    """
+    first_item = []
+    app        = QtCore.QCoreApplication.instance()
+
+    def filter_items( i, signalmgr=None ):
+        for step in range(10):
+            signalmgr.handle_if_abort()
+            time.sleep(0.002)
+            signalmgr.add_item.emit( i )
+
+    def add_item( i ):
+        if i == nrestarts-1  and  not first_item:
+            first_item.append( time.time() )
+
+    threadpool = QtCore.QThreadPool()
+    threadpool.setMaxThreadCount( nthreads )
+    task       = SoloThreadedTask(
+        callback    = filter_items,
+        signals     = {'add_item':int},
+        connections = {'add_item':[add_item]},
+    )
+
+    for i in range(nrestarts):
+        start = time.time()
+        task.start( threadpool=threadpool, i=i )
+
+    while not first_item:
+        app.processEvents()
+    latency = first_item[0] - start
+
+    threadpool.waitForDone()
+    return latency
+
+
+class _nullcontext( object ):
+    def __enter__(self):
+        pass
+    def __exit__(self, *exc_info):
+        pass
+
+
+def run( sizes=(10000, 100000) ):
+    """
+    Runs all benchmarks in this module, returning a
+    dictionary of results.
+
+    Returns:
+
+        .. code-block:: python
+
+            {
+                'stream_per_item': { 10000: 0.0000150, ... },
+                'stream_batched':  { 10000: 0.0000010, ... },
+                ...
+            }
+    """
+    results = {
+        'stream_per_item':      {},
+        'stream_batched':       {},
+        'solo_restart_withdraw':{},
+        'solo_restart_queued':  {},
+        'micro_per_task':       {},
+        'micro_fused':          {},
+        'task_throughput':      {},
+        'signal_roundtrip':     {},
+        'solo_first_result':    {},
+    }
+    for nitems in sizes:
+        results['stream_per_item'][ nitems ] = bench_stream( nitems )
+        results['stream_batched'][ nitems ]  = bench_stream( nitems, batch_size=500 )
+
+    for nrestarts in (10, 100):
+        results['solo_restart_withdraw'][ nrestarts ] = bench_solo_restart( nrestarts, withdraw=True  )
+        results['solo_restart_queued'][ nrestarts ]   = bench_solo_restart( nrestarts, withdraw=False )
+
+    for njobs in (10000,):
+        results['micro_per_task'][ njobs ] = bench_micro_jobs( njobs )
+        results['micro_fused'][ njobs ]    = bench_micro_jobs( njobs, fused=True )
+        results['task_throughput'][ njobs ] = bench_task_throughput( njobs )
+
+    for nroundtrips in (1000,):
+        results['signal_roundtrip'][ nroundtrips ] = bench_signal_roundtrip( nroundtrips )
+
+    for nrestarts in (10, 100):
+        results['solo_first_result'][ nrestarts ] = bench_solo_first_result( nrestarts )
+    return results
+
+
+
+if __name__ == '__main__':
+    from qconcurrency import QApplication
+    qapp = QApplication()
+    logging.getLogger('qconcurrency').setLevel( logging.ERROR )
+
+    results = run()
+    for name in sorted(results):
+        for n in sorted(results[name]):
+            if name.startswith('solo_'):
+                print( '%-22s %8s starts %10.2f ms latency' % (name, n, results[name][n] * 1000) )
+            else:
+                print( '%-22s %8s items  %10.2f us/op' % (name, n, results[name][n] * 1000000) )
@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+"""
+Name :          benchmarks/run.py
+Created :       Oct 17, 2026
+Author :        Will Pittman
+Contact :       willjpittman@gmail.com
+________________________________________________________________________________
+Description :   Runs all benchmarks (`bench_threading.py` , `bench_models.py` ),
+                and compares their results against stored baselines.
+
+                    # compare against benchmarks/baselines.json
+                    python benchmarks/run.py
+
+                    # include DictModel tables of 1M rows (slow)
+                    python benchmarks/run.py --full
+
+                    # store this run's results as the new baselines
+                    python benchmarks/run.py --update-baselines
+
+                    # exit 1 if any benchmark is >25% slower than it's baseline
+                    python benchmarks/run.py --fail-on-regression --threshold 25
+
+                Qt runs offscreen (``QT_QPA_PLATFORM=offscreen`` ) unless
+                another platform is set. All results are seconds (lower is better),
+                the fastest of `--repeat` runs.
+                Baselines are machine-specific, regenerate them before comparing
+                on a different machine.
+________________________________________________________________________________
+"""
+#builtin
+from   __future__    import unicode_literals
+from   __future__    import absolute_import
+from   __future__    import division
+from   __future__    import print_function
+import argparse
+import io
+import json
+import logging
+import os
+import platform
+import sys
+#external
+#internal
+benchmarks_path   = os.path.dirname( os.path.realpath(__file__) )
+qconcurrency_path = os.path.dirname( benchmarks_path )
+sys.path.insert(0, qconcurrency_path )
+sys.path.insert(0, benchmarks_path )
+
+default_baselines = os.path.join( benchmarks_path, 'baselines.json' )
+
+# DictModel table sizes
+quick_sizes = (1000, 10000, 100000)
+full_sizes  = (1000, 10000, 100000, 1000000)
+
+
+def run_benchmarks( full=False, repeat=3 ):
+    """
+    Runs all benchmarks `repeat` times, keeping the fastest result of each
+    (the least disturbed by other processes).
+
+    Returns:
+        ``{ 'bench_name/n': seconds, ... }``
+    """
+    import bench_models
+    import bench_threading
+
+    results = {}
+    for i in range(repeat):
+        for (module, kwds) in (
+            (bench_threading, {}),
+            (bench_models,    {'sizes': full_sizes if full else quick_sizes}),
+        ):
+            for (name, sized_results) in module.run( **kwds ).items():
+                for (n, seconds) in sized_results.items():
+                    key = '%s/%s' % (name, n)
+                    results[ key ] = min( seconds, results.get( key, seconds ) )
+    return results
+
+
+def environment():
+    """
+    Returns a description of the machine/libraries the benchmarks ran on.
+    """
+    from Qt import QtCore, __binding__
+    return {
+        'python':   platform.python_version(),
+        'binding':  __binding__,
+        'qt':       QtCore.qVersion(),
+        'platform': platform.platform(),
+        'cpus':     QtCore.QThread.idealThreadCount(),
+    }
+
+
+def load_baselines( filepath ):
+    """
+    Returns the baselines stored in `filepath` ( ``{'environment':{...}, 'results':{...}}`` ),
+    or ``None`` if it does not exist.
+    """
+    if not os.path.isfile( filepath ):
+        return None
+    with io.open( filepath, 'r', encoding='utf-8' ) as fd:
+        return json.load( fd )
+
+
+def save_results( filepath, results ):
+    data = {
+        'environment': environment(),
+        'results':     results,
+    }
+    with io.open( filepath, 'w', encoding='utf-8' ) as fd:
+        fd.write( json.dumps( data, indent=2, sort_keys=True ) )
+
+
+def compare( results, baselines, threshold=25.0 ):
+    """
+    Compares `results` against `baselines` .
+
+    Args:
+        results (dict):   ``{ 'bench_name/n': seconds, ... }``
+        baselines (dict): ``{ 'bench_name/n': seconds, ... }``
+
+        threshold (float, optional):
+            Percentage a result may be slower/faster than it's baseline,
+            before it is reported as a regression/improvement.
+
+    Returns:
+        ``[ (name, baseline, result, change_percent, status), ... ]`` sorted by name,
+        where `status` is one of ``'ok', 'regressed', 'improved', 'new'`` .
+    """
+    rows = []
+    for name in sorted(results):
+        result   = results[ name ]
+        baseline = baselines.get( name )
+        if not baseline:
+            rows.append( (name, None, result, None, 'new') )
+            continue
+
+        change = ( result - baseline ) / baseline * 100
+        if change > threshold:
+            status = 'regressed'
+        elif change < -threshold:
+            status = 'improved'
+        else:
+            status = 'ok'
+        rows.append( (name, baseline, result, change, status) )
+    return rows
+
+
+def format_seconds( seconds ):
+    if seconds is None:
+        return '-'
+    if seconds < 0.001:
+        return '%.2f us' % (seconds * 1000000)
+    if seconds < 1:
+        return '%.2f ms' % (seconds * 1000)
+    return '%.2f s' % seconds
+
+
+def print_report( rows ):
+    print( '%-36s %12s %12s %9s  %s' % ('benchmark', 'baseline', 'result', 'change', 'status') )
+    print( '-' * 82 )
+    for (name, baseline, result, change, status) in rows:
+        change = '-' if change is None else '%+.1f%%' % change
+        print( '%-36s %12s %12s %9s  %s' % (name, format_seconds(baseline), format_seconds(result), change, status) )
+
+    regressed = [ row for row in rows if row[4] == 'regressed' ]
+    print( '\n%s benchmarks, %s regressed, %s improved' % (
+        len(rows), len(regressed), len([ row for row in rows if row[4] == 'improved' ]) ) )
+
+
+def main( argv=None ):
+    parser = argparse.ArgumentParser( description='Runs qconcurrency benchmarks, comparing results against baselines.' )
+    parser.add_argument( '--baselines', default=default_baselines, help='baselines file (default: %(default)s)' )
+    parser.add_argument( '--update-baselines', action='store_true', help="store this run's results as the baselines" )
+    parser.add_argument( '--output', help="also write this run's results to this file" )
+    parser.add_argument( '--threshold', type=float, default=25.0, help='percent change reported as a regression/improvement (default: %(default)s)' )
+    parser.add_argument( '--fail-on-regression', action='store_true', help='exit 1 if any benchmark regressed' )
+    parser.add_argument( '--full', action='store_true', help='include DictModel tables of 1M rows' )
+    parser.add_argument( '--repeat', type=int, default=3, help='runs per benchmark, the fastest is kept (default: %(default)s)' )
+    args = parser.parse_args( argv )
+
+    os.environ.setdefault( 'QT_QPA_PLATFORM', 'offscreen' )
+    from qconcurrency import QApplication
+    qapp = QApplication()
+    logging.getLogger('qconcurrency').setLevel( logging.ERROR )
+
+    results = run_benchmarks( full=args.full, repeat=args.repeat )
+
+    if args.output:
+        save_results( args.output, results )
+
+    baselines = load_baselines( args.baselines )
+    rows      = compare( results, baselines['results'] if baselines else {}, threshold=args.threshold )
+    if baselines:
+        print( 'baselines: %s' % json.dumps( baselines['environment'], sort_keys=True ) )
+    print( 'this run:  %s\n' % json.dumps( environment(), sort_keys=True ) )
+    print_report( rows )
+
+    if args.update_baselines:
+        save_results( args.baselines, results )
+        print( '\nupdated baselines: %s' % args.baselines )
+
+    if args.fail_on_regression  and  any([ row[4] == 'regressed' for row in rows ]):
+        return 1
+    return 0
+
+
+
+if __name__ == '__main__':
+    sys.exit( main() )
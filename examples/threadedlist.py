@@ -11,7 +11,6 @@ qconcurrency_path = '/'.join(os.path.realpath(__file__).replace('\\','/').split(
 sys.path.insert(0, qconcurrency_path )
 from   qconcurrency.threading_ import ThreadedTask, SoloThreadedTask
 from   Qt                      import QtCore, QtWidgets
-import six
 import time
 
 
@@ -19,8 +18,6 @@ class MyThreadedList( QtWidgets.QListWidget ):
     def __init__(self):
         QtWidgets.QListWidget.__init__(self)
 
-        self._sem_rendering  = QtCore.QSemaphore(1)
-
         self._thread_loading = SoloThreadedTask(
             callback    = self._find_list_items,
             signals     = {
@@ -47,15 +44,14 @@ class MyThreadedList( QtWidgets.QListWidget ):
         """
         signalmgr.clear.emit()
 
+        # at most 5x items wait to be added to the list. Once full, `emit()`
+        # blocks until the UI catches up (raising UserCancelledOperation if
+        # the job is cancelled meanwhile, discarding items that were waiting).
+        add_item = signalmgr.channel( 'add_item', capacity=5 )
+
         for i in range(100):
             signalmgr.handle_if_abort()   # check for a request-abort, and exit early
-
-            # slow signals down, emitting one object at a time
-            # so that job can be cancelled.
-            # ( signals have no priority, once emitted,  )
-            # ( you must wait for them all to be handled )
-            self._sem_rendering.tryAcquire(1,5000)
-            signalmgr.add_item.emit( str(i) )  # add an item to the list
+            add_item.emit( str(i) )       # add an item to the list
 
     def addItem(self, item):
         """
@@ -63,23 +59,7 @@ class MyThreadedList( QtWidgets.QListWidget ):
         then adds the item to the list.
         """
         time.sleep(0.01)
-        try:
-            QtWidgets.QListWidget.addItem(self, item )
-        except:
-            self._mutex_rendering.unlock()
-            six.reraise( *sys.exc_info() )
-
-
-        if not self._sem_rendering.available():
-            self._sem_rendering.release(1)
-
-        # in this example, the wait is performed
-        # in the UI thread - it never has a chance to process
-        # QApp events (causing item to be rendered) until it runs
-        # out of signals to fire. It is unlikely you will
-        # need the following line in your production code.
-        #
-        QtCore.QCoreApplication.instance().processEvents()
+        QtWidgets.QListWidget.addItem(self, item )
 
 
 
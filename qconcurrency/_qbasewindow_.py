@@ -24,6 +24,7 @@ from   Qt import QtCore, QtWidgets
 import six
 #internal
 from   qconcurrency.exceptions_   import *
+from   qconcurrency.taskgroup     import TaskGroup
 from   qconcurrency.threading_    import ThreadedTask, SoloThreadedTask
 from   qconcurrency.widgets       import ProgressBar
 from   qconcurrency._fake_        import Fake
@@ -32,10 +33,18 @@ logger = logging.getLogger(__name__)
 
 
 class QBaseWindow( QtWidgets.QWidget ):
+    """
+    Window with a progressbar, that creates tasks reporting to it.
+
+    Tasks/solotasks created by :py:meth:`new_task`/:py:meth:`new_solotask`
+    belong to this window's :py:meth:`taskgroup` . They are cancelled when
+    the window is closed, and detached when it is destroyed.
+    """
     def __init__(self, title=None ):
         QtWidgets.QWidget.__init__(self)
-        self._title  = title
-        self._layout = None
+        self._title     = title
+        self._layout    = None
+        self._taskgroup = TaskGroup( owner=self )
 
 
         # Build Widgets
@@ -61,23 +70,37 @@ class QBaseWindow( QtWidgets.QWidget ):
     def setLayout(self, layout):
         self._mainwidget.setLayout( layout )
 
+    def taskgroup(self):
+        """
+        Returns the :py:obj:`qconcurrency.taskgroup.TaskGroup` that owns this window's tasks.
+        """
+        return self._taskgroup
+
+    def closeEvent(self, event):
+        self._taskgroup.cancel()
+        QtWidgets.QWidget.closeEvent(self, event)
+
     def new_task(self, callback, signals=None, *args, **kwds):
         task = self._progressbar.new_task(
             callback = callback,
             signals  = signals,
             *args, **kwds
         )
-        return task
+        return self._taskgroup.add( task )
 
-    def new_solotask(self, callback, signals=None, connections=None, mutex_expiry=5000):
+    def new_solotask(self, callback, signals=None, connections=None, mutex_expiry=5000, debounce=None, coalesce=False, priority=None, threadpool=None):
 
         solotask = self._progressbar.new_solotask(
             callback     = callback,
             signals      = signals,
             connections  = connections,
             mutex_expiry = mutex_expiry,
+            debounce     = debounce,
+            coalesce     = coalesce,
+            priority     = priority,
+            threadpool   = threadpool,
         )
-        return solotask
+        return self._taskgroup.add( solotask )
 
 
 
@@ -100,7 +123,7 @@ class _ProgressSoloThreadedTask_QBaseObject( SoloThreadedTask ):
     available on the :py:obj:`SoloThreadedTask` s :py:obj:`SignalManager`.
 
     """
-    def __init__(self, qbaseobject, callback, signals=None, connections=None, mutex_expiry=5000):
+    def __init__(self, qbaseobject, callback, signals=None, connections=None, mutex_expiry=5000, debounce=None, coalesce=False, priority=None, threadpool=None):
         """
         Args:
             qbaseobject (QBaseObject):
@@ -113,6 +136,10 @@ class _ProgressSoloThreadedTask_QBaseObject( SoloThreadedTask ):
             signals      = signals,
             connections  = connections,
             mutex_expiry = mutex_expiry,
+            debounce     = debounce,
+            coalesce     = coalesce,
+            priority     = priority,
+            threadpool   = threadpool,
         )
 
     def start(self, expiryTimeout=-1, threadpool=None, wait=False, *args, **kwds ):
@@ -155,7 +182,7 @@ class _ProgressSoloThreadedTask_QBaseObject( SoloThreadedTask ):
                     connections[ signal ] = [ progbar_connections[signal] ]
 
 
-            SoloThreadedTask.start(self,
+            return SoloThreadedTask.start(self,
                                expiryTimeout = expiryTimeout,
                                threadpool    = threadpool,
                                wait          = wait,
@@ -166,6 +193,21 @@ class _ProgressSoloThreadedTask_QBaseObject( SoloThreadedTask ):
 
 
 class QBaseObject( object ):
+    """
+    Mixin that creates tasks reporting to the progressbar of it's window (if any).
+
+    Tasks/solotasks created by :py:meth:`new_task`/:py:meth:`new_solotask` belong to
+    this object's :py:meth:`taskgroup` (cancelled/detached when it is destroyed, if it is a QObject).
+    """
+    def taskgroup(self):
+        """
+        Returns the :py:obj:`qconcurrency.taskgroup.TaskGroup` that owns this object's tasks.
+        """
+        if getattr( self, '_qbaseobject_taskgroup', None ) is None:
+            owner = self if isinstance( self, QtCore.QObject ) else None
+            self._qbaseobject_taskgroup = TaskGroup( owner=owner )
+        return self._qbaseobject_taskgroup
+
     def new_task(self, callback, signals=None, *args, **kwds):
 
         # assign signals
@@ -183,9 +225,9 @@ class QBaseObject( object ):
             *args, **kwds
         )
 
-        return task
+        return self.taskgroup().add( task )
 
-    def new_solotask(self, callback, signals=None, connections=None, mutex_expiry=5000):
+    def new_solotask(self, callback, signals=None, connections=None, mutex_expiry=5000, debounce=None, coalesce=False, priority=None, threadpool=None):
 
         # assign signals
         default_signals = {
@@ -214,9 +256,13 @@ class QBaseObject( object ):
             signals      = default_signals,
             connections  = default_connections,
             mutex_expiry = mutex_expiry,
+            debounce     = debounce,
+            coalesce     = coalesce,
+            priority     = priority,
+            threadpool   = threadpool,
         )
 
-        return solotask
+        return self.taskgroup().add( solotask )
 
 
 
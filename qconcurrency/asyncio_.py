@@ -0,0 +1,336 @@
+#!/usr/bin/env python
+"""
+Name :          qconcurrency.asyncio_.py
+Created :       Oct 17, 2026
+Author :        Will Pittman
+Contact :       willjpittman@gmail.com
+________________________________________________________________________________
+Description :   Runs coroutines on a shared :py:mod:`asyncio` event-loop,
+                with the same signals/abort-handling as a
+                :py:obj:`qconcurrency.threading_.ThreadedTask`
+                (python-3.5+ only).
+________________________________________________________________________________
+"""
+#builtin
+from __future__    import unicode_literals
+from __future__    import absolute_import
+from __future__    import division
+from __future__    import print_function
+import asyncio
+import logging
+import sys
+import threading
+import traceback
+#package
+#external
+import six
+#internal
+from   qconcurrency.exceptions_  import *
+from   qconcurrency.futures_     import TaskFuture
+from   qconcurrency.threading_   import SignalManagerFactory
+
+logger = logging.getLogger(__name__)
+loc    = locals
+
+__all__ = [
+    'AsyncLoop',
+    'CoroutineTask',
+    'get_loop',
+]
+
+_loop      = None               # AsyncLoop shared by all CoroutineTasks (see get_loop)
+_loop_lock = threading.Lock()
+
+
+def get_loop():
+    """
+    Returns the shared :py:obj:`AsyncLoop` (the default loop for
+    :py:meth:`CoroutineTask.start` ), creating it on first use.
+    """
+    global _loop
+
+    with _loop_lock:
+        if _loop is None:
+            _loop = AsyncLoop()
+        return _loop
+
+
+
+class AsyncLoop( object ):
+    """
+    An :py:mod:`asyncio` event-loop, run forever in a dedicated (daemon) thread.
+    A single loop thread can wait on thousands of coroutines at once.
+
+    Example:
+
+        .. code-block:: python
+
+            with AsyncLoop() as asyncloop:
+                CoroutineTask( fetch, url=url ).start( loop=asyncloop )
+    """
+    def __init__(self):
+        self._loop   = None   # asyncio.AbstractEventLoop
+        self._thread = None   # threading.Thread running `self._loop`
+        self._lock   = threading.Lock()
+
+    def loop(self):
+        """
+        Returns the :py:obj:`asyncio.AbstractEventLoop` ,
+        starting it's thread on first use.
+        """
+        with self._lock:
+            if self._loop is None:
+                self._loop   = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target = self._run_forever,
+                    name   = 'qconcurrency-asyncloop',
+                )
+                self._thread.daemon = True
+                self._thread.start()
+            return self._loop
+
+    def _run_forever(self):
+        asyncio.set_event_loop( self._loop )
+        self._loop.run_forever()
+
+    def call_soon(self, callback, *args ):
+        """
+        Runs ``callback( *args )`` within the loop's thread (threadsafe).
+        """
+        self.loop().call_soon_threadsafe( callback, *args )
+
+    def close(self, timeout=5 ):
+        """
+        Stops the loop, and waits for it's thread to exit.
+        Coroutines still running are abandoned.
+        """
+        with self._lock:
+            if self._loop is None:
+                return
+
+            self._loop.call_soon_threadsafe( self._loop.stop )
+            self._thread.join( timeout )
+            if not self._thread.is_alive():
+                self._loop.close()
+
+            self._loop   = None
+            self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, err_type, err_msg, err_tb ):
+        self.close()
+
+
+
+class CoroutineTask( object ):
+    """
+    Runs a coroutine-function on an :py:mod:`asyncio` event-loop,
+    with the same interface as a :py:obj:`qconcurrency.threading_.ThreadedTask`
+    (signals, :py:meth:`request_abort` , and a :py:obj:`qconcurrency.futures_.TaskFuture`
+    returned by :py:meth:`start` ). No thread is used while the coroutine awaits.
+
+    Like a :py:obj:`ThreadedTask` callback, the coroutine-function must accept
+    the keyword-argument `signalmgr` , and may periodically run
+    :py:meth:`SignalManager.handle_if_abort` . In addition, :py:meth:`request_abort`
+    cancels the coroutine, raising :py:obj:`asyncio.CancelledError` from
+    whatever it is currently awaiting (use ``try/finally`` for cleanup).
+
+    Example:
+
+        .. code-block:: python
+
+            async def fetch_users( userids, signalmgr=None ):
+                signalmgr.add_progress.emit( len(userids) )
+                for userid in userids:
+                    user = await client.get_user( userid )
+                    signalmgr.add_user.emit( user )
+                    signalmgr.incr_progress.emit(1)
+
+            task = CoroutineTask(
+                callback = fetch_users,
+                signals  = {'add_user':object, 'add_progress':int, 'incr_progress':int},
+                userids  = userids,
+            )
+            task.signal('add_user').connect( userlist.add_user )
+            future = task.start()
+
+    .. note::
+
+        By default, coroutines are run on the loop returned by :py:func:`get_loop` .
+        `loop` may instead be any running :py:obj:`asyncio.AbstractEventLoop`
+        (ex: a Qt-integrated event-loop, running in the UI thread). Do not wait
+        on the task's future from within the loop's own thread.
+    """
+    def __init__(self, callback, signals=None, *args, **kwds ):
+        """
+        Args:
+            callback (coroutine-function):
+                An ``async def`` function, that accepts the keyword-argument `signalmgr` .
+
+            signals (dict, optional):
+                Dictionary of signal-names, and the datatypes they will emit.
+                See :py:meth:`qconcurrency.threading_.ThreadedTask.__init__` .
+
+            *args/**kwds:
+                Any additional arguments/keyword-arguments are passed
+                to the callback.
+        """
+        # Arguments
+        self._callback = callback
+        self._args     = args
+        self._kwds     = kwds
+
+        # Attributes
+        self._future     = TaskFuture( task=self )
+        self._loop       = None              # asyncio.AbstractEventLoop this task was started on
+        self._task       = None              # asyncio.Task running the coroutine
+        self._started    = False             # True once the coroutine has been created (or withdrawn)
+        self._start_lock = threading.Lock()
+
+        self._signals  = {
+            'returned':        None,
+            'exception':       None,
+            'abort_requested': None,
+        }
+        if signals:
+            self._signals.update( signals )
+
+        self._signalmgr = SignalManagerFactory( self._signals )
+
+    def start(self, loop=None ):
+        """
+        Schedules the coroutine to run on an event-loop.
+
+        Args:
+            loop (AsyncLoop, asyncio.AbstractEventLoop, optional):
+                The loop to run the coroutine on.
+                By default, the shared loop from :py:func:`get_loop` .
+
+        Returns:
+            :py:obj:`qconcurrency.futures_.TaskFuture` for this task's result.
+        """
+        if loop is None:
+            loop = get_loop()
+        if isinstance( loop, AsyncLoop ):
+            loop = loop.loop()
+
+        self._loop = loop
+        loop.call_soon_threadsafe( self._run )
+        return self._future
+
+    def _run(self):
+        """
+        Creates the coroutine (within the loop's thread).
+        """
+        with self._start_lock:
+            if self._started:
+                return
+            self._started = True
+
+        if self._signalmgr._abort_requested:
+            self._handle_cancelled()
+            return
+
+        self._future._set_running()
+        try:
+            coroutine = self._callback( signalmgr=self._signalmgr, *self._args, **self._kwds )
+            self._task = asyncio.ensure_future( coroutine, loop=self._loop )
+        except:
+            self._handle_exception( *sys.exc_info() )
+            return
+
+        self._task.add_done_callback( self._handle_done )
+
+    def _handle_done(self, task):
+        if task.cancelled():
+            self._handle_cancelled()
+            return
+
+        exc = task.exception()
+        if isinstance( exc, UserCancelledOperation ):
+            self._handle_cancelled()
+        elif exc is not None:
+            self._handle_exception( type(exc), exc, exc.__traceback__ )
+        else:
+            self._handle_returned( task.result() )
+
+    def _handle_returned(self, retval):
+        self._signalmgr.flush_batches()
+
+        if not self._signals['returned']:
+            self._signalmgr.returned.emit()
+        else:
+            self._signalmgr.returned.emit( retval )
+        self._future._set_result( retval )
+
+    def _handle_cancelled(self):
+        logger.debug('Responding to user-cancelled-operation. Exiting coroutine: %s' % repr(self) )
+        self._signalmgr.flush_batches()
+        self._signalmgr.exception.emit()
+        self._future._set_cancelled()
+
+    def _handle_exception(self, exc_type, exc, exc_tb ):
+        logger.error( 'called with %s( %s, %s )' % (repr(self._callback), repr(self._args), repr(self._kwds) ) )
+        logger.error( '%s\n\nUnhandled Exception occurred in coroutine' % ''.join(traceback.format_exception( exc_type, exc, exc_tb )) )
+        self._signalmgr.flush_batches()
+        self._signalmgr.exception.emit()
+        self._future._set_exception( exc )
+
+    def future(self):
+        """
+        Returns the :py:obj:`qconcurrency.futures_.TaskFuture`
+        for this task's result.
+        """
+        return self._future
+
+    def withdraw(self):
+        """
+        Prevents the coroutine from being created, if it has not been already.
+        A withdrawn task emits no signals.
+
+        Returns:
+            ``True`` if the task was withdrawn, ``False`` if it has already started.
+        """
+        with self._start_lock:
+            if self._started:
+                return False
+            self._started = True
+
+        self._future._set_cancelled()
+        return True
+
+    def signalmgr(self):
+        """
+        Returns the :py:obj:`SignalManager` passed to the coroutine.
+        """
+        return self._signalmgr
+
+    def signal(self, signal_name):
+        """
+        Returns one of the :py:obj:`QtCore.Signal` s defined in `signals`.
+        """
+        return getattr( self._signalmgr, signal_name )
+
+    def connect_batch(self, signal_name, callback ):
+        """
+        See :py:meth:`SignalManager.connect_batch` .
+        """
+        self._signalmgr.connect_batch( signal_name, callback )
+
+    def request_abort(self,*args,**kwds):
+        """
+        Runs :py:meth:`SignalManager._request_abort` , and
+        cancels the coroutine (at it's current ``await`` ).
+        """
+        logger.warning('Abort Requested for `CoroutineTask`: %s' % repr(self))
+        self._signalmgr._request_abort()
+
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe( self._cancel )
+
+    def _cancel(self):
+        if self._task is not None:
+            self._task.cancel()
+
@@ -31,4 +31,11 @@ class TimedOut( Exception ):
     pass
 
 
+class ProcessTaskError( Exception ):
+    """
+    If a callback running in a child-process (see :py:obj:`qconcurrency.multiprocessing_.ProcessPool` )
+    raises an unhandled exception. The message contains the child-process's traceback.
+    """
+    pass
+
 
@@ -0,0 +1,479 @@
+#!/usr/bin/env python
+"""
+Name :          qconcurrency.futures_.py
+Created :       Oct 17, 2026
+Author :        Will Pittman
+Contact :       willjpittman@gmail.com
+________________________________________________________________________________
+Description :   Future objects, representing the eventual result of a
+                :py:obj:`qconcurrency.threading_.ThreadedTask` .
+________________________________________________________________________________
+"""
+#builtin
+from __future__    import unicode_literals
+from __future__    import absolute_import
+from __future__    import division
+from __future__    import print_function
+import logging
+import threading
+import traceback
+import time
+#package
+#external
+from   Qt import QtCore
+import six
+#internal
+from   qconcurrency.exceptions_  import *
+
+logger = logging.getLogger(__name__)
+loc    = locals
+
+__all__ = [
+    'TaskFuture',
+    'gather',
+    'any_of',
+]
+
+_dispatcher      = None              # _FutureDispatcher (runs done-callbacks in the UI thread)
+_dispatcher_lock = threading.Lock()
+
+
+class _FutureDispatcher( QtCore.QObject ):
+    """
+    Runs :py:obj:`TaskFuture` done-callbacks in the UI thread.
+    A single instance is shared by all futures (see :py:func:`_get_dispatcher` ).
+    """
+    _dispatch = QtCore.Signal(object)  # (future, [callback, ...])
+
+    def __init__(self):
+        QtCore.QObject.__init__(self)
+        # always queued, so callbacks never run from within the code resolving a future
+        self._dispatch.connect( self._run_callbacks, QtCore.Qt.QueuedConnection )
+
+    def _run_callbacks(self, item):
+        (future, callbacks) = item
+        for callback in callbacks:
+            try:
+                callback( future )
+            except:
+                logger.error( '%s\n\nUnhandled Exception in TaskFuture callback: %s' % (traceback.format_exc(), repr(callback)) )
+
+
+def _get_dispatcher():
+    """
+    Returns the :py:obj:`_FutureDispatcher` , creating it
+    (in the UI thread) on first use.
+    """
+    global _dispatcher
+
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = _FutureDispatcher()
+
+            app = QtCore.QCoreApplication.instance()
+            if app is not None:
+                _dispatcher.moveToThread( app.thread() )
+
+        return _dispatcher
+
+
+def _in_ui_thread():
+    app = QtCore.QCoreApplication.instance()
+    return app is not None  and  QtCore.QThread.currentThread() == app.thread()
+
+
+
+class TaskFuture( object ):
+    """
+    The eventual result of a :py:obj:`qconcurrency.threading_.ThreadedTask` .
+    Returned by :py:meth:`qconcurrency.threading_.ThreadedTask.start` .
+
+    Unlike the task's `returned` signal, the result is always available
+    (regardless of the datatypes declared in `signals` ), and callbacks added
+    using :py:meth:`add_done_callback` are always run in the UI thread.
+
+    Example:
+
+        .. code-block:: python
+
+            def load_user( userid, signalmgr=None ):
+                return db.users.find( userid )
+
+            futures = [ ThreadedTask( load_user, userid=i ).start() for i in userids ]
+
+            # join them, without any signal bookkeeping
+            gather( futures ).add_done_callback(
+                lambda future: userlist.set_users( future.result() )
+            )
+
+            # transform a result (in the UI thread), or pass it to another task
+            future = ThreadedTask( load_user, userid=1 ).start()
+            future.map( lambda user: user['name'] ).add_done_callback( ... )
+            future.then( load_user_projects )
+
+    """
+    _ui_wait_interval = 0.01   # seconds between processing Qt events, while waiting in the UI thread
+
+    def __init__(self, task=None, on_cancel=None ):
+        """
+        Args:
+            task (qconcurrency.threading_.ThreadedTask, optional):
+                The task whose result this future represents.
+                :py:meth:`cancel` withdraws/requests abort on this task.
+
+            on_cancel (callable, optional):
+                Called by :py:meth:`cancel` (for futures not
+                representing a single task, ex: :py:func:`gather` ).
+        """
+        self._task             = task
+        self._on_cancel        = on_cancel
+        self._cancel_requested = False
+
+        self._state     = 'pending'   # 'pending', 'running', 'finished', 'cancelled'
+        self._result    = None
+        self._exception = None
+        self._callbacks = []
+        self._condition = threading.Condition()
+
+    def __repr__(self):
+        return '<TaskFuture state=%s at %s>' % (self._state, hex(id(self)))
+
+    # Status
+    # ======
+
+    def done(self):
+        """
+        Returns ``True`` if the task has returned, raised, or been cancelled.
+        """
+        return self._state in ('finished', 'cancelled')
+
+    def running(self):
+        """
+        Returns ``True`` if the task is currently running.
+        """
+        return self._state == 'running'
+
+    def cancelled(self):
+        """
+        Returns ``True`` if the task exited because it was cancelled
+        (withdrawn before it started, or raised :py:obj:`UserCancelledOperation` ).
+        """
+        return self._state == 'cancelled'
+
+    # Results
+    # =======
+
+    def result(self, timeout=None ):
+        """
+        Returns the task's return-value, waiting for it to complete if necessary.
+        When called from the UI thread, Qt events are processed while waiting.
+
+        Args:
+            timeout (numbers.Number, optional):
+                Seconds to wait. ``None`` waits indefinitely.
+
+        Raises:
+            :py:obj:`TimedOut`:               if `timeout` expires
+            :py:obj:`UserCancelledOperation`: if the task was cancelled
+            Exception:                        the exception raised by the task
+        """
+        self._wait( timeout )
+
+        if self._state == 'cancelled':
+            raise UserCancelledOperation('task was cancelled')
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def exception(self, timeout=None ):
+        """
+        Returns the exception raised by the task (or ``None`` ),
+        waiting for it to complete if necessary.
+
+        Args:
+            timeout (numbers.Number, optional):
+                Seconds to wait. ``None`` waits indefinitely.
+
+        Raises:
+            :py:obj:`TimedOut`:               if `timeout` expires
+            :py:obj:`UserCancelledOperation`: if the task was cancelled
+        """
+        self._wait( timeout )
+
+        if self._state == 'cancelled':
+            raise UserCancelledOperation('task was cancelled')
+        return self._exception
+
+    def _wait(self, timeout=None ):
+        """
+        Blocks until :py:meth:`done` (processing Qt events, if in the UI thread).
+
+        Raises:
+            :py:obj:`TimedOut`
+        """
+        in_ui_thread = _in_ui_thread()
+
+        deadline = None
+        if timeout is not None:
+            deadline = time.time() + timeout
+
+        with self._condition:
+            while not self.done():
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        raise TimedOut('waited %ss for task to complete' % timeout)
+
+                if not in_ui_thread:
+                    self._condition.wait( remaining )
+                    continue
+
+                if remaining is None  or  remaining > self._ui_wait_interval:
+                    remaining = self._ui_wait_interval
+                self._condition.wait( remaining )
+
+                self._condition.release()
+                try:
+                    QtCore.QCoreApplication.instance().processEvents()
+                finally:
+                    self._condition.acquire()
+
+    # Callbacks
+    # =========
+
+    def add_done_callback(self, callback ):
+        """
+        Runs ``callback( future )`` in the UI thread once this future is done.
+        If it is already done, `callback` is run immediately (or as soon as the
+        UI thread processes events, if called from another thread).
+        """
+        with self._condition:
+            if not self.done():
+                self._callbacks.append( callback )
+                return
+
+        if _in_ui_thread():
+            callback( self )
+        else:
+            _get_dispatcher()._dispatch.emit( (self, [callback]) )
+
+    def cancel(self):
+        """
+        Cancels the task. If it has not started, it is withdrawn from it's
+        threadpool (and this future is cancelled immediately), otherwise an
+        abort is requested (see :py:meth:`SignalManager.handle_if_abort` ).
+
+        Returns:
+            ``False`` if the future is already done, otherwise ``True`` .
+        """
+        if self.done():
+            return False
+
+        self._cancel_requested = True
+        if self._task is not None:
+            if not self._task.withdraw():
+                self._task.request_abort()
+
+        if self._on_cancel is not None:
+            self._on_cancel()
+
+        return True
+
+    def map(self, callback ):
+        """
+        Returns a new :py:obj:`TaskFuture` , resolved with ``callback( result )``
+        (run in the UI thread). Exceptions/cancellation are passed on unchanged.
+
+        If `callback` returns a :py:obj:`TaskFuture` , the new future
+        is resolved with it's result instead.
+        """
+        mapped = TaskFuture( on_cancel=self.cancel )
+
+        def handle_done( future ):
+            if not future._succeeded():
+                mapped._copy_state( future )
+                return
+
+            try:
+                retval = callback( future._result )
+            except Exception as exc:
+                logger.error( '%s\n\nUnhandled Exception in TaskFuture.map callback: %s' % (traceback.format_exc(), repr(callback)) )
+                mapped._set_exception( exc )
+                return
+
+            if isinstance( retval, TaskFuture ):
+                mapped._on_cancel = retval.cancel
+                retval.add_done_callback( mapped._copy_state )
+            else:
+                mapped._set_result( retval )
+
+        self.add_done_callback( handle_done )
+        return mapped
+
+    def then(self, callback, threadpool=None ):
+        """
+        Once this future succeeds, starts a new :py:obj:`qconcurrency.threading_.ThreadedTask`
+        running ``callback( result, signalmgr=signalmgr )`` . Returns a :py:obj:`TaskFuture`
+        for the new task. Exceptions/cancellation are passed on unchanged.
+
+        Args:
+            callback (callable):
+                The callback for the new task.
+
+            threadpool (QtCore.QThreadPool, str, optional):
+                The threadpool to start the new task in.
+        """
+        from qconcurrency.threading_ import ThreadedTask
+
+        chained = TaskFuture( on_cancel=self.cancel )
+
+        def handle_done( future ):
+            if not future._succeeded():
+                chained._copy_state( future )
+                return
+
+            if chained._cancel_requested:
+                chained._set_cancelled()
+                return
+
+            task               = ThreadedTask( callback, None, future._result )
+            task_future        = task.start( threadpool=threadpool )
+            chained._on_cancel = task_future.cancel
+            task_future.add_done_callback( chained._copy_state )
+
+        self.add_done_callback( handle_done )
+        return chained
+
+    # Resolution
+    # ==========
+
+    def _succeeded(self):
+        return self._state == 'finished'  and  self._exception is None
+
+    def _set_running(self):
+        with self._condition:
+            if self._state == 'pending':
+                self._state = 'running'
+
+    def _set_result(self, result):
+        self._resolve( 'finished', result=result )
+
+    def _set_exception(self, exception):
+        self._resolve( 'finished', exception=exception )
+
+    def _set_cancelled(self):
+        self._resolve( 'cancelled' )
+
+    def _copy_state(self, future):
+        """
+        Resolves this future with the same outcome as `future` .
+        """
+        if future.cancelled():
+            self._set_cancelled()
+        elif future._exception is not None:
+            self._set_exception( future._exception )
+        else:
+            self._set_result( future._result )
+
+    def _resolve(self, state, result=None, exception=None ):
+        """
+        Sets the outcome of this future, waking anything waiting on it,
+        and queues it's done-callbacks to run in the UI thread.
+        (Futures can only be resolved once, later calls are ignored).
+        """
+        with self._condition:
+            if self.done():
+                return
+
+            self._state     = state
+            self._result    = result
+            self._exception = exception
+            self._task      = None
+
+            callbacks       = self._callbacks
+            self._callbacks = []
+            self._condition.notify_all()
+
+        if callbacks:
+            _get_dispatcher()._dispatch.emit( (self, callbacks) )
+
+
+
+def gather( futures ):
+    """
+    Returns a :py:obj:`TaskFuture` that resolves with a list of the results
+    of all `futures` (in the same order) once they all succeed.
+
+    If any of the futures raises/is cancelled, the returned future
+    does the same immediately. Cancelling the returned future cancels
+    all of `futures` .
+
+    Example:
+
+        .. code-block:: python
+
+            futures  = [ ThreadedTask( load_file, path=path ).start() for path in paths ]
+            gathered = gather( futures )
+            gathered.add_done_callback( lambda future: show_files( future.result() ) )
+    """
+    futures   = list(futures)
+    gathered  = TaskFuture( on_cancel=lambda: [ future.cancel() for future in futures ] )
+    remaining = [ len(futures) ]
+
+    if not futures:
+        gathered._set_result( [] )
+        return gathered
+
+    def handle_done( future ):
+        if gathered.done():
+            return
+
+        if not future._succeeded():
+            gathered._copy_state( future )
+            return
+
+        remaining[0] -= 1
+        if remaining[0] == 0:
+            gathered._set_result( [ future._result for future in futures ] )
+
+    for future in futures:
+        future.add_done_callback( handle_done )
+
+    return gathered
+
+
+def any_of( futures ):
+    """
+    Returns a :py:obj:`TaskFuture` that resolves with the result of the first
+    of `futures` to succeed. If none of them succeed, it resolves with the outcome
+    of the last to complete. Cancelling the returned future cancels all of `futures` .
+
+    Example:
+
+        .. code-block:: python
+
+            # use whichever mirror responds first
+            futures = [ ThreadedTask( download, url=url ).start() for url in mirrors ]
+            any_of( futures ).add_done_callback( ... )
+    """
+    futures   = list(futures)
+    first     = TaskFuture( on_cancel=lambda: [ future.cancel() for future in futures ] )
+    remaining = [ len(futures) ]
+
+    if not futures:
+        first._set_cancelled()
+        return first
+
+    def handle_done( future ):
+        if first.done():
+            return
+
+        remaining[0] -= 1
+        if future._succeeded()  or  remaining[0] == 0:
+            first._copy_state( future )
+
+    for future in futures:
+        future.add_done_callback( handle_done )
+
+    return first
@@ -0,0 +1,425 @@
+#!/usr/bin/env python
+"""
+Name :          qconcurrency.graph.py
+Created :       Oct 17, 2026
+Author :        Will Pittman
+Contact :       willjpittman@gmail.com
+________________________________________________________________________________
+Description :   Runs :py:obj:`qconcurrency.threading_.ThreadedTask` s that depend on
+                each other's results, starting each as soon as it's dependencies
+                have succeeded.
+________________________________________________________________________________
+"""
+#builtin
+from __future__    import unicode_literals
+from __future__    import absolute_import
+from __future__    import division
+from __future__    import print_function
+from   collections import MutableMapping, OrderedDict
+import functools
+import logging
+import time
+#package
+#external
+from   Qt import QtCore
+import six
+#internal
+from   qconcurrency              import metrics
+from   qconcurrency              import threadpools
+from   qconcurrency.exceptions_  import *
+from   qconcurrency.futures_     import TaskFuture
+from   qconcurrency.threading_   import ThreadedTask
+
+logger = logging.getLogger(__name__)
+loc    = locals
+
+__all__ = [
+    'TaskGraph',
+]
+
+
+
+class TaskGraph( QtCore.QObject ):
+    """
+    A directed-acyclic-graph of :py:obj:`qconcurrency.threading_.ThreadedTask` s.
+    Each task is started as soon as all of it's dependencies have succeeded
+    (tasks without dependencies on each other run concurrently), and is passed
+    their results as keyword-arguments.
+
+    If a task raises, or is aborted, the tasks that depend on it (directly or not)
+    are cancelled without running. Other tasks keep running, unless `fail_fast` is set.
+
+    Example:
+
+        .. code-block:: python
+
+            def load_user( userid, signalmgr=None ):
+                return db.users.find( userid )
+
+            def load_projects( user, signalmgr=None ):
+                return db.projects.find( owner=user['id'] )
+
+            graph = TaskGraph( threadpool='io' )
+            graph.add_task( 'user',     load_user, userid=5 )
+            graph.add_task( 'settings', load_settings )
+            graph.add_task( 'projects', load_projects, depends=['user'] )
+            graph.add_task( 'window',   build_window,  depends={'projects':'projects', 'settings':None} )
+            graph.task('projects').signal('returned').connect( projectlist.set_projects )
+
+            graph.start().add_done_callback( lambda future: print( graph.critical_path() ) )
+
+    :py:meth:`future` resolves with ``{ name : result }`` once every task succeeds,
+    otherwise with the outcome (exception, or cancellation) of the first task that did not.
+    """
+    finished  = QtCore.Signal(object)  # { name : result }   every task succeeded
+    exception = QtCore.Signal()        # a task raised/was aborted (emitted once all tasks are done)
+
+    def __init__(self, threadpool=None, fail_fast=False, parent=None ):
+        """
+        Args:
+            threadpool (QtCore.QThreadPool, str, optional):
+                Threadpool (or registered threadpool name) that tasks run in,
+                unless they set their own. By default :py:meth:`QtCore.QThreadPool.globalInstance` .
+
+            fail_fast (bool, optional):
+                If ``True`` , the first task to raise aborts every task in the graph
+                (not only the tasks that depend on it).
+
+            parent (QtCore.QObject, optional):
+                Qt parent of this object.
+        """
+        QtCore.QObject.__init__(self, parent)
+
+        self._threadpool = threadpool
+        self._fail_fast  = fail_fast
+        self._nodes      = OrderedDict()   # { name : _GraphNode }
+        self._results    = {}              # { name : result }
+        self._failed     = None            # future of the first task that did not succeed
+        self._remaining  = 0               # tasks whose futures are not yet done
+        self._aborted    = False           # True once request_abort() was called (no more tasks are started)
+        self._started    = None            # time.time() the graph was started
+        self._future     = TaskFuture( on_cancel=self.request_abort )
+
+    def add_task(self, name, callback, signals=None, depends=None, threadpool=None, priority=None, *args, **kwds ):
+        """
+        Adds a task to the graph.
+
+        Args:
+            name (str):  ``(ex: 'projects' )``
+                Unique name of the task.
+
+            callback (callable):
+                The task's callback (see :py:obj:`qconcurrency.threading_.ThreadedTask` ).
+
+            signals (dict, optional):
+                The task's signals (see :py:obj:`qconcurrency.threading_.ThreadedTask` ).
+
+            depends (list, dict, optional):
+                Names of the tasks that must succeed before this task starts.
+                Their results are passed to `callback` as keyword-arguments
+                named after the task. A dictionary maps each dependency to the name of
+                the keyword-argument it is passed as (or ``None`` to not pass it's result).
+
+                .. code-block:: python
+
+                    depends = ['user', 'settings']                    # callback( user=..., settings=... )
+                    depends = {'user': 'owner', 'settings': None}     # callback( owner=... )
+
+            threadpool (QtCore.QThreadPool, str, optional):
+                Threadpool (or registered threadpool name) this task runs in.
+                By default, the graph's threadpool.
+
+            priority (int, optional):
+                A :py:obj:`qconcurrency.threading_.TaskPriority` this task is queued with.
+
+            *args/**kwds:
+                Any additional arguments/keyword-arguments are passed to `callback` .
+
+        Returns:
+            :py:obj:`qconcurrency.threading_.ThreadedTask` (not yet started, connect to it's signals).
+        """
+        if self._started is not None:
+            raise RuntimeError('Cannot add tasks to a TaskGraph that has already been started')
+        if name in self._nodes:
+            raise RuntimeError('TaskGraph already has a task named "%s"' % name)
+
+        if depends is None:
+            depends = OrderedDict()
+        elif isinstance( depends, MutableMapping ):
+            depends = OrderedDict( depends )
+        elif isinstance( depends, six.string_types ):
+            raise TypeError('Expected list/dict for `depends` argument, received: %s' % repr(depends))
+        else:
+            depends = OrderedDict([ (dependency, dependency) for dependency in depends ])
+
+        node = _GraphNode( name, depends, threadpool, priority )
+        node.task = ThreadedTask(
+            functools.partial( _run_node, node, callback ),
+            signals,
+            *args, **kwds
+        )
+        node.task._metrics_name = metrics.callback_name( callback )
+        self._nodes[ name ] = node
+        return node.task
+
+    def task(self, name ):
+        """
+        Returns the :py:obj:`qconcurrency.threading_.ThreadedTask` named `name` .
+        """
+        if name not in self._nodes:
+            raise RuntimeError(
+                'TaskGraph has no task named "%s". Available tasks: %s' % ( name, repr(list(self._nodes.keys())) )
+            )
+        return self._nodes[ name ].task
+
+    def start(self):
+        """
+        Validates the graph, and starts every task without dependencies.
+
+        Raises:
+            RuntimeError: if a task depends on an unknown task, or the dependencies form a cycle.
+
+        Returns:
+            :py:obj:`qconcurrency.futures_.TaskFuture` (see :py:meth:`future` )
+        """
+        if self._started is not None:
+            raise RuntimeError('TaskGraph has already been started')
+        self._validate()
+
+        self._started   = time.time()
+        self._remaining = len(self._nodes)
+        if not self._nodes:
+            self._future._set_result( {} )
+            self.finished.emit( {} )
+            return self._future
+
+        for node in self._nodes.values():
+            for dependency in node.depends:
+                self._nodes[ dependency ].dependents.append( node.name )
+            node.task.future().add_done_callback( functools.partial( self._handle_task_done, node.name ) )
+
+        for node in list(self._nodes.values()):
+            if not node.depends:
+                self._submit( node )
+
+        return self._future
+
+    def future(self):
+        """
+        Returns a :py:obj:`qconcurrency.futures_.TaskFuture` that resolves with
+        ``{ name : result }`` once every task has succeeded.
+        """
+        return self._future
+
+    def results(self):
+        """
+        Returns ``{ name : result }`` of the tasks that have succeeded so far.
+        """
+        return dict(self._results)
+
+    def request_abort(self):
+        """
+        Aborts every task. Tasks that have not started are cancelled,
+        running tasks have an abort requested.
+        """
+        self._aborted = True
+        for node in self._nodes.values():
+            if node.submitted is None:
+                node.task.future()._set_cancelled()
+            else:
+                node.task.future().cancel()
+
+    def timings(self):
+        """
+        Returns when each task was submitted/started/finished, in seconds
+        since the graph was started (``None`` if it has not happened).
+
+        .. code-block:: python
+
+            {
+                'user':     {'submitted': 0.0,   'started': 0.001, 'finished': 0.250, 'queue_wait': 0.001, 'run_time': 0.249},
+                'projects': {'submitted': 0.251, 'started': 0.251, 'finished': 0.900, 'queue_wait': 0.0,   'run_time': 0.649},
+                ...
+            }
+        """
+        timings = {}
+        for node in self._nodes.values():
+            submitted = self._relative( node.submitted )
+            started   = self._relative( node.run_started )
+            finished  = self._relative( node.run_finished )
+            timings[ node.name ] = {
+                'submitted':  submitted,
+                'started':    started,
+                'finished':   finished,
+                'queue_wait': ( started - submitted ) if started is not None else None,
+                'run_time':   ( finished - started ) if finished is not None else None,
+            }
+        return timings
+
+    def critical_path(self):
+        """
+        Returns the chain of tasks that determined how long the graph took to run:
+        starting from the last task to finish, each task's dependency that finished last
+        (the one it was waiting on). Shortening any other task would not finish the graph sooner.
+
+        Returns:
+
+            .. code-block:: python
+
+                {
+                    'path':     ['user', 'projects', 'window'],  # first to last
+                    'duration': 1.25,                            # seconds from start until the last task finished
+                    'tasks':    { 'user': {...}, ... },          # timings() of the tasks in `path`
+                }
+        """
+        timings  = self.timings()
+        finished = [ name for name in self._nodes if timings[ name ]['finished'] is not None ]
+        if not finished:
+            return { 'path': [], 'duration': 0.0, 'tasks': {} }
+
+        name = max( finished, key=lambda name: timings[ name ]['finished'] )
+        path = [ name ]
+        while True:
+            depends = [ dependency for dependency in self._nodes[ name ].depends if timings[ dependency ]['finished'] is not None ]
+            if not depends:
+                break
+            name = max( depends, key=lambda dependency: timings[ dependency ]['finished'] )
+            path.insert( 0, name )
+
+        return {
+            'path':     path,
+            'duration': timings[ path[-1] ]['finished'],
+            'tasks':    dict([ (name, timings[ name ]) for name in path ]),
+        }
+
+    def _relative(self, timestamp ):
+        if timestamp is None  or  self._started is None:
+            return None
+        return timestamp - self._started
+
+    def _validate(self):
+        """
+        Raises a :py:obj:`RuntimeError` if a task depends on an unknown task,
+        or if the dependencies form a cycle.
+        """
+        for node in self._nodes.values():
+            for dependency in node.depends:
+                if dependency not in self._nodes:
+                    raise RuntimeError(
+                        'Task "%s" depends on unknown task "%s"' % ( node.name, dependency )
+                    )
+
+        visited = {}   # { name : 'visiting'/'visited' }
+        for name in self._nodes:
+            if name in visited:
+                continue
+
+            # iterative depth-first search, `stack` holds (name, iter(dependencies))
+            stack = [ (name, iter(self._nodes[ name ].depends)) ]
+            visited[ name ] = 'visiting'
+            while stack:
+                (current, dependencies) = stack[-1]
+                for dependency in dependencies:
+                    if visited.get( dependency ) == 'visiting':
+                        cycle = [ item[0] for item in stack ]
+                        cycle = cycle[ cycle.index( dependency ): ] + [ dependency ]
+                        raise RuntimeError( 'TaskGraph dependencies form a cycle: %s' % ' -> '.join( cycle ) )
+                    if dependency not in visited:
+                        visited[ dependency ] = 'visiting'
+                        stack.append( (dependency, iter(self._nodes[ dependency ].depends)) )
+                        break
+                else:
+                    visited[ current ] = 'visited'
+                    stack.pop()
+
+    def _submit(self, node ):
+        """
+        Passes `node` it's dependencies' results, and starts it.
+        """
+        for (dependency, kwarg) in node.depends.items():
+            if kwarg:
+                node.task._kwds[ kwarg ] = self._results[ dependency ]
+
+        node.submitted = time.time()
+        node.task.start(
+            threadpool = threadpools.resolve_threadpool( node.threadpool or self._threadpool ),
+            priority   = node.priority,
+        )
+
+    def _handle_task_done(self, name, future ):
+        """
+        Starts the dependents of a task that succeeded, or cancels the dependents
+        of a task that did not (run in the UI thread).
+        """
+        node = self._nodes[ name ]
+        self._remaining -= 1
+
+        if future._succeeded():
+            self._results[ name ] = future.result()
+
+            # (a task may succeed after the graph failed, or was aborted)
+            for dependent in node.dependents:
+                if self._failed is not None  or  self._aborted:
+                    break
+                dependent = self._nodes[ dependent ]
+                if dependent.submitted is not None  or  dependent.task.future().done():
+                    continue
+                if all([ dependency in self._results for dependency in dependent.depends ]):
+                    self._submit( dependent )
+        else:
+            if self._failed is None:
+                self._failed = future
+            if future.cancelled():
+                logger.debug('TaskGraph task "%s" was cancelled, cancelling it\'s dependents' % name)
+            else:
+                logger.debug('TaskGraph task "%s" raised, cancelling it\'s dependents' % name)
+
+            # cancelled dependents cancel their own dependents, once their futures are done
+            for dependent in node.dependents:
+                if self._nodes[ dependent ].submitted is None:
+                    self._nodes[ dependent ].task.future()._set_cancelled()
+
+            if self._fail_fast  and  not future.cancelled():
+                self.request_abort()
+
+        if self._remaining:
+            return
+
+        if self._failed is None:
+            self._future._set_result( dict(self._results) )
+            self.finished.emit( dict(self._results) )
+        else:
+            self._future._copy_state( self._failed )
+            self.exception.emit()
+
+
+
+class _GraphNode( object ):
+    """
+    A task in a :py:obj:`TaskGraph` , and it's timings.
+    """
+    def __init__(self, name, depends, threadpool, priority ):
+        self.name       = name
+        self.depends    = depends   # OrderedDict( (dependency-name, keyword-argument or None), ... )
+        self.dependents = []        # names of tasks that depend on this one
+        self.threadpool = threadpool
+        self.priority   = priority
+        self.task       = None      # ThreadedTask
+
+        # time.time()
+        self.submitted    = None
+        self.run_started  = None
+        self.run_finished = None
+
+
+
+def _run_node( node, callback, *args, **kwds ):
+    """
+    Runs a :py:obj:`TaskGraph` task's callback (within a thread), recording when it ran.
+    """
+    node.run_started = time.time()
+    try:
+        return callback( *args, **kwds )
+    finally:
+        node.run_finished = time.time()
+
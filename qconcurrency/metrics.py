@@ -0,0 +1,282 @@
+#!/usr/bin/env python
+"""
+Name :          qconcurrency.metrics.py
+Created :       Oct 17, 2026
+Author :        Will Pittman
+Contact :       willjpittman@gmail.com
+________________________________________________________________________________
+Description :   A low-overhead registry of counters and histograms (per callback-name),
+                recorded by :py:obj:`qconcurrency.threading_.ThreadedTask` and
+                :py:obj:`qconcurrency.threading_.SoloThreadedTask` (queue-wait,
+                run-time, abort-latency, ...).
+________________________________________________________________________________
+"""
+#builtin
+from __future__    import unicode_literals
+from __future__    import absolute_import
+from __future__    import division
+from __future__    import print_function
+import bisect
+import functools
+import json
+import logging
+import threading
+#package
+#external
+import six
+#internal
+
+logger = logging.getLogger(__name__)
+loc    = locals
+
+__all__ = [
+    'Histogram',
+    'MetricsRegistry',
+    'callback_name',
+    'get_registry',
+]
+
+
+# upper-bounds (seconds) of histogram buckets
+_default_buckets = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+_registry = None
+
+
+def get_registry():
+    """
+    Returns the :py:obj:`MetricsRegistry` that tasks record their metrics in.
+
+    Example:
+
+        .. code-block:: python
+
+            # the 5x callbacks that kept their threads busiest
+            for (name, hist) in get_registry().top( 'run_time', n=5 ):
+                print( '%s: %s runs, p95 %.3fs' % (name, hist['count'], hist['p95']) )
+    """
+    global _registry
+    if _registry is None:
+        _registry = MetricsRegistry()
+    return _registry
+
+
+def callback_name( callback ):
+    """
+    Returns a readable name for `callback` , used to group it's metrics
+    ( ex: ``'myapp.widgets.ThumbnailView._load_thumbnails'`` ).
+    """
+    while isinstance( callback, functools.partial ):
+        callback = callback.func
+
+    name = getattr( callback, '__qualname__', None )
+    if name is None:
+        name = getattr( callback, '__name__', None )
+        im_class = getattr( callback, 'im_class', None )   # python-2 bound methods
+        if name is not None  and  im_class is not None:
+            name = '%s.%s' % (im_class.__name__, name)
+    if name is None:
+        name = type(callback).__name__
+
+    module = getattr( callback, '__module__', None )
+    if module:
+        return '%s.%s' % (module, name)
+    return name
+
+
+
+class Histogram( object ):
+    """
+    Counts observations (seconds) into fixed buckets, keeping their count/total/min/max.
+    Percentiles are estimated from the buckets.
+    """
+    def __init__(self, buckets=None ):
+        if buckets is None:
+            buckets = _default_buckets
+
+        self._buckets = tuple(buckets)
+        self._counts  = [0] * (len(self._buckets) + 1)   # last bucket holds values above all bounds
+        self.count    = 0
+        self.total    = 0.0
+        self.min      = None
+        self.max      = None
+
+    def observe(self, value ):
+        self._counts[ bisect.bisect_left( self._buckets, value ) ] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None  or  value < self.min:
+            self.min = value
+        if self.max is None  or  value > self.max:
+            self.max = value
+
+    def percentile(self, q ):
+        """
+        Returns an estimate of the `q` th percentile ( ``0 <= q <= 100`` ),
+        interpolated within the bucket it falls in.
+        """
+        if not self.count:
+            return None
+
+        rank  = q / 100.0 * self.count
+        seen  = 0
+        lower = 0.0
+        for (index, count) in enumerate(self._counts):
+            if index < len(self._buckets):
+                upper = self._buckets[ index ]
+            else:
+                upper = self.max
+
+            if count  and  seen + count >= rank:
+                value = lower + (upper - lower) * ( (rank - seen) / count )
+                return min( max( value, self.min ), self.max )
+
+            seen += count
+            lower = upper
+
+        return self.max
+
+    def as_dict(self):
+        return {
+            'count':   self.count,
+            'total':   self.total,
+            'mean':    ( self.total / self.count ) if self.count else None,
+            'min':     self.min,
+            'max':     self.max,
+            'p50':     self.percentile(50),
+            'p95':     self.percentile(95),
+            'p99':     self.percentile(99),
+            'buckets': list(zip( list(self._buckets) + ['+inf'], self._counts )),
+        }
+
+
+
+class MetricsRegistry( object ):
+    """
+    Thread-safe counters/histograms, keyed by ``(metric, name)``
+    (where `name` is normally a :py:func:`callback_name` ).
+
+    Metrics recorded by tasks:
+
+        ============== ========= ====================================================================
+        metric         type      description
+        ============== ========= ====================================================================
+        queue_wait     histogram seconds between ``ThreadedTask.start()`` and the task starting to run
+        run_time       histogram seconds the callback ran for
+        mutex_wait     histogram seconds a SoloThreadedTask thread waited for the previous thread to exit
+        abort_latency  histogram seconds between ``request_abort()`` and the running callback exiting
+        returned       counter   callbacks that returned
+        exception      counter   callbacks that raised an exception
+        cancelled      counter   callbacks that exited from a ``UserCancelledOperation``
+        abort_requests counter   calls to ``request_abort()``
+        ============== ========= ====================================================================
+
+    Set :py:attr:`enabled` to ``False`` to stop recording.
+    """
+    def __init__(self, buckets=None ):
+        self.enabled     = True
+        self._buckets    = buckets
+        self._lock       = threading.Lock()
+        self._counters   = {}   # { metric : { name : int } }
+        self._histograms = {}   # { metric : { name : Histogram } }
+
+    def incr(self, metric, name, n=1 ):
+        """
+        Adds `n` to the counter `metric` for `name` .
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            counters = self._counters.setdefault( metric, {} )
+            counters[ name ] = counters.get( name, 0 ) + n
+
+    def observe(self, metric, name, value ):
+        """
+        Records `value` (seconds) in the histogram `metric` for `name` .
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            histograms = self._histograms.setdefault( metric, {} )
+            histogram  = histograms.get( name )
+            if histogram is None:
+                histogram = histograms[ name ] = Histogram( self._buckets )
+            histogram.observe( value )
+
+    def counter(self, metric, name ):
+        """
+        Returns the value of the counter `metric` for `name` (``0`` if never incremented).
+        """
+        with self._lock:
+            return self._counters.get( metric, {} ).get( name, 0 )
+
+    def histogram(self, metric, name ):
+        """
+        Returns the histogram `metric` for `name` as a dict
+        (see :py:meth:`Histogram.as_dict` ), or ``None`` if nothing was recorded.
+        """
+        with self._lock:
+            histogram = self._histograms.get( metric, {} ).get( name )
+            if histogram is None:
+                return None
+            return histogram.as_dict()
+
+    def top(self, metric, n=10, key='total' ):
+        """
+        Returns the `n` names with the highest `key` for the histogram `metric` .
+
+        Args:
+            metric (str):
+                A histogram metric ( ex: ``'run_time'`` ).
+
+            n (int, optional):
+                Number of names to return.
+
+            key (str, optional):
+                Key of :py:meth:`Histogram.as_dict` to sort by ( ex: ``'total'``, ``'p95'``, ``'max'`` ).
+
+        Returns:
+            ``[ (name, histogram_dict), ... ]`` highest first.
+        """
+        with self._lock:
+            items = [ (name, hist.as_dict()) for (name, hist) in self._histograms.get( metric, {} ).items() ]
+        items.sort( key=lambda item: item[1][ key ] or 0, reverse=True )
+        return items[:n]
+
+    def snapshot(self):
+        """
+        Returns all recorded metrics.
+
+        .. code-block:: python
+
+            {
+                'counters':   { 'returned': { 'myapp.load_users': 12, ... }, ... },
+                'histograms': { 'run_time': { 'myapp.load_users': {'count': 12, 'p95': 0.4, ...}, ... }, ... },
+            }
+        """
+        with self._lock:
+            return {
+                'counters':   dict([ (metric, dict(counters)) for (metric, counters) in self._counters.items() ]),
+                'histograms': dict([
+                    (metric, dict([ (name, hist.as_dict()) for (name, hist) in histograms.items() ]))
+                    for (metric, histograms) in self._histograms.items()
+                ]),
+            }
+
+    def to_json(self, indent=None ):
+        """
+        Returns :py:meth:`snapshot` as a JSON string.
+        """
+        return json.dumps( self.snapshot(), indent=indent, sort_keys=True )
+
+    def reset(self):
+        """
+        Discards all recorded metrics.
+        """
+        with self._lock:
+            self._counters   = {}
+            self._histograms = {}
+
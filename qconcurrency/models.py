@@ -15,6 +15,7 @@ from __future__          import absolute_import
 from __future__          import division
 from __future__          import print_function
 from collections         import Iterable, MutableMapping
+import contextlib
 #external
 from Qt                  import QtGui, QtCore
 import six
@@ -23,6 +24,8 @@ import six
 __all__ = [
     'DictModel',
     'DictModelRow',
+    'ColumnarDictModel',
+    'ColumnarDictModelRow',
 ]
 
 
@@ -36,169 +39,22 @@ __all__ = [
 #!TODO: validation based on `hierarchy`, preventing nesting below defined
 #!TODO: validation of column-names when setting columnvals
 
-class DictModel( QtGui.QStandardItemModel ):
+class _DictModelColumns( object ):
     """
-    Customized python interface for :py:obj:`QtGui.QStandardItemModel` so that it's
-    values, and nested tables can be accessed like a python dictionary.
-
-    Example:
-
-
-        Simple Example:
-
-
-        .. code-block:: bash
-
-            | _id | firstname | lastname  | username |
-            |========================================|
-            | 101 | luke      | skywalker | lukes    |
-            | 102 | leia      | skywalker | leias    |
-            |========================================|
-
-        .. code-block:: python
-
-            model = DictModel( columns=('firstname','lastname','username') )
-
-            model.add_row( 101, columnvals = {
-                    'firstname':'luke'      ,
-                    'lastname' :'skywalker' ,
-                    'username' :'lukes'     ,
-                }
-            )
-
-            userId = 101
-            print( model[userId].column('firstname') )
-            >>> 'luke'
-
-            print( model[userId].columnvals() )
-            >>> {'_id':101, 'firstname':'luke', 'lastname':'skywalker', 'username':'lukes'}
-
-
-
-        Nested-Table Example:
-
-        .. code-block:: bash
-
-            |=============|
-            | _id | class |  # level: 'jedi_class'
-            |=============|
-            | 101 | sith  |
-            |  |===========================================|
-            |  | _id | firstname  | lastname   | username  | # level: 'user'
-            |  |===========================================|
-            |  | 56  | Darth      | Vader      | anakins   |
-            |  | 57  | Darth      | Maul       | darthm    |
-            |  |===========================================|
-            |             |
-            | 102 | jedi  |
-            |  |===========================================|
-            |  | _id | firstname  | lastname   | username  | # level: 'user'
-            |  |===========================================|
-            |  | 58  | Mace       | Windu      | macew     |
-            |  | 59  | Ben        | Kenobi     | benk      |
-            |  |===========================================|
-            |             |
-            |=============|
-
-        .. code-block:: python
-
-            model = DictModel(
-                    hierarchy = ('jedi_class','user'),
-                    columns   = {
-                        'jedi_class':  ('class'),
-                        'user':        ('firstname','lastname','username')
-                    },
-                )
-
-            sith_row = model.add_row( 101, {'class':'sith'} )
-            jedi_row = model.add_row( 102, {'class':'jedi'} )
-            sith_row.add_child( 56, {'firstname':'Darth', 'lastname':'Vader', 'username':'anakins'} )
-            sith_row.add_child( 57, {'firstname':'Darth', 'lastname':'Maul',  'username':'darthm'} )
-
-            jediclassId = 101
-            userId      =  56
-            print( model[jediclassId][userId].column('username') )
-            >>> 'anakins'
-
-            print( model[jediclassId].level() )
-            >>> 'jedi_class'
-
-            print( model[jediclassId][userId].level() )
-            >>> 'user'
-
-
-        :py:obj:`qconcurrency.models.DictModel`  column datatypes
-
-        .. code-block:: bash
-
-            |===============================================|
-            | _id          | columnA        | columnB       |
-            |===============================================|
-            | DictModelRow |  QStandardItem | QStandardItem |
-            |   |===============================================|
-            |   | _id          | columnA        | columnB       |
-            |   |===============================================|
-            |   | DictModelRow |  QStandardItem | QStandardItem |
-            |   |===============================================|
-            |                                               |
-            |===============================================|
-
+    Column/hierarchy handling shared by :py:obj:`qconcurrency.models.DictModel`
+    and :py:obj:`qconcurrency.models.ColumnarDictModel` .
     """
-    def __init__(self, columns, hierarchy=None ):
+    def _init_columns(self, columns, hierarchy=None ):
         """
-
-        Args:
-            columns (list, dict):
-                Defines the available columns for the table/tree this :py:obj:`QtGui.QStandardItemModel`
-                (the `key`, generally referring to the databaseId, is always the first column)
-
-                If `hierarchy` argument is set, you have two options:
-
-                    * This can be a list of column-names, that will be
-                      created in all levels of nested table.
-
-                    * This can be a dictionary in the form of ``{'level_name':(column,column,column,...), ...}``
-                      that indicates specific-columns for each level of table-nesting.
-
-                If `hierarchy` is not set, this must be a list of column-names,
-                and they will be applicable to any level of table-nesting.
-
-                .. code-block:: python
-
-                    {
-                        'jedi_class': ('class',),
-                        'user':       ('firstname','lastname'),
-                    }
-
-
-            hierarchy (dict, optional):  ``(ex:  ('department_type','department')  )``
-                A list that labels what type of data is stored at each
-                level of table-nesting in this :py:obj:`qconcurrency.models.DictModel`. Each item
-                indicates another level of nesting.
-
-                .. code-block:: python
-
-                    hierarchy = ('jedi_class','user'),
-
+        Validates/stores the `columns` and `hierarchy` arguments.
+        See :py:meth:`qconcurrency.models.DictModel.__init__`
         """
-        QtGui.QStandardItemModel.__init__(self)
 
         # Attributes
         self._defaultcolumnvals = {}      # all columns for new rows are initialized as ``None``
         self._columns           = None    # either a list of columns, or a dict of hierarchy-keys and their columns
         self._hierarchy         = None    # either ``None``, or a list, indicating the level of each
 
-        self._data              = {}      # unfortunately, if an item has a dict interface
-                                          # and has assignments within a context-manager,
-                                          # IPython tries to save/restore the values when it
-                                          # is destroyed.
-                                          #
-                                          # This means we need a real-dict (or something
-                                          # to fake it) in order to cleanly use
-                                          # within IPython. So we are now  keeping
-                                          # 2x references to the data.
-
-
         # Validation
         # ==========
 
@@ -217,7 +73,7 @@ class DictModel( QtGui.QStandardItemModel ):
 
             # so that hierarchy can always be handled the same,
             # create `columns` as a dict, if a list was passed
-            elif hasattr( columns, Iterable ):
+            elif isinstance( columns, Iterable ):
                 new_columns = {}
                 for level in hierarchy:
                     new_columns[ level ] = columns[:]
@@ -251,43 +107,6 @@ class DictModel( QtGui.QStandardItemModel ):
         self._columns   = columns
         self._hierarchy = hierarchy
 
-    def add_row(self, key, columnvals=None ):
-        """
-        Adds a new (toplevel) row to this DictModel, henceforth referred to by the key `key`.
-
-        Args:
-            key (obj):
-                Key is the id you will use to refer to this object.
-                Generally it will be a databaseId. This object must be
-                hashable.
-
-            columnvals (dict, optional):
-                Optionally, you may provide a dictionary of column-val assignments
-                (appropriate to this item's table-level). All columns, not
-                assigned in `columnvals` will be initialized with a value of ''.
-
-
-        Returns:
-            :py:obj:`qconcurrency.models.DictModelRow`
-        """
-
-        set_columnvals = self._defaultcolumnvals.copy()
-        if self._hierarchy:
-            set_columnvals = set_columnvals[ self._hierarchy[0] ]
-
-
-        if columnvals:
-            set_columnvals.update( columnvals )
-
-        item = DictModelRow( parent=self, key=key, columnvals=set_columnvals)
-
-        # NOTE: this step should not be necessary,
-        #       but it seems to be...
-        self.setItem( self.rowCount()-1, 0, item )
-        self._data[ str(key) ] = item
-
-        return item
-
     def columns(self, level=None ):
         """
         Returns the columns for a particular level of nested-table
@@ -431,27 +250,6 @@ class DictModel( QtGui.QStandardItemModel ):
         """
         return self._hierarchy
 
-    def _get_rowitem(self, key):
-        """
-        Returns the item in the first column of this :py:obj:`QtGui.QStandardItemModel`
-        for the row with the key indicated by `key`.
-
-        Args:
-            key (obj):
-                A key assigned to a row within this Model. Generally,
-                this would be a database-Id.
-
-        Returns:
-            QtGui.QStandardItem
-        """
-        for i in range(self.rowCount()):
-            if self.item(i,0).text() == str(key):
-                return self.item(i,0)
-
-        raise KeyError(
-            'no row has the key "%s"' % key
-        )
-
     def _get_colindex(self, level, column):
         """
         Returns the column-index for a column within this :py:obj:`QtGui.QStandardItemModel`
@@ -502,439 +300,1582 @@ class DictModel( QtGui.QStandardItemModel ):
             )
         )
 
-    def keys(self):
-        """
-        Returns list containing keys for every
-        row that has been added to this :py:obj:`qconcurrency.models.DictModel` s root
 
-        Returns:
 
-            .. code-block:: python
+class DictModel( _DictModelColumns, QtGui.QStandardItemModel ):
+    """
+    Customized python interface for :py:obj:`QtGui.QStandardItemModel` so that it's
+    values, and nested tables can be accessed like a python dictionary.
 
-                [ 1, 2, 3, 5, 8, ... ]
+    Example:
 
-        """
-        return self._data.keys()
 
+        Simple Example:
 
-    def removeRow(self, key):
-        self._data.pop( str(key) )
 
-        # row is gone. that is all we care about
-        try:
-            modelitem = self._get_rowitem( key )
-            return QtGui.QStandardItemModel.removeRow( self, modelitem.row() )
-        except( KeyError ):
-            return
+        .. code-block:: bash
 
-    def takeRow(self, key):
-        return self.removeRow( str(key) )
+            | _id | firstname | lastname  | username |
+            |========================================|
+            | 101 | luke      | skywalker | lukes    |
+            | 102 | leia      | skywalker | leias    |
+            |========================================|
 
+        .. code-block:: python
 
-    def __getitem__(self, key):
-        """
-        Returns a :py:obj:`qconcurrency.models.DictModelRow` object representing
-        a row from this :py:obj:`qconcurrency.models.DictModel`.
-        """
-        return self._data[str(key)]
+            model = DictModel( columns=('firstname','lastname','username') )
 
-    def __delitem__(self, key):
-        """
-        Wraps :py:meth:`removeRow`
-        """
-        self.removeRow( key )
+            model.add_row( 101, columnvals = {
+                    'firstname':'luke'      ,
+                    'lastname' :'skywalker' ,
+                    'username' :'lukes'     ,
+                }
+            )
+
+            userId = 101
+            print( model[userId].column('firstname') )
+            >>> 'luke'
+
+            print( model[userId].columnvals() )
+            >>> {'_id':101, 'firstname':'luke', 'lastname':'skywalker', 'username':'lukes'}
+
+
+
+        Nested-Table Example:
+
+        .. code-block:: bash
+
+            |=============|
+            | _id | class |  # level: 'jedi_class'
+            |=============|
+            | 101 | sith  |
+            |  |===========================================|
+            |  | _id | firstname  | lastname   | username  | # level: 'user'
+            |  |===========================================|
+            |  | 56  | Darth      | Vader      | anakins   |
+            |  | 57  | Darth      | Maul       | darthm    |
+            |  |===========================================|
+            |             |
+            | 102 | jedi  |
+            |  |===========================================|
+            |  | _id | firstname  | lastname   | username  | # level: 'user'
+            |  |===========================================|
+            |  | 58  | Mace       | Windu      | macew     |
+            |  | 59  | Ben        | Kenobi     | benk      |
+            |  |===========================================|
+            |             |
+            |=============|
+
+        .. code-block:: python
+
+            model = DictModel(
+                    hierarchy = ('jedi_class','user'),
+                    columns   = {
+                        'jedi_class':  ('class'),
+                        'user':        ('firstname','lastname','username')
+                    },
+                )
+
+            sith_row = model.add_row( 101, {'class':'sith'} )
+            jedi_row = model.add_row( 102, {'class':'jedi'} )
+            sith_row.add_child( 56, {'firstname':'Darth', 'lastname':'Vader', 'username':'anakins'} )
+            sith_row.add_child( 57, {'firstname':'Darth', 'lastname':'Maul',  'username':'darthm'} )
+
+            jediclassId = 101
+            userId      =  56
+            print( model[jediclassId][userId].column('username') )
+            >>> 'anakins'
+
+            print( model[jediclassId].level() )
+            >>> 'jedi_class'
+
+            print( model[jediclassId][userId].level() )
+            >>> 'user'
+
+
+        :py:obj:`qconcurrency.models.DictModel`  column datatypes
+
+        .. code-block:: bash
+
+            |===============================================|
+            | _id          | columnA        | columnB       |
+            |===============================================|
+            | DictModelRow |  QStandardItem | QStandardItem |
+            |   |===============================================|
+            |   | _id          | columnA        | columnB       |
+            |   |===============================================|
+            |   | DictModelRow |  QStandardItem | QStandardItem |
+            |   |===============================================|
+            |                                               |
+            |===============================================|
+
+    """
+    bulk_insert_started  = QtCore.Signal()  # before rows are added to a non-empty model by :py:meth:`add_rows` , :py:meth:`DictModelRow.add_children`
+    bulk_insert_finished = QtCore.Signal()  # once all of those rows have been added (each row still emits `rowsInserted` )
+
+    def __init__(self, columns, hierarchy=None ):
+        """
+
+        Args:
+            columns (list, dict):
+                Defines the available columns for the table/tree this :py:obj:`QtGui.QStandardItemModel`
+                (the `key`, generally referring to the databaseId, is always the first column)
+
+                If `hierarchy` argument is set, you have two options:
+
+                    * This can be a list of column-names, that will be
+                      created in all levels of nested table.
+
+                    * This can be a dictionary in the form of ``{'level_name':(column,column,column,...), ...}``
+                      that indicates specific-columns for each level of table-nesting.
+
+                If `hierarchy` is not set, this must be a list of column-names,
+                and they will be applicable to any level of table-nesting.
+
+                .. code-block:: python
+
+                    {
+                        'jedi_class': ('class',),
+                        'user':       ('firstname','lastname'),
+                    }
+
+
+            hierarchy (dict, optional):  ``(ex:  ('department_type','department')  )``
+                A list that labels what type of data is stored at each
+                level of table-nesting in this :py:obj:`qconcurrency.models.DictModel`. Each item
+                indicates another level of nesting.
+
+                .. code-block:: python
+
+                    hierarchy = ('jedi_class','user'),
+
+        """
+        QtGui.QStandardItemModel.__init__(self)
+
+        # Attributes
+        self._bulk_depth        = 0       # number of nested :py:meth:`_bulk_insert` contexts
+
+        self._data              = {}      # unfortunately, if an item has a dict interface
+                                          # and has assignments within a context-manager,
+                                          # IPython tries to save/restore the values when it
+                                          # is destroyed.
+                                          #
+                                          # This means we need a real-dict (or something
+                                          # to fake it) in order to cleanly use
+                                          # within IPython. So we are now  keeping
+                                          # 2x references to the data.
+                                          #
+                                          # It also serves as the index of
+                                          # toplevel-rows { str(key) : DictModelRow }
+                                          # (see :py:meth:`_keyindex` )
+
+
+        self._init_columns( columns, hierarchy )
+
+        # Connections (keep key-indexes in sync when rows are
+        # added/removed using the QStandardItemModel interface)
+        self.rowsInserted.connect( self._handle_rows_inserted )
+        self.rowsAboutToBeRemoved.connect( self._handle_rows_about_to_be_removed )
+
+    def add_row(self, key, columnvals=None ):
+        """
+        Adds a new (toplevel) row to this DictModel, henceforth referred to by the key `key`.
+
+        Args:
+            key (obj):
+                Key is the id you will use to refer to this object.
+                Generally it will be a databaseId. This object must be
+                hashable.
+
+            columnvals (dict, optional):
+                Optionally, you may provide a dictionary of column-val assignments
+                (appropriate to this item's table-level). All columns, not
+                assigned in `columnvals` will be initialized with a value of ''.
+
+
+        Returns:
+            :py:obj:`qconcurrency.models.DictModelRow`
+        """
+
+        set_columnvals = self._defaultcolumnvals.copy()
+        if self._hierarchy:
+            set_columnvals = set_columnvals[ self._hierarchy[0] ]
+
+
+        if columnvals:
+            set_columnvals.update( columnvals )
+
+        item = DictModelRow( parent=self, key=key, columnvals=set_columnvals)
+
+        # NOTE: this step should not be necessary,
+        #       but it seems to be...
+        self.setItem( self.rowCount()-1, 0, item )
+
+        return item
+
+    def add_rows(self, rows):
+        """
+        Adds several (toplevel) rows to this DictModel at once (optionally with
+        nested child-rows). Views/widgets are notified once per toplevel row
+        (or by a single model-reset, if the model is empty), instead of once per cell.
+
+        Example:
+
+            .. code-block:: python
+
+                model.add_rows([
+                    (101, {'class':'sith'}, [
+                        (56, {'firstname':'Darth', 'lastname':'Vader'}),
+                        (57, {'firstname':'Darth', 'lastname':'Maul'}),
+                    ]),
+                    (102, {'class':'jedi'}),
+                ])
+
+        Args:
+            rows (iterable):  ``(ex: [(key, columnvals), (key, columnvals, children), ...] )``
+                An iterable of ``(key, columnvals)`` or ``(key, columnvals, children)``
+                tuples, where `children` is another iterable in the same format
+                that will be added as child-rows. See :py:meth:`add_row` .
+
+        Returns:
+
+            .. code-block:: python
+
+                [ DictModelRow, DictModelRow, ... ]  # the added toplevel rows
+        """
+        with self._bulk_insert():
+            return self._add_rows( self, rows )
+
+    def _add_rows(self, parent, rows):
+        """
+        Adds `rows` to `parent`. See :py:meth:`add_rows` .
+
+        Each row (along with it's columnvals, and all of it's child-rows) is
+        built before it is added to `parent` , so views are notified of a single
+        row-insertion per toplevel row, instead of once per cell and child-row.
+
+        Args:
+            parent (DictModel, DictModelRow):
+                The model (toplevel rows), or the row that
+                `rows` will be added to.
+
+            rows (iterable):
+                See :py:meth:`add_rows`
+
+        Returns:
+
+            .. code-block:: python
+
+                [ DictModelRow, DictModelRow, ... ]
+        """
+        level   = self._child_level( parent )
+        columns = self.columns( level )
+
+        items = []
+        for row in rows:
+            if len(row) == 2:
+                (key, columnvals) = row
+                children          = None
+            elif len(row) == 3:
+                (key, columnvals, children) = row
+            else:
+                raise RuntimeError(
+                    'Expected rows in the format `(key, columnvals)` or `(key, columnvals, children)`. '
+                    'Received: %s' % repr(row)
+                )
+
+            item        = DictModelRow( parent=None, key=key )
+            item._level = level
+            if children:
+                self._add_rows( item, children )
+
+            set_columnvals = self.default_columnvals( level ).copy()
+            if columnvals:
+                set_columnvals.update( columnvals )
+
+            cells = [ item ]
+            for column in columns[1:]:
+                if set_columnvals.get( column ) is None:
+                    cells.append( QtGui.QStandardItem( '' ) )
+                else:
+                    cells.append( QtGui.QStandardItem( str(set_columnvals[ column ]) ) )
+
+            parent.insertRow( parent.rowCount(), cells )
+            parent._keyindex()[ str(key) ] = item
+            items.append( item )
+
+        return items
+
+    def _child_level(self, parent):
+        """
+        Returns the level of the rows that are children of `parent`.
+        See :py:meth:`qconcurrency.models.DictModelRow.level`
+
+        Args:
+            parent (DictModel, DictModelRow):
+                The model (toplevel rows), or a row.
+        """
+        if isinstance( parent, QtGui.QStandardItemModel ):
+            if self.hierarchy():
+                return self.hierarchy()[0]
+            return 0
+
+        if self.hierarchy():
+            return self.hierarchy()[ self.hierarchy().index( parent.level() ) +1 ]
+        return parent.level() +1
+
+    @contextlib.contextmanager
+    def _bulk_insert(self):
+        """
+        Context-manager wrapping :py:meth:`_add_rows` . When this model
+        is empty, views/widgets are notified by a single model-reset
+        (begun before any rows are added). Otherwise they are notified of
+        each inserted row, preserving their current-index, selection, etc.
+        and the rows are wrapped in :py:attr:`bulk_insert_started` / :py:attr:`bulk_insert_finished`
+        so that widgets that rebuild themselves can do so once.
+        (nested uses only notify once)
+        """
+        self._bulk_depth += 1
+        outermost = ( self._bulk_depth == 1 )
+        reset     = ( outermost  and  self.rowCount() == 0 )
+        if reset:
+            self.beginResetModel()
+        elif outermost:
+            self.bulk_insert_started.emit()
+
+        try:
+            yield
+        finally:
+            self._bulk_depth -= 1
+            if reset:
+                self.endResetModel()
+            elif outermost:
+                self.bulk_insert_finished.emit()
+
+    def _get_rowitem(self, key):
+        """
+        Returns the item in the first column of this :py:obj:`QtGui.QStandardItemModel`
+        for the row with the key indicated by `key`.
+
+        Args:
+            key (obj):
+                A key assigned to a row within this Model. Generally,
+                this would be a database-Id.
+
+        Returns:
+            QtGui.QStandardItem
+        """
+        if str(key) in self._data:
+            return self._data[ str(key) ]
+
+        raise KeyError(
+            'no row has the key "%s"' % key
+        )
+
+    def _keyindex(self):
+        """
+        Returns the dictionary indexing the toplevel rows of
+        this :py:obj:`qconcurrency.models.DictModel` by their key.
+
+        Returns:
+
+            .. code-block:: python
+
+                { '101': DictModelRow, '102': DictModelRow, ... }
+        """
+        return self._data
+
+    def _get_keyindex_owner(self, parent):
+        """
+        Returns the :py:obj:`DictModel` or :py:obj:`DictModelRow` whose
+        children are referred to by the :py:obj:`QtCore.QModelIndex` `parent`.
+        (``None`` if `parent` is not a :py:obj:`DictModelRow` )
+        """
+        if not parent.isValid():
+            return self
+
+        owner = self.itemFromIndex( parent )
+        if isinstance( owner, DictModelRow ):
+            return owner
+
+    def _handle_rows_inserted(self, parent, first, last):
+        """
+        Adds :py:obj:`DictModelRow` s inserted using the :py:obj:`QtGui.QStandardItemModel`
+        interface (ex: ``appendRow()`` ) to their parent's key-index.
+        """
+        owner = self._get_keyindex_owner( parent )
+        if owner is None:
+            return
+
+        for row in range( first, last+1 ):
+            if owner is self:
+                item = self.item( row, 0 )
+            else:
+                item = owner.child( row, 0 )
+
+            if isinstance( item, DictModelRow ):
+                owner._keyindex()[ str(item.id()) ] = item
+
+    def _handle_rows_about_to_be_removed(self, parent, first, last):
+        """
+        Removes :py:obj:`DictModelRow` s from their parent's key-index
+        before they are removed from the model (however they are removed).
+        """
+        owner = self._get_keyindex_owner( parent )
+        if owner is None:
+            return
+
+        keyindex = owner._keyindex()
+        for row in range( first, last+1 ):
+            if owner is self:
+                item = self.item( row, 0 )
+            else:
+                item = owner.child( row, 0 )
+
+            if isinstance( item, DictModelRow ):
+                if keyindex.get( str(item.id()) ) is item:
+                    keyindex.pop( str(item.id()) )
+
+    def keys(self):
+        """
+        Returns list containing keys for every
+        row that has been added to this :py:obj:`qconcurrency.models.DictModel` s root
+
+        Returns:
+
+            .. code-block:: python
+
+                [ 1, 2, 3, 5, 8, ... ]
+
+        """
+        return self._data.keys()
+
+
+    def removeRow(self, key):
+        """
+        Removes the toplevel row with the key `key`.
+        """
+
+        # row is gone. that is all we care about
+        try:
+            modelitem = self._get_rowitem( key )
+        except( KeyError ):
+            return
+
+        self._data.pop( str(key) )
+        return QtGui.QStandardItemModel.removeRow( self, modelitem.row() )
+
+    def takeRow(self, key):
+        return self.removeRow( str(key) )
+
+
+    def __getitem__(self, key):
+        """
+        Returns a :py:obj:`qconcurrency.models.DictModelRow` object representing
+        a row from this :py:obj:`qconcurrency.models.DictModel`.
+        """
+        return self._data[str(key)]
+
+    def __delitem__(self, key):
+        """
+        Wraps :py:meth:`removeRow`
+        """
+        self.removeRow( key )
+
+    def __contains__(self, item):
+        """
+        Returns True/False if a row with `key` exists in
+        :py:obj:`QtWidgets.QStandardItemModel`
+        """
+        return str(item) in self._data
+
+    def __len__(self):
+        """
+        Wraps `self._data.__len__`
+        """
+        return len(self._data)
+
+    def __iter__(self):
+        """
+        Allows iteration over Ids in DictModel.
+        """
+        return iter(self._data)
+
+    def has_key(self, k):
+        """
+        Wraps `self._data.has_key`
+        """
+        return self._data.has_key(k)
+
+    def keys(self):
+        """
+        Lists `key` value for every row in the
+        :py:obj:`QtWidgets.QStandardItemModel`
+        """
+        return self._data.keys()
+
+    def values(self):
+        """
+        Lists :py:obj:`DictModelRow` objects for every row in the
+        :py:obj:`QtWidgets.QStandardItemModel`
+        """
+        return self._data.values()
+
+    def items(self):
+        """
+        Lists a tuple with the `key` and :py:obj:`DictModelRow`
+        objects for every row in the :py:obj:`QtWidgets.QStandardItemModel`
+        """
+        return self._data.items()
+
+    def clear(self):
+        """
+        Removes all items from :py:obj:`QtGui.QStandardItemModel`
+        """
+        self._data = {}
+        QtGui.QStandardItemModel.clear(self)
+
+
+
+class DictModelRow( QtGui.QStandardItem ):
+    """
+    A DictModelRow is a :py:obj:`QtGui.QStandardItem` that holds
+    an item's key (usually database-Id) within a :py:obj:`qconcurrency.models.DictModel`.
+    It is always added to a :py:obj:`qconcurrency.models.DictModel` at the column-index ``0``.
+    When setting columnvals, they are added to the same parent :py:obj:`qconcurrency.models.DictModel`
+    or :py:obj:`qconcurrency.models.DictModelRow`, but at different column-indexes.
+
+
+    Example:
+
+        .. code-block:: bash
+
+                            ===== ========|
+            DictModelRow     _id  | class |  # level: 'jedi_class'
+                 |          ===== ========|
+                 +---------> 101  | sith  |
+                 |            |============================================|
+                 |            |  _id | firstname  | lastname   | username  | # level: 'user'
+                 |            |============================================|
+                 +-------------> 56  | Darth      | Vader      | anakins   |
+                 +-------------> 57  | Darth      | Maul       | darthm    |
+                              |============================================|
+                                        /\\           /\\            /\\
+                                        |            |             |
+               QtGui.QStandardItem  ----+------------+-------------+
+
+    """
+    def __init__(self, parent, key, columnvals=None ):
+        """
+        Args:
+            parent (QtGui.QStandardItem, QtGui.QStandardItemModel ):
+                Another QStandardItem that has already
+                been added to the model, or a model itself.
+
+                It will be used to access the model's info,
+                and this widget will be added to it.
+
+                If ``None`` , the row is not added anywhere, and the caller is
+                responsible for setting it's level, and adding it (with it's columnvals).
+
+            key (obj):
+                A hashable python object that will be
+                used to represent this object's databaseId.
+
+            columnvals (dict, optional):
+                A dictionary of columns, and assignments to store
+                in the view.
+        """
+
+        QtGui.QStandardItem.__init__(self, str(key))
+
+        if parent is None:
+            # built before it is added to the model, see :py:meth:`qconcurrency.models.DictModel._add_rows`
+            self._key      = key
+            self._children = {}
+            self._level    = None
+            return
+
+        if not isinstance( parent, QtGui.QStandardItemModel ):
+            if not parent.model():
+                raise RuntimeError(
+                    '`parent` %s QStandardItem must have already been added to a QStandardItemModel' % repr(parent)
+                )
+
+        self._key      = key
+        self._children = {}    # { str(key) : DictModelRow } index of child-rows
+        self._level    = None  # if `hierarchy` argument was set in `DictModel`, this will be
+                            # a label indicating the type of information this
+                            # table represents.
+                            #
+                            # otherwise, this will be an incremented integer
+                            # (starting from 0)
+
+
+
+        # append this item to the parent's list of children
+        if isinstance( parent, QtGui.QStandardItemModel ):
+            if parent.hierarchy():
+                self._level = parent.hierarchy()[0]
+            else:
+                self._level = 0
+            parent.setItem( parent.rowCount(), 0, self )
+            parent._keyindex()[ str(key) ] = self
+
+        else:
+            hierarchy = parent.model().hierarchy()
+            if hierarchy:
+                index = hierarchy.index( parent.level() )+1
+                self._level = hierarchy[ index ]
+            else:
+                self._level = parent.level() +1
+
+            parent.setChild( parent.rowCount(), 0, self )
+            parent._keyindex()[ str(key) ] = self
+
+        self.setText( str(key) )
+        set_columnvals = self.model().default_columnvals(self._level).copy()
+        if columnvals:
+            set_columnvals.update( columnvals )
+        self.set_columnvals( set_columnvals )
+
+    def __getitem__(self, key):
+        return self._get_child_row(key)
+
+    def add_child(self, key, columnvals=None ):
+        """
+        Adds a new row to this DictModel, at a new level of nesting
+        henceforth referred to by the key `key`.
+
+        Example:
+
+            .. code-block:: bash
+
+                |==============|
+                | _id | column |
+                |==============|
+                | 100 | 'A'    |     # add_child( 102, {'column':'A1'} )
+                |   |==============|
+                |   | _id | column | # added child:  model[100][102]
+                |   |==============|
+                |   | 102 | 'A1'   |
+                |   |==============|
+                |              |
+                | 101 | 'B'    |
+                |==============|
+
+        Args:
+            key (obj):
+                Key is the id you will use to refer to this object.
+                Generally it will be a databaseId. This object must be
+                hashable.
+
+            columnvals (dict, optional):
+                Optionally, you may provide a dictionary of column-val assignments
+                (appropriate to this item's table-level) as determined by the `columns`
+                argument to :py:meth:`qconcurrency.models.DictModel.__init__`
+
+
+        Returns:
+            :py:obj:`qconcurrency.models.DictModelRow`
+
+        See Also:
+            * :py:meth:`qconcurrency.models.DictModelRow.add_row`
+            * :py:meth:`qconcurrency.models.DictModel.add_row`
 
-    def __contains__(self, item):
         """
-        Returns True/False if a row with `key` exists in
-        :py:obj:`QtWidgets.QStandardItemModel`
+        item = DictModelRow( parent=self, key=key, columnvals=columnvals )
+        return item
+
+    def add_children(self, rows):
         """
-        return str(item) in self._data
+        Adds several child-rows to this row at once (optionally with their own
+        nested child-rows). Views/widgets are notified once per added row
+        (not once per cell, or nested child-row).
+
+        Args:
+            rows (iterable):  ``(ex: [(key, columnvals), (key, columnvals, children), ...] )``
+                See :py:meth:`qconcurrency.models.DictModel.add_rows`
+
+        Returns:
+
+            .. code-block:: python
+
+                [ DictModelRow, DictModelRow, ... ]  # the added child-rows
+
+        See Also:
+            * :py:meth:`qconcurrency.models.DictModelRow.add_child`
+            * :py:meth:`qconcurrency.models.DictModel.add_rows`
+        """
+        model = self.model()
+        with model._bulk_insert():
+            return model._add_rows( self, rows )
+
+    def add_row(self, key, columnvals=None ):
+        """
+        Adds a new row to this DictModel, at the same level of nesting
+        henceforth referred to by the key `key`.
+
+        Example:
+
+            .. code-block:: bash
+
+                |==============|
+                | _id | column |
+                |==============|
+                | 100 | 'A'    | # add_row( 102, {'column':'C'} )
+                | 101 | 'B'    |
+                | 102 | 'C'    | # added row: model[102]
+                |==============|
+
+
+        Args:
+            key (obj):
+                Key is the id you will use to refer to this object.
+                Generally it will be a databaseId. This object must be
+                hashable.
+
+            columnvals (dict, optional):
+                Optionally, you may provide a dictionary of column-val assignments
+                (appropriate to this item's table-level) as determined by the `columns`
+                argument to :py:meth:`qconcurrency.models.DictModel.__init__`
+
+
+        Returns:
+            :py:obj:`qconcurrency.models.DictModelRow`
+
+        See Also:
+            * :py:meth:`qconcurrency.models.DictModelRow.add_row`
+            * :py:meth:`qconcurrency.models.DictModel.add_row`
+
+        """
+        if self.parent():
+            item = DictModelRow( parent=self.parent(), key=key, columnvals=columnvals )
+        else:
+            item = DictModelRow( parent=self.model(), key=key, columnvals=columnvals )
+
+        return item
+
+    def set_columnvals(self, columnvals ):
+        """
+        Set columnvals on a key of this :py:obj:`qconcurrency.models.DictModel`
+        """
+
+        # validation
+        if self.model() is None:
+            raise RuntimeError('Cannot set columnvals until item has been added to a model')
+
+        columns   = self.model().columns( self._level )
+        parent    = self.parent()
+        row       = self.row()
+
+        # set columnvals
+        for i in range(len(columns)):
+            column = columns[i]
+
+
+            if column in columnvals:
+
+                if columnvals[column] == None:
+                    columnvals[column] = ''
+
+                if parent is not None:
+                    parent.setChild(
+                        row,                                           # row
+                        i,                                             # column
+                        QtGui.QStandardItem( str(columnvals[column]) ) # item
+                    )
+                else:
+                    self.model().setItem(
+                        row,                                           # row
+                        i,                                             # column
+                        QtGui.QStandardItem( str(columnvals[column]) ) # item
+                    )
+
+    def columnvals(self):
+        """
+        Returns a dictionary of this item's columnvals from the Model.
+        A column `_id` will be added to the list of columns, which will
+        be the `key` value of this row.
+        """
+        columnvals = {}
+        columns    = self.model().columns(self._level)
+
+        for i in range(len(columns)):
+            column = columns[i]
+
+            # nested-modelitem
+            if self.parent() is not None:
+                modelitem = self.parent().child( self.row(), i )
+                if modelitem is not None:
+                    columnvals[ column ] = modelitem.text()
+                else:
+                    raise RuntimeError(
+                        'item at level "%s" in column "%s" (%s,%s) is None. Expected QtCore.QStandardItem' % (
+                            self._level, column, self.row(), i)
+                    )
+
+            # root-modelitems
+            else:
+                modelitem = self.model().item( self.row(), i )
+                if modelitem is not None:
+                    columnvals[ column ] = modelitem.text()
+                else:
+                    raise RuntimeError(
+                        'item at level "%s" in column "%s" (%s,%s) is None. Expected QtCore.QStandardItem' % (
+                            self._level, column, self.row(), i)
+                    )
+        columnvals['_id'] = self._key
+
+        return columnvals
+
+    def columnval(self, name):
+        """
+        Retrieve a single column-value only.
+        """
+
+        if name == '_id':
+            if self.parent() is not None:
+                return self.parent().child( self.row(), 0 ).text()
+            else:
+                return self.model().item( self.row(), 0 ).text()
+
+        columns = self.model().columns(self._level)
+        for i in range(len(columns)):
+            column = columns[i]
+            if column == name:
+                if self.parent() is not None:
+                    modelitem = self.parent().child( self.row(), i )
+                    if modelitem:
+                        return modelitem.text()
+                else:
+                    modelitem = self.model().item( self.row(), i )
+                    if modelitem:
+                        return modelitem.text()
+
+        raise KeyError(
+            'Unable to find a column named: "%s" in %s' % (name, repr(columns))
+        )
+
+    def columnitem(self, name):
+        """
+        Returns the sibling-widget representing one of the columnvals
+        """
+        sibling_index = self.index().sibling( self.index().row(), self._get_colindex( name ) )
+        return self.model().itemFromIndex( sibling_index )
+
+    def level(self):
+        """
+        Returns either a label (if :py:meth:`qconcurrency.models.DictModel.__init__` was passed a
+        `hierarchy` argument), or an integer representing the nesting-depth.
+        Either way, level is used to indicate the level-of-nesting of the table
+        that this item is in.
+        """
+        return self._level
+
+    def delete(self):
+        """
+        Removes this *row* from the model.
+        """
+        if self.parent() is not None:
+            self.parent().removeRow( self.id() )
+        else:
+            self.model().removeRow( self.id() )
+
+    def removeRow(self, key):
+        """
+        Removes the child-row with the key `key`.
+        """
+
+        # row is gone. that is all we care about
+        if str(key) not in self._children:
+            return
+
+        modelitem = self._children.pop( str(key) )
+        return QtGui.QStandardItem.removeRow( self, modelitem.row() )
+
+    def _get_sibling_row(self, key):
+        """
+        Returns a sibling with a different key at the same level.
+
+        Example:
+
+            .. code-block:: bash
+
+                ----------------------------------------------------
+                key          | name            | path              |
+                ----------------------------------------------------
+                100          | 'mnt'           | '/mnt'            |
+                   100.1     | 'mntusb'        | '/mnt/usb'        |
+                     100.1.a | 'mntusbbackup'  | '/mnt/usb/backup' |
+                   100.2     | 'mntcd'         | '/mnt/cd'         |
+                             |                 |                   |
+                200          | 'home'          | '/home'           |
+                   200.1     | 'will'          | '/home/will'      |
+
+            In the above diagram representing the :py:obj:`QStandardItemModel`,
+            from `100.1` you would be able retrieve `100.2`.
+        """
+        if self.parent() == None:
+            keyindex = self.model()._keyindex()
+        else:
+            keyindex = self.parent()._keyindex()
+
+        if str(key) in keyindex:
+            return keyindex[ str(key) ]
+
+        raise KeyError(
+            'Unable to find key %s in table containing %s' % (key, repr(self))
+        )
 
-    def __len__(self):
-        """
-        Wraps `self._data.__len__`
+    def _get_child_row(self, key):
         """
-        return len(self._data)
+        Returns a child with a particular key.
 
-    def __iter__(self):
-        """
-        Allows iteration over Ids in DictModel.
+
+        Example:
+
+            .. code-block:: bash
+
+                ----------------------------------------------------
+                key          | name            | path              |
+                ----------------------------------------------------
+                100          | 'mnt'           | '/mnt'            |
+                   100.1     | 'mntusb'        | '/mnt/usb'        |
+                     100.1.a | 'mntusbbackup'  | '/mnt/usb/backup' |
+                   100.2     | 'mntcd'         | '/mnt/cd'         |
+                             |                 |                   |
+                200          | 'home'          | '/home'           |
+                   200.1     | 'will'          | '/home/will'      |
+
+            In the above diagram representing the :py:obj:`QStandardItemModel`,
+            from `100.1` you would be able retrieve `100.1.a`.
         """
-        return iter(self._data)
+        if not self.rowCount():
+            raise RuntimeError(
+                '%s has no children. Cannot retrieve child at key %s' % (repr(self), key)
+            )
 
-    def has_key(self, k):
+        if str(key) in self._children:
+            return self._children[ str(key) ]
+
+        raise KeyError(
+            'Cannot find child identified by key "%s" in %s' % (key,repr(self))
+        )
+
+    def _get_colindex(self, column):
+        return self.model()._get_colindex( self.level(), column )
+
+    def _keyindex(self):
         """
-        Wraps `self._data.has_key`
+        Returns the dictionary indexing the child-rows of
+        this :py:obj:`qconcurrency.models.DictModelRow` by their key.
+
+        Returns:
+
+            .. code-block:: python
+
+                { '56': DictModelRow, '57': DictModelRow, ... }
         """
-        return self._data.has_key(k)
+        return self._children
 
     def keys(self):
         """
-        Lists `key` value for every row in the
-        :py:obj:`QtWidgets.QStandardItemModel`
+        Returns list containig keys for every
+        child-row that has been added to this :py:obj:`qconcurrency.models.DictModelRow`
         """
-        return self._data.keys()
+        keys = []
+        for i in range(self.rowCount()):
+            keys.append( self.child(i,0).text() )
+        return keys
 
-    def values(self):
+    def id(self):
         """
-        Lists :py:obj:`DictModelRow` objects for every row in the
-        :py:obj:`QtWidgets.QStandardItemModel`
+        Returns the `key` this row represents.
+        (It's value depends on the value passed to :py:meth:`qconcurrency.models.DictModelRow.add_row`
+        or :py:meth:`qconcurrency.models.DictModelRow.add_child` ).
         """
-        return self._data.values()
+        return self._key
 
-    def items(self):
-        """
-        Lists a tuple with the `key` and :py:obj:`DictModelRow`
-        objects for every row in the :py:obj:`QtWidgets.QStandardItemModel`
-        """
-        return self._data.items()
 
-    def clear(self):
+
+class _ColumnarTable( object ):
+    """
+    Storage for a single table (the toplevel-rows, or the child-rows of a row)
+    within a :py:obj:`qconcurrency.models.ColumnarDictModel` .
+
+    Values are stored in one list per-column (rather than one object per-cell).
+
+    .. code-block:: python
+
+        keys    = [ 101,     102      ]
+        columns = [
+                    ['luke', 'leia'   ],   # firstname
+                    ['sky',  'sky'    ],   # lastname
+                  ]
+    """
+    def __init__(self, level, ncolumns, parent=None, parent_key=None ):
         """
-        Removes all items from :py:obj:`QtGui.QStandardItemModel`
+        Args:
+            level (obj):
+                The `level` (see :py:meth:`DictModelRow.level` ) of rows in this table.
+
+            ncolumns (int):
+                The number of columns (not including the key) in this table.
+
+            parent (_ColumnarTable, optional):
+                The table containing the parent-row of this table.
+                (``None`` for the toplevel table)
+
+            parent_key (str, optional):
+                ``str(key)`` of the parent-row within `parent` .
         """
-        self._data = {}
-        QtGui.QStandardItemModel.clear(self)
+        self.level      = level
+        self.parent     = parent
+        self.parent_key = parent_key
+        self.keys       = []                                   # keys in row-order
+        self.rows       = {}                                   # { str(key) : row-number }
+        self.columns    = [ [] for i in range(ncolumns) ]      # one list of values per-column
+        self.children   = {}                                   # { str(key) : _ColumnarTable }
 
 
 
-class DictModelRow( QtGui.QStandardItem ):
+class ColumnarDictModel( _DictModelColumns, QtCore.QAbstractItemModel ):
     """
-    A DictModelRow is a :py:obj:`QtGui.QStandardItem` that holds
-    an item's key (usually database-Id) within a :py:obj:`qconcurrency.models.DictModel`.
-    It is always added to a :py:obj:`qconcurrency.models.DictModel` at the column-index ``0``.
-    When setting columnvals, they are added to the same parent :py:obj:`qconcurrency.models.DictModel`
-    or :py:obj:`qconcurrency.models.DictModelRow`, but at different column-indexes.
+    An alternative to :py:obj:`qconcurrency.models.DictModel` with the same
+    dictionary-like interface, implemented on a :py:obj:`QtCore.QAbstractItemModel` .
 
+    Instead of a :py:obj:`QtGui.QStandardItem` per cell, values are stored
+    unmodified in one list per column (see :py:obj:`_ColumnarTable` ), and are only
+    converted to strings when they are displayed. This uses a fraction of the
+    memory of a :py:obj:`qconcurrency.models.DictModel`, and is much faster to populate.
+
+    Rows are represented by lightweight :py:obj:`qconcurrency.models.ColumnarDictModelRow`
+    objects, that are created when they are requested.
 
     Example:
 
-        .. code-block:: bash
+        .. code-block:: python
 
-                            ===== ========|
-            DictModelRow     _id  | class |  # level: 'jedi_class'
-                 |          ===== ========|
-                 +---------> 101  | sith  |
-                 |            |============================================|
-                 |            |  _id | firstname  | lastname   | username  | # level: 'user'
-                 |            |============================================|
-                 +-------------> 56  | Darth      | Vader      | anakins   |
-                 +-------------> 57  | Darth      | Maul       | darthm    |
-                              |============================================|
-                                        /\\           /\\            /\\
-                                        |            |             |
-               QtGui.QStandardItem  ----+------------+-------------+
+            model = ColumnarDictModel(
+                    hierarchy = ('jedi_class','user'),
+                    columns   = {
+                        'jedi_class':  ('class',),
+                        'user':        ('firstname','lastname','username')
+                    },
+                )
+
+            sith_row = model.add_row( 101, {'class':'sith'} )
+            sith_row.add_child( 56, {'firstname':'Darth', 'lastname':'Vader', 'username':'anakins'} )
+
+            print( model[101][56].columnval('username') )
+            >>> 'anakins'
+
+    .. note::
+
+        Unlike :py:obj:`qconcurrency.models.DictModel`, adding a row with a key
+        that already exists at the same level updates the existing row.
 
     """
-    def __init__(self, parent, key, columnvals=None ):
+    def __init__(self, columns, hierarchy=None ):
         """
         Args:
-            parent (QtGui.QStandardItem, QtGui.QStandardItemModel ):
-                Another QStandardItem that has already
-                been added to the model, or a model itself.
+            columns (list, dict):
+                See :py:meth:`qconcurrency.models.DictModel.__init__`
 
-                It will be used to access the model's info,
-                and this widget will be added to it.
+            hierarchy (dict, optional):  ``(ex:  ('department_type','department')  )``
+                See :py:meth:`qconcurrency.models.DictModel.__init__`
+        """
+        QtCore.QAbstractItemModel.__init__(self)
 
-            key (obj):
-                A hashable python object that will be
-                used to represent this object's databaseId.
+        self._init_columns( columns, hierarchy )
+        self._root = self._new_table( level=self._child_level(None) )
 
-            columnvals (dict, optional):
-                A dictionary of columns, and assignments to store
-                in the view.
+    # QAbstractItemModel
+    # ==================
+
+    def index(self, row, column, parent=QtCore.QModelIndex() ):
+        if not self.hasIndex( row, column, parent ):
+            return QtCore.QModelIndex()
+
+        table = self._child_table( parent )
+        return self.createIndex( row, column, table )
+
+    def parent(self, index=None ):
+        # QObject.parent()
+        if index is None:
+            return QtCore.QAbstractItemModel.parent(self)
+
+        if not index.isValid():
+            return QtCore.QModelIndex()
+
+        table = index.internalPointer()
+        if table.parent is None:
+            return QtCore.QModelIndex()
+
+        return self.createIndex( table.parent.rows[ table.parent_key ], 0, table.parent )
+
+    def rowCount(self, parent=QtCore.QModelIndex() ):
+        if parent.column() > 0:
+            return 0
+
+        table = self._child_table( parent )
+        if table is None:
+            return 0
+        return len(table.keys)
+
+    def columnCount(self, parent=QtCore.QModelIndex() ):
+        if not parent.isValid():
+            return len(self._root.columns) +1
+
+        table = parent.internalPointer()
+        try:
+            level = self._child_level( table.level )
+        except IndexError:
+            # the last level of the hierarchy cannot have children
+            return len(self.columns( table.level ))
+        return len(self.columns( level ))
+
+    def data(self, index, role=QtCore.Qt.DisplayRole ):
+        if not index.isValid():
+            return None
+
+        table = index.internalPointer()
+        if index.column() == 0:
+            value = table.keys[ index.row() ]
+        else:
+            value = table.columns[ index.column()-1 ][ index.row() ]
+
+        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            if value is None:
+                return ''
+            return str(value)
+
+        elif role == QtCore.Qt.UserRole:
+            return value
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole ):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            columns = self.columns( self._root.level )
+            if section < len(columns):
+                return columns[ section ]
+
+    def flags(self, index):
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+
+    # Storage
+    # =======
+
+    def _child_level(self, level):
         """
+        Returns the level of rows nested under a row with the level `level`
+        (or the level of toplevel rows, if `level` is ``None`` ).
+        """
+        if self._hierarchy:
+            if level is None:
+                return self._hierarchy[0]
+            return self._hierarchy[ list(self._hierarchy).index( level ) +1 ]
 
-        QtGui.QStandardItem.__init__(self, str(key))
+        if level is None:
+            return 0
+        return level +1
 
-        if not isinstance( parent, QtGui.QStandardItemModel ):
-            if not parent.model():
-                raise RuntimeError(
-                    '`parent` %s QStandardItem must have already been added to a QStandardItemModel' % repr(parent)
-                )
+    def _new_table(self, level, parent=None, parent_key=None ):
+        """
+        Returns a new (empty) :py:obj:`_ColumnarTable` for rows of level `level` .
+        """
+        ncolumns = len(self.columns( level )) -1
+        return _ColumnarTable( level, ncolumns, parent=parent, parent_key=parent_key )
 
-        self._key   = key
-        self._level = None  # if `hierarchy` argument was set in `DictModel`, this will be
-                            # a label indicating the type of information this
-                            # table represents.
-                            #
-                            # otherwise, this will be an incremented integer
-                            # (starting from 0)
+    def _child_table(self, parent, create=False ):
+        """
+        Returns the :py:obj:`_ColumnarTable` containing the children
+        of the row at the :py:obj:`QtCore.QModelIndex` `parent` .
 
+        Args:
+            parent (QtCore.QModelIndex):
+                Index of the parent row (an invalid index for toplevel rows).
 
+            create (bool, optional):
+                If ``True``, the table is created if it does not already exist.
+                Otherwise ``None`` is returned.
+        """
+        if not parent.isValid():
+            return self._root
 
-        # append this item to the parent's list of children
-        if isinstance( parent, QtGui.QStandardItemModel ):
-            if parent.hierarchy():
-                self._level = parent.hierarchy()[0]
+        table = parent.internalPointer()
+        key   = str( table.keys[ parent.row() ] )
+
+        if key not in table.children and create:
+            table.children[ key ] = self._new_table(
+                level      = self._child_level( table.level ),
+                parent     = table,
+                parent_key = key,
+            )
+        return table.children.get( key )
+
+    def _table_index(self, table):
+        """
+        Returns the :py:obj:`QtCore.QModelIndex` of the row
+        that `table` contains the children of.
+        """
+        if table.parent is None:
+            return QtCore.QModelIndex()
+        return self.createIndex( table.parent.rows[ table.parent_key ], 0, table.parent )
+
+    def _add_rows(self, table, rows):
+        """
+        Adds `rows` to `table`, notifying views once per table.
+        See :py:meth:`add_rows`
+
+        Returns:
+
+            .. code-block:: python
+
+                [ ColumnarDictModelRow, ColumnarDictModelRow, ... ]
+        """
+        columns  = self.columns( table.level )[1:]
+        defaults = self.default_columnvals( table.level )
+
+        keys     = []
+        new_rows = []
+        children = []
+        for row in rows:
+            if len(row) == 2:
+                (key, columnvals) = row
+                row_children      = None
+            elif len(row) == 3:
+                (key, columnvals, row_children) = row
             else:
-                self._level = 0
-            parent.setItem( parent.rowCount(), 0, self )
+                raise RuntimeError(
+                    'Expected rows in the format `(key, columnvals)` or `(key, columnvals, children)`. '
+                    'Received: %s' % repr(row)
+                )
 
-        else:
-            hierarchy = parent.model().hierarchy()
-            if hierarchy:
-                index = hierarchy.index( parent.level() )+1
-                self._level = hierarchy[ index ]
+            keys.append( key )
+            if str(key) in table.rows:
+                self._set_columnvals( table, key, columnvals )
             else:
-                self._level = parent.level() +1
+                new_rows.append( (key, columnvals) )
 
-            parent.setChild( parent.rowCount(), 0, self )
+            if row_children:
+                children.append( (key, row_children) )
 
-        self.setText( str(key) )
-        default_columnvals = self.model().default_columnvals(self._level)
-        self.set_columnvals( default_columnvals )
-        if columnvals:
-            self.set_columnvals( columnvals )
 
-    def __getitem__(self, key):
-        return self._get_child_row(key)
+        if new_rows:
+            first = len(table.keys)
+            self.beginInsertRows( self._table_index( table ), first, first + len(new_rows) -1 )
 
-    def add_child(self, key, columnvals=None ):
+            for (key, columnvals) in new_rows:
+                table.rows[ str(key) ] = len(table.keys)
+                table.keys.append( key )
+                for i in range(len(columns)):
+                    if columnvals and columns[i] in columnvals:
+                        table.columns[i].append( columnvals[ columns[i] ] )
+                    else:
+                        table.columns[i].append( defaults[ columns[i] ] )
+
+            self.endInsertRows()
+
+
+        for (key, row_children) in children:
+            parent_index = self.createIndex( table.rows[ str(key) ], 0, table )
+            self._add_rows( self._child_table( parent_index, create=True ), row_children )
+
+        return [ ColumnarDictModelRow( self, table, key ) for key in keys ]
+
+    def _set_columnvals(self, table, key, columnvals):
         """
-        Adds a new row to this DictModel, at a new level of nesting
-        henceforth referred to by the key `key`.
+        Sets the values of columns in `columnvals` for the row `key` in `table` .
+        See :py:meth:`qconcurrency.models.ColumnarDictModelRow.set_columnvals`
+        """
+        columns = self.columns( table.level )
+        row     = table.rows[ str(key) ]
 
-        Example:
+        for i in range(1, len(columns)):
+            if columns[i] in columnvals:
+                table.columns[i-1][ row ] = columnvals[ columns[i] ]
 
-            .. code-block:: bash
+        self.dataChanged.emit(
+            self.createIndex( row, 0,              table ),
+            self.createIndex( row, len(columns)-1, table ),
+        )
+
+    def _remove_row(self, table, key):
+        """
+        Removes the row `key` (and all of it's children) from `table` .
+        """
+        key = str(key)
+        if key not in table.rows:
+            return
+
+        row = table.rows[ key ]
+        self.beginRemoveRows( self._table_index( table ), row, row )
+
+        table.keys.pop( row )
+        for column in table.columns:
+            column.pop( row )
+        table.rows.pop( key )
+        table.children.pop( key, None )
+
+        for i in range(row, len(table.keys)):
+            table.rows[ str(table.keys[i]) ] = i
+
+        self.endRemoveRows()
+
+    # Dictionary Interface
+    # ====================
+
+    def add_row(self, key, columnvals=None ):
+        """
+        Adds a new (toplevel) row to this model, henceforth referred to by the key `key`.
+        See :py:meth:`qconcurrency.models.DictModel.add_row`
+
+        Returns:
+            :py:obj:`qconcurrency.models.ColumnarDictModelRow`
+        """
+        return self._add_rows( self._root, [(key, columnvals)] )[0]
+
+    def add_rows(self, rows):
+        """
+        Adds several (toplevel) rows to this model at once (optionally with
+        nested child-rows). Views are notified once per table.
+        See :py:meth:`qconcurrency.models.DictModel.add_rows`
+
+        Returns:
+
+            .. code-block:: python
+
+                [ ColumnarDictModelRow, ColumnarDictModelRow, ... ]
+        """
+        return self._add_rows( self._root, rows )
+
+    def itemFromIndex(self, index):
+        """
+        Returns the :py:obj:`qconcurrency.models.ColumnarDictModelRow`
+        for the row at the :py:obj:`QtCore.QModelIndex` `index` .
+        """
+        if not index.isValid():
+            return None
+
+        table = index.internalPointer()
+        return ColumnarDictModelRow( self, table, table.keys[ index.row() ] )
+
+    def removeRow(self, key):
+        """
+        Removes the toplevel row with the key `key`.
+        """
+        self._remove_row( self._root, key )
+
+    def takeRow(self, key):
+        return self.removeRow( key )
+
+    def __getitem__(self, key):
+        """
+        Returns a :py:obj:`qconcurrency.models.ColumnarDictModelRow` object representing
+        a row from this :py:obj:`qconcurrency.models.ColumnarDictModel`.
+        """
+        if str(key) not in self._root.rows:
+            raise KeyError( str(key) )
+        return ColumnarDictModelRow( self, self._root, self._root.keys[ self._root.rows[ str(key) ] ] )
 
-                |==============|
-                | _id | column |
-                |==============|
-                | 100 | 'A'    |     # add_child( 102, {'column':'A1'} )
-                |   |==============|
-                |   | _id | column | # added child:  model[100][102]
-                |   |==============|
-                |   | 102 | 'A1'   |
-                |   |==============|
-                |              |
-                | 101 | 'B'    |
-                |==============|
+    def __delitem__(self, key):
+        """
+        Wraps :py:meth:`removeRow`
+        """
+        self.removeRow( key )
 
-        Args:
-            key (obj):
-                Key is the id you will use to refer to this object.
-                Generally it will be a databaseId. This object must be
-                hashable.
+    def __contains__(self, item):
+        return str(item) in self._root.rows
 
-            columnvals (dict, optional):
-                Optionally, you may provide a dictionary of column-val assignments
-                (appropriate to this item's table-level) as determined by the `columns`
-                argument to :py:meth:`qconcurrency.models.DictModel.__init__`
+    def __len__(self):
+        return len(self._root.keys)
 
+    def __iter__(self):
+        return iter(self.keys())
 
-        Returns:
-            :py:obj:`qconcurrency.models.DictModelRow`
+    def has_key(self, k):
+        return k in self
 
-        See Also:
-            * :py:meth:`qconcurrency.models.DictModelRow.add_row`
-            * :py:meth:`qconcurrency.models.DictModel.add_row`
+    def keys(self):
+        """
+        Lists `key` value (as a string) for every toplevel
+        row, in the order they appear in the model.
+        """
+        return [ str(key) for key in self._root.keys ]
 
+    def values(self):
         """
-        item = DictModelRow( parent=self, key=key, columnvals=columnvals )
-        return item
+        Lists :py:obj:`ColumnarDictModelRow` objects for every toplevel row.
+        """
+        return [ ColumnarDictModelRow( self, self._root, key ) for key in self._root.keys ]
 
-    def add_row(self, key, columnvals=None ):
+    def items(self):
         """
-        Adds a new row to this DictModel, at the same level of nesting
-        henceforth referred to by the key `key`.
+        Lists a tuple with the `key` and :py:obj:`ColumnarDictModelRow`
+        for every toplevel row.
+        """
+        return [ (str(key), ColumnarDictModelRow( self, self._root, key )) for key in self._root.keys ]
 
-        Example:
+    def clear(self):
+        """
+        Removes all rows from this model.
+        """
+        self.beginResetModel()
+        self._root = self._new_table( level=self._child_level(None) )
+        self.endResetModel()
 
-            .. code-block:: bash
 
-                |==============|
-                | _id | column |
-                |==============|
-                | 100 | 'A'    | # add_row( 102, {'column':'C'} )
-                | 101 | 'B'    |
-                | 102 | 'C'    | # added row: model[102]
-                |==============|
 
+class ColumnarDictModelRow( object ):
+    """
+    A row within a :py:obj:`qconcurrency.models.ColumnarDictModel` .
+    Provides the same interface as :py:obj:`qconcurrency.models.DictModelRow` .
 
+    These are lightweight handles that are created when requested, the row's
+    data is stored within the model.
+    """
+    def __init__(self, model, table, key ):
+        """
         Args:
-            key (obj):
-                Key is the id you will use to refer to this object.
-                Generally it will be a databaseId. This object must be
-                hashable.
+            model (ColumnarDictModel):
+                The model this row belongs to.
 
-            columnvals (dict, optional):
-                Optionally, you may provide a dictionary of column-val assignments
-                (appropriate to this item's table-level) as determined by the `columns`
-                argument to :py:meth:`qconcurrency.models.DictModel.__init__`
+            table (_ColumnarTable):
+                The table within `model` that this row belongs to.
 
+            key (obj):
+                The key this row represents.
+        """
+        self._model = model
+        self._table = table
+        self._key   = key
 
-        Returns:
-            :py:obj:`qconcurrency.models.DictModelRow`
+    def __eq__(self, other):
+        if not isinstance( other, ColumnarDictModelRow ):
+            return False
+        return (other._table is self._table) and (str(other._key) == str(self._key))
 
-        See Also:
-            * :py:meth:`qconcurrency.models.DictModelRow.add_row`
-            * :py:meth:`qconcurrency.models.DictModel.add_row`
+    def __ne__(self, other):
+        return not self.__eq__( other )
 
-        """
-        if self.parent():
-            item = DictModelRow( parent=self.parent(), key=key, columnvals=columnvals )
-        else:
-            item = DictModelRow( parent=self.model(), key=key, columnvals=columnvals )
+    def __hash__(self):
+        return hash( (id(self._table), str(self._key)) )
 
-        return item
+    def __getitem__(self, key):
+        return self._get_child_row( key )
 
-    def set_columnvals(self, columnvals ):
+    def add_child(self, key, columnvals=None ):
         """
-        Set columnvals on a key of this :py:obj:`qconcurrency.models.DictModel`
+        Adds a new row nested under this row, henceforth referred to by the key `key`.
+        See :py:meth:`qconcurrency.models.DictModelRow.add_child`
+
+        Returns:
+            :py:obj:`qconcurrency.models.ColumnarDictModelRow`
         """
+        return self.add_children( [(key, columnvals)] )[0]
 
-        # validation
-        if self.model() is None:
-            raise RuntimeError('Cannot set columnvals until item has been added to a model')
+    def add_children(self, rows):
+        """
+        Adds several rows nested under this row at once.
+        See :py:meth:`qconcurrency.models.DictModel.add_rows`
 
-        columns   = self.model().columns( self._level )
+        Returns:
 
-        # set columnvals
-        for i in range(len(columns)):
-            column = columns[i]
+            .. code-block:: python
 
+                [ ColumnarDictModelRow, ColumnarDictModelRow, ... ]
+        """
+        table = self._model._child_table( self.index(), create=True )
+        return self._model._add_rows( table, rows )
 
-            if column in columnvals:
+    def add_row(self, key, columnvals=None ):
+        """
+        Adds a new row at the same level of nesting as this row.
+        See :py:meth:`qconcurrency.models.DictModelRow.add_row`
 
-                if columnvals[column] == None:
-                    columnvals[column] = ''
+        Returns:
+            :py:obj:`qconcurrency.models.ColumnarDictModelRow`
+        """
+        return self._model._add_rows( self._table, [(key, columnvals)] )[0]
 
-                if self.parent() is not None:
-                    self.parent().setChild(
-                        self.index().row(),                            # row
-                        i,                                             # column
-                        QtGui.QStandardItem( str(columnvals[column]) ) # item
-                    )
-                else:
-                    self.model().setItem(
-                        self.index().row(),                            # row
-                        i,                                             # column
-                        QtGui.QStandardItem( str(columnvals[column]) ) # item
-                    )
+    def set_columnvals(self, columnvals ):
+        """
+        Set columnvals on this row.
+        """
+        self._model._set_columnvals( self._table, self._key, columnvals )
 
     def columnvals(self):
         """
-        Returns a dictionary of this item's columnvals from the Model.
+        Returns a dictionary of this row's columnvals (as strings).
         A column `_id` will be added to the list of columns, which will
         be the `key` value of this row.
         """
         columnvals = {}
-        columns    = self.model().columns(self._level)
-
-        for i in range(len(columns)):
-            column = columns[i]
-
-            # nested-modelitem
-            if self.parent() is not None:
-                modelitem = self.parent().child( self.row(), i )
-                if modelitem is not None:
-                    columnvals[ column ] = modelitem.text()
-                else:
-                    raise RuntimeError(
-                        'item at level "%s" in column "%s" (%s,%s) is None. Expected QtCore.QStandardItem' % (
-                            self._level, column, self.row(), i)
-                    )
-
-            # root-modelitems
-            else:
-                modelitem = self.model().item( self.row(), i )
-                if modelitem is not None:
-                    columnvals[ column ] = modelitem.text()
-                else:
-                    raise RuntimeError(
-                        'item at level "%s" in column "%s" (%s,%s) is None. Expected QtCore.QStandardItem' % (
-                            self._level, column, self.row(), i)
-                    )
+        columns    = self._model.columns( self._table.level )
+        row        = self.row()
+
+        columnvals[ columns[0] ] = str(self._key)
+        for i in range(1, len(columns)):
+            value = self._table.columns[i-1][ row ]
+            if value is None:
+                value = ''
+            columnvals[ columns[i] ] = str(value)
         columnvals['_id'] = self._key
 
         return columnvals
 
     def columnval(self, name):
         """
-        Retrieve a single column-value only.
+        Retrieve a single column-value only (as a string).
         """
-
         if name == '_id':
-            if self.parent() is not None:
-                return self.parent().child( self.row(), 0 ).text()
-            else:
-                return self.model().item( self.row(), 0 ).text()
+            return str(self._key)
 
-        columns = self.model().columns(self._level)
-        for i in range(len(columns)):
-            column = columns[i]
-            if column == name:
-                if self.parent() is not None:
-                    modelitem = self.parent().child( self.row(), i )
-                    if modelitem:
-                        return modelitem.text()
-                else:
-                    modelitem = self.model().item( self.row(), i )
-                    if modelitem:
-                        return modelitem.text()
+        columns = self._model.columns( self._table.level )
+        if name not in columns:
+            raise KeyError(
+                'Unable to find a column named: "%s" in %s' % (name, repr(columns))
+            )
 
-        raise KeyError(
-            'Unable to find a column named: "%s" in %s' % (name, repr(columns))
-        )
+        i = columns.index( name )
+        if i == 0:
+            return str(self._key)
 
-    def columnitem(self, name):
-        """
-        Returns the sibling-widget representing one of the columnvals
-        """
-        sibling_index = self.index().sibling( self.index().row(), self._get_colindex( name ) )
-        return self.model().itemFromIndex( sibling_index )
+        value = self._table.columns[i-1][ self.row() ]
+        if value is None:
+            return ''
+        return str(value)
 
     def level(self):
         """
-        Returns either a label (if :py:meth:`qconcurrency.models.DictModel.__init__` was passed a
-        `hierarchy` argument), or an integer representing the nesting-depth.
-        Either way, level is used to indicate the level-of-nesting of the table
-        that this item is in.
+        Returns either a label (if a `hierarchy` was assigned to the model),
+        or an integer representing the nesting-depth.
         """
-        return self._level
+        return self._table.level
 
     def delete(self):
         """
         Removes this *row* from the model.
         """
-        if self.parent() is not None:
-            self.parent().removeRow( self.id() )
-        else:
-            self.model().removeRow( self.id() )
+        self._model._remove_row( self._table, self._key )
+
+    def removeRow(self, key):
+        """
+        Removes the child-row with the key `key`.
+        """
+        table = self._model._child_table( self.index() )
+        if table is not None:
+            self._model._remove_row( table, key )
 
     def _get_sibling_row(self, key):
         """
         Returns a sibling with a different key at the same level.
-
-        Example:
-
-            .. code-block:: bash
-
-                ----------------------------------------------------
-                key          | name            | path              |
-                ----------------------------------------------------
-                100          | 'mnt'           | '/mnt'            |
-                   100.1     | 'mntusb'        | '/mnt/usb'        |
-                     100.1.a | 'mntusbbackup'  | '/mnt/usb/backup' |
-                   100.2     | 'mntcd'         | '/mnt/cd'         |
-                             |                 |                   |
-                200          | 'home'          | '/home'           |
-                   200.1     | 'will'          | '/home/will'      |
-
-            In the above diagram representing the :py:obj:`QStandardItemModel`,
-            from `100.1` you would be able retrieve `100.2`.
         """
-        if self.parent() == None:
-            for i in range(self.model().rowCount()):
-                if self.model().item(i,0).text() == str(key):
-                    return self.model().item(i,0)
-        else:
-            for i in range(self.parent().rowCount()):
-                if self.parent().child(i,0).text() == str(key):
-                    return self.parent().child(i,0)
+        if str(key) in self._table.rows:
+            return ColumnarDictModelRow( self._model, self._table, self._table.keys[ self._table.rows[ str(key) ] ] )
 
         raise KeyError(
             'Unable to find key %s in table containing %s' % (key, repr(self))
@@ -943,60 +1884,73 @@ class DictModelRow( QtGui.QStandardItem ):
     def _get_child_row(self, key):
         """
         Returns a child with a particular key.
-
-
-        Example:
-
-            .. code-block:: bash
-
-                ----------------------------------------------------
-                key          | name            | path              |
-                ----------------------------------------------------
-                100          | 'mnt'           | '/mnt'            |
-                   100.1     | 'mntusb'        | '/mnt/usb'        |
-                     100.1.a | 'mntusbbackup'  | '/mnt/usb/backup' |
-                   100.2     | 'mntcd'         | '/mnt/cd'         |
-                             |                 |                   |
-                200          | 'home'          | '/home'           |
-                   200.1     | 'will'          | '/home/will'      |
-
-            In the above diagram representing the :py:obj:`QStandardItemModel`,
-            from `100.1` you would be able retrieve `100.1.a`.
         """
-        if not self.rowCount():
+        table = self._model._child_table( self.index() )
+        if table is None or not table.keys:
             raise RuntimeError(
                 '%s has no children. Cannot retrieve child at key %s' % (repr(self), key)
             )
 
-        for i in range(self.rowCount()):
-            if self.child(i,0).text() == str(key):
-                return self.child(i,0)
+        if str(key) in table.rows:
+            return ColumnarDictModelRow( self._model, table, table.keys[ table.rows[ str(key) ] ] )
 
         raise KeyError(
             'Cannot find child identified by key "%s" in %s' % (key,repr(self))
         )
 
-    def _get_colindex(self, column):
-        return self.model()._get_colindex( self.level(), column )
-
     def keys(self):
         """
-        Returns list containig keys for every
-        child-row that has been added to this :py:obj:`qconcurrency.models.DictModelRow`
+        Returns list containig keys (as strings) for every
+        child-row of this row.
         """
-        keys = []
-        for i in range(self.rowCount()):
-            keys.append( self.child(i,0).text() )
-        return keys
+        table = self._model._child_table( self.index() )
+        if table is None:
+            return []
+        return [ str(key) for key in table.keys ]
 
     def id(self):
         """
         Returns the `key` this row represents.
-        (It's value depends on the value passed to :py:meth:`qconcurrency.models.DictModelRow.add_row`
-        or :py:meth:`qconcurrency.models.DictModelRow.add_child` ).
         """
         return self._key
 
+    def row(self):
+        """
+        Returns the row-number of this row within it's parent.
+        """
+        return self._table.rows[ str(self._key) ]
+
+    def rowCount(self):
+        """
+        Returns the number of child-rows under this row.
+        """
+        table = self._model._child_table( self.index() )
+        if table is None:
+            return 0
+        return len(table.keys)
+
+    def index(self):
+        """
+        Returns the :py:obj:`QtCore.QModelIndex` of this row (column ``0`` ).
+        """
+        return self._model.createIndex( self.row(), 0, self._table )
+
+    def parent(self):
+        """
+        Returns the parent :py:obj:`ColumnarDictModelRow` , or ``None``
+        if this is a toplevel row.
+        """
+        if self._table.parent is None:
+            return None
+        parent_table = self._table.parent
+        return ColumnarDictModelRow( self._model, parent_table, parent_table.keys[ parent_table.rows[ self._table.parent_key ] ] )
+
+    def model(self):
+        """
+        Returns the :py:obj:`ColumnarDictModel` this row belongs to.
+        """
+        return self._model
+
 
 
 if __name__ == '__main__':
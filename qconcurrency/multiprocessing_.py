@@ -0,0 +1,374 @@
+#!/usr/bin/env python
+"""
+Name :          qconcurrency.multiprocessing_.py
+Created :       Oct 17, 2026
+Author :        Will Pittman
+Contact :       willjpittman@gmail.com
+________________________________________________________________________________
+Description :   Runs :py:obj:`qconcurrency.threading_.ThreadedTask` callbacks
+                in child-processes (for CPU-bound work, that would otherwise
+                compete with the UI thread for the GIL).
+________________________________________________________________________________
+"""
+#builtin
+from __future__    import unicode_literals
+from __future__    import absolute_import
+from __future__    import division
+from __future__    import print_function
+import multiprocessing
+import logging
+import os
+import threading
+import traceback
+import time
+#package
+#external
+import six
+#internal
+from   qconcurrency.exceptions_  import *
+from   qconcurrency.threading_   import SignalBatcher
+
+logger = logging.getLogger(__name__)
+loc    = locals
+
+__all__ = [
+    'ProcessPool',
+]
+
+
+class ProcessPool( object ):
+    """
+    A pool of child-processes that :py:obj:`qconcurrency.threading_.ThreadedTask`
+    and :py:obj:`qconcurrency.threading_.SoloThreadedTask` callbacks can be run in.
+
+    The task is still queued in a :py:obj:`QtCore.QThreadPool`, but that thread
+    only relays the child-process's signals (re-emitting them on the task's
+    :py:obj:`SignalManager` ) and forwards abort-requests to the child-process.
+
+    The callback, it's arguments, it's return-value, and all signal-arguments
+    must be picklable (the callback must be importable from a module, not a
+    lambda or nested function).
+
+    Example:
+
+        .. code-block:: python
+
+            # mymodule.py
+            def decode_images( paths, signalmgr=None ):
+                signalmgr.add_progress.emit( len(paths) )
+                for path in paths:
+                    signalmgr.handle_if_abort()
+                    ...
+                    signalmgr.incr_progress.emit(1)
+
+
+            processpool = ProcessPool( processes=4 )
+
+            task = progressbar.new_task( mymodule.decode_images, paths=paths )
+            task.start( processpool=processpool )
+
+    .. note::
+
+        Within the child-process, `signalmgr` is a stand-in that queues
+        signal-emissions back to the parent-process. It supports
+        ``signalmgr.<signal>.emit()`` , :py:meth:`handle_if_abort` and
+        :py:meth:`batch` .
+    """
+    _poll_interval = 0.02   # seconds between checks for abort-requests, while relaying signals
+    _start_timeout = 5      # seconds a task may remain unstarted while a worker is idle (once a worker was replaced)
+
+    def __init__(self, processes=None, context=None ):
+        """
+        Args:
+            processes (int, optional):
+                Number of child-processes. By default, the number of CPUs.
+
+            context (str, optional):  ``(ex: 'spawn', 'fork', 'forkserver' )``
+                The :py:mod:`multiprocessing` start-method (python-3 only).
+                Defaults to ``'spawn'`` , since forking a process that
+                is running Qt threads is unsafe.
+        """
+        self._processes = processes
+        self._context   = context
+        self._pool      = None   # multiprocessing.Pool
+        self._manager   = None   # multiprocessing.Manager (shares queues/events with the child-processes)
+        self._running   = set()  # pids of the child-processes that are running a callback
+        self._lock      = threading.Lock()
+
+    def _get_context(self):
+        if not hasattr( multiprocessing, 'get_context' ):
+            return multiprocessing
+        return multiprocessing.get_context( self._context or 'spawn' )
+
+    def _start_pool(self):
+        """
+        Creates the child-processes (on first use).
+        """
+        with self._lock:
+            if self._pool is None:
+                context       = self._get_context()
+                self._manager = context.Manager()
+                self._pool    = context.Pool( processes=self._processes )
+            return (self._pool, self._manager)
+
+    def run_task(self, callback, signalmgr, args=None, kwds=None ):
+        """
+        Runs ``callback( signalmgr=signalmgr, *args, **kwds )`` in a child-process,
+        blocking until it completes. Signals emitted by the child-process are emitted
+        on `signalmgr` , and when :py:meth:`SignalManager.handle_if_abort` would raise
+        in this thread, it will raise in the child-process.
+
+        This is run by :py:obj:`qconcurrency.threading_.ThreadedTask` from the
+        :py:obj:`QtCore.QThreadPool` thread.
+
+        Args:
+            callback (callable):
+                A picklable function.
+
+            signalmgr (SignalManager):
+                The task's :py:obj:`SignalManager` .
+
+            args (tuple, optional):
+                Positional arguments for `callback` .
+
+            kwds (dict, optional):
+                Keyword arguments for `callback` .
+
+        Returns:
+            The callback's return-value.
+
+        Raises:
+            :py:obj:`UserCancelledOperation`: if the callback exited because of an abort-request
+            :py:obj:`ProcessTaskError`:       if the callback raised any other exception,
+                                              or it's child-process exited before it completed
+        """
+        (pool, manager) = self._start_pool()
+
+        queue         = manager.Queue()
+        abort_event   = manager.Event()
+        signal_names  = list(signalmgr.signals().keys())
+        abort_sent    = False
+        pid           = None    # the child-process running the callback (once it has started)
+        workers       = _pool_process_pids( pool )
+        idle_since    = None    # time since which a worker has been idle, while the callback is unstarted
+
+        result = pool.apply_async(
+            _run_in_process,
+            ( callback, args or (), kwds or {}, signal_names, queue, abort_event ),
+        )
+
+        try:
+            while True:
+                if signalmgr._abort_requested and not abort_sent:
+                    abort_event.set()
+                    abort_sent = True
+
+                try:
+                    message = queue.get( timeout=self._poll_interval )
+                except six.moves.queue.Empty:
+                    # failed to unpickle the callback
+                    if result.ready() and not result.successful():
+                        result.get()
+
+                    # child-process died (the pool replaces it, but never completes `result` ,
+                    # which would also prevent the pool from being joined)
+                    if pid is not None  and  not _is_pool_process_alive( pool, pid ):
+                        error = ProcessTaskError(
+                            'child-process (pid %s) exited before the task completed: %s' % (pid, repr(callback))
+                        )
+                        result._set( 0, (False, error) )
+                        raise error
+
+                    # child-process died before the callback started (ex: while unpickling it's arguments).
+                    # Workers take tasks as soon as they are idle, so if one has been replaced, and
+                    # another has been idle for a while, the task is no longer queued.
+                    if pid is None:
+                        if self._is_worker_idle( pool, workers ):
+                            idle_since = idle_since or time.time()
+                        else:
+                            idle_since = None
+
+                        if idle_since is not None  and  time.time() - idle_since > self._start_timeout:
+                            error = ProcessTaskError(
+                                'child-process exited before the task started: %s' % repr(callback)
+                            )
+                            result._set( 0, (False, error) )
+                            raise error
+                    continue
+
+                if message[0] == 'started':
+                    pid = message[1]
+                    with self._lock:
+                        self._running.add( pid )
+
+                elif message[0] == 'signal':
+                    (_, signal, args) = message
+                    getattr( signalmgr, signal ).emit( *args )
+
+                elif message[0] == 'returned':
+                    return message[1]
+
+                elif message[0] == 'cancelled':
+                    raise UserCancelledOperation( message[1] )
+
+                elif message[0] == 'exception':
+                    raise ProcessTaskError( message[1] )
+        finally:
+            with self._lock:
+                self._running.discard( pid )
+
+    def _is_worker_idle(self, pool, workers ):
+        """
+        Returns ``True`` if a worker of `pool` has been replaced since
+        `workers` (the pids of it's workers) was recorded, and one of it's
+        workers is not running a callback.
+        """
+        pids = _pool_process_pids( pool )
+        if not ( pids - workers ):
+            return False
+        with self._lock:
+            return bool( pids - self._running )
+
+    def close(self, wait=True ):
+        """
+        Shuts down the child-processes.
+
+        Args:
+            wait (bool, optional):
+                If ``True`` , pending tasks are completed first.
+                Otherwise child-processes are terminated immediately.
+        """
+        with self._lock:
+            if self._pool is None:
+                return
+
+            if wait:
+                self._pool.close()
+                self._pool.join()
+            else:
+                self._pool.terminate()
+            self._manager.shutdown()
+
+            self._pool    = None
+            self._manager = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, err_type, err_msg, err_tb ):
+        self.close( wait=(err_type is None) )
+
+
+
+class _ProcessSignal( object ):
+    """
+    Stands in for a :py:obj:`QtCore.Signal` within a child-process,
+    queuing emissions to be re-emitted in the parent-process.
+    """
+    def __init__(self, name, queue ):
+        self._name  = name
+        self._queue = queue
+
+    def emit(self, *args):
+        self._queue.put( ('signal', self._name, args) )
+
+
+
+class _ProcessSignalManager( object ):
+    """
+    Stands in for a :py:obj:`SignalManager` within a child-process.
+    See :py:obj:`ProcessPool` .
+    """
+    _abort_check_interval = 0.01   # seconds between checking the (shared) abort-event
+
+    def __init__(self, signal_names, queue, abort_event ):
+        self._queue           = queue
+        self._abort_event     = abort_event
+        self._abort_requested = False
+        self._abort_checked   = 0     # time.time() of last check of `abort_event`
+        self._signals         = {}
+        self._batchers        = {}
+
+        for signal in signal_names:
+            self._signals[ signal ] = _ProcessSignal( signal, queue )
+            setattr( self, signal, self._signals[ signal ] )
+
+        self._batch_ = _ProcessSignal( '_batch_', queue )
+
+    def handle_if_abort(self, msg=None):
+        """
+        Raises :py:obj:`UserCancelledOperation` if an abort
+        has been requested of the task in the parent-process.
+        """
+        # (checking the event is a round-trip to the manager-process)
+        now = time.time()
+        if not self._abort_requested  and  now - self._abort_checked >= self._abort_check_interval:
+            self._abort_checked   = now
+            self._abort_requested = self._abort_event.is_set()
+
+        if self._abort_requested:
+            raise UserCancelledOperation( msg or '' )
+
+    def signals(self):
+        return self._signals
+
+    def batch(self, signal, size=100, interval=50, max_pending=None ):
+        """
+        See :py:meth:`qconcurrency.threading_.SignalManager.batch`
+
+        `max_pending` is accepted so callbacks can be run in a thread or process alike,
+        but it is not applied (batches are relayed to the UI by the parent-process,
+        which does not report back when they are delivered).
+        """
+        if signal not in self._signals:
+            raise RuntimeError(
+                'SignalManager has no signal named "%s". Available signals: %s' % (
+                    signal, repr(sorted(self._signals.keys())) )
+            )
+        if signal not in self._batchers:
+            self._batchers[ signal ] = SignalBatcher( self, signal, size=size, interval=interval )
+        return self._batchers[ signal ]
+
+    def flush_batches(self):
+        for batcher in self._batchers.values():
+            batcher.flush()
+
+
+
+def _is_pool_process_alive( pool, pid ):
+    """
+    Returns ``True`` if the process `pid` is a running worker of the :py:obj:`multiprocessing.Pool` `pool` .
+    """
+    for process in list(pool._pool):
+        if process.pid == pid:
+            return process.is_alive()
+    return False
+
+
+def _pool_process_pids( pool ):
+    """
+    Returns the pids of the running workers of the :py:obj:`multiprocessing.Pool` `pool` .
+    """
+    return set([ process.pid for process in list(pool._pool) if process.is_alive() ])
+
+
+def _run_in_process( callback, args, kwds, signal_names, queue, abort_event ):
+    """
+    Runs `callback` within a child-process, reporting it's
+    signals/result back to :py:meth:`ProcessPool.run_task` using `queue` .
+    """
+    signalmgr = _ProcessSignalManager( signal_names, queue, abort_event )
+    queue.put( ('started', os.getpid()) )
+
+    try:
+        retval = callback( signalmgr=signalmgr, *args, **kwds )
+        signalmgr.flush_batches()
+        queue.put( ('returned', retval) )
+
+    except( UserCancelledOperation ) as exc:
+        signalmgr.flush_batches()
+        queue.put( ('cancelled', '%s' % exc) )
+
+    except:
+        signalmgr.flush_batches()
+        queue.put( ('exception', traceback.format_exc()) )
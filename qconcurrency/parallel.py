@@ -0,0 +1,404 @@
+#!/usr/bin/env python
+"""
+Name :          qconcurrency.parallel.py
+Created :       Oct 17, 2026
+Author :        Will Pittman
+Contact :       willjpittman@gmail.com
+________________________________________________________________________________
+Description :   Applies a function to many items across a :py:obj:`QtCore.QThreadPool` ,
+                in chunks (one :py:obj:`qconcurrency.threading_.ThreadedTask` per chunk),
+                and fuses many small callables into shared tasks.
+________________________________________________________________________________
+"""
+#builtin
+from __future__    import unicode_literals
+from __future__    import absolute_import
+from __future__    import division
+from __future__    import print_function
+import functools
+import logging
+import traceback
+import uuid
+#package
+#external
+from   Qt import QtCore
+import six
+#internal
+from   qconcurrency              import metrics
+from   qconcurrency              import threadpools
+from   qconcurrency.exceptions_  import *
+from   qconcurrency.futures_     import TaskFuture
+from   qconcurrency.threading_   import ThreadedTask
+
+logger = logging.getLogger(__name__)
+loc    = locals
+
+__all__ = [
+    'ParallelMap',
+    'TaskFuser',
+    'parallel_map',
+]
+
+
+def parallel_map( callback, items, chunksize=None, ordered=True, threadpool=None, progressbar=None ):
+    """
+    Creates and starts a :py:obj:`ParallelMap` .
+    See :py:meth:`ParallelMap.__init__` for arguments.
+
+    Example:
+
+        .. code-block:: python
+
+            def thumbnail( path ):
+                return load_thumbnail( path )
+
+            pmap = parallel_map( thumbnail, paths, progressbar=progressbar )
+            pmap.results_ready.connect( lambda results: [ view.set_thumbnail(i, thumb) for (i, thumb) in results ] )
+            pmap.future().add_done_callback( lambda future: view.set_loaded() )
+
+    Returns:
+        :py:obj:`ParallelMap`
+    """
+    pmap = ParallelMap(
+        callback    = callback,
+        items       = items,
+        chunksize   = chunksize,
+        ordered     = ordered,
+        threadpool  = threadpool,
+        progressbar = progressbar,
+    )
+    pmap.start()
+    return pmap
+
+
+
+class ParallelMap( QtCore.QObject ):
+    """
+    Runs ``callback( item )`` for every item in `items` , across a :py:obj:`QtCore.QThreadPool` .
+
+    Items are split into chunks, and each chunk is run by a single
+    :py:obj:`qconcurrency.threading_.ThreadedTask` , so the per-task costs
+    (signal-manager, runnable, signal-delivery) are paid once per chunk
+    instead of once per item.
+
+    Results are delivered to the UI thread as each chunk completes, using the signal
+    `results_ready` ( a list of ``(index, result)`` tuples ). When `ordered` , results
+    are delivered in the order of `items` (a chunk is held until all chunks before it
+    have completed), otherwise in the order that chunks complete.
+
+    :py:meth:`future` resolves with the list of all results (in the order of `items` ).
+    If any item raises an exception, the remaining chunks are aborted.
+    """
+    results_ready = QtCore.Signal(object)  # [ (index, result), ... ]
+    finished      = QtCore.Signal()        # all items completed successfully
+    exception     = QtCore.Signal()        # an item raised, or the map was aborted
+
+    _chunks_per_thread = 4   # default number of chunks, per thread in the threadpool
+
+    def __init__(self, callback, items, chunksize=None, ordered=True, threadpool=None, progressbar=None ):
+        """
+        Args:
+            callback (callable):
+                Function called with each item ( ``callback( item )`` ).
+                It's return-value is the item's result.
+
+            items (iterable):
+                Items to run `callback` on.
+
+            chunksize (int, optional):
+                Number of items run by each task. By default, items are split
+                into 4x as many chunks as the threadpool has threads.
+
+            ordered (bool, optional):
+                If ``True`` , `results_ready` delivers results in the
+                order of `items` . Otherwise as soon as they are available.
+
+            threadpool (QtCore.QThreadPool, str, optional):
+                Threadpool (or registered threadpool name) to run chunks in. By default :py:meth:`QtCore.QThreadPool.globalInstance` .
+
+            progressbar (qconcurrency.widgets.ProgressBar, optional):
+                If provided, progress is reported to this progressbar
+                (under a single jobid) as chunks complete.
+        """
+        QtCore.QObject.__init__(self)
+
+        threadpool = threadpools.resolve_threadpool( threadpool )
+
+        self._callback    = callback
+        self._items       = list(items)
+        self._ordered     = ordered
+        self._threadpool  = threadpool
+        self._progressbar = progressbar
+        self._jobid       = uuid.uuid4().hex
+
+        if not chunksize:
+            nchunks   = max( 1, threadpool.maxThreadCount() * self._chunks_per_thread )
+            chunksize = max( 1, -(-len(self._items) // nchunks) )
+        self._chunksize = chunksize
+
+        self._tasks          = []      # [ ThreadedTask, ... ]  (one per chunk)
+        self._chunk_results  = {}      # { chunk_index : [ result, ... ] }
+        self._next_delivered = 0       # (ordered) index of the next chunk to deliver
+        self._future         = TaskFuture( on_cancel=self.request_abort )
+
+    def start(self):
+        """
+        Queues all chunks in the threadpool.
+
+        Returns:
+            :py:obj:`qconcurrency.futures_.TaskFuture` (see :py:meth:`future` )
+        """
+        if self._tasks:
+            raise RuntimeError('ParallelMap has already been started')
+
+        if not self._items:
+            self._future._set_result( [] )
+            self.finished.emit()
+            return self._future
+
+        if self._progressbar is not None:
+            self._progressbar.add_progress( len(self._items), jobid=self._jobid )
+
+        metrics_name = metrics.callback_name( self._callback )
+        for start in range( 0, len(self._items), self._chunksize ):
+            chunk = self._items[ start : start + self._chunksize ]
+            task  = ThreadedTask( _run_chunk, None, self._callback, chunk )
+            task._metrics_name = metrics_name
+            self._tasks.append( task )
+
+        for (chunk_index, task) in enumerate(self._tasks):
+            future = task.start( threadpool=self._threadpool )
+            future.add_done_callback( lambda future, chunk_index=chunk_index: self._handle_chunk_done( chunk_index, future ) )
+
+        return self._future
+
+    def future(self):
+        """
+        Returns a :py:obj:`qconcurrency.futures_.TaskFuture` that resolves with
+        the list of all results (in the order of `items` ).
+        """
+        return self._future
+
+    def request_abort(self):
+        """
+        Aborts all chunks. Queued chunks are withdrawn from the threadpool,
+        running chunks exit before their next item.
+        """
+        for task in self._tasks:
+            task.future().cancel()
+
+    def _handle_chunk_done(self, chunk_index, future ):
+        """
+        Collects/delivers a chunk's results (run in the UI thread).
+        """
+        if self._future.done():
+            return
+
+        if not future._succeeded():
+            self._future._copy_state( future )
+            self.request_abort()
+            self._finish_progress()
+            self.exception.emit()
+            return
+
+        results = future.result()
+        self._chunk_results[ chunk_index ] = results
+        if self._progressbar is not None:
+            self._progressbar.incr_progress( len(results), jobid=self._jobid )
+
+        if self._ordered:
+            while self._next_delivered in self._chunk_results:
+                self._deliver( self._next_delivered )
+                self._next_delivered += 1
+        else:
+            self._deliver( chunk_index )
+
+        if len(self._chunk_results) == len(self._tasks):
+            all_results = []
+            for index in range(len(self._tasks)):
+                all_results.extend( self._chunk_results[ index ] )
+            self._future._set_result( all_results )
+            self._finish_progress()
+            self.finished.emit()
+
+    def _deliver(self, chunk_index ):
+        start = chunk_index * self._chunksize
+        self.results_ready.emit(
+            list(zip( range( start, start + len(self._chunk_results[ chunk_index ]) ), self._chunk_results[ chunk_index ] ))
+        )
+
+    def _finish_progress(self):
+        if self._progressbar is not None:
+            self._progressbar._handle_return_or_abort( jobid=self._jobid )
+
+
+class TaskFuser( QtCore.QObject ):
+    """
+    Packs many small callables into shared :py:obj:`qconcurrency.threading_.ThreadedTask` s,
+    that run them sequentially. Each submitted callable still gets it's own
+    :py:obj:`qconcurrency.futures_.TaskFuture` , but the per-task costs (signal-manager,
+    runnable, signal-delivery) are paid once per fused batch.
+
+    A batch is started once it holds `size` callables, or `latency` milliseconds
+    after it's first callable was submitted (whichever comes first).
+
+    Results/errors are delivered to the UI thread per-batch, using the signals
+    `results_ready` and `errors` ( lists of ``(index, result)`` and ``(index, exception)`` ,
+    where `index` is the order the callable was submitted in).
+
+    Example:
+
+        .. code-block:: python
+
+            fuser = TaskFuser( size=500, latency=20 )
+            fuser.results_ready.connect( model.add_file_stats )
+
+            for path in paths:
+                fuser.submit( os.stat, path )
+
+    .. note::
+
+        :py:meth:`submit` must be called from the thread the :py:obj:`TaskFuser`
+        belongs to (normally the UI thread), since the latency-bound uses a :py:obj:`QtCore.QTimer` .
+    """
+    results_ready = QtCore.Signal(object)  # [ (index, result),    ... ]
+    errors        = QtCore.Signal(object)  # [ (index, exception), ... ]
+
+    def __init__(self, size=100, latency=10, threadpool=None ):
+        """
+        Args:
+            size (int, optional):
+                Maximum number of callables fused into a single task.
+
+            latency (int, optional):
+                Maximum milliseconds a submitted callable waits
+                for it's batch to fill, before the batch is started.
+
+            threadpool (QtCore.QThreadPool, str, optional):
+                Threadpool (or registered threadpool name) to run batches in. By default :py:meth:`QtCore.QThreadPool.globalInstance` .
+        """
+        QtCore.QObject.__init__(self)
+
+        threadpool = threadpools.resolve_threadpool( threadpool )
+
+        self._size       = size
+        self._threadpool = threadpool
+        self._pending    = []   # [ (index, future, callback, args, kwds), ... ]
+        self._running    = {}   # { id(task) : ThreadedTask }  batches started, but not yet complete
+        self._index      = 0    # index assigned to the next submitted callable
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval( latency )
+        self._timer.timeout.connect( self.flush )
+
+    def submit(self, callback, *args, **kwds ):
+        """
+        Adds ``callback( *args, **kwds )`` to the current batch.
+        (unlike a :py:obj:`ThreadedTask` callback, `signalmgr` is not passed).
+
+        Returns:
+            :py:obj:`qconcurrency.futures_.TaskFuture` for the callable's result.
+        """
+        future = TaskFuture()
+        self._pending.append( (self._index, future, callback, args, kwds) )
+        self._index += 1
+
+        if len(self._pending) >= self._size:
+            self.flush()
+        elif not self._timer.isActive():
+            self._timer.start()
+
+        return future
+
+    def flush(self):
+        """
+        Starts the current batch immediately.
+        """
+        self._timer.stop()
+        if not self._pending:
+            return
+
+        batch         = self._pending
+        self._pending = []
+
+        task = ThreadedTask( _run_fused, None, batch )
+        self._running[ id(task) ] = task
+        future = task.start( threadpool=self._threadpool )
+        future.add_done_callback( functools.partial( self._handle_batch_done, id(task), batch ) )
+
+    def request_abort(self):
+        """
+        Cancels all callables that have not yet run
+        (pending, or in started batches).
+        """
+        self._timer.stop()
+        pending       = self._pending
+        self._pending = []
+        for item in pending:
+            item[1]._set_cancelled()
+
+        for task in list(self._running.values()):
+            task.request_abort()
+
+    def _handle_batch_done(self, task_id, batch, future ):
+        """
+        Delivers a batch's results/errors (run in the UI thread).
+        If the batch was withdrawn before it ran (or failed), it's
+        unresolved futures are resolved the same way.
+        """
+        self._running.pop( task_id, None )
+        if not future._succeeded():
+            for item in batch:
+                item[1]._copy_state( future )
+            return
+
+        (results, errors) = future.result()
+        if results:
+            self.results_ready.emit( results )
+        if errors:
+            self.errors.emit( errors )
+
+
+
+def _run_chunk( callback, chunk, signalmgr=None ):
+    """
+    Runs `callback` on each item of `chunk` (within a thread),
+    exiting early if an abort is requested.
+    """
+    results = []
+    for item in chunk:
+        signalmgr.handle_if_abort()
+        results.append( callback( item ) )
+    return results
+
+
+def _run_fused( batch, signalmgr=None ):
+    """
+    Runs each callable in a :py:obj:`TaskFuser` batch (within a thread),
+    resolving their futures as they complete.
+
+    Returns:
+        ``( [(index, result), ...], [(index, exception), ...] )``
+    """
+    results = []
+    errors  = []
+    for (index, future, callback, args, kwds) in batch:
+        if future._cancel_requested  or  signalmgr._abort_requested:
+            future._set_cancelled()
+            continue
+
+        future._set_running()
+        try:
+            retval = callback( *args, **kwds )
+        except( UserCancelledOperation ):
+            future._set_cancelled()
+        except Exception as exc:
+            logger.error( '%s\n\nUnhandled Exception in fused callable: %s' % (traceback.format_exc(), repr(callback)) )
+            future._set_exception( exc )
+            errors.append( (index, exc) )
+        else:
+            future._set_result( retval )
+            results.append( (index, retval) )
+
+    return (results, errors)
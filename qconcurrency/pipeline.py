@@ -0,0 +1,431 @@
+#!/usr/bin/env python
+"""
+Name :          qconcurrency.pipeline.py
+Created :       Oct 17, 2026
+Author :        Will Pittman
+Contact :       willjpittman@gmail.com
+________________________________________________________________________________
+Description :   Runs items through a chain of stages (ex: load -> parse -> index),
+                each stage with it's own threadpool and number of workers,
+                connected by bounded queues so I/O and CPU work overlap.
+________________________________________________________________________________
+"""
+#builtin
+from __future__    import unicode_literals
+from __future__    import absolute_import
+from __future__    import division
+from __future__    import print_function
+import inspect
+import logging
+import threading
+import time
+#package
+#external
+from   Qt          import QtCore
+from   six.moves   import queue
+import six
+#internal
+from   qconcurrency              import threadpools
+from   qconcurrency.exceptions_  import *
+from   qconcurrency.futures_     import TaskFuture
+from   qconcurrency.threading_   import ThreadedTask
+
+logger = logging.getLogger(__name__)
+loc    = locals
+
+__all__ = [
+    'Pipeline',
+    'PipelineStage',
+]
+
+
+_end_of_stream = object()   # put in a stage's queue once per worker, after the last item
+
+
+class Pipeline( QtCore.QObject ):
+    """
+    Runs each item through a chain of stages. Every stage has it's own
+    threadpool and number of workers (each a :py:obj:`qconcurrency.threading_.ThreadedTask` ),
+    and reads it's items from a bounded queue filled by the previous stage.
+    A stage that falls behind fills it's queue, pausing the stages before it
+    (so memory stays bounded), while stages on other threadpools keep working.
+    Since stages wait on each other, all workers must be able to run at once
+    (:py:meth:`start` raises a :py:obj:`RuntimeError` if a threadpool has too few threads).
+
+    Results of the last stage are delivered to the UI thread in batches
+    using the signal `results_ready` (in the order they complete).
+
+    An exception in any stage, or :py:meth:`request_abort` aborts every stage
+    (workers blocked on a full/empty queue exit promptly).
+
+    Example:
+
+        .. code-block:: python
+
+            pipeline = Pipeline()
+            pipeline.add_stage( 'load',  load_file,  workers=8, threadpool='io'  )
+            pipeline.add_stage( 'parse', parse_file, workers=4, threadpool='cpu' )
+            pipeline.add_stage( 'index', index_file, workers=1 )
+            pipeline.results_ready.connect( model.add_files )
+            pipeline.stats_ready.connect( statusbar.show_pipeline_stats )
+
+            pipeline.start( filepaths )
+
+    A stage's callback is called with one item ( ``callback( item )`` ), it's return-value
+    is passed to the next stage. If it returns a generator, each yielded value is passed
+    to the next stage instead (so a stage may split, or filter items).
+    """
+    results_ready = QtCore.Signal(object)  # [ result, ... ]
+    stats_ready   = QtCore.Signal(object)  # see `stats()` (every `stats_interval` , while running)
+    finished      = QtCore.Signal()        # all items passed through every stage
+    exception     = QtCore.Signal()        # a stage raised, or the pipeline was aborted
+
+    def __init__(self, threadpool=None, stats_interval=1000, parent=None ):
+        """
+        Args:
+            threadpool (QtCore.QThreadPool, str, optional):
+                Threadpool (or registered threadpool name) of the task that feeds
+                items into the first stage, and of stages that do not set one.
+                By default :py:meth:`QtCore.QThreadPool.globalInstance` .
+
+            stats_interval (int, optional):
+                Milliseconds between emissions of `stats_ready` while running
+                ( ``0`` disables them).
+
+            parent (QtCore.QObject, optional):
+                Qt parent of this object.
+        """
+        QtCore.QObject.__init__(self, parent)
+
+        self._threadpool = threadpool
+        self._stages     = []     # [ PipelineStage, ... ]
+        self._tasks      = []     # [ ThreadedTask, ... ] feeder, and all workers
+        self._remaining  = 0      # number of tasks that have not completed
+        self._future     = TaskFuture( on_cancel=self.request_abort )
+
+        self._stats_timer = QtCore.QTimer(self)
+        self._stats_timer.setInterval( stats_interval )
+        self._stats_timer.timeout.connect( self._emit_stats )
+        self._stats_interval = stats_interval
+
+    def add_stage(self, name, callback, workers=1, threadpool=None, queue_size=None ):
+        """
+        Appends a stage to the pipeline.
+
+        Args:
+            name (str):  ``(ex: 'parse' )``
+                Name of the stage (used in :py:meth:`stats` ).
+
+            callback (callable):
+                Called with each item ( ``callback( item )`` ) within a worker-thread.
+
+            workers (int, optional):
+                Number of items this stage processes concurrently.
+
+            threadpool (QtCore.QThreadPool, str, optional):
+                Threadpool (or registered threadpool name) this stage's workers run in.
+                By default, the pipeline's threadpool.
+
+            queue_size (int, optional):
+                Maximum number of items waiting for this stage.
+                By default, 4x it's number of workers.
+
+        Returns:
+            :py:obj:`PipelineStage`
+        """
+        if self._tasks:
+            raise RuntimeError('Cannot add stages to a Pipeline that has already been started')
+        if name in [ stage.name for stage in self._stages ]:
+            raise RuntimeError('Pipeline already has a stage named "%s"' % name)
+
+        stage = PipelineStage(
+            name       = name,
+            callback   = callback,
+            workers    = workers,
+            threadpool = threadpools.resolve_threadpool( threadpool or self._threadpool ),
+            queue_size = queue_size or workers * 4,
+        )
+        self._stages.append( stage )
+        return stage
+
+    def stages(self):
+        """
+        Returns a list of this pipeline's :py:obj:`PipelineStage` s (in order).
+        """
+        return list(self._stages)
+
+    def start(self, items ):
+        """
+        Starts all stages, and feeds `items` into the first stage.
+
+        Args:
+            items (iterable):
+                Items to run through the pipeline. It is consumed
+                within a thread, as the first stage has room for them.
+
+        Returns:
+            :py:obj:`qconcurrency.futures_.TaskFuture` (see :py:meth:`future` )
+        """
+        if not self._stages:
+            raise RuntimeError('Pipeline has no stages')
+        if self._tasks:
+            raise RuntimeError('Pipeline has already been started')
+
+        feeder = ThreadedTask( _feed, None, items, self._stages[0] )
+        feeder._metrics_name = 'pipeline.feed'
+        tasks  = [ (feeder, threadpools.resolve_threadpool( self._threadpool )) ]
+
+        for (index, stage) in enumerate(self._stages):
+            next_stage = None
+            if index + 1 < len(self._stages):
+                next_stage = self._stages[ index + 1 ]
+
+            stage._started = time.time()
+            for i in range(stage.workers):
+                task = ThreadedTask( _run_stage, {'result': object}, stage, next_stage )
+                task._metrics_name = 'pipeline.%s' % stage.name
+                if next_stage is None:
+                    task.connect_batch( 'result', self._deliver_results )
+                tasks.append( (task, stage.threadpool) )
+
+        # every worker waits on it's neighbours, they must all be able to run at once
+        required = {}
+        for (task, threadpool) in tasks:
+            required[ threadpool ] = required.get( threadpool, 0 ) + 1
+        for (threadpool, nthreads) in required.items():
+            if nthreads > threadpool.maxThreadCount():
+                raise RuntimeError((
+                    'Pipeline requires %s threads in threadpool %s, but it has a maxThreadCount of %s. '
+                    'Reduce the number of workers, or run stages in another threadpool.'
+                    ) % ( nthreads, repr(threadpool), threadpool.maxThreadCount() )
+                )
+
+        self._tasks     = [ task for (task, threadpool) in tasks ]
+        self._remaining = len(self._tasks)
+        if self._stats_interval:
+            self._stats_timer.start()
+
+        for (task, threadpool) in tasks:
+            future = task.start( threadpool=threadpool )
+            future.add_done_callback( self._handle_task_done )
+
+        return self._future
+
+    def future(self):
+        """
+        Returns a :py:obj:`qconcurrency.futures_.TaskFuture` that resolves (with ``None`` )
+        once every item has passed through every stage.
+        """
+        return self._future
+
+    def request_abort(self):
+        """
+        Aborts every stage. Queued workers are withdrawn from their threadpools,
+        running workers exit before their next item.
+        """
+        for task in self._tasks:
+            task.future().cancel()
+
+    def stats(self):
+        """
+        Returns the throughput and queue-depth of each stage.
+
+        .. code-block:: python
+
+            {
+                'load':  {'workers': 8, 'processed': 1200, 'queue_depth': 32, 'queue_size': 32, 'throughput': 240.0, 'utilization': 0.95},
+                'parse': {'workers': 4, 'processed': 1180, 'queue_depth': 3,  'queue_size': 16, 'throughput': 236.0, 'utilization': 0.41},
+                ...
+            }
+
+        A stage whose queue stays full is waiting for slower stages after it,
+        a stage whose queue stays empty is waiting for the stages before it.
+        See :py:meth:`PipelineStage.stats` .
+        """
+        return dict([ (stage.name, stage.stats()) for stage in self._stages ])
+
+    def _emit_stats(self):
+        self.stats_ready.emit( self.stats() )
+
+    def _deliver_results(self, items ):
+        """
+        Delivers a batch of results from the last stage (run in the UI thread).
+        """
+        if self._future.done():
+            return
+        self.results_ready.emit([ args[0] for args in items ])
+
+    def _handle_task_done(self, future ):
+        """
+        Resolves the pipeline once all tasks complete,
+        or aborts it as soon as any task fails (run in the UI thread).
+        """
+        self._remaining -= 1
+        if self._future.done():
+            if not self._remaining:
+                self._stats_timer.stop()
+            return
+
+        if not future._succeeded():
+            self._stats_timer.stop()
+            self._future._copy_state( future )
+            self.request_abort()
+            self.exception.emit()
+            return
+
+        if not self._remaining:
+            self._stats_timer.stop()
+            self._future._set_result( None )
+            if self._stats_interval:
+                self._emit_stats()
+            self.finished.emit()
+
+
+
+class PipelineStage( object ):
+    """
+    A stage of a :py:obj:`Pipeline` (created by :py:meth:`Pipeline.add_stage` ).
+    Holds the stage's input queue, and it's statistics.
+    """
+    def __init__(self, name, callback, workers, threadpool, queue_size ):
+        self.name       = name
+        self.callback   = callback
+        self.workers    = workers
+        self.threadpool = threadpool
+        self.queue      = queue.Queue( maxsize=queue_size )
+
+        self._lock      = threading.Lock()
+        self._active    = workers   # workers that have not yet received `_end_of_stream`
+        self._processed = 0         # items the callback completed
+        self._busy      = 0.0       # seconds spent in the callback (all workers)
+        self._started   = None      # time.time() the pipeline was started
+
+    def stats(self):
+        """
+        Returns:
+
+            .. code-block:: python
+
+                {
+                    'workers':     4,      # number of workers
+                    'processed':   1180,   # items processed
+                    'queue_depth': 3,      # items waiting for this stage
+                    'queue_size':  16,     # maximum items waiting for this stage
+                    'throughput':  236.0,  # items processed per second
+                    'utilization': 0.41,   # fraction of the workers' time spent in the callback
+                }
+        """
+        with self._lock:
+            processed = self._processed
+            busy      = self._busy
+
+        elapsed = 0
+        if self._started is not None:
+            elapsed = time.time() - self._started
+
+        return {
+            'workers':     self.workers,
+            'processed':   processed,
+            'queue_depth': self.queue.qsize(),
+            'queue_size':  self.queue.maxsize,
+            'throughput':  ( processed / elapsed ) if elapsed else 0.0,
+            'utilization': min( 1.0, busy / (elapsed * self.workers) ) if elapsed else 0.0,
+        }
+
+    def _record(self, seconds ):
+        with self._lock:
+            self._processed += 1
+            self._busy      += seconds
+
+    def _worker_exited(self):
+        """
+        Returns ``True`` if the calling worker was the last
+        of this stage to receive `_end_of_stream` .
+        """
+        with self._lock:
+            self._active -= 1
+            return self._active == 0
+
+
+
+def _put( stage, item, signalmgr ):
+    """
+    Adds `item` to `stage` 's queue, waiting for room (exits if an abort is requested).
+    """
+    while True:
+        signalmgr.handle_if_abort()
+        try:
+            stage.queue.put( item, timeout=0.05 )
+            return
+        except( queue.Full ):
+            pass
+
+
+def _get( stage, signalmgr ):
+    """
+    Returns the next item from `stage` 's queue, waiting for one (exits if an abort is requested).
+    """
+    while True:
+        signalmgr.handle_if_abort()
+        try:
+            return stage.queue.get( timeout=0.05 )
+        except( queue.Empty ):
+            pass
+
+
+def _feed( items, stage, signalmgr=None ):
+    """
+    Adds each of `items` to the first stage's queue (within a thread).
+    """
+    for item in items:
+        _put( stage, item, signalmgr )
+    for i in range(stage.workers):
+        _put( stage, _end_of_stream, signalmgr )
+
+
+def _run_stage( stage, next_stage, signalmgr=None ):
+    """
+    A worker of `stage` (within a thread). Runs the stage's callback on items
+    from it's queue, passing results to `next_stage` (or to the UI, if it is the last stage).
+    """
+    if next_stage is None:
+        results = signalmgr.batch(
+            'result',
+            size        = ThreadedTask.stream_size,
+            interval    = ThreadedTask.stream_interval,
+            max_pending = ThreadedTask.stream_max_pending,
+        )
+        output = lambda value: results.emit( value )
+    else:
+        output = lambda value: _put( next_stage, value, signalmgr )
+
+    while True:
+        item = _get( stage, signalmgr )
+        if item is _end_of_stream:
+            break
+
+        # time spent waiting for room in the next stage is not busy-time
+        start  = time.time()
+        retval = stage.callback( item )
+        busy   = time.time() - start
+
+        if inspect.isgenerator( retval ):
+            while True:
+                signalmgr.handle_if_abort()
+                start = time.time()
+                try:
+                    value = next( retval )
+                except StopIteration:
+                    busy += time.time() - start
+                    break
+                busy += time.time() - start
+                output( value )
+        else:
+            output( retval )
+        stage._record( busy )
+
+    # the last worker of this stage ends the next stage
+    if stage._worker_exited()  and  next_stage is not None:
+        for i in range(next_stage.workers):
+            _put( next_stage, _end_of_stream, signalmgr )
+
@@ -0,0 +1,272 @@
+#!/usr/bin/env python
+"""
+Name :          qconcurrency.taskgroup.py
+Created :       Oct 17, 2026
+Author :        Will Pittman
+Contact :       willjpittman@gmail.com
+________________________________________________________________________________
+Description :   A scope that owns the tasks started within it, cancelling them
+                all when the scope exits, or the object it is attached to
+                (ex: a window) is destroyed.
+________________________________________________________________________________
+"""
+#builtin
+from __future__    import unicode_literals
+from __future__    import absolute_import
+from __future__    import division
+from __future__    import print_function
+from   collections import OrderedDict
+import functools
+import logging
+import threading
+import time
+#package
+#external
+from   Qt import QtCore
+import six
+#internal
+
+logger = logging.getLogger(__name__)
+loc    = locals
+
+__all__ = [
+    'TaskGroup',
+    'current_taskgroup',
+]
+
+
+_local = threading.local()   # `taskgroups` : [ TaskGroup, ... ] entered in this thread (innermost last)
+
+
+def current_taskgroup():
+    """
+    Returns the innermost :py:obj:`TaskGroup` entered (using ``with`` ) in this thread,
+    or ``None`` . :py:meth:`qconcurrency.threading_.ThreadedTask.start` adds the task to it.
+    """
+    taskgroups = getattr( _local, 'taskgroups', None )
+    if taskgroups:
+        return taskgroups[-1]
+    return None
+
+
+
+class TaskGroup( object ):
+    """
+    Owns a set of tasks, so they can be cancelled together.
+
+    Owned tasks may be :py:obj:`qconcurrency.threading_.ThreadedTask` ,
+    :py:obj:`qconcurrency.threading_.SoloThreadedTask` , :py:obj:`qconcurrency.parallel.ParallelMap` ,
+    :py:obj:`qconcurrency.pipeline.Pipeline` , or :py:obj:`qconcurrency.graph.TaskGraph` .
+    They are added using :py:meth:`add`/:py:meth:`start` , or by starting
+    a :py:obj:`qconcurrency.threading_.ThreadedTask` within a ``with`` block.
+    Tasks are released from the group once they complete.
+
+    All owned tasks are cancelled:
+
+        * when the ``with`` block exits
+        * when `owner` is destroyed (a task still running is then detached, so it no longer
+          calls into the owner's now deleted widgets)
+        * when :py:meth:`cancel` is called ( :py:obj:`qconcurrency.QBaseWindow` does this when it is closed)
+
+    Example:
+
+        .. code-block:: python
+
+            # tasks started by a widget are cancelled when it is deleted
+            class ThumbnailView( QtWidgets.QListWidget ):
+                def __init__(self):
+                    QtWidgets.QListWidget.__init__(self)
+                    self._taskgroup = TaskGroup( owner=self )
+
+                def load(self, paths):
+                    task = ThreadedTask( load_thumbnails, paths=paths )
+                    task.signal('returned').connect( self.add_thumbnails )
+                    self._taskgroup.start( task, threadpool='io' )
+
+            # any search still running when the first one finds a match is cancelled
+            def find( dirpaths, filename, signalmgr=None ):
+                with TaskGroup():
+                    futures = [ ThreadedTask( search_dir, dirpath=d, filename=filename ).start() for d in dirpaths ]
+                    return any_of( futures ).result()
+    """
+    _wait_interval = 0.01   # seconds between checks (and processing Qt events in the UI thread), while waiting
+
+    def __init__(self, owner=None, wait=None, detach=False ):
+        """
+        Args:
+            owner (QtCore.QObject, optional):
+                If provided, all owned tasks are cancelled (and detached) when `owner` is destroyed.
+
+            wait (numbers.Number, optional):
+                Seconds to wait for owned tasks to exit, when the ``with`` block
+                exits or `owner` is destroyed (see :py:meth:`cancel` ).
+
+            detach (bool, optional):
+                If ``True`` , tasks still running when the ``with`` block exits are
+                detached (see :py:meth:`cancel` ). Tasks are always detached when
+                `owner` is destroyed.
+        """
+        self._wait   = wait
+        self._detach = detach
+        self._tasks  = OrderedDict()   # { id(task) : task }
+        self._lock   = threading.Lock()
+
+        if owner is not None:
+            # (partial) holds a strong reference to this group, so it outlives it's owner
+            owner.destroyed.connect( functools.partial( TaskGroup._handle_owner_destroyed, self ) )
+
+    def add(self, task ):
+        """
+        Adds `task` to this group (without starting it).
+
+        Args:
+            task (object):
+                A :py:obj:`qconcurrency.threading_.ThreadedTask` ,
+                or any object with a ``future()`` (ex: :py:obj:`qconcurrency.parallel.ParallelMap` ),
+                or ``stop()`` (ex: :py:obj:`qconcurrency.threading_.SoloThreadedTask` ) method.
+
+        Returns:
+            `task`
+        """
+        if not hasattr( task, 'future' )  and  not hasattr( task, 'stop' ):
+            raise TypeError(
+                'Expected a task with a `future()` or `stop()` method, received: %s' % repr(task)
+            )
+
+        with self._lock:
+            if id(task) in self._tasks:
+                return task
+            self._tasks[ id(task) ] = task
+
+        if hasattr( task, 'future' ):
+            task.future().add_done_callback( functools.partial( self._discard, id(task) ) )
+        return task
+
+    def start(self, task, *args, **kwds ):
+        """
+        Adds `task` to this group, and starts it.
+
+        Args:
+            task (object):
+                See :py:meth:`add` .
+
+            *args/**kwds:
+                Passed to ``task.start()`` .
+
+        Returns:
+            The return-value of ``task.start()`` (normally a :py:obj:`qconcurrency.futures_.TaskFuture` ).
+        """
+        self.add( task )
+        return task.start( *args, **kwds )
+
+    def tasks(self):
+        """
+        Returns a list of the owned tasks that are still running (or queued).
+        """
+        with self._lock:
+            tasks = list(self._tasks.values())
+        return [ task for task in tasks if _is_running( task ) ]
+
+    def cancel(self, wait=None, detach=False ):
+        """
+        Cancels every owned task. Queued tasks are withdrawn from their threadpools,
+        running tasks have an abort requested (they exit at their next
+        :py:meth:`qconcurrency.threading_.SignalManager.handle_if_abort` ).
+        The group may still be used afterwards.
+
+        Args:
+            wait (numbers.Number, optional):
+                Seconds to wait for the cancelled tasks to exit (negative waits indefinitely).
+                When waiting in the UI thread, Qt events continue to be processed.
+
+            detach (bool, optional):
+                If ``True`` , tasks that are still running (after waiting) are detached:
+                their signals are disconnected from all slots, so they no longer call into
+                objects that may be deleted (see :py:meth:`qconcurrency.threading_.ThreadedTask.detach` ).
+
+        Returns:
+            ``True`` if all cancelled tasks have exited.
+        """
+        with self._lock:
+            tasks = list(self._tasks.values())
+
+        for task in tasks:
+            if hasattr( task, 'future' ):
+                task.future().cancel()
+            else:
+                task.stop()
+
+        exited = True
+        if wait:
+            exited = self.wait( wait )
+
+        if detach:
+            for task in self.tasks():
+                if hasattr( task, 'detach' ):
+                    task.detach()
+
+        return exited  and  not self.tasks()
+
+    def wait(self, timeout=None ):
+        """
+        Waits for all owned tasks to exit. When called from the UI thread,
+        Qt events are processed while waiting.
+
+        Args:
+            timeout (numbers.Number, optional):
+                Seconds to wait before giving up. ``None`` or a negative
+                number waits indefinitely.
+
+        Returns:
+            ``True`` if all tasks exited, ``False`` if `timeout` expired.
+        """
+        app          = QtCore.QCoreApplication.instance()
+        in_ui_thread = app is not None  and  QtCore.QThread.currentThread() == app.thread()
+
+        deadline = None
+        if timeout is not None  and  timeout >= 0:
+            deadline = time.time() + timeout
+
+        while self.tasks():
+            if deadline is not None  and  time.time() >= deadline:
+                return False
+            if in_ui_thread:
+                app.processEvents()
+            time.sleep( self._wait_interval )
+
+        if in_ui_thread:
+            app.processEvents()
+        return True
+
+    def __enter__(self):
+        if getattr( _local, 'taskgroups', None ) is None:
+            _local.taskgroups = []
+        _local.taskgroups.append( self )
+        return self
+
+    def __exit__(self, err_type, err_msg, err_tb ):
+        _local.taskgroups.remove( self )
+        self.cancel( wait=self._wait, detach=self._detach )
+
+    def _discard(self, task_id, future=None ):
+        with self._lock:
+            self._tasks.pop( task_id, None )
+
+    def _handle_owner_destroyed(self, *args ):
+        logger.debug('TaskGroup owner destroyed, cancelling %s tasks' % len(self._tasks))
+        self.cancel( wait=self._wait, detach=True )
+
+
+
+def _is_running( task ):
+    """
+    Returns ``True`` if an owned task is running (or queued).
+    """
+    from qconcurrency.threading_ import ThreadedTask
+
+    if isinstance( task, ThreadedTask ):
+        return task._threadpool is not None  and  not task.future().done()
+    if hasattr( task, 'future' ):
+        return not task.future().done()
+    return task.is_active()
+
@@ -4,9 +4,15 @@ from __future__    import absolute_import
 from __future__    import division
 from __future__    import print_function
 import sys
+import time
+#external
+from   Qt import QtCore
 
 __all__ = [
     'mock',
+    'process_events_until',
+    'new_threadpool',
+    'loop_until_abort',
 ]
 
 _major = sys.version_info[0]
@@ -18,6 +24,48 @@ else:
     from unittest import mock
 
 
+def process_events_until( predicate, timeout=5 ):
+    """
+    Processes Qt events (in the UI thread) until ``predicate()`` returns ``True`` ,
+    or `timeout` seconds have passed.
+    """
+    app   = QtCore.QCoreApplication.instance()
+    start = time.time()
+    while not predicate() and time.time() - start < timeout:
+        app.processEvents()
+        time.sleep(0.005)
+
+
+def new_threadpool( nthreads=8 ):
+    """
+    Returns a new :py:obj:`QtCore.QThreadPool` with `nthreads` threads
+    (so tests do not share, or depend on the size of, the global threadpool).
+    """
+    threadpool = QtCore.QThreadPool()
+    threadpool.setMaxThreadCount( nthreads )
+    return threadpool
+
+
+def loop_until_abort( started=None, timeout=10, signalmgr=None ):
+    """
+    Task-callback that runs until an abort is requested (raising
+    :py:obj:`qconcurrency.exceptions_.UserCancelledOperation` ),
+    or `timeout` seconds have passed (returning ``'finished'`` ).
+
+    Args:
+        started (threading.Event, optional):
+            Set once the callback is running.
+    """
+    if started is not None:
+        started.set()
+
+    start = time.time()
+    while time.time() - start < timeout:
+        signalmgr.handle_if_abort()
+        time.sleep(0.005)
+    return 'finished'
+
+
 
 
 if __name__ == '__main__':
@@ -20,213 +20,845 @@ import sys
 import os
 import uuid
 import time
-import importlib
 import functools
+import heapq
+import inspect
+import itertools
 import traceback
 import threading
 #package
 #external
-from   Qt import QtCore, QtWidgets
+from   Qt import QtCore, QtWidgets, QtCompat
 import six
 #internal
 from   qconcurrency.exceptions_  import *
+from   qconcurrency.futures_     import TaskFuture
+from   qconcurrency              import metrics
+from   qconcurrency              import taskgroup
+from   qconcurrency              import threadpools
+from   qconcurrency              import tracing
 
 logger = logging.getLogger(__name__)
 loc    = locals
 
 __all__ = [
     'SignalManagerFactory',
+    'SignalManagerClassFactory',
+    'SignalBatcher',
+    'SignalChannel',
+    'ChannelPolicy',
+    'TaskPriority',
     'ThreadedTask',
     'SoloThreadedTask',
     'QSemaphoreLocker',
 ]
 
-def SignalManagerFactory( signals, queue_stop=None ):
+_signalmanager_classes_maxsize = 256            # max number of cached SignalManager classes
+_signalmanager_classes         = OrderedDict()  # { signature : SignalManager-class } (least-recently-used first)
+_signalmanager_classes_lock    = threading.Lock()
+
+_started_tasks      = set()             # ThreadedTasks kept alive until their future resolves (see ThreadedTask.start)
+_started_tasks_lock = threading.Lock()
+
+_priority_ager      = None              # _PriorityAger (raises priority of long-queued tasks)
+_priority_ager_lock = threading.Lock()
+
+_batch_flusher      = None              # _BatchFlusher (flushes SignalBatchers once their interval expires)
+_batch_flusher_lock = threading.Lock()
+
+
+class SignalBatcher( object ):
     """
-    Dynamically creates a :py:obj:`SignalManager` class
-    with all requested signals.
+    Accumulates emissions of a :py:obj:`SignalManager` signal within the
+    worker-thread, and sends them to the UI thread as a list in a single
+    queued signal. Created using :py:meth:`SignalManager.batch` .
 
+    A batch is flushed when it contains `size` items, when `interval`
+    milliseconds have passed since it's first item was added (even if the
+    worker-thread does not emit again, see :py:obj:`_BatchFlusher` ),
+    or when :py:meth:`flush` is called.
+    :py:obj:`ThreadedTask` flushes all batches before it emits `returned`/`exception`.
 
-    :py:obj:`SignalManager` objects are dynamically
-    created :py:obj:`QtCore.QObject` designed to be handed
-    off to a separate thread. They contain a variable
-    number of signals, and the method `handle_if_abort`
-    which checks the value of `self._abort_requested`
+    If `max_pending` is set, at most `max_pending` batches may be waiting to be
+    delivered in the UI thread. :py:meth:`emit` blocks the worker-thread until the UI
+    catches up (raising :py:obj:`UserCancelledOperation` if an abort is requested
+    meanwhile), so a fast producer cannot flood the UI's event-queue.
 
     Example:
 
         .. code-block:: python
 
-            class SignalManager( QtCore.QObject ):
-                returned  = QtCore.Signal()
-                exception = QtCore.Signal()
+            def find_items( signalmgr=None ):
+                add_item = signalmgr.batch( 'add_item', size=500 )
+                for i in range(100000):
+                    signalmgr.handle_if_abort()
+                    add_item.emit( i, str(i) )
 
-                def handle_if_abort(self):
-                    if self._abort_requested:
-                        raise UserCancelledOperation()
+    See Also:
+        * :py:meth:`SignalManager.connect_batch`
+    """
+    def __init__(self, signalmgr, signal, size=100, interval=50, max_pending=None ):
+        """
+        Args:
+            signalmgr (SignalManager):
+                The :py:obj:`SignalManager` whose signal is being batched.
 
-    Args:
-        signals (dict, optional): ``(ex: {signal_name:emitted datatype(s)} )``
+            signal (str):  ``(ex: 'add_item' )``
+                The name of the signal being batched.
 
-            A dictionary of signal-names, and the datatypes
-            they will emit.
+            size (int, optional):
+                Flush the batch once it contains this many items.
 
-            .. code-block:: python
+            interval (int, optional):
+                Flush the batch once it's oldest item is this many milliseconds old.
 
-                {
-                    'update_status': None,        # update_status = QtCore.Signal()
-                    'log_message':  str,          # log_message   = QtCore.Signal(str)
-                    'add_item':     (int, str),   # add_item      = QtCore.Signal(int, str)
-                }
+            max_pending (int, optional):
+                If provided, the maximum number of batches sent to the UI thread
+                that have not yet been delivered (see class docstring).
+        """
+        self._signalmgr   = signalmgr
+        self._signal      = signal
+        self._size        = size
+        self._interval    = interval / 1000.0
+        self._items       = []
+        self._first       = None   # time.time() when first item was added to batch
+        self._lock        = threading.Lock()
+        self._send_lock   = threading.Lock()   # held while a batch is taken and sent (keeps batches in order)
+        self._max_pending = max_pending
+        self._pending     = 0                       # batches sent, not yet delivered
+        self._pending_changed = threading.Condition()
+
+    def emit(self, *args):
+        """
+        Adds an item (the arguments you would have passed
+        to the signal's ``emit()`` ) to the batch.
+        """
+        with self._lock:
+            if not self._items:
+                self._first = time.time()
+                if self._size > 1  and  self._interval > 0:
+                    _get_batch_flusher().schedule( self, self._first + self._interval )
+            self._items.append( args )
+
+            if len(self._items) < self._size  and  (time.time() - self._first) < self._interval:
+                return
 
-        queue_stop (queue.Queue, optional):
-            A queue that handles request-aborts. When
-            :py:obj:`SignalManager.handle_if_abort` is run,
-            if the queue contains this thread's assigned id,
-            then this thread will be stopped.
+        with self._send_lock:
+            with self._lock:
+                items       = self._items
+                self._items = []
+            if items:
+                self._send( items )
+
+    def flush(self):
+        """
+        Sends all items in the batch to the UI thread.
+        (if an abort has been requested, blocked items are discarded).
+        """
+        with self._send_lock:
+            with self._lock:
+                items       = self._items
+                self._items = []
+
+            if items:
+                try:
+                    self._send( items )
+                except( UserCancelledOperation ):
+                    pass
+
+    def _flush_expired(self):
+        """
+        Called by the :py:obj:`_BatchFlusher` thread once the batch's `interval` may have expired.
+        Never blocks: if the batch is being sent, or the UI has `max_pending` undelivered
+        batches, it is checked again after another `interval` .
+
+        Returns:
+            The time to check again ( ``time.time()`` ), or ``None`` .
+        """
+        retry = time.time() + max( self._interval, 0.001 )
+        if not self._send_lock.acquire( False ):
+            return retry
+
+        try:
+            with self._lock:
+                if not self._items  or  (time.time() - self._first) < self._interval:
+                    return None
+
+            if self._max_pending:
+                with self._pending_changed:
+                    if self._pending >= self._max_pending:
+                        return retry
+                    self._pending += 1
+
+            with self._lock:
+                items       = self._items
+                self._items = []
+            self._signalmgr._batch_.emit( self._signal, items )
+            return None
+        finally:
+            self._send_lock.release()
+
+    def _send(self, items ):
+        """
+        Sends `items` to the UI thread, first waiting
+        for capacity if `max_pending` is set.
+        """
+        if self._max_pending:
+            with self._pending_changed:
+                while self._pending >= self._max_pending:
+                    self._signalmgr.handle_if_abort( 'aborted while waiting for the UI to consume "%s"' % self._signal )
+                    self._pending_changed.wait( 0.25 )
+                self._pending += 1
 
+        self._signalmgr._batch_.emit( self._signal, items )
+
+    def _delivered(self):
+        """
+        Called from the UI thread once a batch has been delivered.
+        """
+        if self._max_pending:
+            with self._pending_changed:
+                self._pending -= 1
+                self._pending_changed.notify_all()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, err_type, err_msg, err_tb ):
+        self.flush()
+
+    def _wake(self):
+        """
+        Wakes a producer waiting for capacity (so it can respond to an abort).
+        """
+        with self._pending_changed:
+            self._pending_changed.notify_all()
+
+
+
+class _BatchFlusher( object ):
     """
+    Flushes :py:obj:`SignalBatcher` s once their `interval` expires, so items do not
+    wait in a worker-thread that is busy (or blocked) and does not emit again.
 
-    if not isinstance( signals, MutableMapping ):
-        raise RuntimeError(
-            'Expected `signals` argument to be a dictionary of \n'
-            'signal-names, and emit-datatypes \n'
-        )
+    A single daemon thread is shared by all batchers (see :py:func:`_get_batch_flusher` ),
+    it sleeps until the earliest scheduled batch expires.
+    """
+    def __init__(self):
+        self.pid        = os.getpid()        # a forked child-process needs it's own thread
+        self._scheduled = []                 # heap of [ (time.time() to flush, n, SignalBatcher), ... ]
+        self._counter   = itertools.count()  # orders batchers scheduled for the same time
+        self._condition = threading.Condition()
 
+        self._thread = threading.Thread( target=self._run, name='qconcurrency.SignalBatcher flusher' )
+        self._thread.daemon = True
+        self._thread.start()
 
-    # extend globals to include all types needed for signals
-    def import_signal_datatype( _globals, datatype ):
+    def schedule(self, batcher, flush_time ):
+        """
+        Flushes `batcher` at `flush_time` ( ``time.time()`` ), if it's batch has expired by then.
+        """
+        with self._condition:
+            heapq.heappush( self._scheduled, (flush_time, next(self._counter), batcher) )
+            if self._scheduled[0][2] is batcher:
+                self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._scheduled:
+                    self._condition.wait()
+
+                wait = self._scheduled[0][0] - time.time()
+                if wait > 0:
+                    self._condition.wait( wait )
+                    continue
+                (flush_time, n, batcher) = heapq.heappop( self._scheduled )
+
+            try:
+                retry = batcher._flush_expired()
+            except Exception:
+                logger.error( '%s\n\nUnhandled Exception flushing batch of "%s"' % (traceback.format_exc(), batcher._signal) )
+                retry = None
+
+            if retry is not None:
+                self.schedule( batcher, retry )
+
+
+def _get_batch_flusher():
+    """
+    Returns the :py:obj:`_BatchFlusher` , starting it's thread on first use
+    (and again in forked child-processes, see :py:obj:`qconcurrency.multiprocessing_.ProcessPool` ).
+    """
+    global _batch_flusher
+
+    with _batch_flusher_lock:
+        if _batch_flusher is None  or  _batch_flusher.pid != os.getpid():
+            _batch_flusher = _BatchFlusher()
+        return _batch_flusher
+
+
+
+class ChannelPolicy( object ):
+    """
+    What :py:meth:`SignalChannel.emit` does when it's channel is full.
+
+    Example:
+
+        .. code-block:: python
+
+            # wait for the UI to consume items
+            signalmgr.channel( 'add_item', capacity=50, policy=ChannelPolicy.BLOCK )
+
+            # only the most recent progress is worth displaying
+            signalmgr.channel( 'progress', capacity=1, policy=ChannelPolicy.COALESCE )
+    """
+    BLOCK       = 'block'        # the producer waits until the UI has consumed an item
+    DROP_OLDEST = 'drop_oldest'  # the oldest undelivered item is discarded
+    COALESCE    = 'coalesce'     # an undelivered item with the same key is replaced, otherwise blocks
+
+    policies = ( BLOCK, DROP_OLDEST, COALESCE )
+
+
+
+class SignalChannel( object ):
+    """
+    A bounded queue between a worker-thread emitting a :py:obj:`SignalManager` signal,
+    and the UI thread it is delivered in. Created using :py:meth:`SignalManager.channel` .
+
+    Qt queues every emitted signal, so a worker that emits faster than
+    the UI can handle them grows the event-queue (and memory) without bound.
+    A channel holds at most `capacity` undelivered items, and applies it's
+    :py:obj:`ChannelPolicy` when it is full. Items are re-emitted one-at-a-time
+    using the signal `signal` in the UI thread, returning to the event-loop
+    (so widgets repaint) after each batch of items that were waiting.
+
+    A producer blocked by a full channel raises :py:obj:`UserCancelledOperation`
+    as soon as an abort is requested, and undelivered items are discarded
+    (they belong to a cancelled operation).
+
+    Example:
+
+        .. code-block:: python
+
+            def find_items( signalmgr=None ):
+                add_item = signalmgr.channel( 'add_item', capacity=10 )
+                for path in os.listdir( '/mnt/projects' ):
+                    signalmgr.handle_if_abort()
+                    add_item.emit( path )   # waits while 10x items are undelivered
+
+    Attributes:
+        dropped (int):   number of items discarded by :py:attr:`ChannelPolicy.DROP_OLDEST`
+        coalesced (int): number of items replaced by :py:attr:`ChannelPolicy.COALESCE`
+
+    See Also:
+        * :py:obj:`qconcurrency.threading_.SignalBatcher`
+    """
+    def __init__(self, signalmgr, signal, capacity=100, policy=ChannelPolicy.BLOCK, key=None ):
         """
         Args:
-            _globals (dict):
-                A modified version of `globals` builtin, that will be used
-                when defining class
+            signalmgr (SignalManager):
+                The :py:obj:`SignalManager` whose signal is being queued.
+
+            signal (str):  ``(ex: 'add_item' )``
+                The name of the signal being queued.
+
+            capacity (int, optional):
+                Maximum number of undelivered items.
+
+            policy (str, optional):
+                A :py:obj:`ChannelPolicy` , applied when the channel is full.
+
+            key (callable, optional):
+                Used with :py:attr:`ChannelPolicy.COALESCE` . Called with the emitted arguments,
+                undelivered items with an equal key are replaced. By default all items
+                share a key (only the most recent is kept).
+        """
+        if policy not in ChannelPolicy.policies:
+            raise RuntimeError(
+                'Invalid channel policy "%s". Expected one of: %s' % ( policy, repr(ChannelPolicy.policies) )
+            )
+        if capacity < 1:
+            raise RuntimeError( 'Channel capacity must be at least 1, received: %s' % capacity )
+
+        self._signalmgr = signalmgr
+        self._signal    = signal
+        self._capacity  = capacity
+        self._policy    = policy
+        self._key       = key
+        self._items     = OrderedDict()   # { key : args } undelivered items (oldest first)
+        self._keys      = itertools.count()
+        self._scheduled = False           # True while a `_drain_` is queued in the UI thread
+        self._flushing  = False           # True if all undelivered items must be delivered in the next drain
+        self._changed   = threading.Condition()
+
+        self.dropped   = 0
+        self.coalesced = 0
+
+    def emit(self, *args ):
+        """
+        Queues an item (the arguments you would have passed to the signal's ``emit()`` )
+        to be emitted in the UI thread, applying the channel's policy if it is full.
+
+        Raises:
+            :py:obj:`UserCancelledOperation`: if an abort is requested while waiting.
+        """
+        with self._changed:
+            if self._policy == ChannelPolicy.COALESCE:
+                key = self._key( *args ) if self._key else None
+                if key in self._items:
+                    self._items[ key ] = args
+                    self.coalesced += 1
+                    return
+            else:
+                key = next( self._keys )
+
+            while len(self._items) >= self._capacity:
+                if self._policy == ChannelPolicy.DROP_OLDEST:
+                    self._items.popitem( last=False )
+                    self.dropped += 1
+                    break
+                self._signalmgr.handle_if_abort( 'aborted while waiting for the UI to consume "%s"' % self._signal )
+                self._changed.wait( 0.25 )
+
+            self._signalmgr.handle_if_abort()
+            self._items[ key ] = args
+            schedule        = not self._scheduled
+            self._scheduled = True
+
+        if schedule:
+            self._signalmgr._drain_.emit( self._signal )
+
+    def flush(self):
+        """
+        Ensures all undelivered items are delivered before any
+        signal emitted after this call. :py:obj:`ThreadedTask` flushes
+        all channels before it emits `returned`/`exception`.
+        """
+        with self._changed:
+            if self._items:
+                self._flushing = True
+
+    def qsize(self):
+        """
+        Returns the number of undelivered items.
+        """
+        with self._changed:
+            return len(self._items)
+
+    def _discard(self):
+        """
+        Discards undelivered items, and wakes producers waiting for capacity
+        (called when an abort is requested).
+        """
+        with self._changed:
+            self._items.clear()
+            self._changed.notify_all()
+
+    def _drain(self):
+        """
+        Runs in the UI thread, emitting the items that were waiting when it started.
+        Items queued meanwhile are delivered by another drain, after the UI has
+        processed it's other events.
+        """
+        emit = self._signalmgr._signals[ self._signal ].emit
+
+        with self._changed:
+            nitems = len(self._items)
+
+        while True:
+            for i in range(nitems):
+                with self._changed:
+                    if not self._items:
+                        break
+                    args = self._items.popitem( last=False )[1]
+                    self._changed.notify_all()
+                emit( *args )
+
+            with self._changed:
+                if not self._items:
+                    self._scheduled = False
+                    self._flushing  = False
+                    return
+                if not self._flushing:
+                    self._signalmgr._drain_.emit( self._signal )
+                    return
+                nitems = len(self._items)
+
+
+
+class _SignalManagerBase( QtCore.QObject ):
+    """
+    Baseclass for all :py:obj:`SignalManager` classes created by
+    :py:obj:`SignalManagerClassFactory`. Signals are added to subclasses,
+    this class provides the methods shared by all of them.
+    """
+    _signal_names = ()
+
+    def __init__(self, _id=None, signals=None, queue_stop=None ):
+        QtCore.QObject.__init__(self)
+
+        self._id              = _id
+        self._queue_stop      = queue_stop
+        self._abort_requested = False
+        self._signals_arg     = signals
+        self._signals         = {}
+        self._batchers        = {}   # { signal_name : SignalBatcher }
+        self._batch_callbacks = {}   # { signal_name : [ callback, ... ] }
+        self._batchers_lock   = threading.Lock()
+        self._channels        = {}   # { signal_name : SignalChannel }
+        self._traced_slots    = {}   # { signal_name : { slot : tracing._TracedSlot } }
+
+        for signal in self._signal_names:
+            self._signals[ signal ] = getattr( self, signal )
+
+        self._batch_.connect( self._deliver_batch )
+        self._drain_.connect( self._drain_channel )
+
+    def _request_abort(self):
+        """
+        Private method that sets attr :py:attr:`_abort_requested`.
+        Designed to be connected to a signal.
+
+        Producers waiting on a :py:obj:`SignalBatcher`/:py:obj:`SignalChannel`
+        are woken (to raise :py:obj:`UserCancelledOperation` ), and
+        undelivered channel items are discarded.
+        """
+        self._abort_requested = True
+
+        with self._batchers_lock:
+            batchers = list(self._batchers.values())
+            channels = list(self._channels.values())
+        for batcher in batchers:
+            batcher._wake()
+        for channel in channels:
+            channel._discard()
 
-            datatype (object):
-                A python object, emitted by a signal.
+    def handle_if_abort(self, msg=None):
+        """
+        Checks if an abort has been requested. If so,
+        raises :py:obj:`UserCancelledOperation`
+
+        Raises:
+            :py:obj:`UserCancelledOperation`
+        """
+        if not msg:
+            msg = ''
+
+        # if self._request_abort() has been called
+        if self._abort_requested:
+            raise UserCancelledOperation( msg )
+
+    def signals(self):
+        """
+        Returns a dictionary of signal-names, and the signal
+        they represent.
 
         Returns:
 
             .. code-block:: python
 
-                (
-                    _globals, # globals() with datatype pkg imported
-                    pkgname , # full importpath of datatype
-                )
+                {
+                    "returned":  QtCore.Signal(),
+                    "exception": QtCore.Signal(tuple)
+                    ...
+                }
+        """
+        return self._signals
 
+    def batch(self, signal, size=100, interval=50, max_pending=None ):
         """
-        str_datatype = datatype.__name__
+        Returns a :py:obj:`SignalBatcher` for the signal `signal` .
+        Items emitted using it are sent to the UI thread in batches,
+        rather than as one queued signal per item.
+
+        Subsequent calls return the same :py:obj:`SignalBatcher` .
+
+        Args:
+            signal (str):  ``(ex: 'add_item' )``
+                The name of the signal to batch.
+
+            size (int, optional):
+                Flush the batch once it contains this many items.
 
-        if datatype.__module__ != '__builtin__':
-            _globals[ datatype.__module__.split('.')[-1] ] = (
-                importlib.import_module( datatype.__module__ )
+            interval (int, optional):
+                Flush the batch once it's oldest item is this many milliseconds old.
+
+            max_pending (int, optional):
+                If provided, :py:meth:`SignalBatcher.emit` blocks while this many
+                batches are waiting to be delivered in the UI thread.
+
+        Returns:
+            :py:obj:`SignalBatcher`
+        """
+        if signal not in self._signals:
+            raise RuntimeError(
+                'SignalManager has no signal named "%s". Available signals: %s' % (
+                    signal, repr(sorted(self._signals.keys())) )
             )
-            str_datatype = '%s.%s' % (
-                datatype.__module__.split('.')[-1],
-                datatype.__name__,
+
+        with self._batchers_lock:
+            if signal not in self._batchers:
+                self._batchers[ signal ] = SignalBatcher( self, signal, size=size, interval=interval, max_pending=max_pending )
+            return self._batchers[ signal ]
+
+    def channel(self, signal, capacity=100, policy=ChannelPolicy.BLOCK, key=None ):
+        """
+        Returns a :py:obj:`SignalChannel` for the signal `signal` .
+        Items emitted using it are held in a bounded queue until the UI
+        thread consumes them, rather than growing Qt's event-queue.
+
+        Subsequent calls return the same :py:obj:`SignalChannel` .
+
+        Args:
+            signal (str):  ``(ex: 'add_item' )``
+                The name of the signal to queue.
+
+            capacity (int, optional):
+                Maximum number of undelivered items.
+
+            policy (str, optional):
+                A :py:obj:`ChannelPolicy` , applied when the channel is full.
+
+            key (callable, optional):
+                Used with :py:attr:`ChannelPolicy.COALESCE` (see :py:obj:`SignalChannel` ).
+
+        Returns:
+            :py:obj:`SignalChannel`
+        """
+        if signal not in self._signals:
+            raise RuntimeError(
+                'SignalManager has no signal named "%s". Available signals: %s' % (
+                    signal, repr(sorted(self._signals.keys())) )
             )
-        return _globals, str_datatype
 
+        with self._batchers_lock:
+            if signal not in self._channels:
+                self._channels[ signal ] = SignalChannel( self, signal, capacity=capacity, policy=policy, key=key )
+            return self._channels[ signal ]
+
+    def flush_batches(self):
+        """
+        Flushes all :py:obj:`SignalBatcher` s created by :py:meth:`batch` ,
+        and :py:obj:`SignalChannel` s created by :py:meth:`channel` .
+        """
+        with self._batchers_lock:
+            batchers = list(self._batchers.values())
+            channels = list(self._channels.values())
+
+        for batcher in batchers:
+            batcher.flush()
+        for channel in channels:
+            channel.flush()
+
+    def connect_batch(self, signal, callback ):
+        """
+        Connects `callback` to receive batches of the signal `signal`
+        (once per batch, rather than once per item).
+
+        By default, batched items are re-emitted in the UI thread, one-at-a-time
+        using the signal `signal` . Once a callback has been connected here, they
+        are instead delivered as a list of argument-tuples.
+
+        Args:
+            signal (str):  ``(ex: 'add_item' )``
+                The name of the batched signal.
+
+            callback (callable):
+                A callable that accepts a list of tuples.
+
+                .. code-block:: python
+
+                    def add_items( items ):
+                        for (key, name) in items:
+                            ...
+        """
+        self._batch_callbacks.setdefault( signal, [] ).append( callback )
 
+    def _is_connected(self, signal ):
+        """
+        Returns True if any slots are connected to the signal `signal` .
+        (PySide6 warns, rather than raising, when a signal without
+        connections is disconnected)
+        """
+        metaobject = self.metaObject()
+        for i in range( metaobject.methodCount() ):
+            method = metaobject.method(i)
+            if method.methodType() != QtCore.QMetaMethod.Signal:
+                continue
+            if bytes( method.name() ).decode() == signal  and  self.isSignalConnected( method ):
+                return True
+        return False
+
+    def _deliver_batch(self, signal, items ):
+        """
+        Runs in the UI thread, delivering a batch of items
+        emitted by a :py:obj:`SignalBatcher` .
+        """
+        try:
+            self._deliver_batch_items( signal, items )
+        finally:
+            batcher = self._batchers.get( signal )
+            if batcher is not None:
+                batcher._delivered()
+
+    def _drain_channel(self, signal ):
+        """
+        Runs in the UI thread, delivering items queued
+        in the :py:obj:`SignalChannel` of `signal` .
+        """
+        self._channels[ signal ]._drain()
+
+    def _deliver_batch_items(self, signal, items ):
+        if signal in self._batch_callbacks:
+            tracer = tracing.get_tracer()
+            for callback in self._batch_callbacks[ signal ]:
+                start = time.time()
+                callback( items )
+                if tracer is not None:
+                    tracer.complete( '%s: %s' % (signal, tracing._slot_name( callback )), 'ui', start, time.time(), {'items': len(items)} )
+            return
+
+        emit = self._signals[ signal ].emit
+        for args in items:
+            emit( *args )
+
+
+def _signalmanager_signature( signals ):
+    """
+    Normalizes a `signals` dictionary into a hashable signature,
+    so that equivalent dictionaries share a :py:obj:`SignalManager` class.
 
+    Args:
+        signals (dict):  ``(ex: {'add_item':(int,str), 'returned':None} )``
+            See :py:obj:`SignalManagerFactory`
 
-    _globals = globals()
-    class_   = (
-        'from Qt import QtCore \n'
-        'class SignalManager( QtCore.QObject ):\n'
-    )
+    Returns:
 
+        .. code-block:: python
 
+            (
+                ('add_item', (int,str)),
+                ('returned', ()       ),
+            )
+    """
+    signature = []
     for signal in signals:
+        datatypes = signals[ signal ]
 
         # signals without a returntype
-        if not signals[signal]:
-            class_ += '    {signal} = QtCore.Signal() \n'.format(signal=signal)
+        if not datatypes:
+            datatypes = ()
 
         # signals with multiple returns
-        elif isinstance( signals[signal], Iterable ):
-            str_datatypes = []
-            for datatype in signals[signal]:
-                (_globals, str_datatype) = import_signal_datatype( _globals, datatype )
-                str_datatypes.append( str_datatype )
-
-            class_ += '    {signal} = QtCore.Signal({signal_datatypes})\n'.format(
-                signal           = signal,
-                signal_datatypes = ','.join(str_datatypes)
-            )
+        elif isinstance( datatypes, Iterable ) and not isinstance( datatypes, six.string_types ):
+            datatypes = tuple( datatypes )
+
+        # single signal datatype
+        else:
+            datatypes = ( datatypes, )
+
+        signature.append( (str(signal), datatypes) )
+
+    return tuple( sorted( signature, key=lambda x: x[0] ) )
+
+
+def SignalManagerClassFactory( signals ):
+    """
+    Returns a :py:obj:`SignalManager` class with all requested signals.
+
+    Classes are cached by their signal signature (the signal-names and
+    their datatypes, regardless of order). Requesting a previously seen
+    signature returns the existing class, so creating a :py:obj:`ThreadedTask`
+    only costs a :py:obj:`QtCore.QObject` instantiation. The cache holds at most
+    ``_signalmanager_classes_maxsize`` classes, evicting the least-recently-used.
+
+    Args:
+        signals (dict): ``(ex: {signal_name:emitted datatype(s)} )``
+            See :py:obj:`SignalManagerFactory`
+
+    Returns:
+        A subclass of :py:obj:`QtCore.QObject`
+    """
+
+    if not isinstance( signals, MutableMapping ):
+        raise RuntimeError(
+            'Expected `signals` argument to be a dictionary of \n'
+            'signal-names, and emit-datatypes \n'
+        )
+
+    signature = _signalmanager_signature( signals )
+
+    with _signalmanager_classes_lock:
+        if signature in _signalmanager_classes:
+            class_ = _signalmanager_classes.pop( signature )
+            _signalmanager_classes[ signature ] = class_
+            return class_
+
+        attrs = { str('_signal_names'): tuple([ signal for (signal, datatypes) in signature ]) }
+        for (signal, datatypes) in signature:
+            attrs[ signal ] = QtCore.Signal( *datatypes )
+        attrs[ str('_batch_') ] = QtCore.Signal( str, object )   # signal_name, [ args, ... ]
+        attrs[ str('_drain_') ] = QtCore.Signal( str )           # signal_name (of a SignalChannel)
+
+        class_ = type( str('SignalManager'), (_SignalManagerBase,), attrs )
+
+        _signalmanager_classes[ signature ] = class_
+        while len(_signalmanager_classes) > _signalmanager_classes_maxsize:
+            _signalmanager_classes.popitem( last=False )
+
+        return class_
+
+
+def SignalManagerFactory( signals, queue_stop=None ):
+    """
+    Dynamically creates a :py:obj:`SignalManager` object
+    with all requested signals.
+
+
+    :py:obj:`SignalManager` objects are dynamically
+    created :py:obj:`QtCore.QObject` designed to be handed
+    off to a separate thread. They contain a variable
+    number of signals, and the method `handle_if_abort`
+    which checks the value of `self._abort_requested`
+
+    Example:
+
+        .. code-block:: python
+
+            class SignalManager( QtCore.QObject ):
+                returned  = QtCore.Signal()
+                exception = QtCore.Signal()
+
+                def handle_if_abort(self):
+                    if self._abort_requested:
+                        raise UserCancelledOperation()
+
+    Args:
+        signals (dict, optional): ``(ex: {signal_name:emitted datatype(s)} )``
+
+            A dictionary of signal-names, and the datatypes
+            they will emit.
+
+            .. code-block:: python
+
+                {
+                    'update_status': None,        # update_status = QtCore.Signal()
+                    'log_message':  str,          # log_message   = QtCore.Signal(str)
+                    'add_item':     (int, str),   # add_item      = QtCore.Signal(int, str)
+                }
+
+        queue_stop (queue.Queue, optional):
+            A queue that handles request-aborts. When
+            :py:obj:`SignalManager.handle_if_abort` is run,
+            if the queue contains this thread's assigned id,
+            then this thread will be stopped.
 
-        # single signal datatype
-        else:
-            (_globals, str_datatype) = import_signal_datatype( _globals, signals[signal] )
-            class_ += '    {signal} = QtCore.Signal({datatype})\n'.format(
-                signal   = signal,
-                datatype = str_datatype,
-            )
+    See Also:
+        * :py:obj:`qconcurrency.threading_.SignalManagerClassFactory`
 
-    # self._signals
-    class_ += (
-        '    def __init__(self, _id=None, signals=None, queue_stop=None ): \n'
-        '        QtCore.QObject.__init__(self)               \n'
-        '                                                    \n'
-        '        self._id              = _id                 \n'
-        '        self._queue_stop      = queue_stop          \n'
-        '        self._abort_requested = False               \n'
-        '        self._signals_arg     = signals             \n'
-        '        self._signals         = {                   \n'
-    )
-    for signal in signals:
-        class_ += '            "{signal}": self.{signal},\n'.format(signal=signal)
-    class_ += '        }\n'
-
-    # methods
-    class_ += (
-        '    def _request_abort(self):                                              \n'
-        '        """                                                                \n'
-        '        Private method that sets attr :py:attr:`_abort_requested`.         \n'
-        '        Designed to be connected to a signal.                              \n'
-        '        """                                                                \n'
-        '        self._abort_requested = True                                       \n'
-        '                                                                           \n'
-        '    def handle_if_abort(self, msg=None):                                   \n'
-        '        """                                                                \n'
-        '        Checks if an abort has been requested. If so,                      \n'
-        '        raises :py:obj:`UserCancelledOperation`                            \n'
-        '                                                                           \n'
-        '        Raises:                                                            \n'
-        '            :py:obj:`UserCancelledOperation`                               \n'
-        '        """                                                                \n'
-        '        if not msg:                                                        \n'
-        '            msg = ""                                                       \n'
-        '                                                                           \n'
-        '        # if self._request_abort() has been called                         \n'
-        '        if self._abort_requested:                                          \n'
-        '            raise UserCancelledOperation( msg )                            \n'
-        '                                                                           \n'
-        '                                                                           \n'
-        '    def signals(self):                                                     \n'
-        '        """                                                                \n'
-        '        Returns a dictionary of signal-names, and the signal               \n'
-        '        they represent.                                                    \n'
-        '                                                                           \n'
-        '        Returns:                                                           \n'
-        '                                                                           \n'
-        '            .. code-block:: python                                         \n'
-        '                                                                           \n'
-        '                {                                                          \n'
-        '                    "returned":  QtCore.Signal(),                          \n'
-        '                    "exception": QtCore.Signal(tuple)                      \n'
-        '                    ...                                                    \n'
-        '                }                                                          \n'
-        '        """                                                                \n'
-        '        return self._signals                                               \n'
-    )
-
-
-
-    _locals = locals()
-    exec( class_, _globals, _locals )
-
-    return _locals['SignalManager']()
+    """
+    return SignalManagerClassFactory( signals )( queue_stop=queue_stop )
 
 
 
@@ -319,6 +951,111 @@ class QSemaphoreLocker( QtCore.QObject ):
 
 
 
+class TaskPriority( object ):
+    """
+    Priorities for :py:meth:`ThreadedTask.start` (and :py:obj:`SoloThreadedTask` ).
+    When more tasks are queued than the :py:obj:`QtCore.QThreadPool` has threads,
+    higher priority tasks are started first.
+
+    To prevent starvation, a queued task's priority is raised by `aging_step`
+    every `aging_interval` milliseconds it spends waiting (up to :py:attr:`INTERACTIVE` ),
+    so background work still progresses while the UI keeps the pool busy.
+
+    Example:
+
+        .. code-block:: python
+
+            # the list the user is looking at
+            ThreadedTask( load_visible_rows ).start( priority=TaskPriority.INTERACTIVE )
+
+            # prefetch of the next page
+            ThreadedTask( load_next_page ).start( priority=TaskPriority.BACKGROUND )
+    """
+    BACKGROUND  = 0
+    NORMAL      = 50
+    INTERACTIVE = 100
+
+    aging_interval = 500   # milliseconds a queued task waits before it's priority is raised
+    aging_step     = 10    # amount priority is raised by
+
+
+
+class _PriorityAger( QtCore.QObject ):
+    """
+    Raises the priority of :py:obj:`ThreadedTask` s that have been waiting
+    in their threadpool's queue (see :py:obj:`TaskPriority` ).
+
+    A queued runnable's priority cannot be changed, so it is taken back
+    from the threadpool ( :py:meth:`QtCore.QThreadPool.tryTake` ), and
+    re-queued with the new priority. A single instance (running in the UI thread)
+    is shared by all tasks (see :py:func:`_get_priority_ager` ).
+    """
+    _watch_ = QtCore.Signal()
+
+    def __init__(self):
+        QtCore.QObject.__init__(self)
+
+        self._queued = {}               # { id(task) : [task, time.time() queued/last raised] }
+        self._lock   = threading.Lock()
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.timeout.connect( self._age )
+        self._watch_.connect( self._start_timer )
+
+    def add(self, task ):
+        with self._lock:
+            self._queued[ id(task) ] = [ task, time.time() ]
+        self._watch_.emit()
+
+    def discard(self, task ):
+        with self._lock:
+            self._queued.pop( id(task), None )
+
+    def _start_timer(self):
+        if not self._timer.isActive()  or  self._timer.interval() != TaskPriority.aging_interval:
+            self._timer.start( TaskPriority.aging_interval )
+
+    def _age(self):
+        now      = time.time()
+        interval = TaskPriority.aging_interval / 1000.0
+
+        with self._lock:
+            queued = list(self._queued.values())
+
+        for item in queued:
+            (task, waiting_since) = item
+            if now - waiting_since < interval:
+                continue
+
+            if not task._raise_priority( TaskPriority.aging_step ):
+                self.discard( task )
+            else:
+                item[1] = now
+
+        with self._lock:
+            if not self._queued:
+                self._timer.stop()
+
+
+def _get_priority_ager():
+    """
+    Returns the :py:obj:`_PriorityAger` , creating it
+    (in the UI thread) on first use.
+    """
+    global _priority_ager
+
+    with _priority_ager_lock:
+        if _priority_ager is None:
+            _priority_ager = _PriorityAger()
+
+            app = QtCore.QCoreApplication.instance()
+            if app is not None:
+                _priority_ager.moveToThread( app.thread() )
+
+        return _priority_ager
+
+
+
 class ThreadedTask( QtCore.QRunnable ):
     """
     Bundles a callback method, it's arguments, and a variable
@@ -412,12 +1149,50 @@ class ThreadedTask( QtCore.QRunnable ):
             task.signal('exception').connect(run_on_exit)
             task.start()
 
+
+        *Use the returned future*
+
+        :py:meth:`start` returns a :py:obj:`qconcurrency.futures_.TaskFuture` ,
+        whose done-callbacks are run in the UI thread.
+
+        .. code-block:: python
+
+            def load_user( userid, signalmgr=None ):
+                return db.users.find( userid )
+
+            future = ThreadedTask( load_user, userid=1 ).start()
+            future.add_done_callback( lambda future: show_user( future.result() ) )
+
+
+        *Stream results from a generator*
+
+        If the callback is a generator, the values it yields are sent to the UI thread
+        in batches (signal `yielded` , or :py:meth:`connect_stream` ). Aborts are checked
+        before each value is produced, and the generator is paused while the UI
+        has not yet consumed `max_pending` batches. It's return-value (python-3) is
+        emitted in `returned` .
+
+        .. code-block:: python
+
+            def find_files( root, signalmgr=None ):
+                for (dirpath, dirnames, filenames) in os.walk( root ):
+                    for filename in filenames:
+                        yield os.path.join( dirpath, filename )
+
+            task = ThreadedTask( find_files, root='/mnt/projects' )
+            task.connect_stream( listwidget.addItems )   # list of paths, per batch
+            task.start()
+
     See Also:
 
         * :py:obj:`qconcurrency.threading_.SignalManagerFactory`
         * :py:obj:`qconcurrency.threading_.SoloThreadedTask`
 
     """
+    stream_size        = 100   # default max values per batch, yielded by generator callbacks
+    stream_interval    = 50    # default max milliseconds a yielded value waits for it's batch to fill
+    stream_max_pending = 4     # default max batches waiting to be consumed by the UI, before the generator is paused
+
     def __init__(self, callback, signals=None, *args, **kwds ):
         """
         Args:
@@ -452,12 +1227,26 @@ class ThreadedTask( QtCore.QRunnable ):
         self._kwds     = kwds
         self._id       = None # used by SoloThreadedTask
 
+        self._future      = TaskFuture( task=self )
+        self._threadpool  = None             # threadpool this task was queued in
+        self._pool_stats  = None             # threadpool's occupancy-stats (registered threadpools only)
+        self._queued_at   = None             # time.time() this task was queued
+        self._abort_requested_at = None      # time.time() of the first request_abort()
+        self._metrics_name       = None      # name metrics are recorded under (default: callback_name(callback))
+        self._trace_flow         = None      # tracing flow-id, from submit to run (if tracing was enabled)
+        self._processpool = None             # qconcurrency.multiprocessing_.ProcessPool the callback is run in (if any)
+        self._started    = False             # True once the threadpool has started running this task
+        self._start_lock = threading.Lock()  # guards _started (see :py:meth:`withdraw`)
+        self._priority   = TaskPriority.NORMAL
+        self._stream     = ( self.stream_size, self.stream_interval, self.stream_max_pending )
+
 
         # Attributes
         self._signals  = {
             'returned':        None,
             'exception':       None,
             'abort_requested': None,
+            'yielded':         object,   # values yielded by generator callbacks
         }
         if signals:
             self._signals.update( signals )
@@ -484,45 +1273,243 @@ class ThreadedTask( QtCore.QRunnable ):
                 signals  = {'returned': (int,int)},  #: mycallback is now expected to return 2x integers
             )
         """
+        with self._start_lock:
+            self._started = True
+        if self._priority < TaskPriority.INTERACTIVE:
+            _get_priority_ager().discard( self )
+        self._future._set_running()
+
+        run_started = time.time()
+        tracer      = tracing.get_tracer()
+        if tracer is not None  and  self._trace_flow is not None:
+            tracer.flow_end( self._trace_flow, 'submit', 'task' )
+
+        registry    = metrics.get_registry()
+        if registry.enabled  and  self._queued_at is not None:
+            registry.observe( 'queue_wait', self.metrics_name(), run_started - self._queued_at )
+
+        pool_stats = self._pool_stats
+        if pool_stats is not None:
+            timing = pool_stats.task_started( run_started - self._queued_at )
+
+        try:
+            self._run_callback( run_started )
+        finally:
+            if pool_stats is not None:
+                pool_stats.task_completed( timing )
 
+    def _run_callback(self, run_started ):
+        """
+        Runs the callback, emitting signals/resolving the future (see :py:meth:`run` ).
+        """
         try:
-            retval = self._callback( signalmgr=self._signalmgr, *self._args, **self._kwds )
+            if self._processpool is not None:
+                retval = self._processpool.run_task( self._callback, self._signalmgr, self._args, self._kwds )
+            else:
+                retval = self._callback( signalmgr=self._signalmgr, *self._args, **self._kwds )
+                if inspect.isgenerator( retval ):
+                    retval = _stream_generator( retval, self._signalmgr, *self._stream )
+            self._record_run( 'returned', run_started )
+            self._signalmgr.flush_batches()
 
             if not self._signals['returned']:
                 self._signalmgr.returned.emit()
             else:
                 self._signalmgr.returned.emit( retval )
+            self._future._set_result( retval )
 
         except( UserCancelledOperation ):
             logger.debug('Responding to user-cancelled-operation. Exiting thread: %s' % repr(self) )
             exc_info = sys.exc_info()
+            self._record_run( 'cancelled', run_started )
+            self._signalmgr.flush_batches()
             self._signalmgr.exception.emit()
+            self._future._set_cancelled()
 
         except:
             logger.error( 'called with %s( %s, %s )' % (repr(self._callback), repr(self._args), repr(self._kwds) ) )
             exc_info = sys.exc_info()
-            logger.error( '%s\n\nUnhandled Exception occurred in thread: %s' % (traceback.format_exc(exc_info), repr(exc_info)) )
+            logger.error( '%s\n\nUnhandled Exception occurred in thread: %s' % (traceback.format_exc(), repr(exc_info)) )
+            self._record_run( 'exception', run_started )
+            self._signalmgr.flush_batches()
             self._signalmgr.exception.emit()
+            self._future._set_exception( exc_info[1] )
+
+    def _record_run(self, status, run_started ):
+        """
+        Records the callback's run-time, outcome (`status` ), and abort-latency
+        (if an abort was requested) in :py:func:`qconcurrency.metrics.get_registry` ,
+        and traces the run (if :py:func:`qconcurrency.tracing.enable_tracing` ).
+        """
+        now    = time.time()
+        tracer = tracing.get_tracer()
+        if tracer is not None:
+            tracer.complete( self.metrics_name(), 'task', run_started, now, {'status': status} )
+
+        registry = metrics.get_registry()
+        if not registry.enabled:
+            return
+
+        name = self.metrics_name()
+        registry.observe( 'run_time', name, now - run_started )
+        registry.incr( status, name )
 
-    def start(self, expiryTimeout=-1, threadpool=None ):
+        abort_requested_at = self._abort_requested_at
+        if abort_requested_at is not None:
+            registry.observe( 'abort_latency', name, now - max( abort_requested_at, run_started ) )
+
+    def metrics_name(self):
+        """
+        Returns the name this task's metrics are recorded under
+        (see :py:mod:`qconcurrency.metrics` ).
+        """
+        if self._metrics_name is None:
+            self._metrics_name = metrics.callback_name( self._callback )
+        return self._metrics_name
+
+    def start(self, expiryTimeout=-1, threadpool=None, processpool=None, priority=None ):
         """
         Queues this thread in a :py:obj:`QtCore.QThreadPool`
         (by default :py:obj:`QtCore.QThreadPool.globalInstance()` )
 
         Args:
             expiryTimeout (int, optional):
-                Thread that unused for N milliseconds are considered expired
-                and will exit. By default, no exipiryTimeout is set ``(-1)``.
+                If provided, sets the threadpool's :py:meth:`QtCore.QThreadPool.setExpiryTimeout`
+                (threads unused for N milliseconds expire, and exit).
+                By default ``(-1)``, the threadpool's expiryTimeout is left unchanged.
 
-            threadpool (QtCore.QThreadPool, optional):
+            threadpool (QtCore.QThreadPool, str, optional):
                 By default, this :py:obj:`ThreadedTask` will be queued in the
                 QCoreApplication's global threadpool. If you would prefer to assign
-                another, you may specify it here.
+                another, you may specify it here (or the name of a threadpool
+                registered in :py:mod:`qconcurrency.threadpools` , ex: ``'io'`` ).
+
+            processpool (qconcurrency.multiprocessing_.ProcessPool, optional):
+                If provided, the callback is run in one of this pool's child-processes
+                (the thread in `threadpool` relays it's signals).
+                Generator callbacks cannot be streamed from a child-process.
+                See :py:obj:`qconcurrency.multiprocessing_.ProcessPool` .
+
+            priority (int, optional):
+                A :py:obj:`TaskPriority` (or any int, higher starts first).
+                By default :py:attr:`TaskPriority.NORMAL` .
+
+        Returns:
+            :py:obj:`qconcurrency.futures_.TaskFuture` for this task's result.
+        """
+        threadpool = threadpools.resolve_threadpool( threadpool )
+
+        if expiryTimeout is not None  and  expiryTimeout != -1:
+            threadpool.setExpiryTimeout( expiryTimeout )
+
+        # started within a ``with TaskGroup():`` block
+        group = taskgroup.current_taskgroup()
+        if group is not None:
+            group.add( self )
+
+        if priority is None:
+            priority = TaskPriority.NORMAL
+
+        self._threadpool  = threadpool
+        self._processpool = processpool
+        self._priority    = priority
+        self._pool_stats  = threadpools._get_stats( threadpool )
+        self._queued_at   = time.time()
+        if self._pool_stats is not None:
+            self._pool_stats.task_queued()
+
+        tracer = tracing.get_tracer()
+        if tracer is not None:
+            tracer.instant( 'submit', 'task', {'callback': self.metrics_name(), 'priority': priority} )
+            self._trace_flow = tracer.flow_start( 'submit', 'task' )
+
+        # keep this task (and it's SignalManager) alive until it's final signals
+        # are delivered, even if the caller does not keep a reference to it
+        with _started_tasks_lock:
+            _started_tasks.add( self )
+        self._future.add_done_callback( self._release )
+
+        # queued tasks below INTERACTIVE are aged (requires QThreadPool.tryTake, Qt-5.9+)
+        if priority < TaskPriority.INTERACTIVE  and  hasattr( threadpool, 'tryTake' ):
+            _get_priority_ager().add( self )
+
+        threadpool.start( self, priority )
+        return self._future
+
+    def _release(self, future=None ):
+        """
+        Drops the reference kept by :py:meth:`start` (run in the UI thread,
+        after the task's final signals).
+        """
+        with _started_tasks_lock:
+            _started_tasks.discard( self )
+
+    def _raise_priority(self, amount ):
+        """
+        Re-queues this task with it's priority raised by `amount` (up to
+        :py:attr:`TaskPriority.INTERACTIVE` ), if it is still queued.
+
+        Returns:
+            ``True`` if the task is still queued, and may be raised again.
+        """
+        with self._start_lock:
+            if self._started  or  self._priority >= TaskPriority.INTERACTIVE:
+                return False
+            if not self._threadpool.tryTake( self ):
+                return False
+
+            self._priority = min( self._priority + amount, TaskPriority.INTERACTIVE )
+            self._threadpool.start( self, self._priority )
+
+        logger.debug('Raised priority of queued `ThreadedTask` to %s: %s' % (self._priority, repr(self)))
+        return self._priority < TaskPriority.INTERACTIVE
+
+    def future(self):
+        """
+        Returns the :py:obj:`qconcurrency.futures_.TaskFuture`
+        for this task's result.
+        """
+        return self._future
+
+    def withdraw(self):
         """
-        if not threadpool:
-            threadpool = QtCore.QThreadPool.globalInstance()
+        Removes this task from it's :py:obj:`QtCore.QThreadPool` if it is
+        still queued (and has not started running). A withdrawn task never
+        runs, and emits no signals.
 
-        threadpool.start( self, expiryTimeout )
+        Once withdrawn, the underlying :py:obj:`QtCore.QRunnable` is deleted
+        (it's ownership is returned to us by the threadpool), so the task
+        cannot be started again.
+
+        Returns:
+            ``True`` if the task was withdrawn, ``False`` if it is
+            running/has run, or this Qt version does not support
+            :py:meth:`QtCore.QThreadPool.tryTake` (Qt-5.9+).
+        """
+        # held while withdrawing, so the threadpool cannot run (and delete)
+        # this task between checking `_started` and `tryTake()`
+        with self._start_lock:
+            if self._started or self._threadpool is None:
+                return False
+
+            if not hasattr( self._threadpool, 'tryTake' ):
+                return False
+
+            if not self._threadpool.tryTake( self ):
+                return False
+
+            self._started = True
+
+        logger.debug('Withdrew queued `ThreadedTask`: %s' % repr(self))
+        _get_priority_ager().discard( self )
+        if self._pool_stats is not None:
+            self._pool_stats.task_withdrawn()
+        tracer = tracing.get_tracer()
+        if tracer is not None:
+            tracer.instant( 'withdrawn', 'task', {'callback': self.metrics_name()} )
+        self._future._set_cancelled()
+        QtCompat.delete( self )
+        return True
 
     def signalmgr(self):
         """
@@ -537,7 +1524,44 @@ class ThreadedTask( QtCore.QRunnable ):
         Returns one of the :py:obj:`QtCore.Signal` s defined in `signals`.
         See documentation in :py:meth:`__init__`.
         """
-        return getattr( self._signalmgr, signal_name )
+        signal = getattr( self._signalmgr, signal_name )
+
+        # while tracing, slots connected to the signal are traced in the UI thread
+        if tracing.get_tracer() is not None  and  not signal_name.startswith('_'):
+            traced_slots = self._signalmgr._traced_slots.setdefault( signal_name, {} )
+            return tracing._TracedSignal( signal, signal_name, traced_slots )
+        return signal
+
+    def connect_batch(self, signal_name, callback ):
+        """
+        Connects `callback` to receive batches of items emitted
+        using ``signalmgr.batch( signal_name )`` .
+        See :py:meth:`SignalManager.connect_batch` .
+        """
+        self._signalmgr.connect_batch( signal_name, callback )
+
+    def connect_stream(self, callback, size=None, interval=None, max_pending=None ):
+        """
+        Connects `callback` to receive lists of the values yielded
+        by a generator callback (once per batch), in the UI thread.
+
+        Args:
+            callback (callable):
+                A callable that accepts a list of yielded values.
+
+            size (int, optional):
+                Max values per batch (default :py:attr:`stream_size` ).
+
+            interval (int, optional):
+                Max milliseconds a value waits for it's batch to fill (default :py:attr:`stream_interval` ).
+
+            max_pending (int, optional):
+                Max batches waiting to be consumed by the UI, before the generator
+                is paused (default :py:attr:`stream_max_pending` ).
+        """
+        defaults     = ( self.stream_size, self.stream_interval, self.stream_max_pending )
+        self._stream = tuple([ default if value is None else value for (value, default) in zip( (size, interval, max_pending), defaults ) ])
+        self._signalmgr.connect_batch( 'yielded', _StreamCallback( callback ) )
 
     def request_abort(self,*args,**kwds):
         """
@@ -547,8 +1571,154 @@ class ThreadedTask( QtCore.QRunnable ):
         to exit).
         """
         logger.warning('Abort Requested for `ThreadedTask`: %s' % repr(self))
+        if self._abort_requested_at is None:
+            self._abort_requested_at = time.time()
+            metrics.get_registry().incr( 'abort_requests', self.metrics_name() )
+            tracer = tracing.get_tracer()
+            if tracer is not None:
+                tracer.instant( 'abort_requested', 'task', {'callback': self.metrics_name()} )
         self._signalmgr._request_abort()
 
+    def detach(self):
+        """
+        Disconnects all slots from this task's signals (and it's batch callbacks),
+        so that if it is still running, it no longer calls into objects that may
+        have since been deleted. Done-callbacks of it's :py:meth:`future` still run.
+        See :py:obj:`qconcurrency.taskgroup.TaskGroup` .
+        """
+        for (signal_name, signal) in self._signalmgr.signals().items():
+            # private signals are used internally (ex: SoloThreadedTask bookkeeping)
+            if signal_name.startswith('_'):
+                continue
+            if not self._signalmgr._is_connected( signal_name ):
+                continue
+            try:
+                signal.disconnect()
+            except( RuntimeError ):
+                pass   # no connections
+
+        self._signalmgr._batch_callbacks.clear()
+        self._signalmgr._traced_slots.clear()
+
+
+
+def _stream_generator( generator, signalmgr, size, interval, max_pending ):
+    """
+    Exhausts `generator` (within a thread), sending it's values to the UI thread
+    in batches using the signal `yielded` . Aborts are checked before each value,
+    and while waiting for the UI to consume batches. A partial batch is sent once
+    it is `interval` milliseconds old, even while the generator is blocked
+    producing it's next value (see :py:obj:`SignalBatcher` ).
+
+    Returns:
+        The generator's return-value (``None`` in python-2).
+    """
+    stream = signalmgr.batch( 'yielded', size=size, interval=interval, max_pending=max_pending )
+    try:
+        while True:
+            signalmgr.handle_if_abort()
+            try:
+                value = next( generator )
+            except StopIteration as stop:
+                stream.flush()
+                return getattr( stop, 'value', None )
+            stream.emit( value )
+    finally:
+        generator.close()
+
+
+class _StreamCallback( object ):
+    """
+    Adapts a :py:meth:`SignalManager.connect_batch` callback (a list of argument-tuples)
+    to a :py:meth:`ThreadedTask.connect_stream` callback (a list of yielded values).
+    """
+    def __init__(self, callback ):
+        self._callback = callback
+
+    def __call__(self, items ):
+        return self._callback([ args[0] for args in items ])
+
+
+
+class _Debouncer( QtCore.QObject ):
+    """
+    Collapses bursts of calls to :py:meth:`request` into a single call
+    of `callback` , using the arguments of the most recent request.
+
+    By default (debounce), `callback` is run once no requests have been
+    made for `interval` milliseconds. If `coalesce` is set, `callback`
+    is run `interval` milliseconds after the first request of a burst
+    (so a continuous stream of requests is still run periodically).
+
+    Requests may be made from any thread, `callback` is always
+    run in the thread this object belongs to.
+    """
+    _requested = QtCore.Signal()
+
+    def __init__(self, callback, interval, coalesce=False ):
+        """
+        Args:
+            callback (callable):
+                The callable to run with the latest requested arguments.
+
+            interval (int):
+                Milliseconds to wait before running `callback` .
+
+            coalesce (bool, optional):
+                If ``True``, further requests do not postpone `callback` .
+        """
+        QtCore.QObject.__init__(self)
+
+        self._callback = callback
+        self._coalesce = coalesce
+        self._pending  = None   # (args, kwds) of latest request
+        self._lock     = threading.Lock()
+
+        self._timer = QtCore.QTimer( self )
+        self._timer.setSingleShot( True )
+        self._timer.setInterval( interval )
+        self._timer.timeout.connect( self._run_pending )
+
+        self._requested.connect( self._schedule )
+
+    def request(self, *args, **kwds):
+        """
+        Requests that `callback` be run with `args` and `kwds`
+        (replacing the arguments of any pending request).
+        """
+        with self._lock:
+            self._pending = (args, kwds)
+        self._requested.emit()
+
+    def cancel(self):
+        """
+        Discards the pending request (if any).
+        """
+        with self._lock:
+            self._pending = None
+
+    def is_pending(self):
+        """
+        Returns ``True`` if a request is waiting to be run.
+        """
+        return self._pending is not None
+
+    def _schedule(self):
+        if self._coalesce  and  self._timer.isActive():
+            return
+        self._timer.start()
+
+    def _run_pending(self):
+        with self._lock:
+            pending       = self._pending
+            self._pending = None
+
+        if pending is None:
+            return
+
+        (args, kwds) = pending
+        self._callback( *args, **kwds )
+
 
 
 class SoloThreadedTask( object ):
@@ -598,13 +1768,29 @@ class SoloThreadedTask( object ):
                         signalmgr.add_item.emit( i )  # add an item to the list
 
 
+        *Debounce starts (ex: filter-as-you-type)*
+
+        Calls to :py:meth:`start` within `debounce` milliseconds of each other
+        are collapsed into a single task, run with the arguments of the latest call.
+
+        .. code-block:: python
+
+            self._thread_filter = SoloThreadedTask(
+                callback = self._filter_items,
+                debounce = 200,
+            )
+            self._lineedit.textChanged.connect(
+                lambda text: self._thread_filter.start( text=text )
+            )
 
 
     See Also:
         * :py:obj:`qconcurrency.threading_.ThreadedTask`
 
     """
-    def __init__(self, callback, signals=None, connections=None, mutex_expiry=5000 ):
+    _ui_wait_interval = 0.01   # seconds between processing Qt events, while waiting in the UI thread
+
+    def __init__(self, callback, signals=None, connections=None, mutex_expiry=5000, batch_connections=None, debounce=None, coalesce=False, processpool=None, priority=None, threadpool=None, stream_connections=None ):
         """
         Args:
             callback (callable):
@@ -637,6 +1823,50 @@ class SoloThreadedTask( object ):
                         ...
                     }
 
+            mutex_expiry (int, optional):
+                Milliseconds a new thread will wait for the previous thread
+                to exit, before running regardless.
+
+            batch_connections (dict, optional):
+                Dictionary of signal-names, and a python-callable, or list
+                of python-callables that receive batches of items emitted
+                using :py:meth:`SignalManager.batch` .
+                See :py:meth:`SignalManager.connect_batch` .
+
+                .. code-block:: python
+
+                    {
+                        'add_item':     [ mylist.addItems ],
+                        ...
+                    }
+
+            stream_connections (callable, list, optional):
+                A python-callable, or list of python-callables that receive lists
+                of the values yielded by a generator `callback` .
+                See :py:meth:`ThreadedTask.connect_stream` .
+
+            debounce (int, optional):
+                If provided, :py:meth:`start` waits until it has not been called
+                for this many milliseconds before starting a thread (using the
+                arguments of the latest call). Calls with `wait` start immediately.
+
+            coalesce (bool, optional):
+                Used with `debounce` . If ``True``, a thread is started `debounce`
+                milliseconds after the first call to :py:meth:`start` in a burst,
+                rather than after the calls stop (the latest arguments still win).
+
+            processpool (qconcurrency.multiprocessing_.ProcessPool, optional):
+                If provided, `callback` is run in one of this pool's child-processes.
+                See :py:obj:`qconcurrency.multiprocessing_.ProcessPool` .
+
+            priority (int, optional):
+                A :py:obj:`TaskPriority` that this task's threads are queued with.
+                By default :py:attr:`TaskPriority.NORMAL` .
+
+            threadpool (QtCore.QThreadPool, str, optional):
+                Threadpool (or name of a threadpool registered in :py:mod:`qconcurrency.threadpools` )
+                that this task's threads are queued in, when :py:meth:`start` is not passed one.
+
             *args/**kwds:
                 Any additional arguments/keyword-arguments are passed
                 to the callback in :py:meth:`run`
@@ -656,11 +1886,23 @@ class SoloThreadedTask( object ):
                     'received type: %s' ) % repr(type(connections))
                 )
 
+        if batch_connections:
+            if not isinstance( batch_connections, MutableMapping ):
+                raise TypeError((
+                    'Expected dictionary for `batch_connections` argument '
+                    'received type: %s' ) % repr(type(batch_connections))
+                )
+
 
         # Args
         self._callback           = callback
         self._mutex_expiry       = mutex_expiry
+        self._processpool        = processpool
+        self._priority           = priority
+        self._threadpool         = threadpool
+        self._metrics_name       = metrics.callback_name( callback )
         self._active_threads     = OrderedDict()  # { uuid : request_abort(method) }
+        self._tasks              = {}             # { uuid : ThreadedTask } (released from the UI thread, see `_release_task`)
 
         self._thread_with_mutex = None # uuid.uuid4().hex of thread holding `self._mutex_loading`
                                        # ( continues to hold Id after thread  exits        )
@@ -674,11 +1916,19 @@ class SoloThreadedTask( object ):
         if signals:
             self._signals.update( signals )
 
-        self._connections = connections
+        self._connections        = connections
+        self._batch_connections  = batch_connections
+        self._stream_connections = stream_connections
+
+        self._debouncer      = None
+        self._pending_future = None   # TaskFuture returned by a debounced start(), see `_start_debounced`
+        if debounce:
+            self._debouncer = _Debouncer( self._start_debounced, debounce, coalesce=coalesce )
 
 
         # locks
         self._mutex_loading    = QtCore.QMutex()
+        self._threads_changed  = threading.Condition()  # guards/notifies changes to `_active_threads`
 
     def start(self, expiryTimeout=-1, threadpool=None, wait=False, _connections=None, *args,**kwds):
         """
@@ -692,10 +1942,11 @@ class SoloThreadedTask( object ):
                 Thread that unused for N milliseconds are considered expired
                 and will exit. By default, no exipiryTimeout is set ``(-1)``.
 
-            threadpool (QtCore.QThreadPool, optional):
+            threadpool (QtCore.QThreadPool, str, optional):
                 By default, this :py:obj:`ThreadedTask` will be queued in the
-                QCoreApplication's global threadpool. If you would prefer to assign
-                another, you may specify it here.
+                threadpool passed to :py:meth:`__init__` (or the QCoreApplication's
+                global threadpool). If you would prefer to assign another, you may
+                specify it here (or the name of a registered threadpool, ex: ``'io'`` ).
 
             _connections(dict, optional):
                 Entirely replaces the connections defined in ``__init__`` .
@@ -712,6 +1963,48 @@ class SoloThreadedTask( object ):
                 Any additional arguments/keyword-arguments will be passed
                 to the `callback` defined in :py:meth:`__init__` when it is
                 run from it's separate thread.
+
+        Returns:
+            :py:obj:`qconcurrency.futures_.TaskFuture` for the started thread's result.
+            (It is cancelled if the thread is superseded by a later call to :py:meth:`start` ).
+        """
+        if self._debouncer is not None:
+            self._cancel_pending_future()
+            if not wait:
+                future               = TaskFuture()
+                self._pending_future = future
+                self._debouncer.request( expiryTimeout, threadpool, False, _connections, *args, **kwds )
+                return future
+            self._debouncer.cancel()
+
+        return self._start( expiryTimeout, threadpool, wait, _connections, *args, **kwds )
+
+    def _start_debounced(self, *args, **kwds ):
+        """
+        Starts the thread for a debounced :py:meth:`start` ,
+        resolving the future it returned with the thread's result.
+        """
+        future               = self._pending_future
+        self._pending_future = None
+
+        task_future = self._start( *args, **kwds )
+        if future is not None:
+            future._on_cancel = task_future.cancel
+            task_future.add_done_callback( future._copy_state )
+
+    def _cancel_pending_future(self):
+        """
+        Cancels the future returned by a debounced :py:meth:`start`
+        that has been superseded before it's thread started.
+        """
+        future               = self._pending_future
+        self._pending_future = None
+        if future is not None:
+            future._set_cancelled()
+
+    def _start(self, expiryTimeout=-1, threadpool=None, wait=False, _connections=None, *args, **kwds ):
+        """
+        Starts a new thread (see :py:meth:`start` ), without debouncing.
         """
 
         with threading.Lock():
@@ -725,7 +2018,13 @@ class SoloThreadedTask( object ):
                 threadId = threadId,
                 *args, **kwds
             )
-            self._active_threads[ threadId ] = task.request_abort
+            task._metrics_name = self._metrics_name
+
+            # previous threads are superseded by this one
+            with self._threads_changed:
+                self._withdraw_superseded()
+                self._active_threads[ threadId ] = task.request_abort
+                self._tasks[ threadId ]          = task
 
             if not _connections:
                 _connections = self._connections
@@ -742,6 +2041,21 @@ class SoloThreadedTask( object ):
                             _connections[signal_name]
                         )
 
+            if self._batch_connections:
+                for signal_name in self._batch_connections:
+                    if isinstance( self._batch_connections[ signal_name ], Iterable ):
+                        for callback in self._batch_connections[ signal_name ]:
+                            task.connect_batch( signal_name, callback )
+                    else:
+                        task.connect_batch( signal_name, self._batch_connections[ signal_name ] )
+
+            if self._stream_connections:
+                if isinstance( self._stream_connections, Iterable ):
+                    for callback in self._stream_connections:
+                        task.connect_stream( callback )
+                else:
+                    task.connect_stream( self._stream_connections )
+
             task.signal('thread_acquired_mutex').connect(
                 self._set_active_threadId
             )
@@ -750,36 +2064,93 @@ class SoloThreadedTask( object ):
                 QtCore.Qt.DirectConnection
             )
 
-            if not wait:
-                task.start( expiryTimeout=expiryTimeout, threadpool=threadpool )
-                logger.debug('created threadId: %s' % threadId)
+            future = task.start( expiryTimeout=expiryTimeout, threadpool=threadpool or self._threadpool, priority=self._priority )
+            future.add_done_callback( functools.partial( self._release_task, threadId ) )
+            logger.debug('created threadId: %s' % threadId)
 
-            else:
-                elapsed = 0
-                # wait for thread to lock
-                while self._mutex_loading.tryLock(0)   and   threadId in self._active_threads:
-                    if elapsed == 0:
-                        task.start( expiryTimeout=expiryTimeout, threadpool=threadpool )
-                        logger.debug('created threadId: %s' % threadId)
-                    self._mutex_loading.unlock()
-                    time.sleep(0.05)
-                    elapsed += 0.05
-                logger.debug( 'locked by thread' )
-
-
-                # wait for thread to unlock
-                while threadId  in  self._active_threads  and  self._active_threads:
-                    if wait not in (True,False):
-                        if elapsed >= wait:
-                            raise TimedOut(
-                                'waited %ss for job to complete without success' % elapsed
-                            )
-
-                    time.sleep(0.05)
-                    elapsed += 0.05
-                    QtCore.QCoreApplication.instance().processEvents()
+        if wait:
+            if wait is True:
+                wait = None
 
-                self._mutex_loading.unlock()
+            if not self._wait_until( lambda: threadId not in self._active_threads, timeout=wait ):
+                raise TimedOut(
+                    'waited %ss for job to complete without success' % wait
+                )
+
+        return future
+
+    def _wait_until(self, predicate, timeout=None ):
+        """
+        Blocks until ``predicate()`` returns ``True`` . `predicate` is
+        re-evaluated whenever a thread is added/removed from :py:attr:`_active_threads` .
+
+        When called from the UI thread, Qt events are processed while waiting
+        (so signals emitted by the threads are still delivered).
+
+        Args:
+            predicate (callable):
+                A callable returning ``True`` once the wait is over.
+
+            timeout (numbers.Number, optional):
+                Seconds to wait before giving up. ``None`` or a negative
+                number waits indefinitely.
+
+        Returns:
+            ``True`` if `predicate` was satisfied, ``False`` if `timeout` expired.
+        """
+        app          = QtCore.QCoreApplication.instance()
+        in_ui_thread = app is not None  and  QtCore.QThread.currentThread() == app.thread()
+
+        deadline = None
+        if timeout is not None  and  timeout >= 0:
+            deadline = time.time() + timeout
+
+        with self._threads_changed:
+            while not predicate():
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        return False
+
+                if not in_ui_thread:
+                    self._threads_changed.wait( remaining )
+                    continue
+
+                # UI thread: wake periodically to process events
+                if remaining is None  or  remaining > self._ui_wait_interval:
+                    remaining = self._ui_wait_interval
+                self._threads_changed.wait( remaining )
+
+                self._threads_changed.release()
+                try:
+                    app.processEvents()
+                finally:
+                    self._threads_changed.acquire()
+
+        if in_ui_thread:
+            app.processEvents()
+        return True
+
+    def _withdraw_superseded(self):
+        """
+        Requests abort on all active threads. Threads that are still
+        queued in their threadpool are withdrawn from it, so they
+        do not occupy a thread only to immediately exit.
+        """
+        for threadId in list(self._active_threads.keys()):
+            task = self._tasks.get( threadId )
+
+            if task is not None and task.withdraw():
+                self._active_threads.pop( threadId, None )
+                self._tasks.pop( threadId, None )
+                self._threads_changed.notify_all()
+                continue
+
+            request_abort = self._active_threads.get( threadId )
+            if request_abort:
+                logger.debug('requesting abort on threadId: %s' % threadId )
+                request_abort()
 
     def _run(self, threadId=None, signalmgr=None, *args, **kwds ):
         """
@@ -790,38 +2161,51 @@ class SoloThreadedTask( object ):
             * calls your callback method
         """
 
-        if not  self._mutex_loading.tryLock():
+        locked = self._mutex_loading.tryLock()
+        if not locked:
             logger.debug('Waiting for loading mutex to be released: %s' % threadId )
+            wait_started = time.time()
             self.stop( until_threadId=threadId )
-            self._mutex_loading.tryLock( self._mutex_expiry )
-
-
-        logger.debug('mutex acquired by threadId: %s' % threadId)
+            locked = self._mutex_loading.tryLock( self._mutex_expiry )
+            wait_ended = time.time()
+            metrics.get_registry().observe( 'mutex_wait', self._metrics_name, wait_ended - wait_started )
+            tracer = tracing.get_tracer()
+            if tracer is not None:
+                tracer.complete( 'mutex_wait', 'task', wait_started, wait_ended, {'callback': self._metrics_name} )
+
+        if locked:
+            logger.debug('mutex acquired by threadId: %s' % threadId)
+        else:
+            logger.warning('mutex not released within %sms, running regardless. threadId: %s' % (self._mutex_expiry, threadId))
         signalmgr.thread_acquired_mutex.emit( threadId )
 
         retval = None
 
         try:
-            retval = self._callback(
-                signalmgr = signalmgr,
-                *args, **kwds
-            )
+            # superseded while waiting for the mutex
+            signalmgr.handle_if_abort()
 
-        except( UserCancelledOperation ):
-            exc_info = sys.exc_info()
-            logger.debug('Responding to user-cancelled-operation. Exiting thread: %s' % repr(self) )
-            signalmgr._thread_exit_.emit( threadId )
-            self._mutex_loading.unlock()
+            if self._processpool is not None:
+                retval = self._processpool.run_task( self._callback, signalmgr, args, kwds )
+            else:
+                retval = self._callback(
+                    signalmgr = signalmgr,
+                    *args, **kwds
+                )
+                # generators are exhausted while the mutex is held
+                if inspect.isgenerator( retval ):
+                    retval = _stream_generator(
+                        retval, signalmgr,
+                        ThreadedTask.stream_size, ThreadedTask.stream_interval, ThreadedTask.stream_max_pending,
+                    )
 
-        except:
-            exc_info = sys.exc_info()
-            logger.error( '%s\n\nUnhandled Exception occurred in thread: %s' % (traceback.format_exc(exc_info), repr(exc_info)) )
+        # exceptions are handled by ThreadedTask.run() (logged, `exception` signal emitted)
+        finally:
+            if locked:
+                self._mutex_loading.unlock()
+                logger.debug('mutex released by threadId: %s' % threadId)
             signalmgr._thread_exit_.emit( threadId )
-            self._mutex_loading.unlock()
 
-        signalmgr._thread_exit_.emit( threadId )
-        logger.debug('mutex released by threadId: %s' % threadId)
-        self._mutex_loading.unlock()
         return retval
 
     def stop(self, until_threadId=None, wait=None ):
@@ -840,39 +2224,37 @@ class SoloThreadedTask( object ):
                 the thread with a threadId matching `until_threadId`.
 
             wait (numbers.Number, optional):  ``(ex: None, -1, 100)``
-                Optionally, wait *N* seconds for job to complete
-                after requesting abort. If negative number, waits
-                indefinitely. Waiting in the main UI thread will
-                result in a deadlock.
+                Optionally, wait *N* seconds for the aborted threads to exit.
+                If negative number, waits indefinitely. When waiting in the
+                UI thread, Qt events continue to be processed.
 
         Raises
             * :py:obj:`TimedOut` if user set a wait time.
         """
 
-        for active_threadId in self._active_threads:
+        # a pending (debounced) start is cancelled along with the threads
+        if until_threadId is None  and  self._debouncer is not None:
+            self._debouncer.cancel()
+            self._cancel_pending_future()
+
+        # (threads pop themselves from `_active_threads` as they exit)
+        aborted = []
+        for active_threadId in list(self._active_threads.keys()):
             if active_threadId == until_threadId:
                 return
             else:
-                logger.debug('requesting abort on threadId: %s' % active_threadId )
-                self._active_threads[ active_threadId ]()
+                request_abort = self._active_threads.get( active_threadId )
+                if request_abort:
+                    logger.debug('requesting abort on threadId: %s' % active_threadId )
+                    request_abort()
+                    aborted.append( active_threadId )
 
         if wait:
-            elapsed = 0
-            while True:
-                locked = self._mutex_loading.tryLock(0)
-
-                # if lock is free, exit
-                if locked:
-                    self._mutex_loading.unlock()
-                    break
-
-                # if waited user-requested time, exit
-                if elapsed > 0  and  elapsed >= wait:
-                    raise TimedOut('waited %ss for thread to end' % elapsed)
-                    break
+            def aborted_threads_exited():
+                return not any([ threadId in self._active_threads for threadId in aborted ])
 
-                time.sleep(0.05)
-                elapsed += 0.05
+            if not self._wait_until( aborted_threads_exited, timeout=wait ):
+                raise TimedOut('waited %ss for thread to end' % wait)
 
     def _set_active_threadId(self, threadId):
         """
@@ -892,16 +2274,37 @@ class SoloThreadedTask( object ):
         (removing discontinued will remove a lot of clutter)
         """
 
-        if threadId in self._active_threads:
-            self._active_threads.pop( threadId )
+        with self._threads_changed:
+            self._active_threads.pop( threadId, None )
+            self._threads_changed.notify_all()
+
+    def _release_task(self, threadId, future=None ):
+        """
+        Drops our reference to the :py:obj:`ThreadedTask` for `threadId`
+        once it has exited. This runs in the UI thread (as a done-callback of
+        the task's future, queued after the task's final signals), so that the task's
+        :py:obj:`SignalManager` is neither destroyed from the threadpool thread while
+        new connections are being made, nor before it's final signals are delivered.
+        """
+        self._tasks.pop( threadId, None )
+
+    def detach(self):
+        """
+        Detaches all of this :py:obj:`SoloThreadedTask` 's threads that are still running
+        (see :py:meth:`ThreadedTask.detach` ).
+        """
+        for task in list(self._tasks.values()):
+            task.detach()
 
     def is_active(self):
         """
         Returns ``True`` if this :py:obj:`SoloThreadedTask` is
-        overseeing an active thread.
+        overseeing an active thread (or has a pending debounced start).
         """
         if self._active_threads:
             return True
+        if self._debouncer is not None  and  self._debouncer.is_pending():
+            return True
         return False
 
 
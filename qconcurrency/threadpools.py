@@ -0,0 +1,481 @@
+#!/usr/bin/env python
+"""
+Name :          qconcurrency.threadpools.py
+Created :       Oct 17, 2026
+Author :        Will Pittman
+Contact :       willjpittman@gmail.com
+________________________________________________________________________________
+Description :   A registry of named :py:obj:`QtCore.QThreadPool` s (one per class
+                of workload), with per-threadpool occupancy statistics,
+                and an optional tuner that sizes a threadpool from them.
+________________________________________________________________________________
+"""
+#builtin
+from __future__    import unicode_literals
+from __future__    import absolute_import
+from __future__    import division
+from __future__    import print_function
+from   collections import deque
+import logging
+import math
+import threading
+import time
+#package
+#external
+from   Qt import QtCore
+import six
+#internal
+
+logger = logging.getLogger(__name__)
+loc    = locals
+
+__all__ = [
+    'ThreadPoolTuner',
+    'get_threadpool',
+    'register_threadpool',
+    'resolve_threadpool',
+    'threadpool_names',
+    'threadpool_stats',
+]
+
+
+_threadpools      = {}   # { name : QtCore.QThreadPool }
+_threadpool_stats = {}   # { id(threadpool) : _ThreadPoolStats }  (registered threadpools only)
+_threadpools_lock = threading.RLock()
+
+# CPU-time used by the current thread (not available in python-2)
+_thread_time = getattr( time, 'thread_time', None )
+
+# threadpools created on first use, if they have not been registered
+# ( 'global' is QtCore.QThreadPool.globalInstance() )
+_default_threadpools = {
+    'io':          {'max_threads': 8},                                  # network/disk reads (mostly waiting)
+    'cpu':         {'max_threads': QtCore.QThread.idealThreadCount()},  # computation
+    'ui-prefetch': {'max_threads': 2},                                  # speculative loads, for data not yet visible
+}
+
+
+def register_threadpool( name, max_threads=None, expiry_timeout=None, threadpool=None ):
+    """
+    Creates (or reconfigures) a named threadpool.
+
+    Tasks queued in different threadpools do not compete for threads, so
+    a burst of slow network-loads in ``'io'`` cannot delay quick loads
+    queued in another threadpool.
+
+    Example:
+
+        .. code-block:: python
+
+            register_threadpool( 'network', max_threads=16, expiry_timeout=60000 )
+
+            task = ThreadedTask( fetch_thumbnail, url=url )
+            task.start( threadpool='network' )
+
+    Args:
+        name (str):
+            Name used to select this threadpool ( ex: ``ThreadedTask.start( threadpool=name )`` ).
+
+        max_threads (int, optional):
+            :py:meth:`QtCore.QThreadPool.setMaxThreadCount`
+
+        expiry_timeout (int, optional):
+            :py:meth:`QtCore.QThreadPool.setExpiryTimeout` (milliseconds)
+
+        threadpool (QtCore.QThreadPool, optional):
+            Register an existing threadpool under `name` ,
+            instead of creating a new one.
+
+    Returns:
+        :py:obj:`QtCore.QThreadPool`
+    """
+    with _threadpools_lock:
+        if threadpool is None:
+            threadpool = _threadpools.get( name )
+        if threadpool is None:
+            threadpool = QtCore.QThreadPool()
+
+        if max_threads is not None:
+            threadpool.setMaxThreadCount( max_threads )
+        if expiry_timeout is not None:
+            threadpool.setExpiryTimeout( expiry_timeout )
+
+        _threadpools[ name ] = threadpool
+        if id(threadpool) not in _threadpool_stats:
+            _threadpool_stats[ id(threadpool) ] = _ThreadPoolStats( name, threadpool )
+
+        return threadpool
+
+
+def get_threadpool( name ):
+    """
+    Returns the threadpool registered as `name` (creating it, if it is one of
+    ``'global'``, ``'io'``, ``'cpu'``, ``'ui-prefetch'`` ).
+
+    Raises:
+        :py:obj:`RuntimeError`: if no threadpool is registered as `name`
+    """
+    with _threadpools_lock:
+        if name in _threadpools:
+            return _threadpools[ name ]
+
+        if name == 'global':
+            return register_threadpool( name, threadpool=QtCore.QThreadPool.globalInstance() )
+
+        if name in _default_threadpools:
+            return register_threadpool( name, **_default_threadpools[ name ] )
+
+        raise RuntimeError(
+            'No threadpool registered as "%s". Available threadpools: %s' % (
+                name, repr(threadpool_names()) )
+        )
+
+
+def resolve_threadpool( threadpool=None ):
+    """
+    Returns a :py:obj:`QtCore.QThreadPool` from a `threadpool` argument.
+
+    Args:
+        threadpool (QtCore.QThreadPool, str, optional):
+            A threadpool, the name of a registered threadpool, or ``None``
+            for :py:meth:`QtCore.QThreadPool.globalInstance` .
+    """
+    if not threadpool:
+        return QtCore.QThreadPool.globalInstance()
+    if isinstance( threadpool, six.string_types ):
+        return get_threadpool( threadpool )
+    return threadpool
+
+
+def threadpool_names():
+    """
+    Returns a sorted list of the names of all registered (and default) threadpools.
+    """
+    with _threadpools_lock:
+        return sorted( set(_threadpools.keys()) | set(_default_threadpools.keys()) | set(['global']) )
+
+
+def threadpool_stats( name=None ):
+    """
+    Returns occupancy statistics for a registered threadpool
+    (or all threadpools that have been used, if `name` is not provided).
+
+    .. code-block:: python
+
+        >>> threadpool_stats('io')
+        {
+            'max_threads':  8,     # QThreadPool.maxThreadCount()
+            'active':       8,     # tasks running
+            'queued':       31,    # tasks waiting for a thread
+            'peak_active':  8,     # max tasks running at once
+            'submitted':    140,   # tasks started
+            'completed':    101,   # tasks that have finished running
+            'withdrawn':    0,     # tasks removed from the queue before running (ThreadedTask.withdraw)
+            'occupancy':    1.0,   # active / max_threads
+            'avg_wait':     0.43,  # average seconds tasks waited in the queue
+            'avg_runtime':  0.25,  # average seconds tasks ran for
+            'blocking':     0.9,   # fraction of task run-time not spent on the cpu (None if unmeasured)
+        }
+
+        >>> threadpool_stats()
+        { 'io': {...}, 'global': {...} }
+    """
+    with _threadpools_lock:
+        if name is not None:
+            return _threadpool_stats[ id(get_threadpool( name )) ].as_dict()
+
+        return dict([ (stats.name, stats.as_dict()) for stats in _threadpool_stats.values() ])
+
+
+def _get_stats( threadpool ):
+    """
+    Returns the :py:obj:`_ThreadPoolStats` for `threadpool` ,
+    or ``None`` if it is not a registered threadpool.
+    """
+    return _threadpool_stats.get( id(threadpool) )
+
+
+
+class _ThreadPoolStats( object ):
+    """
+    Task counts for a registered threadpool.
+    Updated by :py:obj:`qconcurrency.threading_.ThreadedTask` .
+    """
+    def __init__(self, name, threadpool ):
+        self.name        = name
+        self._threadpool = threadpool
+        self._lock       = threading.Lock()
+
+        self.submitted   = 0
+        self.started     = 0
+        self.completed   = 0
+        self.withdrawn   = 0
+        self.peak_active = 0
+        self.total_wait  = 0.0   # seconds started tasks spent queued
+        self.total_wall  = 0.0   # seconds completed tasks spent running
+        self.total_cpu   = 0.0   # cpu-seconds completed tasks used (``None`` if it cannot be measured)
+        if _thread_time is None:
+            self.total_cpu = None
+
+    def task_queued(self):
+        with self._lock:
+            self.submitted += 1
+
+    def task_started(self, wait ):
+        """
+        Returns:
+            ``(wall_time, cpu_time)`` at the start of the task (pass to :py:meth:`task_completed` ).
+        """
+        with self._lock:
+            self.started    += 1
+            self.total_wait += wait
+            self.peak_active = max( self.peak_active, self.started - self.completed )
+
+        return ( time.time(), _thread_time() if _thread_time else None )
+
+    def task_completed(self, timing ):
+        (wall_start, cpu_start) = timing
+        wall = time.time() - wall_start
+        with self._lock:
+            self.completed  += 1
+            self.total_wall += wall
+            if cpu_start is not None:
+                self.total_cpu += _thread_time() - cpu_start
+
+    def task_withdrawn(self):
+        with self._lock:
+            self.withdrawn += 1
+
+    def as_dict(self):
+        with self._lock:
+            max_threads = self._threadpool.maxThreadCount()
+            active      = self.started - self.completed
+            return {
+                'max_threads':  max_threads,
+                'active':       active,
+                'queued':       self.submitted - self.started - self.withdrawn,
+                'peak_active':  self.peak_active,
+                'submitted':    self.submitted,
+                'completed':    self.completed,
+                'withdrawn':    self.withdrawn,
+                'occupancy':    ( active / max_threads ) if max_threads else 0.0,
+                'avg_wait':     ( self.total_wait / self.started ) if self.started else 0.0,
+                'avg_runtime':  ( self.total_wall / self.completed ) if self.completed else 0.0,
+                'blocking':     _blocking_ratio( self.total_wall, self.total_cpu ),
+            }
+
+    def snapshot(self):
+        """
+        Returns:
+            ``(completed, queued, active, total_wall, total_cpu)``
+        """
+        with self._lock:
+            return (
+                self.completed,
+                self.submitted - self.started - self.withdrawn,
+                self.started - self.completed,
+                self.total_wall,
+                self.total_cpu,
+            )
+
+
+
+class ThreadPoolTuner( QtCore.QObject ):
+    """
+    Periodically resizes a registered threadpool's :py:meth:`QtCore.QThreadPool.maxThreadCount` ,
+    from the wall-time vs cpu-time of the :py:obj:`qconcurrency.threading_.ThreadedTask` s
+    that completed since the last sample.
+
+    Tasks that spend most of their time blocked (waiting on disk/network) leave their
+    thread's core idle, so the threadpool is sized to ``cores / (1 - blocking)`` ,
+    within `min_threads` and `max_threads` . The threadpool only grows while tasks are
+    queued, and changes by at most half of it's size per sample.
+
+    Each change is emitted using the signal `adjusted` , and kept in :py:meth:`decisions` .
+
+    Example:
+
+        .. code-block:: python
+
+            tuner = ThreadPoolTuner( 'io', min_threads=2, max_threads=64 )
+            tuner.adjusted.connect( lambda decision: logger.info( repr(decision) ) )
+            tuner.start()
+
+    .. note::
+
+        Requires :py:func:`time.thread_time` (python-3.7+) to measure cpu-time,
+        otherwise the threadpool is left unchanged.
+    """
+    adjusted = QtCore.Signal(object)  # { 'time', 'threads', 'previous_threads', 'blocking', 'queued', 'throughput' }
+
+    def __init__(self, threadpool, min_threads=1, max_threads=None, interval=1000, history=100, parent=None ):
+        """
+        Args:
+            threadpool (str, QtCore.QThreadPool):
+                A threadpool registered in :py:mod:`qconcurrency.threadpools` (or it's name).
+
+            min_threads (int, optional):
+                The threadpool never shrinks below this many threads.
+
+            max_threads (int, optional):
+                The threadpool never grows beyond this many threads.
+                By default, 8x :py:meth:`QtCore.QThread.idealThreadCount` .
+
+            interval (int, optional):
+                Milliseconds between samples.
+
+            history (int, optional):
+                Number of decisions kept in :py:meth:`decisions` .
+
+            parent (QtCore.QObject, optional):
+                Qt parent of this object.
+        """
+        QtCore.QObject.__init__(self, parent)
+
+        threadpool = resolve_threadpool( threadpool )
+        stats      = _get_stats( threadpool )
+        if stats is None:
+            raise RuntimeError(
+                'ThreadPoolTuner requires a threadpool registered with `register_threadpool()`: %s' % repr(threadpool)
+            )
+
+        self._cores = max( 1, QtCore.QThread.idealThreadCount() )
+        if max_threads is None:
+            max_threads = self._cores * 8
+
+        self._threadpool  = threadpool
+        self._stats       = stats
+        self._min_threads = max( 1, min_threads )
+        self._max_threads = max( self._min_threads, max_threads )
+
+        self._decisions       = deque( maxlen=history )
+        self._last_sample     = None   # ( time.time(), completed, total_wall, total_cpu )
+        self._last_blocking   = None
+        self._last_throughput = 0.0
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval( interval )
+        self._timer.timeout.connect( self.sample )
+
+    def start(self):
+        """
+        Starts sampling the threadpool every `interval` milliseconds.
+        """
+        self._last_sample = None
+        self._take_sample()
+        self._timer.start()
+
+    def stop(self):
+        """
+        Stops sampling the threadpool (it's size is left unchanged).
+        """
+        self._timer.stop()
+
+    def is_active(self):
+        return self._timer.isActive()
+
+    def sample(self):
+        """
+        Samples the threadpool's stats, and resizes it if required.
+
+        Returns:
+            The decision (dict) if the threadpool was resized, otherwise ``None`` .
+        """
+        previous = self._last_sample
+        (now, completed, queued, total_wall, total_cpu) = self._take_sample()
+        if previous is None  or  total_cpu is None:
+            return None
+
+        (prev_time, prev_completed, prev_wall, prev_cpu) = previous
+        ncompleted = completed - prev_completed
+        if ncompleted <= 0:
+            return None
+
+        blocking = _blocking_ratio( total_wall - prev_wall, total_cpu - prev_cpu )
+        self._last_throughput = ncompleted / max( now - prev_time, 1e-6 )
+        if blocking is None:
+            # (ex: tasks shorter than the clock's resolution)
+            return None
+        self._last_blocking = blocking
+
+        current = self._threadpool.maxThreadCount()
+        target  = self._target_threads( current, blocking, queued )
+        if target == current:
+            return None
+
+        self._threadpool.setMaxThreadCount( target )
+        decision = {
+            'time':             now,
+            'threads':          target,
+            'previous_threads': current,
+            'blocking':         blocking,
+            'queued':           queued,
+            'throughput':       self._last_throughput,
+        }
+        self._decisions.append( decision )
+        logger.debug('Resized threadpool from %s to %s threads: %s' % (current, target, repr(decision)))
+        self.adjusted.emit( decision )
+        return decision
+
+    def decisions(self):
+        """
+        Returns a list of the most recent resizes (oldest first).
+        See `adjusted` for the keys of each decision.
+        """
+        return list(self._decisions)
+
+    def metrics(self):
+        """
+        Returns the tuner's current state.
+
+        .. code-block:: python
+
+            {
+                'threads':     12,     # threadpool's current maxThreadCount()
+                'min_threads': 1,
+                'max_threads': 64,
+                'blocking':    0.66,   # fraction of the last sample's task wall-time not spent on cpu
+                'throughput':  240.0,  # tasks completed per second, during the last sample
+                'adjustments': 3,      # number of decisions kept
+            }
+        """
+        return {
+            'threads':     self._threadpool.maxThreadCount(),
+            'min_threads': self._min_threads,
+            'max_threads': self._max_threads,
+            'blocking':    self._last_blocking,
+            'throughput':  self._last_throughput,
+            'adjustments': len(self._decisions),
+        }
+
+    def _take_sample(self):
+        now = time.time()
+        (completed, queued, active, total_wall, total_cpu) = self._stats.snapshot()
+        self._last_sample = ( now, completed, total_wall, total_cpu )
+        return ( now, completed, queued, total_wall, total_cpu )
+
+    def _target_threads(self, current, blocking, queued ):
+        """
+        Returns the threadpool-size for a sample (see class docstring).
+        """
+        ideal = int( math.ceil( self._cores / max( 1.0 - blocking, 0.01 ) ) )
+
+        # without a queue, more threads would not be used
+        if ideal > current  and  not queued:
+            ideal = current
+
+        step   = max( 1, current // 2 )
+        target = max( current - step, min( current + step, ideal ) )
+        return max( self._min_threads, min( self._max_threads, target ) )
+
+
+
+def _blocking_ratio( wall, cpu ):
+    """
+    Returns the fraction of `wall` time not spent on the cpu
+    ( ``None`` if it cannot be measured).
+    """
+    if cpu is None  or  wall <= 0:
+        return None
+    return min( 1.0, max( 0.0, 1.0 - cpu / wall ) )
+
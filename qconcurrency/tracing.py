@@ -0,0 +1,358 @@
+#!/usr/bin/env python
+"""
+Name :          qconcurrency.tracing.py
+Created :       Oct 17, 2026
+Author :        Will Pittman
+Contact :       willjpittman@gmail.com
+________________________________________________________________________________
+Description :   An opt-in tracer, recording task submit/run/abort, mutex-waits and
+                UI-side slot execution into a bounded ring-buffer, exported as
+                Chrome trace-event JSON (viewable in https://ui.perfetto.dev
+                or ``chrome://tracing`` ).
+
+                Slots connected using ``ThreadedTask.signal()`` are only
+                traced if they were connected while tracing was enabled.
+________________________________________________________________________________
+"""
+#builtin
+from __future__    import unicode_literals
+from __future__    import absolute_import
+from __future__    import division
+from __future__    import print_function
+from   collections import deque
+import functools
+import inspect
+import io
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+#package
+#external
+from   Qt import QtCore
+import six
+#internal
+
+logger = logging.getLogger(__name__)
+loc    = locals
+
+__all__ = [
+    'Tracer',
+    'disable_tracing',
+    'enable_tracing',
+    'get_tracer',
+]
+
+
+_tracer = None   # the enabled Tracer (or None)
+
+
+def enable_tracing( capacity=100000 ):
+    """
+    Starts recording trace-events (replacing any enabled :py:obj:`Tracer` ).
+
+    Once the ring-buffer holds `capacity` events, the oldest events are
+    discarded, so tracing may be left enabled in long-running programs.
+
+    Example:
+
+        .. code-block:: python
+
+            enable_tracing( capacity=50000 )
+            # ...
+            get_tracer().write( '/tmp/myapp.trace.json' )   # open in https://ui.perfetto.dev
+
+    Returns:
+        :py:obj:`Tracer`
+    """
+    global _tracer
+    _tracer = Tracer( capacity )
+    return _tracer
+
+
+def disable_tracing():
+    """
+    Stops recording trace-events.
+
+    Returns:
+        The :py:obj:`Tracer` that was enabled (or ``None`` ), so it's events may still be written.
+    """
+    global _tracer
+    tracer  = _tracer
+    _tracer = None
+    return tracer
+
+
+def get_tracer():
+    """
+    Returns the enabled :py:obj:`Tracer` , or ``None`` if tracing is disabled.
+    """
+    return _tracer
+
+
+
+class Tracer( object ):
+    """
+    Records Chrome trace-events in a bounded ring-buffer.
+
+    Events recorded by :py:mod:`qconcurrency.threading_` :
+
+        ================ ======== =============================================================
+        name             category description
+        ================ ======== =============================================================
+        <callback-name>  task     (complete) the task's callback running in it's thread
+        submit           task     (instant) ``ThreadedTask.start()`` (with a flow-arrow to the run)
+        abort_requested  task     (instant) ``ThreadedTask.request_abort()``
+        withdrawn        task     (instant) ``ThreadedTask.withdraw()``
+        mutex_wait       task     (complete) a SoloThreadedTask thread waiting for the previous thread
+        <signal>: <slot> ui       (complete) a slot running in the UI thread, for a signal from a task
+        ================ ======== =============================================================
+
+    Slots connected using :py:meth:`qconcurrency.threading_.ThreadedTask.signal` are only traced
+    if they were connected while tracing was enabled (slots connected before tracing was enabled,
+    or directly to the :py:obj:`qconcurrency.threading_.SignalManager` are not).
+    Callbacks connected using :py:meth:`qconcurrency.threading_.ThreadedTask.connect_batch`
+    are traced whenever tracing is enabled.
+    """
+    def __init__(self, capacity=100000 ):
+        """
+        Args:
+            capacity (int, optional):
+                Maximum number of events kept (oldest events are discarded first).
+        """
+        self._events       = deque( maxlen=capacity )
+        self._thread_names = {}   # { tid : name }
+        self._flow_ids     = itertools.count(1)
+        self._pid          = os.getpid()
+
+    def complete(self, name, category, start, end, args=None ):
+        """
+        Records an event that spans from `start` to `end` (seconds, ``time.time()`` )
+        in the current thread.
+        """
+        event = self._event( name, category, 'X', start )
+        event['dur'] = ( end - start ) * 1000000
+        if args:
+            event['args'] = args
+        self._events.append( event )
+
+    def instant(self, name, category, args=None ):
+        """
+        Records an event at the current time, in the current thread.
+        """
+        event = self._event( name, category, 'i', time.time() )
+        event['s'] = 't'
+        if args:
+            event['args'] = args
+        self._events.append( event )
+
+    def flow_start(self, name, category ):
+        """
+        Starts an arrow from the current thread/time (ex: where a task was submitted).
+
+        Returns:
+            The flow's id (pass to :py:meth:`flow_end` ).
+        """
+        flow_id     = next( self._flow_ids )
+        event       = self._event( name, category, 's', time.time() )
+        event['id'] = flow_id
+        self._events.append( event )
+        return flow_id
+
+    def flow_end(self, flow_id, name, category ):
+        """
+        Ends the arrow `flow_id` at the current thread/time (ex: where the task started running).
+        """
+        event       = self._event( name, category, 'f', time.time() )
+        event['id'] = flow_id
+        event['bp'] = 'e'
+        self._events.append( event )
+
+    def events(self):
+        """
+        Returns a list of the recorded events (oldest first).
+        """
+        return list(self._events)
+
+    def clear(self):
+        self._events.clear()
+
+    def to_json(self):
+        """
+        Returns the recorded events as a Chrome trace-event JSON string.
+        """
+        metadata = [
+            { 'name': 'thread_name', 'ph': 'M', 'pid': self._pid, 'tid': tid, 'args': {'name': name} }
+            for (tid, name) in list(self._thread_names.items())
+        ]
+        return json.dumps({
+            'traceEvents':     metadata + self.events(),
+            'displayTimeUnit': 'ms',
+        })
+
+    def write(self, filepath ):
+        """
+        Writes the recorded events to `filepath` as Chrome trace-event JSON.
+        """
+        with io.open( filepath, 'w', encoding='utf-8' ) as fd:
+            fd.write( six.text_type( self.to_json() ) )
+
+    def _event(self, name, category, phase, timestamp ):
+        thread = threading.current_thread()
+        tid    = thread.ident
+        if tid not in self._thread_names:
+            self._thread_names[ tid ] = thread.name
+
+        return {
+            'name': name,
+            'cat':  category,
+            'ph':   phase,
+            'ts':   timestamp * 1000000,
+            'pid':  self._pid,
+            'tid':  tid,
+        }
+
+
+
+class _TracedSignal( object ):
+    """
+    Wraps a task's :py:obj:`QtCore.Signal` , tracing the slots connected
+    to it while they run in the UI thread. (Returned by
+    :py:meth:`qconcurrency.threading_.ThreadedTask.signal` while tracing is enabled).
+    """
+    def __init__(self, signal, signal_name, traced_slots ):
+        """
+        Args:
+            signal (QtCore.Signal):
+                The (bound) signal to wrap.
+
+            signal_name (str):
+                The signal's name.
+
+            traced_slots (dict):
+                ``{ slot : _TracedSlot }`` shared by all wrappers of this signal
+                (so a slot can be disconnected using another wrapper).
+        """
+        self._signal      = signal
+        self._signal_name = signal_name
+        self._slots       = traced_slots
+
+    def connect(self, slot, type=None ):
+        # direct-connections run in the emitting thread (not the UI)
+        if type == QtCore.Qt.DirectConnection:
+            return self._signal.connect( slot, type )
+
+        traced = self._slots.get( slot )
+        if traced is None:
+            traced = self._slots[ slot ] = _get_traced_slot( slot, self._signal_name )
+
+        if type is None:
+            return self._signal.connect( traced.run )
+        return self._signal.connect( traced.run, type )
+
+    def disconnect(self, slot=None ):
+        if slot is None:
+            self._slots.clear()
+            return self._signal.disconnect()
+
+        traced = self._slots.pop( slot, None )
+        if traced is None:
+            return self._signal.disconnect( slot )
+        return self._signal.disconnect( traced.run )
+
+    def emit(self, *args ):
+        return self._signal.emit( *args )
+
+    def __getattr__(self, attr ):
+        return getattr( self._signal, attr )
+
+
+
+class _TracedSlot( QtCore.QObject ):
+    """
+    Runs `slot` , recording a complete-event in the enabled :py:obj:`Tracer` .
+
+    When `slot` is a method of a :py:obj:`QtCore.QObject` , this becomes a child
+    of that object. So (as if `slot` were connected directly) it runs in
+    the object's thread, and is disconnected once the object is deleted.
+    (see :py:func:`_get_traced_slot` )
+    """
+    def __init__(self, slot, signal_name ):
+        QtCore.QObject.__init__(self)
+
+        self._slot        = slot
+        self._signal_name = signal_name
+        self._name        = '%s: %s' % ( signal_name, _slot_name( slot ) )
+        self._nargs       = _max_positional_args( slot )
+
+        receiver = getattr( slot, '__self__', None )
+        if isinstance( receiver, QtCore.QObject ):
+            self.moveToThread( receiver.thread() )
+            self.setParent( receiver )
+
+    def run(self, *args ):
+        # like Qt, slots accepting fewer arguments than the signal
+        # receive only the first N
+        if self._nargs is not None:
+            args = args[ :self._nargs ]
+
+        tracer = _tracer
+        if tracer is None:
+            return self._slot( *args )
+
+        start = time.time()
+        try:
+            return self._slot( *args )
+        finally:
+            tracer.complete( self._name, 'ui', start, time.time() )
+
+
+
+def _get_traced_slot( slot, signal_name ):
+    """
+    Returns a :py:obj:`_TracedSlot` for `slot` .
+
+    Those of :py:obj:`QtCore.QObject` methods are children of the object,
+    so they are shared by every task connected to it (instead of one per
+    task accumulating for as long as the object lives).
+    """
+    receiver = getattr( slot, '__self__', None )
+    if isinstance( receiver, QtCore.QObject ):
+        for child in receiver.children():
+            if isinstance( child, _TracedSlot )  and  child._signal_name == signal_name  and  child._slot == slot:
+                return child
+
+    return _TracedSlot( slot, signal_name )
+
+
+def _slot_name( slot ):
+    while isinstance( slot, functools.partial ):
+        slot = slot.func
+    return getattr( slot, '__qualname__', None ) or getattr( slot, '__name__', None ) or type(slot).__name__
+
+
+def _max_positional_args( slot ):
+    """
+    Returns the number of positional arguments `slot` accepts,
+    or ``None`` if it accepts any number (or it cannot be determined).
+    """
+    bound = 0
+    keywords = ()
+    while isinstance( slot, functools.partial ):
+        bound   += len( slot.args )
+        keywords = tuple( keywords ) + tuple( (slot.keywords or {}).keys() )
+        slot     = slot.func
+
+    func = getattr( slot, '__func__', slot )
+    code = getattr( func, '__code__', None )
+    if code is None  or  code.co_flags & inspect.CO_VARARGS:
+        return None
+
+    names = code.co_varnames[ :code.co_argcount ]
+    nargs = len([ name for name in names if name not in keywords ])
+    if getattr( slot, '__self__', None ) is not None:
+        nargs -= 1
+    return max( 0, nargs - bound )
+
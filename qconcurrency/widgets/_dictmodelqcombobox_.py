@@ -91,6 +91,7 @@ class DictModelQComboBox( QtWidgets.QComboBox ):
         self._modelindexes = {}               # {combobox_index : QModelIndex} QModelIndex of each item in QComboBox
         self._level_specific_columns = False  # True    if self._indexinfo is in the format of  { level : {'_id':..., 'name':,..}, level : {...} }
                                               # False   if self._indexinfo is in the format of  {'_id':..., 'name':...}
+        self._model_resetting        = False  # True while the model is being reset, or bulk-inserting rows (rows inserted meanwhile are ignored until it ends)
 
 
 
@@ -101,12 +102,26 @@ class DictModelQComboBox( QtWidgets.QComboBox ):
 
         # Connections (update combobox every time model changes )
         self._dictmodel.itemChanged.connect( self._handle_modelchange )
+        self._dictmodel.modelAboutToBeReset.connect( self._handle_modelreset_started )
+        self._dictmodel.modelReset.connect( self._handle_modelreset )
+        self._dictmodel.bulk_insert_started.connect( self._handle_modelreset_started )
+        self._dictmodel.bulk_insert_finished.connect( self._handle_modelreset )
+        self._dictmodel.rowsInserted.connect( self._handle_modelchange )
         self.currentIndexChanged.connect(self.get_selected)
 
         # Load
         self._populate_combo()
 
     def _handle_modelchange(self,*args,**kwds):
+        if self._model_resetting:
+            return
+        self._populate_combo()
+
+    def _handle_modelreset_started(self):
+        self._model_resetting = True
+
+    def _handle_modelreset(self):
+        self._model_resetting = False
         self._populate_combo()
 
     def _populate_combo(self, _baseitem=None, _indent_lv=0):
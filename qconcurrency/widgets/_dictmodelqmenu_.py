@@ -102,9 +102,16 @@ class DictModelQMenu( QtWidgets.QMenu ):
         self._submenus  = {}         # { uuid : submenu-widget }
                                      # (simply keeps references to qmenus so
                                      # they are note deleted when scope ends)
+        self._model_resetting = False  # True while the model is being reset, or bulk-inserting rows
+                                       # (rows inserted meanwhile are ignored until it ends)
 
         # Connections
         self._dictmodel.itemChanged.connect( self._handle_modelchange )
+        self._dictmodel.modelAboutToBeReset.connect( self._handle_modelreset_started )
+        self._dictmodel.modelReset.connect( self._handle_modelreset )
+        self._dictmodel.bulk_insert_started.connect( self._handle_modelreset_started )
+        self._dictmodel.bulk_insert_finished.connect( self._handle_modelreset )
+        self._dictmodel.rowsInserted.connect( self._handle_modelchange )
 
         # Load
         self._create_actions()
@@ -201,6 +208,19 @@ class DictModelQMenu( QtWidgets.QMenu ):
         Whenever the model changes, recreate the
         QMenu actions/submenus.
         """
+        if self._model_resetting:
+            return
+        self._create_actions()
+
+    def _handle_modelreset_started(self):
+        self._model_resetting = True
+
+    def _handle_modelreset(self):
+        """
+        Once the model has been reset (or rows bulk-inserted), recreate the
+        QMenu actions/submenus.
+        """
+        self._model_resetting = False
         self._create_actions()
 
 
@@ -20,7 +20,7 @@ import copy
 import logging
 import threading
 #external
-from Qt            import QtWidgets
+from Qt            import QtWidgets, QtCore
 #internal
 from qconcurrency.threading_  import ThreadedTask, SoloThreadedTask
 
@@ -38,13 +38,17 @@ class _ProgressSoloThreadedTask( SoloThreadedTask ):
     This way, there is no race-condition where cancelling one thread can knock out
     progress on *all* threads.
     """
-    def __init__(self, progressbar, callback, signals=None, connections=None, mutex_expiry=5000 ):
+    def __init__(self, progressbar, callback, signals=None, connections=None, mutex_expiry=5000, debounce=None, coalesce=False, priority=None, threadpool=None ):
         self._progressbar = progressbar
         SoloThreadedTask.__init__(self,
             callback     = callback,
             signals      = signals,
             connections  = connections,
             mutex_expiry = mutex_expiry,
+            debounce     = debounce,
+            coalesce     = coalesce,
+            priority     = priority,
+            threadpool   = threadpool,
         )
 
     def start(self, expiryTimeout=-1, threadpool=None, wait=False, *args, **kwds ):
@@ -77,7 +81,7 @@ class _ProgressSoloThreadedTask( SoloThreadedTask ):
                 connections[ signal ] = [ progbar_connections[signal] ]
 
 
-        SoloThreadedTask.start(self,
+        return SoloThreadedTask.start(self,
                            expiryTimeout = expiryTimeout,
                            threadpool    = threadpool,
                            wait          = wait,
@@ -98,18 +102,45 @@ class ProgressBar( QtWidgets.QWidget ):
     (my hope is that if errors appear in total-calculated progress in the
     codebase, this will lessen the appearance of an error for the user - each
     thread's progress being set to 100% once it exits).
+
+    Threads that report progress in a tight loop can be throttled
+    using `max_refresh_rate`. Progress is still recorded immediately,
+    but the progressbar widget is only updated at most N times per second.
+
+    Example:
+
+        .. code-block:: python
+
+            bar = ProgressBar( max_refresh_rate=30 )  # repaint at most 30x/second
     """
-    def __init__(self):
+    def __init__(self, max_refresh_rate=None ):
+        """
+        Args:
+            max_refresh_rate (int, optional):
+                If provided, the maximum number of times per second
+                the progressbar will be updated. By default, the progressbar
+                is updated every time progress changes.
+        """
         QtWidgets.QWidget.__init__(self)
 
         self._progress = {}         # { jobid: {'total':10, 'current':3} }
         self._cancelled_jobids = [] # rolling log of cancelled jobids (so later unhandled progress is ignored)
 
-        self._progressbar = None    # the ProgressBar Widget
+        self._total   = 0           # sum of 'total'   in self._progress
+        self._current = 0           # sum of 'current' in self._progress
+
+        self._progressbar   = None  # the ProgressBar Widget
+        self._refresh_timer = None  # QTimer coalescing refreshes (if `max_refresh_rate`)
         self.setHidden(True)
 
         self._initui()
 
+        if max_refresh_rate:
+            self._refresh_timer = QtCore.QTimer( self )
+            self._refresh_timer.setSingleShot( True )
+            self._refresh_timer.setInterval( int( 1000 / max_refresh_rate ) )
+            self._refresh_timer.timeout.connect( self._update_progressbar )
+
     def _initui(self):
 
         # Create Widgets
@@ -139,36 +170,44 @@ class ProgressBar( QtWidgets.QWidget ):
                 self._progress[ jobid ] = {'total':amount, 'current':0}
             else:
                 self._progress[ jobid ]['total'] += amount
+            self._total += amount
 
             self.refresh_progress()
             self.setHidden(False)
 
     def refresh_progress(self):
         """
-        ReCalculates current/total progress, and updates the progressbar
+        Updates the progressbar with the current/total progress.
+        (If a `max_refresh_rate` was set, the update is deferred
+        until the next refresh is allowed).
         """
 
         with threading.Lock():
-            total_progress   = 0
-            current_progress = 0
-            for jobid in list(self._progress.keys()):
-                job_progress = self._progress[ jobid ]
-
-                if   jobid in self._cancelled_jobids:
-                    self._progress.pop(jobid)
+            if self._refresh_timer is None:
+                self._update_progressbar()
 
-                elif job_progress['current'] == job_progress['total']:
-                    self._progress.pop(jobid)
+            elif not self._refresh_timer.isActive():
+                self._refresh_timer.start()
 
-                else:
-                    total_progress   += self._progress[ jobid ]['total']
-                    current_progress += self._progress[ jobid ]['current']
+    def _update_progressbar(self):
+        """
+        Updates the progressbar widget from the running totals,
+        hiding it when all progress is complete.
+        """
+        self._progressbar.setMaximum( self._total   )
+        self._progressbar.setValue(   self._current )
 
-            self._progressbar.setMaximum( total_progress   )
-            self._progressbar.setValue(   current_progress )
+        if self._total <= self._current:
+            self.setHidden(True)
 
-            if total_progress <= current_progress:
-                self.setHidden(True)
+    def _pop_job(self, jobid):
+        """
+        Stops tracking progress of `jobid`, removing
+        it's progress from the running totals.
+        """
+        job_progress   = self._progress.pop( jobid )
+        self._total   -= job_progress['total']
+        self._current -= job_progress['current']
 
     def incr_progress(self, amount, jobid):
         """
@@ -187,6 +226,12 @@ class ProgressBar( QtWidgets.QWidget ):
                 return
 
             self._progress[ jobid ]['current'] += amount
+            self._current += amount
+
+            # completed jobs no longer count towards progress
+            if self._progress[ jobid ]['current'] == self._progress[ jobid ]['total']:
+                self._pop_job( jobid )
+
             self.refresh_progress()
 
     def reset(self, jobid=None ):
@@ -199,10 +244,12 @@ class ProgressBar( QtWidgets.QWidget ):
         with threading.Lock():
             if not jobid:
                 self._progress = {}
+                self._total    = 0
+                self._current  = 0
                 self._progressbar.reset()
 
             elif jobid in self._progress:
-                self._progress.pop( jobid )
+                self._pop_job( jobid )
 
             self.refresh_progress()
 
@@ -215,6 +262,15 @@ class ProgressBar( QtWidgets.QWidget ):
         producer/consumer patterns (multiple threads running at once),
         and no thread depends on another.
 
+        The task is queued in the threadpool passed to it's
+        :py:meth:`ThreadedTask.start` , which may be a name registered
+        in :py:mod:`qconcurrency.threadpools` .
+
+        .. code-block:: python
+
+            task = progressbar.new_task( load_thumbnails, paths=paths )
+            task.start( threadpool='io' )
+
         See also:
             * :py:obj:`ThreadedTask`
             * :py:obj:`SoloThreadedTask`
@@ -257,10 +313,13 @@ class ProgressBar( QtWidgets.QWidget ):
 
         return task
 
-    def new_solotask(self, callback, signals=None, connections=None, mutex_expiry=5000 ):
+    def new_solotask(self, callback, signals=None, connections=None, mutex_expiry=5000, debounce=None, coalesce=False, priority=None, threadpool=None ):
         """
         Creates a new :py:obj:`SoloThreadedTask` object, adding
         signals to it so that it can update this :py:obj:`ProgressBar`.
+
+        See Also:
+            * :py:meth:`qconcurrency.threading_.SoloThreadedTask.__init__`
         """
 
         jobid = uuid.uuid4().hex
@@ -294,6 +353,10 @@ class ProgressBar( QtWidgets.QWidget ):
             signals      = default_signals,
             connections  = default_connections,
             mutex_expiry = mutex_expiry,
+            debounce     = debounce,
+            coalesce     = coalesce,
+            priority     = priority,
+            threadpool   = threadpool,
         )
 
         return solotask
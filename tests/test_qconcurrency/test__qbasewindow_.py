@@ -214,6 +214,21 @@ class Test_QBaseWindow( unittest.TestCase ):
         while qapplication.hasPendingEvents():
             qapplication.processEvents()
 
+    def test_close__cancels_tasks(self):
+        def run_task( signalmgr=None ):
+            while True:
+                signalmgr.handle_if_abort()
+                time.sleep(0.005)
+
+        threadpool = QtCore.QThreadPool()
+        win        = QBaseWindow()
+        win.show()
+        future     = win.new_task( run_task ).start( threadpool=threadpool )
+        self.assertEqual( len(win.taskgroup().tasks()), 1 )
+
+        win.close()
+        self.assertTrue( threadpool.waitForDone( 2000 ) )
+        self.assertTrue( future.cancelled() )
 
 
 
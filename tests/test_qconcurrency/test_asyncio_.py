@@ -0,0 +1,139 @@
+#builtin
+import asyncio
+import threading
+import time
+#external
+import unittest
+from   Qt                      import QtCore, QtWidgets
+import six
+#internal
+from   qconcurrency.testutils   import mock, process_events_until
+from   qconcurrency.asyncio_    import *
+from   qconcurrency.futures_    import gather
+from   qconcurrency.exceptions_ import UserCancelledOperation
+from   qconcurrency             import QApplication
+
+qapplication = QApplication()
+
+
+async def _add( a, b, signalmgr=None ):
+    await asyncio.sleep(0)
+    return a + b
+
+async def _emit_items( nitems, signalmgr=None ):
+    for i in range(nitems):
+        signalmgr.add_item.emit( i, str(i) )
+        await asyncio.sleep(0)
+
+async def _raise( signalmgr=None ):
+    raise ValueError('failed')
+
+async def _wait_forever( started, signalmgr=None ):
+    started.set()
+    await asyncio.sleep(60)
+
+async def _loop_until_abort( started, signalmgr=None ):
+    started.set()
+    while True:
+        signalmgr.handle_if_abort()
+        await asyncio.sleep(0.005)
+
+
+
+class Test_CoroutineTask( unittest.TestCase ):
+    @classmethod
+    def setUpClass(cls):
+        cls.asyncloop = AsyncLoop()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.asyncloop.close()
+
+    def test_result(self):
+        future = CoroutineTask( _add, a=1, b=2 ).start( loop=self.asyncloop )
+        self.assertEqual( future.result( timeout=5 ), 3 )
+
+    def test_returned_signal(self):
+        returned = []
+        task     = CoroutineTask( _add, {'returned':int}, a=1, b=2 )
+        task.signal('returned').connect( returned.append )
+        task.start( loop=self.asyncloop )
+
+        process_events_until( lambda: returned )
+        self.assertEqual( returned, [3] )
+
+    def test_signals_delivered_to_ui_thread(self):
+        items   = []
+        threads = set()
+
+        def add_item( i, s ):
+            items.append( (i,s) )
+            threads.add( QtCore.QThread.currentThread() )
+
+        task = CoroutineTask( _emit_items, {'add_item':(int,str)}, nitems=3 )
+        task.signal('add_item').connect( add_item )
+        task.start( loop=self.asyncloop )
+
+        process_events_until( lambda: len(items) == 3 )
+        self.assertEqual( items, [ (0,'0'), (1,'1'), (2,'2') ] )
+        self.assertEqual( threads, set([ qapplication.thread() ]) )
+
+    def test_exception(self):
+        exception = mock.Mock()
+        task      = CoroutineTask( _raise )
+        task.signal('exception').connect( exception )
+
+        with mock.patch( 'qconcurrency.asyncio_.logger' ):
+            future = task.start( loop=self.asyncloop )
+            self.assertIsInstance( future.exception( timeout=5 ), ValueError )
+
+        process_events_until( lambda: exception.called )
+        exception.assert_called_once_with()
+
+    def test_request_abort_cancels_await(self):
+        started = threading.Event()
+        task    = CoroutineTask( _wait_forever, started=started )
+        future  = task.start( loop=self.asyncloop )
+        started.wait(5)
+
+        start = time.time()
+        with mock.patch( 'qconcurrency.asyncio_.logger' ):
+            task.request_abort()
+            process_events_until( future.done )
+
+        self.assertTrue( future.cancelled() )
+        self.assertLess( time.time() - start, 5 )
+
+    def test_handle_if_abort(self):
+        started = threading.Event()
+        task    = CoroutineTask( _loop_until_abort, started=started )
+        future  = task.start( loop=self.asyncloop )
+        self.assertTrue( started.wait(5) )
+
+        # only set the abort-flag (request_abort() would also cancel the coroutine's await)
+        task.signalmgr()._request_abort()
+        process_events_until( future.done )
+        self.assertTrue( future.cancelled() )
+
+    def test_many_concurrent_waits(self):
+        # 1000x 100ms waits, on a single loop-thread
+        async def wait( signalmgr=None ):
+            await asyncio.sleep(0.1)
+            return True
+
+        start   = time.time()
+        futures = [ CoroutineTask( wait ).start( loop=self.asyncloop ) for i in range(1000) ]
+        results = gather( futures ).result( timeout=10 )
+
+        self.assertEqual( len(results), 1000 )
+        self.assertLess( time.time() - start, 5 )
+
+    def test_default_loop(self):
+        self.assertIs( get_loop(), get_loop() )
+        future = CoroutineTask( _add, a=2, b=2 ).start()
+        self.assertEqual( future.result( timeout=5 ), 4 )
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,234 @@
+#builtin
+import threading
+import time
+#external
+import unittest
+from   Qt                      import QtCore, QtWidgets
+import six
+#internal
+from   qconcurrency.testutils   import mock, process_events_until
+from   qconcurrency.futures_    import *
+from   qconcurrency.threading_  import ThreadedTask, SoloThreadedTask
+from   qconcurrency.exceptions_ import UserCancelledOperation, TimedOut
+from   qconcurrency             import QApplication
+
+qapplication = QApplication()
+
+
+
+class Test_TaskFuture( unittest.TestCase ):
+    def test_result(self):
+        threadpool = QtCore.QThreadPool()
+        future     = ThreadedTask( lambda a, b, signalmgr=None: a + b, a=1, b=2 ).start( threadpool=threadpool )
+
+        self.assertEqual( future.result( timeout=5 ), 3 )
+        self.assertTrue( future.done() )
+        self.assertFalse( future.cancelled() )
+
+    def test_result__without_returned_signal(self):
+        # the result is available, even if `returned` declares no datatype
+        threadpool = QtCore.QThreadPool()
+        task       = ThreadedTask( lambda signalmgr=None: {'a':1}, signals={'returned':None} )
+        future     = task.start( threadpool=threadpool )
+
+        self.assertEqual( future.result( timeout=5 ), {'a':1} )
+        self.assertIs( task.future(), future )
+
+    def test_exception(self):
+        def raise_error( signalmgr=None ):
+            raise ValueError('failed')
+
+        threadpool = QtCore.QThreadPool()
+        with mock.patch( 'qconcurrency.threading_.logger' ):
+            future = ThreadedTask( raise_error ).start( threadpool=threadpool )
+            threadpool.waitForDone()
+
+        self.assertIsInstance( future.exception( timeout=5 ), ValueError )
+        self.assertRaises( ValueError, future.result )
+
+    def test_timeout(self):
+        event      = threading.Event()
+        threadpool = QtCore.QThreadPool()
+        future     = ThreadedTask( lambda signalmgr=None: event.wait(5) ).start( threadpool=threadpool )
+
+        try:
+            self.assertRaises( TimedOut, future.result, 0.05 )
+            self.assertFalse( future.done() )
+        finally:
+            event.set()
+        self.assertTrue( future.result( timeout=5 ) )
+
+    def test_done_callback_in_ui_thread(self):
+        threadpool = QtCore.QThreadPool()
+        threads    = []
+
+        future = ThreadedTask( lambda signalmgr=None: time.sleep(0.02) ).start( threadpool=threadpool )
+        future.add_done_callback( lambda f: threads.append( QtCore.QThread.currentThread() ) )
+        threadpool.waitForDone()
+
+        process_events_until( lambda: threads )
+        self.assertEqual( threads, [ qapplication.thread() ] )
+
+    def test_done_callback__already_done(self):
+        future   = TaskFuture()
+        callback = mock.Mock()
+        future._set_result( 1 )
+
+        future.add_done_callback( callback )
+        callback.assert_called_once_with( future )
+
+    def test_cancel_queued(self):
+        event      = threading.Event()
+        threadpool = QtCore.QThreadPool()
+        threadpool.setMaxThreadCount(1)
+        callback   = mock.Mock()
+
+        ThreadedTask( lambda signalmgr=None: event.wait(5) ).start( threadpool=threadpool )
+        future = ThreadedTask( callback ).start( threadpool=threadpool )
+
+        self.assertTrue( future.cancel() )
+        event.set()
+        threadpool.waitForDone()
+
+        self.assertTrue( future.cancelled() )
+        self.assertRaises( UserCancelledOperation, future.result )
+        callback.assert_not_called()
+
+    def test_cancel_running(self):
+        def loop_until_abort( signalmgr=None ):
+            while True:
+                signalmgr.handle_if_abort()
+                time.sleep(0.005)
+
+        threadpool = QtCore.QThreadPool()
+        future     = ThreadedTask( loop_until_abort ).start( threadpool=threadpool )
+        process_events_until( future.running )
+
+        self.assertTrue( future.cancel() )
+        threadpool.waitForDone()
+        self.assertTrue( future.cancelled() )
+        self.assertFalse( future.cancel() )
+
+    def test_map(self):
+        threadpool = QtCore.QThreadPool()
+        future     = ThreadedTask( lambda signalmgr=None: 2 ).start( threadpool=threadpool )
+        mapped     = future.map( lambda result: result * 10 )
+
+        self.assertEqual( mapped.result( timeout=5 ), 20 )
+
+    def test_map__exception_passed_on(self):
+        future = TaskFuture()
+        mapped = future.map( mock.Mock() )
+        future._set_exception( ValueError('failed') )
+
+        self.assertIsInstance( mapped.exception( timeout=5 ), ValueError )
+
+    def test_then(self):
+        threadpool = QtCore.QThreadPool()
+        threads    = []
+
+        def double( value, signalmgr=None ):
+            threads.append( QtCore.QThread.currentThread() )
+            return value * 2
+
+        future  = ThreadedTask( lambda signalmgr=None: 3 ).start( threadpool=threadpool )
+        chained = future.then( double, threadpool=threadpool )
+
+        self.assertEqual( chained.result( timeout=5 ), 6 )
+        self.assertNotEqual( threads, [ qapplication.thread() ] )
+
+    def test_then__cancelled_passed_on(self):
+        callback = mock.Mock()
+        future   = TaskFuture()
+        chained  = future.then( callback )
+        future._set_cancelled()
+
+        process_events_until( chained.done )
+        self.assertTrue( chained.cancelled() )
+        callback.assert_not_called()
+
+
+
+class Test_gather( unittest.TestCase ):
+    def test_results_in_order(self):
+        threadpool = QtCore.QThreadPool()
+        futures    = [
+            ThreadedTask( lambda i, signalmgr=None: time.sleep(0.01*(3-i)) or i, i=i ).start( threadpool=threadpool )
+            for i in range(3)
+        ]
+        self.assertEqual( gather( futures ).result( timeout=5 ), [0,1,2] )
+
+    def test_empty(self):
+        self.assertEqual( gather([]).result(), [] )
+
+    def test_exception(self):
+        futures = [ TaskFuture(), TaskFuture() ]
+        gathered = gather( futures )
+        futures[1]._set_exception( ValueError('failed') )
+
+        self.assertIsInstance( gathered.exception( timeout=5 ), ValueError )
+
+    def test_cancel(self):
+        futures  = [ TaskFuture(), TaskFuture() ]
+        gathered = gather( futures )
+        gathered.cancel()
+
+        self.assertTrue( all([ future._cancel_requested for future in futures ]) )
+
+
+
+class Test_any_of( unittest.TestCase ):
+    def test_first_success(self):
+        futures = [ TaskFuture(), TaskFuture(), TaskFuture() ]
+        first   = any_of( futures )
+        futures[0]._set_exception( ValueError('failed') )
+        futures[2]._set_result( 'c' )
+        futures[1]._set_result( 'b' )
+
+        self.assertEqual( first.result( timeout=5 ), 'c' )
+
+    def test_all_failed(self):
+        futures = [ TaskFuture(), TaskFuture() ]
+        first   = any_of( futures )
+        futures[0]._set_exception( ValueError('failed') )
+        futures[1]._set_exception( KeyError('failed') )
+
+        self.assertIsInstance( first.exception( timeout=5 ), KeyError )
+
+
+
+class Test_SoloThreadedTask_future( unittest.TestCase ):
+    def test_returns_future(self):
+        threadpool = QtCore.QThreadPool()
+        task       = SoloThreadedTask( callback=lambda signalmgr=None: 'loaded' )
+        future     = task.start( threadpool=threadpool )
+
+        self.assertEqual( future.result( timeout=5 ), 'loaded' )
+
+    def test_superseded_cancelled(self):
+        def loop_until_abort( signalmgr=None ):
+            while True:
+                signalmgr.handle_if_abort()
+                time.sleep(0.005)
+
+        threadpool = QtCore.QThreadPool()
+        task       = SoloThreadedTask( callback=loop_until_abort )
+        future     = task.start( threadpool=threadpool )
+        process_events_until( future.running )
+
+        task.stop( wait=5 )
+        self.assertTrue( future.cancelled() )
+
+    def test_debounced(self):
+        threadpool = QtCore.QThreadPool()
+        task       = SoloThreadedTask( callback=lambda i, signalmgr=None: i, debounce=10 )
+        futures    = [ task.start( threadpool=threadpool, i=i ) for i in range(3) ]
+
+        self.assertEqual( futures[-1].result( timeout=5 ), 2 )
+        self.assertTrue( futures[0].cancelled() )
+        self.assertTrue( futures[1].cancelled() )
+
+
+
+if __name__ == '__main__':
+    unittest.main()
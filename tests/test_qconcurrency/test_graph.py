@@ -0,0 +1,186 @@
+#builtin
+import threading
+import time
+#external
+import unittest
+from   Qt                      import QtCore, QtWidgets
+import six
+#internal
+from   qconcurrency.testutils   import mock, process_events_until, new_threadpool
+from   qconcurrency.graph       import *
+from   qconcurrency             import QApplication
+
+qapplication = QApplication()
+
+
+
+class Test_TaskGraph( unittest.TestCase ):
+    def test_results_passed_downstream(self):
+        graph = TaskGraph( threadpool=new_threadpool() )
+        graph.add_task( 'a', lambda value, signalmgr=None: value, value=2 )
+        graph.add_task( 'b', lambda signalmgr=None: 3 )
+        graph.add_task( 'c', lambda a, b, signalmgr=None: a * b, depends=['a', 'b'] )
+        graph.add_task( 'd', lambda total, signalmgr=None: total + 1, depends={'c':'total', 'a':None} )
+        future = graph.start()
+
+        process_events_until( future.done )
+        self.assertEqual( future.result(), {'a':2, 'b':3, 'c':6, 'd':7} )
+
+    def test_independent_tasks_concurrent(self):
+        # 'a' and 'b' each wait for the other to start
+        started = {'a': threading.Event(), 'b': threading.Event()}
+
+        def wait_for( label, other, signalmgr=None ):
+            started[ label ].set()
+            return started[ other ].wait( 2 )
+
+        graph = TaskGraph( threadpool=new_threadpool() )
+        graph.add_task( 'a', wait_for, label='a', other='b' )
+        graph.add_task( 'b', wait_for, label='b', other='a' )
+        future = graph.start()
+
+        process_events_until( future.done )
+        self.assertEqual( future.result(), {'a':True, 'b':True} )
+
+    def test_dependent_waits(self):
+        order = []
+
+        def record( label, signalmgr=None, **kwds ):
+            time.sleep(0.01)
+            order.append( label )
+
+        graph = TaskGraph( threadpool=new_threadpool() )
+        graph.add_task( 'c', record, depends=['b'], label='c' )
+        graph.add_task( 'b', record, depends=['a'], label='b' )
+        graph.add_task( 'a', record, label='a' )
+        future = graph.start()
+
+        process_events_until( future.done )
+        self.assertEqual( order, ['a', 'b', 'c'] )
+
+    def test_exception_cancels_dependents(self):
+        ran       = []
+        exception = mock.Mock()
+
+        def fail( signalmgr=None ):
+            raise ValueError('failed')
+
+        def record( label, signalmgr=None, **kwds ):
+            ran.append( label )
+
+        graph = TaskGraph( threadpool=new_threadpool() )
+        graph.add_task( 'fail',       fail )
+        graph.add_task( 'dependent',  record, depends=['fail'], label='dependent' )
+        graph.add_task( 'transitive', record, depends=['dependent'], label='transitive' )
+        graph.add_task( 'independent', record, label='independent' )
+        graph.exception.connect( exception )
+        future = graph.start()
+
+        process_events_until( future.done )
+        self.assertIsInstance( future.exception(), ValueError )
+        self.assertEqual( ran, ['independent'] )
+        self.assertTrue( graph.task('dependent').future().cancelled() )
+        self.assertTrue( graph.task('transitive').future().cancelled() )
+        exception.assert_called_once_with()
+
+    def test_fail_fast(self):
+        def fail( signalmgr=None ):
+            time.sleep(0.05)
+            raise ValueError('failed')
+
+        def wait( signalmgr=None ):
+            while True:
+                signalmgr.handle_if_abort()
+                time.sleep(0.01)
+
+        graph = TaskGraph( threadpool=new_threadpool(), fail_fast=True )
+        graph.add_task( 'fail', fail )
+        graph.add_task( 'wait', wait )
+        future = graph.start()
+
+        process_events_until( future.done )
+        self.assertIsInstance( future.exception(), ValueError )
+        self.assertTrue( graph.task('wait').future().cancelled() )
+
+    def test_fail_fast__dependent_of_running_task(self):
+        # 'slow' ignores the abort and succeeds, it's (cancelled) dependent must not run
+        ran = []
+
+        def fail( signalmgr=None ):
+            raise ValueError('failed')
+
+        def slow( signalmgr=None ):
+            time.sleep(0.1)
+
+        def record( slow, signalmgr=None ):
+            ran.append( True )
+
+        graph = TaskGraph( threadpool=new_threadpool(), fail_fast=True )
+        graph.add_task( 'fail',      fail )
+        graph.add_task( 'slow',      slow )
+        graph.add_task( 'dependent', record, depends=['slow'] )
+        future = graph.start()
+
+        process_events_until( lambda: future.done() and graph.task('slow').future().done() )
+        process_events_until( lambda: False, timeout=0.1 )
+        self.assertIsInstance( future.exception(), ValueError )
+        self.assertTrue( graph.task('slow').future()._succeeded() )
+        self.assertTrue( graph.task('dependent').future().cancelled() )
+        self.assertEqual( ran, [] )
+
+    def test_request_abort(self):
+        def wait( signalmgr=None ):
+            while True:
+                signalmgr.handle_if_abort()
+                time.sleep(0.01)
+
+        graph = TaskGraph( threadpool=new_threadpool() )
+        graph.add_task( 'wait',      wait )
+        graph.add_task( 'dependent', lambda wait, signalmgr=None: None, depends=['wait'] )
+        future = graph.start()
+
+        time.sleep(0.05)
+        future.cancel()
+        process_events_until( future.done )
+        self.assertTrue( future.cancelled() )
+        self.assertTrue( graph.task('wait').future().cancelled() )
+        self.assertTrue( graph.task('dependent').future().cancelled() )
+
+    def test_critical_path(self):
+        def sleep( seconds, signalmgr=None, **kwds ):
+            time.sleep( seconds )
+
+        graph = TaskGraph( threadpool=new_threadpool() )
+        graph.add_task( 'fast', sleep, seconds=0.01 )
+        graph.add_task( 'slow', sleep, seconds=0.1 )
+        graph.add_task( 'last', sleep, depends=['fast', 'slow'], seconds=0.01 )
+        future = graph.start()
+
+        process_events_until( future.done )
+        critical = graph.critical_path()
+        self.assertEqual( critical['path'], ['slow', 'last'] )
+        self.assertGreaterEqual( critical['duration'], 0.11 )
+        self.assertGreaterEqual( critical['tasks']['slow']['run_time'], 0.1 )
+
+        timings = graph.timings()
+        self.assertGreaterEqual( timings['last']['submitted'], timings['slow']['finished'] )
+
+    def test_cycle(self):
+        graph = TaskGraph()
+        graph.add_task( 'a', lambda signalmgr=None, **kwds: None, depends=['c'] )
+        graph.add_task( 'b', lambda signalmgr=None, **kwds: None, depends=['a'] )
+        graph.add_task( 'c', lambda signalmgr=None, **kwds: None, depends=['b'] )
+        self.assertRaises( RuntimeError, graph.start )
+
+    def test_unknown_dependency(self):
+        graph = TaskGraph()
+        graph.add_task( 'a', lambda signalmgr=None, **kwds: None, depends=['missing'] )
+        self.assertRaises( RuntimeError, graph.start )
+
+    def test_empty(self):
+        self.assertEqual( TaskGraph().start().result(), {} )
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+#builtin
+import functools
+import json
+import threading
+import time
+#external
+import unittest
+from   Qt                      import QtCore, QtWidgets
+import six
+#internal
+from   qconcurrency.testutils   import mock, process_events_until, loop_until_abort
+from   qconcurrency.metrics     import *
+from   qconcurrency.threading_  import ThreadedTask, SoloThreadedTask
+from   qconcurrency.exceptions_ import UserCancelledOperation
+from   qconcurrency             import QApplication
+
+qapplication = QApplication()
+
+
+def _sleep( seconds, signalmgr=None ):
+    time.sleep( seconds )
+
+def _raise( signalmgr=None ):
+    raise ValueError('failed')
+
+
+
+class Test_Histogram( unittest.TestCase ):
+    def test_stats(self):
+        histogram = Histogram()
+        for value in (0.002, 0.004, 0.3):
+            histogram.observe( value )
+
+        data = histogram.as_dict()
+        self.assertEqual( data['count'], 3 )
+        self.assertAlmostEqual( data['total'], 0.306 )
+        self.assertEqual( (data['min'], data['max']), (0.002, 0.3) )
+
+    def test_percentile(self):
+        histogram = Histogram( buckets=(1, 2, 3, 4) )
+        for value in (0.5, 1.5, 2.5, 3.5):
+            histogram.observe( value )
+
+        self.assertEqual( histogram.percentile(50), 2 )
+        self.assertEqual( histogram.percentile(100), 3.5 )
+        self.assertEqual( histogram.percentile(0), 0.5 )
+        self.assertIsNone( Histogram().percentile(50) )
+
+    def test_overflow_bucket(self):
+        histogram = Histogram( buckets=(1,) )
+        histogram.observe( 5 )
+        self.assertEqual( histogram.as_dict()['buckets'], [ (1,0), ('+inf',1) ] )
+        self.assertEqual( histogram.percentile(99), 5 )
+
+
+
+class Test_MetricsRegistry( unittest.TestCase ):
+    def test_counters(self):
+        registry = MetricsRegistry()
+        registry.incr( 'returned', 'load' )
+        registry.incr( 'returned', 'load', 2 )
+
+        self.assertEqual( registry.counter( 'returned', 'load' ), 3 )
+        self.assertEqual( registry.counter( 'returned', 'other' ), 0 )
+
+    def test_top(self):
+        registry = MetricsRegistry()
+        registry.observe( 'run_time', 'fast', 0.001 )
+        registry.observe( 'run_time', 'slow', 2.0 )
+        registry.observe( 'run_time', 'medium', 0.5 )
+
+        self.assertEqual( [ name for (name, hist) in registry.top( 'run_time', n=2 ) ], ['slow', 'medium'] )
+
+    def test_snapshot_and_json(self):
+        registry = MetricsRegistry()
+        registry.incr( 'returned', 'load' )
+        registry.observe( 'run_time', 'load', 0.01 )
+
+        snapshot = registry.snapshot()
+        self.assertEqual( snapshot['counters'], {'returned': {'load': 1}} )
+        self.assertEqual( snapshot['histograms']['run_time']['load']['count'], 1 )
+        self.assertEqual( json.loads( registry.to_json() )['counters'], snapshot['counters'] )
+
+    def test_reset(self):
+        registry = MetricsRegistry()
+        registry.observe( 'run_time', 'load', 0.01 )
+        registry.reset()
+        self.assertIsNone( registry.histogram( 'run_time', 'load' ) )
+
+    def test_disabled(self):
+        registry = MetricsRegistry()
+        registry.enabled = False
+        registry.incr( 'returned', 'load' )
+        registry.observe( 'run_time', 'load', 0.01 )
+        self.assertEqual( registry.snapshot(), {'counters': {}, 'histograms': {}} )
+
+    def test_callback_name(self):
+        self.assertEqual( callback_name( _sleep ), '%s._sleep' % __name__ )
+        self.assertEqual( callback_name( functools.partial( _sleep, 1 ) ), '%s._sleep' % __name__ )
+        self.assertEqual( callback_name( Test_MetricsRegistry.test_reset ), '%s.Test_MetricsRegistry.test_reset' % __name__ )
+
+
+
+class Test_TaskMetrics( unittest.TestCase ):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+        patcher = mock.patch( 'qconcurrency.metrics._registry', self.registry )
+        patcher.start()
+        self.addCleanup( patcher.stop )
+
+    def test_queue_wait_and_run_time(self):
+        threadpool = QtCore.QThreadPool()
+        threadpool.setMaxThreadCount(1)
+
+        futures = [ ThreadedTask( _sleep, seconds=0.02 ).start( threadpool=threadpool ) for i in range(2) ]
+        [ future.result( timeout=5 ) for future in futures ]
+
+        name      = callback_name( _sleep )
+        run_time  = self.registry.histogram( 'run_time', name )
+        wait_time = self.registry.histogram( 'queue_wait', name )
+        self.assertEqual( run_time['count'], 2 )
+        self.assertGreaterEqual( run_time['min'], 0.015 )
+        self.assertGreaterEqual( wait_time['max'], 0.015 )
+        self.assertEqual( self.registry.counter( 'returned', name ), 2 )
+
+    def test_exception_counted(self):
+        with mock.patch( 'qconcurrency.threading_.logger' ):
+            ThreadedTask( _raise ).start( threadpool=QtCore.QThreadPool() ).exception( timeout=5 )
+        self.assertEqual( self.registry.counter( 'exception', callback_name( _raise ) ), 1 )
+
+    def test_abort_latency(self):
+        started = threading.Event()
+        task    = ThreadedTask( loop_until_abort, started=started )
+        future  = task.start( threadpool=QtCore.QThreadPool() )
+        started.wait(5)
+
+        with mock.patch( 'qconcurrency.threading_.logger' ):
+            task.request_abort()
+            process_events_until( future.done )
+
+        name = callback_name( loop_until_abort )
+        self.assertEqual( self.registry.counter( 'abort_requests', name ), 1 )
+        self.assertEqual( self.registry.counter( 'cancelled', name ), 1 )
+        self.assertEqual( self.registry.histogram( 'abort_latency', name )['count'], 1 )
+
+    def test_solotask_metrics(self):
+        started  = threading.Event()
+        solotask = SoloThreadedTask( loop_until_abort )
+
+        with mock.patch( 'qconcurrency.threading_.logger' ):
+            solotask.start( threadpool=QtCore.QThreadPool(), started=started )
+            started.wait(5)
+            started.clear()
+            future = solotask.start( threadpool=QtCore.QThreadPool(), started=started )
+            started.wait(5)
+            solotask.stop( wait=5 )
+            process_events_until( future.done )
+
+        # recorded under the solotask's callback (not SoloThreadedTask._run)
+        name = callback_name( loop_until_abort )
+        self.assertEqual( self.registry.counter( 'cancelled', name ), 2 )
+        self.assertEqual( self.registry.histogram( 'abort_latency', name )['count'], 2 )
+        self.assertEqual( self.registry.histogram( 'mutex_wait', name )['count'], 1 )
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,7 @@ from   functools import partial
 import time
 #external
 import unittest
-from   Qt                      import QtCore, QtWidgets
+from   Qt                      import QtCore, QtWidgets, QtGui
 import six
 #internal
 from   qconcurrency.testutils     import mock
@@ -254,6 +254,104 @@ class Test_DictModel( unittest.TestCase ):
         self.assertEqual( model.rowCount(), 3 )
         self.assertEqual( set(model.keys()), set(['1','2','4']) )
 
+    def test_removerow__qt_interface(self):
+        """
+        rows removed using the QStandardItemModel interface
+        are removed from the key-index.
+        """
+        model = DictModel(['A','B'])
+        model.add_row( 1, {'A':21,'B':31})
+        model.add_row( 2, {'A':22,'B':32})
+
+        QtGui.QStandardItemModel.removeRow( model, 0 )
+
+        self.assertEqual( 1 in model, False )
+        self.assertEqual( model[2].columnval('A'), '22' )
+
+    def test_add_row__from_row(self):
+        model = DictModel(['A','B'])
+        row1  = model.add_row( 1, {'A':21,'B':31})
+        row2  = row1.add_row(  2, {'A':22,'B':32})
+
+        self.assertIs( model[2], row2 )
+
+    def test_add_rows(self):
+        model = DictModel(['A','B'])
+        rows  = model.add_rows([
+            (1, {'A':11,'B':12}),
+            (2, {'A':21}),
+        ])
+
+        self.assertEqual( [ row.id() for row in rows ], [1,2] )
+        self.assertEqual( model[1].columnval('B'), '12' )
+        self.assertEqual( model[2].columnval('A'), '21' )
+        self.assertEqual( model[2].columnval('B'), '' )
+
+    def test_add_rows__nested(self):
+        model = DictModel(
+            columns   = {'root':('A','B'), 'sub':('C','D')},
+            hierarchy = ('root','sub'),
+        )
+        model.add_rows([
+            (1, {'A':'a'}, [
+                (10, {'C':'c'}),
+                (11, {'D':'d'}),
+            ]),
+        ])
+
+        self.assertEqual( model[1].keys(), ['10','11'] )
+        self.assertEqual( model[1][10].columnval('C'), 'c' )
+        self.assertEqual( model[1][11].level(), 'sub' )
+
+    def test_add_rows__single_notification(self):
+        model        = DictModel(['A','B'])
+        item_changed = mock.Mock()
+        model_reset  = mock.Mock()
+        model.itemChanged.connect( item_changed )
+        model.modelReset.connect( model_reset )
+
+        model.add_rows([
+            (1, {'A':11}, [ (10, {'A':101}) ]),
+            (2, {'A':21}),
+        ])
+
+        self.assertEqual( item_changed.called, False )
+        self.assertEqual( model_reset.call_count, 1 )
+
+    def test_add_rows__reset_begins_before_insert(self):
+        model    = DictModel(['A','B'])
+        rowcount = []
+        model.modelAboutToBeReset.connect( lambda: rowcount.append( model.rowCount() ) )
+
+        model.add_rows([ (1, {'A':11}), (2, {'A':21}) ])
+        self.assertEqual( rowcount, [0] )
+
+    def test_add_rows__nonempty_inserts_rows(self):
+        model        = DictModel(['A','B'])
+        row          = model.add_row( 1 )
+        child        = row.add_child( 10 )
+        persistent   = QtCore.QPersistentModelIndex( child.index() )
+        model_reset  = mock.Mock()
+        item_changed = mock.Mock()
+        inserted     = []
+        model.modelReset.connect( model_reset )
+        model.itemChanged.connect( item_changed )
+        model.rowsInserted.connect( lambda parent, first, last: inserted.append( (first, last) ) )
+
+        row.add_children([ (11, {'A':'a'}, [(110, None)]), (12, {'B':'b'}) ])
+        model.add_rows([ (2, None) ])
+
+        self.assertEqual( model_reset.called, False )
+        self.assertEqual( item_changed.called, False )
+        self.assertEqual( inserted, [(1,1), (2,2), (1,1)] )   # nested row 110 was added before it's parent
+        self.assertTrue( persistent.isValid() )
+        self.assertEqual( model.itemFromIndex( QtCore.QModelIndex(persistent) ), child )
+        self.assertEqual( model[1][11][110].level(), 2 )
+
+    def test_add_rows__invalid(self):
+        model = DictModel(['A','B'])
+        self.assertRaises( RuntimeError, model.add_rows, [(1,)] )
+
     def test_clear(self):
         model = DictModel(['A','B'])
         row   = model.add_row(    1,{'A':2 ,'B':3 })
@@ -301,6 +399,47 @@ class Test_DictModelRow( unittest.TestCase ):
         self.assertEqual( root.level(), 'root' )
         self.assertEqual( sub.level(),  'sub'  )
 
+    def test_get_child_row(self):
+        model = DictModel(['A','B'])
+        row   = model.add_row( 1 )
+        for key in range(10):
+            row.add_child( key, {'A':key} )
+
+        self.assertEqual( model[1][7].columnval('A'), '7' )
+        self.assertRaises( KeyError, row._get_child_row, 10 )
+
+    def test_get_sibling_row(self):
+        model = DictModel(['A','B'])
+        row   = model.add_row( 1 )
+        child = row.add_child( 10 )
+        row.add_child( 11, {'A':'a'} )
+
+        self.assertEqual( child._get_sibling_row( 11 ).columnval('A'), 'a' )
+        self.assertIs( model[1]._get_sibling_row( 1 ), row )
+
+    def test_delete__nested(self):
+        model = DictModel(['A','B'])
+        row   = model.add_row( 1 )
+        row.add_child( 10 )
+        row.add_child( 11 )
+        row.add_child( 12 )
+
+        model[1][11].delete()
+
+        self.assertEqual( row.keys(), ['10','12'] )
+        self.assertEqual( model[1][12].row(), 1 )
+        self.assertRaises( KeyError, row._get_child_row, 11 )
+
+    def test_add_children(self):
+        model = DictModel(['A','B'])
+        row   = model.add_row( 1 )
+        row.add_child( 10 )
+        children = row.add_children([ (11, {'A':'a'}), (12, {'B':'b'}) ])
+
+        self.assertEqual( len(children), 2 )
+        self.assertEqual( row.keys(), ['10','11','12'] )
+        self.assertEqual( model[1][12].columnval('B'), 'b' )
+
     def test_delete(self):
         model = DictModel(['A','B'])
 
@@ -312,3 +451,109 @@ class Test_DictModelRow( unittest.TestCase ):
         self.assertEqual( set(model.keys()),  set(['1','3']) )
 
 
+
+
+
+class Test_ColumnarDictModel( unittest.TestCase ):
+    def test_defaultcolumns(self):
+        model = ColumnarDictModel( columns=['A','B','C'] )
+        model.add_row( 1 )
+
+        self.assertEqual( model.index(0,0).data(), '1' )
+        for i in range(1,3):
+            self.assertEqual( model.index(0,i).data(), '' )
+
+    def test_toplevelitems(self):
+        model = ColumnarDictModel( columns=['A','B','C'] )
+        row   = model.add_row( 1, {'A':2,'B':3,'C':4} )
+
+        self.assertEqual( model.index(0,3).data(), '4' )
+        self.assertEqual( model.index(0,3).data( QtCore.Qt.UserRole ), 4 )
+        self.assertEqual( model[1].columnval('A'), '2' )
+        self.assertEqual( row.columnvals(), {'id':'1','A':'2','B':'3','C':'4','_id':1} )
+
+    def test_hierarchy(self):
+        model = ColumnarDictModel(
+            columns   = {'root':['A','B'], 'sub':['C','D','E']},
+            hierarchy = ('root','sub'),
+        )
+        root = model.add_row( 111, {'A':1} )
+        sub  = root.add_child( 1, {'C':11} )
+
+        self.assertEqual( root.level(), 'root' )
+        self.assertEqual( sub.level(),  'sub'  )
+        self.assertEqual( model.columnCount( root.index() ), 4 )
+        self.assertEqual( model[111][1].columnval('C'), '11' )
+        self.assertEqual( model.parent( sub.index() ), root.index() )
+        self.assertEqual( sub.parent(), root )
+
+    def test_add_rows(self):
+        model = ColumnarDictModel(['A','B'])
+        inserted = []
+        model.rowsInserted.connect( lambda parent, first, last: inserted.append( (first, last) ) )
+
+        rows = model.add_rows([
+            (1, {'A':'a'}, [(10, {'B':'b'}), (11, None)]),
+            (2, {'B':'c'}),
+        ])
+
+        self.assertEqual( [ r.id() for r in rows ], [1,2] )
+        self.assertEqual( model.keys(), ['1','2'] )
+        self.assertEqual( model[1].keys(), ['10','11'] )
+        self.assertEqual( model[1][10].columnval('B'), 'b' )
+        self.assertEqual( inserted, [(0,1), (0,1)] )
+
+    def test_add_row__existing_key_updates(self):
+        model = ColumnarDictModel(['A','B'])
+        model.add_row( 1, {'A':'a'} )
+        model.add_row( 1, {'B':'b'} )
+
+        self.assertEqual( len(model), 1 )
+        self.assertEqual( model[1].columnvals()['A'], 'a' )
+        self.assertEqual( model[1].columnvals()['B'], 'b' )
+
+    def test_add_rows__invalid(self):
+        model = ColumnarDictModel(['A','B'])
+        self.assertRaises( RuntimeError, model.add_rows, [(1,)] )
+
+    def test_delete(self):
+        model = ColumnarDictModel(['A','B'])
+        row   = model.add_row( 1 )
+        model.add_row( 2 )
+        model.add_row( 3 )
+        row.add_children([ (10, None), (11, None), (12, None) ])
+
+        model[1][11].delete()
+        del model[2]
+
+        self.assertEqual( model.keys(), ['1','3'] )
+        self.assertEqual( model[3].row(), 1 )
+        self.assertEqual( row.keys(), ['10','12'] )
+        self.assertEqual( model[1][12].row(), 1 )
+        self.assertRaises( KeyError, row._get_child_row, 11 )
+        self.assertRaises( KeyError, model.__getitem__, 2 )
+
+    def test_set_columnvals(self):
+        model   = ColumnarDictModel(['A','B'])
+        row     = model.add_row( 1 )
+        changed = []
+        model.dataChanged.connect( lambda topleft, bottomright: changed.append( topleft.row() ) )
+
+        row.set_columnvals({'B':'b'})
+
+        self.assertEqual( model[1].columnval('B'), 'b' )
+        self.assertEqual( changed, [0] )
+
+    def test_view(self):
+        model = ColumnarDictModel(['A','B'])
+        model.add_rows([ (i, {'A':i}, [(i*10, None)]) for i in range(5) ])
+
+        view = QtWidgets.QTreeView()
+        view.setModel( model )
+        view.expandAll()
+
+        self.assertEqual( model.itemFromIndex( model.index(3,0) ), model[3] )
+        self.assertEqual( model.rowCount( model[3].index() ), 1 )
+
+        model.clear()
+        self.assertEqual( len(model), 0 )
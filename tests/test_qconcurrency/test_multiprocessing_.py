@@ -0,0 +1,216 @@
+#builtin
+from   functools import partial
+import os
+import signal
+import time
+#external
+import unittest
+from   Qt                      import QtCore, QtWidgets
+import six
+#internal
+from   qconcurrency.testutils        import mock, process_events_until, loop_until_abort
+from   qconcurrency.multiprocessing_ import *
+from   qconcurrency.threading_       import ThreadedTask, SoloThreadedTask
+from   qconcurrency.exceptions_      import ProcessTaskError
+from   qconcurrency                  import QApplication
+
+qapplication = QApplication()
+
+
+# callbacks run in child-processes must be importable
+
+def _add( a, b, signalmgr=None ):
+    return a + b
+
+def _emit_items( nitems, signalmgr=None ):
+    signalmgr.add_progress.emit( nitems )
+    for i in range(nitems):
+        signalmgr.add_item.emit( i, str(i) )
+        signalmgr.incr_progress.emit( 1 )
+
+def _emit_batched( nitems, signalmgr=None ):
+    add_item = signalmgr.batch( 'add_item', size=3 )
+    for i in range(nitems):
+        add_item.emit( i, str(i) )
+
+def _raise( signalmgr=None ):
+    raise ValueError('failed in child')
+
+def _kill_process( signalmgr=None ):
+    os.kill( os.getpid(), signal.SIGKILL )
+
+class _ExitWhenUnpickled( object ):
+    """ kills the child-process before the callback starts """
+    def __reduce__(self):
+        return ( os._exit, (1,) )
+
+def _emit_batched_pending( nitems, signalmgr=None ):
+    add_item = signalmgr.batch( 'add_item', size=3, max_pending=1 )
+    for i in range(nitems):
+        add_item.emit( i, str(i) )
+
+def _loop_until_abort( signalmgr=None ):
+    # threading.Event() cannot be shared with the child-process
+    signalmgr.started.emit()
+    return loop_until_abort( signalmgr=signalmgr )
+
+
+
+class Test_ProcessPool( unittest.TestCase ):
+    @classmethod
+    def setUpClass(cls):
+        cls.processpool = ProcessPool( processes=2 )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.processpool.close()
+
+    def test_returned(self):
+        threadpool = QtCore.QThreadPool()
+        returned   = []
+
+        task = ThreadedTask(
+            callback = _add,
+            signals  = {'returned':int},
+            a=1, b=2,
+        )
+        task.signal('returned').connect( returned.append )
+        task.start( threadpool=threadpool, processpool=self.processpool )
+
+        threadpool.waitForDone()
+        process_events_until( lambda: returned, timeout=10 )
+        self.assertEqual( returned, [3] )
+
+    def test_custom_signals(self):
+        threadpool = QtCore.QThreadPool()
+        items      = []
+        progress   = []
+
+        task = ThreadedTask(
+            callback = _emit_items,
+            signals  = {'add_item':(int,str), 'add_progress':int, 'incr_progress':int},
+            nitems   = 5,
+        )
+        task.signal('add_item').connect( lambda i, s: items.append( (i,s) ) )
+        task.signal('incr_progress').connect( progress.append )
+        task.start( threadpool=threadpool, processpool=self.processpool )
+
+        threadpool.waitForDone()
+        process_events_until( lambda: len(items) == 5, timeout=10 )
+        self.assertEqual( items, [ (i, str(i)) for i in range(5) ] )
+        self.assertEqual( progress, [1]*5 )
+
+    def test_batch(self):
+        threadpool = QtCore.QThreadPool()
+        batches    = []
+
+        task = ThreadedTask(
+            callback = _emit_batched,
+            signals  = {'add_item':(int,str)},
+            nitems   = 7,
+        )
+        task.connect_batch( 'add_item', batches.append )
+        task.start( threadpool=threadpool, processpool=self.processpool )
+
+        threadpool.waitForDone()
+        process_events_until( lambda: len(batches) == 3, timeout=10 )
+        self.assertEqual( [ len(batch) for batch in batches ], [3,3,1] )
+
+    def test_batch__max_pending(self):
+        threadpool = QtCore.QThreadPool()
+        batches    = []
+
+        task = ThreadedTask(
+            callback = _emit_batched_pending,
+            signals  = {'add_item':(int,str)},
+            nitems   = 7,
+        )
+        task.connect_batch( 'add_item', batches.append )
+        task.start( threadpool=threadpool, processpool=self.processpool )
+
+        threadpool.waitForDone()
+        process_events_until( lambda: len(batches) == 3, timeout=10 )
+        self.assertEqual( [ len(batch) for batch in batches ], [3,3,1] )
+
+    @unittest.skipUnless( hasattr( signal, 'SIGKILL' ), 'requires SIGKILL' )
+    def test_process_killed(self):
+        threadpool = QtCore.QThreadPool()
+        exception  = mock.Mock()
+
+        task = ThreadedTask( callback=_kill_process )
+        task.signal('exception').connect( exception )
+
+        with mock.patch( 'qconcurrency.threading_.logger' ):
+            future = task.start( threadpool=threadpool, processpool=self.processpool )
+            self.assertTrue( threadpool.waitForDone( 5000 ) )
+
+        process_events_until( lambda: exception.called, timeout=10 )
+        exception.assert_called_once_with()
+        self.assertIsInstance( future.exception(), ProcessTaskError )
+
+    def test_process_killed__before_started(self):
+        threadpool = QtCore.QThreadPool()
+        task       = ThreadedTask( _add, a=_ExitWhenUnpickled(), b=1 )
+
+        with mock.patch.object( ProcessPool, '_start_timeout', 0.5 ):
+            with mock.patch( 'qconcurrency.threading_.logger' ):
+                future = task.start( threadpool=threadpool, processpool=self.processpool )
+                self.assertTrue( threadpool.waitForDone( 10000 ) )
+
+        process_events_until( future.done, timeout=10 )
+        self.assertIsInstance( future.exception(), ProcessTaskError )
+
+    def test_exception(self):
+        threadpool = QtCore.QThreadPool()
+        exception  = mock.Mock()
+
+        task = ThreadedTask( callback=_raise )
+        task.signal('exception').connect( exception )
+
+        with mock.patch( 'qconcurrency.threading_.logger' ):
+            task.start( threadpool=threadpool, processpool=self.processpool )
+            threadpool.waitForDone()
+
+        process_events_until( lambda: exception.called, timeout=10 )
+        exception.assert_called_once_with()
+
+    def test_abort_forwarded(self):
+        threadpool = QtCore.QThreadPool()
+        started    = []
+        returned   = mock.Mock()
+        exception  = mock.Mock()
+
+        task = ThreadedTask(
+            callback = _loop_until_abort,
+            signals  = {'started':None},
+        )
+        task.signal('started').connect( lambda: started.append(True) )
+        task.signal('returned').connect( returned )
+        task.signal('exception').connect( exception )
+        task.start( threadpool=threadpool, processpool=self.processpool )
+
+        process_events_until( lambda: started, timeout=10 )
+        start = time.time()
+        task.request_abort()
+        threadpool.waitForDone()
+        process_events_until( lambda: exception.called, timeout=10 )
+
+        self.assertLess( time.time() - start, 5 )
+        exception.assert_called_once_with()
+        returned.assert_not_called()
+
+    def test_solothreadedtask(self):
+        threadpool = QtCore.QThreadPool()
+        returned   = []
+
+        task = SoloThreadedTask(
+            callback    = _add,
+            signals     = {'returned':int},
+            connections = {'returned':[returned.append]},
+            processpool = self.processpool,
+        )
+        task.start( threadpool=threadpool, wait=True, a=2, b=3 )
+        threadpool.waitForDone()
+
+        process_events_until( lambda: returned, timeout=10 )
+        self.assertEqual( returned, [5] )
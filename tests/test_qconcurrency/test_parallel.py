@@ -0,0 +1,182 @@
+#builtin
+import threading
+import time
+#external
+import unittest
+from   Qt                      import QtCore, QtWidgets
+import six
+#internal
+from   qconcurrency.testutils   import mock, process_events_until
+from   qconcurrency.parallel    import *
+from   qconcurrency.threading_  import ThreadedTask
+from   qconcurrency.widgets     import ProgressBar
+from   qconcurrency             import QApplication
+
+qapplication = QApplication()
+
+
+
+class Test_ParallelMap( unittest.TestCase ):
+    def test_result(self):
+        pmap = parallel_map( lambda i: i * 2, range(1000), threadpool=QtCore.QThreadPool() )
+        self.assertEqual( pmap.future().result( timeout=5 ), [ i*2 for i in range(1000) ] )
+
+    def test_chunksize(self):
+        pmap = ParallelMap( lambda i: i, range(10), chunksize=3, threadpool=QtCore.QThreadPool() )
+        pmap.start()
+        self.assertEqual( len(pmap._tasks), 4 )
+        self.assertEqual( pmap.future().result( timeout=5 ), list(range(10)) )
+
+    def test_empty(self):
+        pmap = parallel_map( lambda i: i, [] )
+        self.assertEqual( pmap.future().result(), [] )
+
+    def test_ordered_delivery(self):
+        # later chunks complete first
+        def slow_start( i ):
+            time.sleep( 0.002 * (20 - i) )
+            return i
+
+        delivered = []
+        pmap = ParallelMap( slow_start, range(20), chunksize=2, ordered=True, threadpool=QtCore.QThreadPool() )
+        pmap.results_ready.connect( delivered.extend )
+        pmap.start()
+
+        pmap.future().result( timeout=5 )
+        process_events_until( lambda: len(delivered) == 20 )
+        self.assertEqual( delivered, [ (i,i) for i in range(20) ] )
+
+    def test_unordered_delivery(self):
+        delivered = []
+        pmap = ParallelMap( lambda i: i, range(20), chunksize=2, ordered=False, threadpool=QtCore.QThreadPool() )
+        pmap.results_ready.connect( delivered.extend )
+        pmap.start()
+
+        pmap.future().result( timeout=5 )
+        process_events_until( lambda: len(delivered) == 20 )
+        self.assertEqual( sorted(delivered), [ (i,i) for i in range(20) ] )
+
+    def test_exception_aborts(self):
+        called = []
+
+        def fail_first( i ):
+            called.append( i )
+            if i == 0:
+                raise ValueError('failed')
+            time.sleep(0.01)
+            return i
+
+        threadpool = QtCore.QThreadPool()
+        threadpool.setMaxThreadCount(1)
+        exception  = mock.Mock()
+
+        pmap = ParallelMap( fail_first, range(100), chunksize=10, threadpool=threadpool )
+        pmap.exception.connect( exception )
+        with mock.patch( 'qconcurrency.threading_.logger' ):
+            pmap.start()
+            self.assertIsInstance( pmap.future().exception( timeout=5 ), ValueError )
+            threadpool.waitForDone()
+
+        self.assertLess( len(called), 100 )
+        process_events_until( lambda: exception.called )
+        exception.assert_called_once_with()
+
+    def test_request_abort(self):
+        threadpool = QtCore.QThreadPool()
+        pmap       = parallel_map( lambda i: time.sleep(0.01), range(1000), chunksize=10, threadpool=threadpool )
+
+        with mock.patch( 'qconcurrency.threading_.logger' ):
+            pmap.future().cancel()
+            threadpool.waitForDone()
+
+        process_events_until( pmap.future().done )
+        self.assertTrue( pmap.future().cancelled() )
+
+    def test_progressbar(self):
+        progressbar = ProgressBar()
+        pmap        = ParallelMap( lambda i: i, range(10), chunksize=5, threadpool=QtCore.QThreadPool(), progressbar=progressbar )
+
+        with mock.patch.object( progressbar, 'add_progress' ) as add_progress:
+            with mock.patch.object( progressbar, 'incr_progress' ) as incr_progress:
+                pmap.start()
+                pmap.future().result( timeout=5 )
+                process_events_until( lambda: incr_progress.call_count == 2 )
+
+        add_progress.assert_called_once_with( 10, jobid=pmap._jobid )
+        incr_progress.assert_called_with( 5, jobid=pmap._jobid )
+
+
+
+class Test_TaskFuser( unittest.TestCase ):
+    def test_futures(self):
+        fuser   = TaskFuser( size=10, threadpool=QtCore.QThreadPool() )
+        futures = [ fuser.submit( pow, i, 2 ) for i in range(25) ]
+        fuser.flush()
+
+        self.assertEqual( [ future.result( timeout=5 ) for future in futures ], [ i**2 for i in range(25) ] )
+
+    def test_fused_into_batches(self):
+        fuser = TaskFuser( size=10, latency=1000, threadpool=QtCore.QThreadPool() )
+
+        with mock.patch( 'qconcurrency.parallel.ThreadedTask', wraps=ThreadedTask ) as task_class:
+            for i in range(25):
+                fuser.submit( abs, i )
+            self.assertEqual( task_class.call_count, 2 )
+            fuser.flush()
+            self.assertEqual( task_class.call_count, 3 )
+
+    def test_latency(self):
+        fuser  = TaskFuser( size=1000, latency=10, threadpool=QtCore.QThreadPool() )
+        future = fuser.submit( abs, -1 )
+
+        # started by the timer, without a flush()
+        self.assertEqual( future.result( timeout=5 ), 1 )
+
+    def test_aggregated_results_and_errors(self):
+        def invert( i ):
+            return 1 / i
+
+        results = []
+        errors  = []
+        fuser   = TaskFuser( size=5, threadpool=QtCore.QThreadPool() )
+        fuser.results_ready.connect( results.extend )
+        fuser.errors.connect( errors.extend )
+
+        with mock.patch( 'qconcurrency.parallel.logger' ):
+            futures = [ fuser.submit( invert, i ) for i in range(5) ]
+            futures[-1].result( timeout=5 )
+            process_events_until( lambda: results and errors )
+
+        self.assertEqual( results, [ (i, 1/i) for i in range(1,5) ] )
+        self.assertEqual( [ index for (index, exc) in errors ], [0] )
+        self.assertIsInstance( futures[0].exception(), ZeroDivisionError )
+
+    def test_request_abort(self):
+        fuser   = TaskFuser( size=1000, latency=1000, threadpool=QtCore.QThreadPool() )
+        future  = fuser.submit( abs, -1 )
+        fuser.request_abort()
+
+        self.assertTrue( future.cancelled() )
+
+    def test_batch_withdrawn(self):
+        # the threadpool is busy, the batch is cancelled before it runs
+        release    = threading.Event()
+        threadpool = QtCore.QThreadPool()
+        threadpool.setMaxThreadCount( 1 )
+        blocker    = ThreadedTask( lambda signalmgr=None: release.wait( 5 ) )
+        blocker.start( threadpool=threadpool )
+
+        fuser  = TaskFuser( size=1000, latency=1000, threadpool=threadpool )
+        future = fuser.submit( abs, -1 )
+        fuser.flush()
+        list(fuser._running.values())[0].future().cancel()
+        release.set()
+
+        process_events_until( future.done )
+        self.assertTrue( future.cancelled() )
+        self.assertEqual( fuser._running, {} )
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+#builtin
+import threading
+import time
+#external
+import unittest
+from   Qt                      import QtCore, QtWidgets
+import six
+#internal
+from   qconcurrency.testutils   import mock, process_events_until, new_threadpool
+from   qconcurrency.pipeline    import *
+from   qconcurrency             import QApplication
+
+qapplication = QApplication()
+
+
+
+class Test_Pipeline( unittest.TestCase ):
+    def test_results(self):
+        results  = []
+        finished = mock.Mock()
+
+        pipeline = Pipeline( threadpool=new_threadpool() )
+        pipeline.add_stage( 'double', lambda i: i * 2, workers=2 )
+        pipeline.add_stage( 'str',    lambda i: str(i) )
+        pipeline.results_ready.connect( results.extend )
+        pipeline.finished.connect( finished )
+        pipeline.start( range(100) )
+
+        process_events_until( lambda: finished.called )
+        self.assertEqual( sorted(results, key=int), [ str(i*2) for i in range(100) ] )
+        self.assertTrue( pipeline.future().done() )
+
+    def test_generator_stage(self):
+        results  = []
+
+        def split( i ):
+            if i % 2:
+                yield i
+                yield -i
+
+        pipeline = Pipeline( threadpool=new_threadpool() )
+        pipeline.add_stage( 'split', split )
+        pipeline.results_ready.connect( results.extend )
+        pipeline.start( range(6) )
+
+        process_events_until( lambda: pipeline.future().done() )
+        qapplication.processEvents()
+        self.assertEqual( sorted(results), [-5, -3, -1, 1, 3, 5] )
+
+    def test_stage_threadpools(self):
+        release  = threading.Event()
+        io_pool  = new_threadpool()
+        cpu_pool = new_threadpool()
+
+        pipeline = Pipeline( threadpool=new_threadpool() )
+        load     = pipeline.add_stage( 'load',  lambda i: release.wait() and i, workers=3, threadpool=io_pool  )
+        parse    = pipeline.add_stage( 'parse', lambda i: i, workers=2, threadpool=cpu_pool )
+        pipeline.start( range(20) )
+
+        # workers are running in their stage's threadpool
+        time.sleep(0.05)
+        self.assertEqual( io_pool.activeThreadCount(),  3 )
+        self.assertEqual( cpu_pool.activeThreadCount(), 2 )
+        release.set()
+
+        process_events_until( lambda: pipeline.future().done() )
+        self.assertIs( load.threadpool,  io_pool  )
+        self.assertIs( parse.threadpool, cpu_pool )
+        self.assertEqual( pipeline.stats()['load']['processed'],  20 )
+        self.assertEqual( pipeline.stats()['parse']['processed'], 20 )
+
+    def test_bounded_queues(self):
+        # the last stage is blocked, the stage before it cannot get ahead
+        release  = threading.Event()
+        produced = []
+
+        def produce( i ):
+            produced.append( i )
+            return i
+
+        pipeline = Pipeline( threadpool=new_threadpool(), stats_interval=0 )
+        pipeline.add_stage( 'produce', produce )
+        pipeline.add_stage( 'consume', lambda i: release.wait(), queue_size=2 )
+        pipeline.start( range(100) )
+
+        time.sleep(0.2)
+        stats = pipeline.stats()
+        self.assertEqual( stats['consume']['queue_depth'], 2 )
+        self.assertLessEqual( len(produced), 4 )
+
+        release.set()
+        process_events_until( lambda: pipeline.future().done() )
+        self.assertEqual( len(produced), 100 )
+
+    def test_exception_aborts(self):
+        exception = mock.Mock()
+
+        def fail( i ):
+            raise ValueError('failed')
+
+        pipeline = Pipeline( threadpool=new_threadpool() )
+        pipeline.add_stage( 'load',  lambda i: i, workers=2 )
+        pipeline.add_stage( 'parse', fail )
+        pipeline.exception.connect( exception )
+        pipeline.start( range(1000) )
+
+        process_events_until( lambda: exception.called )
+        self.assertIsInstance( pipeline.future().exception(), ValueError )
+
+        # remaining stages exit (the feeder was blocked on a full queue)
+        process_events_until( lambda: all([ task.future().done() for task in pipeline._tasks ]) )
+        self.assertTrue( all([ task.future().done() for task in pipeline._tasks ]) )
+
+    def test_request_abort(self):
+        release  = threading.Event()
+        pipeline = Pipeline( threadpool=new_threadpool() )
+        pipeline.add_stage( 'wait', lambda i: release.wait(0.01) )
+        pipeline.start( iter(lambda: 1, None) )   # endless
+
+        time.sleep(0.05)
+        pipeline.request_abort()
+        process_events_until( lambda: all([ task.future().done() for task in pipeline._tasks ]) )
+
+        self.assertTrue( all([ task.future().done() for task in pipeline._tasks ]) )
+        self.assertTrue( pipeline.future().cancelled() )
+
+    def test_stats_ready(self):
+        stats = []
+        pipeline = Pipeline( threadpool=new_threadpool(), stats_interval=10 )
+        pipeline.add_stage( 'sleep', lambda i: time.sleep(0.01) )
+        pipeline.stats_ready.connect( stats.append )
+        pipeline.start( range(10) )
+
+        process_events_until( lambda: pipeline.future().done() )
+        self.assertTrue( stats )
+        self.assertEqual( stats[-1]['sleep']['processed'], 10 )
+        self.assertGreater( stats[-1]['sleep']['throughput'], 0 )
+
+    def test_too_few_threads(self):
+        pipeline = Pipeline( threadpool=new_threadpool(2) )
+        pipeline.add_stage( 'load', lambda i: i, workers=2 )
+        self.assertRaises( RuntimeError, pipeline.start, range(10) )
+
+    def test_duplicate_stage(self):
+        pipeline = Pipeline()
+        pipeline.add_stage( 'load', lambda i: i )
+        self.assertRaises( RuntimeError, pipeline.add_stage, 'load', lambda i: i )
+
+
+
+if __name__ == '__main__':
+    unittest.main()
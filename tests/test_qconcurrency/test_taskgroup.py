@@ -0,0 +1,120 @@
+#builtin
+import threading
+import time
+#external
+import unittest
+from   Qt                      import QtCore, QtWidgets, QtCompat
+import six
+#internal
+from   qconcurrency.testutils   import mock, process_events_until, loop_until_abort
+from   qconcurrency.taskgroup   import *
+from   qconcurrency.threading_  import ThreadedTask, SoloThreadedTask
+from   qconcurrency.parallel    import ParallelMap
+from   qconcurrency             import QApplication
+
+qapplication = QApplication()
+
+
+
+class Test_TaskGroup( unittest.TestCase ):
+    def test_cancel(self):
+        threadpool = QtCore.QThreadPool()
+        group      = TaskGroup()
+        futures    = [ group.start( ThreadedTask( loop_until_abort ), threadpool=threadpool ) for i in range(3) ]
+        self.assertEqual( len(group.tasks()), 3 )
+
+        self.assertTrue( group.cancel( wait=2 ) )
+        self.assertTrue( all([ future.cancelled() for future in futures ]) )
+        self.assertEqual( group.tasks(), [] )
+
+    def test_completed_tasks_released(self):
+        threadpool = QtCore.QThreadPool()
+        group      = TaskGroup()
+        future     = group.start( ThreadedTask( lambda signalmgr=None: 1 ), threadpool=threadpool )
+
+        process_events_until( lambda: not group._tasks )
+        self.assertEqual( future.result(), 1 )
+        self.assertEqual( group._tasks, {} )
+
+    def test_with_block(self):
+        threadpool = QtCore.QThreadPool()
+        with TaskGroup( wait=2 ) as group:
+            self.assertIs( current_taskgroup(), group )
+            future = ThreadedTask( loop_until_abort ).start( threadpool=threadpool )
+            self.assertEqual( len(group.tasks()), 1 )
+
+        # cancelled on exit
+        self.assertIsNone( current_taskgroup() )
+        self.assertTrue( future.cancelled() )
+
+    def test_with_block__nested(self):
+        with TaskGroup() as outer:
+            with TaskGroup() as inner:
+                self.assertIs( current_taskgroup(), inner )
+            self.assertIs( current_taskgroup(), outer )
+
+    def test_with_block__within_thread(self):
+        # a task whose sub-tasks are cancelled once it has the result it needs
+        threadpool = QtCore.QThreadPool()
+        subtasks   = []
+
+        def search( signalmgr=None ):
+            with TaskGroup():
+                subtasks.append( ThreadedTask( loop_until_abort ).start( threadpool=threadpool ) )
+                return 'found'
+
+        future = ThreadedTask( search ).start( threadpool=threadpool )
+        self.assertEqual( future.result( timeout=5 ), 'found' )
+        process_events_until( lambda: subtasks[0].done() )
+        self.assertTrue( subtasks[0].cancelled() )
+
+    def test_owner_destroyed(self):
+        threadpool = QtCore.QThreadPool()
+        owner      = QtCore.QObject()
+        group      = TaskGroup( owner=owner )
+        received   = []
+        release    = threading.Event()
+
+        def emit_after_release( signalmgr=None ):
+            release.wait( 5 )
+            signalmgr.add_item.emit( 1 )
+
+        task = ThreadedTask( emit_after_release, {'add_item':int} )
+        task.signal('add_item').connect( received.append )
+        future = group.start( task, threadpool=threadpool )
+
+        QtCompat.delete( owner )
+
+        # still running, but detached
+        release.set()
+        threadpool.waitForDone()
+        process_events_until( future.done )
+        qapplication.processEvents()
+        self.assertEqual( received, [] )
+
+    def test_solotask(self):
+        threadpool = QtCore.QThreadPool()
+        group      = TaskGroup()
+        solotask   = group.add( SoloThreadedTask( loop_until_abort ) )
+        solotask.start( threadpool=threadpool )
+        self.assertEqual( group.tasks(), [solotask] )
+
+        self.assertTrue( group.cancel( wait=2 ) )
+        self.assertFalse( solotask.is_active() )
+
+    def test_parallel_map(self):
+        group = TaskGroup()
+        pmap  = group.add( ParallelMap( lambda i: time.sleep(0.01), range(1000), chunksize=10, threadpool=QtCore.QThreadPool() ) )
+        pmap.start()
+
+        group.cancel( wait=2 )
+        process_events_until( pmap.future().done )
+        self.assertFalse( pmap.future()._succeeded() )
+
+    def test_add__invalid(self):
+        self.assertRaises( TypeError, TaskGroup().add, object() )
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,20 +1,56 @@
 
 #builtin
 from   functools import partial
+import threading
 import time
+import warnings
 #external
 import unittest
 from   Qt                      import QtCore, QtWidgets
 import six
 #internal
-from   qconcurrency.testutils  import mock
+from   qconcurrency.testutils  import mock, process_events_until
 from   qconcurrency.threading_ import *
+from   qconcurrency.exceptions_ import UserCancelledOperation, TimedOut
 from   qconcurrency            import QApplication
 
 qapplication = QApplication()
 
 
 
+class Test_SignalManagerFactory( unittest.TestCase ):
+    def test_signals_created(self):
+        signalmgr = SignalManagerFactory({ 'a':None, 'b':str, 'c':(int,str) })
+        self.assertEqual( set(signalmgr.signals().keys()), set(['a','b','c']) )
+
+    def test_class_reused(self):
+        class_a = SignalManagerClassFactory({ 'test':str, 'returned':None })
+        class_b = SignalManagerClassFactory({ 'returned':None, 'test':(str,) })
+        self.assertIs( class_a, class_b )
+
+    def test_class_differs_by_datatype(self):
+        class_a = SignalManagerClassFactory({ 'test':str })
+        class_b = SignalManagerClassFactory({ 'test':int })
+        self.assertIsNot( class_a, class_b )
+
+    def test_instances_independent(self):
+        signalmgr_a = SignalManagerFactory({ 'test':None })
+        signalmgr_b = SignalManagerFactory({ 'test':None })
+        signalmgr_a._request_abort()
+
+        self.assertRaises( UserCancelledOperation, signalmgr_a.handle_if_abort )
+        signalmgr_b.handle_if_abort()
+
+    def test_cache_evicts_oldest(self):
+        with mock.patch( 'qconcurrency.threading_._signalmanager_classes_maxsize', 2 ):
+            class_a = SignalManagerClassFactory({ 'evict_a':None })
+            SignalManagerClassFactory({ 'evict_b':None })
+            SignalManagerClassFactory({ 'evict_c':None })
+
+            self.assertIsNot( SignalManagerClassFactory({ 'evict_a':None }), class_a )
+
+
+
 class Test_ThreadedTask( unittest.TestCase ):
     def test_running_in_thread(self):
 
@@ -204,6 +240,394 @@ class Test_ThreadedTask( unittest.TestCase ):
         self.assertEqual( queue.get(),   True )
 
 
+    def test_withdraw__queued(self):
+        threadpool = QtCore.QThreadPool()
+        threadpool.setMaxThreadCount(1)
+        release    = threading.Event()
+        ran        = mock.Mock()
+
+        blocker = ThreadedTask( callback=lambda signalmgr: release.wait(5) )
+        task    = ThreadedTask( callback=lambda signalmgr: ran() )
+        blocker.start( threadpool=threadpool )
+        task.start( threadpool=threadpool )
+
+        self.assertTrue( task.withdraw() )
+        release.set()
+        threadpool.waitForDone()
+        ran.assert_not_called()
+
+    def test_withdraw__started(self):
+        threadpool = QtCore.QThreadPool()
+        task       = ThreadedTask( callback=lambda signalmgr: None )
+        task.start( threadpool=threadpool )
+        threadpool.waitForDone()
+
+        self.assertTrue(  task._started )
+        self.assertFalse( task.withdraw() )
+
+    def test_batch__per_item(self):
+        threadpool  = QtCore.QThreadPool()
+        recv_signal = mock.Mock()
+        recv_batch  = mock.Mock()
+
+        def mycallback( signalmgr ):
+            add_item = signalmgr.batch( 'add_item', size=4 )
+            for i in range(10):
+                add_item.emit( i, str(i) )
+
+        task = ThreadedTask(
+            callback = mycallback,
+            signals  = {'add_item':(int,str)},
+        )
+        task.signal('add_item').connect( recv_signal )
+        task.signalmgr()._batch_.connect( recv_batch )
+        task.start( threadpool=threadpool )
+
+        threadpool.waitForDone()
+        QtCore.QCoreApplication.instance().processEvents()
+
+        # 10 items, in batches of 4 (last batch flushed on return)
+        self.assertEqual( recv_batch.call_count, 3 )
+        self.assertEqual(
+            recv_signal.call_args_list,
+            [ mock.call( i, str(i) ) for i in range(10) ],
+        )
+
+    def test_batch__per_batch(self):
+        threadpool  = QtCore.QThreadPool()
+        recv_signal = mock.Mock()
+        recv_batch  = mock.Mock()
+
+        def mycallback( signalmgr ):
+            with signalmgr.batch( 'add_item', size=100 ) as add_item:
+                for i in range(5):
+                    add_item.emit( i )
+
+        task = ThreadedTask(
+            callback = mycallback,
+            signals  = {'add_item':int},
+        )
+        task.signal('add_item').connect( recv_signal )
+        task.connect_batch( 'add_item', recv_batch )
+        task.start( threadpool=threadpool )
+
+        threadpool.waitForDone()
+        QtCore.QCoreApplication.instance().processEvents()
+
+        recv_batch.assert_called_once_with( [ (i,) for i in range(5) ] )
+        recv_signal.assert_not_called()
+
+    def test_batch__flushed_before_exception(self):
+        threadpool = QtCore.QThreadPool()
+        received   = []
+
+        def mycallback( signalmgr ):
+            signalmgr.batch( 'add_item' ).emit( 1 )
+            raise UserCancelledOperation()
+
+        task = ThreadedTask(
+            callback = mycallback,
+            signals  = {'add_item':int},
+        )
+        task.signal('add_item').connect( lambda i: received.append( i ) )
+        task.signal('exception').connect( lambda: received.append( 'exception' ) )
+        task.start( threadpool=threadpool )
+
+        threadpool.waitForDone()
+        QtCore.QCoreApplication.instance().processEvents()
+
+        self.assertEqual( received, [1, 'exception'] )
+
+    def test_batch__interval_flush(self):
+        # the worker is blocked after emitting, the batch is flushed once it's interval expires
+        threadpool = QtCore.QThreadPool()
+        release    = threading.Event()
+        received   = []
+
+        def mycallback( signalmgr ):
+            signalmgr.batch( 'add_item', size=100, interval=20 ).emit( 1 )
+            release.wait( 5 )
+
+        task = ThreadedTask(
+            callback = mycallback,
+            signals  = {'add_item':int},
+        )
+        task.signal('add_item').connect( lambda i: received.append( i ) )
+        start = time.time()
+        task.start( threadpool=threadpool )
+
+        process_events_until( lambda: received, timeout=2 )
+        self.assertEqual( received, [1] )
+        self.assertLess( time.time() - start, 1 )
+        release.set()
+        threadpool.waitForDone()
+
+    def test_batch__unknown_signal(self):
+        signalmgr = SignalManagerFactory({'add_item':int})
+        self.assertRaises( RuntimeError, signalmgr.batch, 'missing' )
+
+    def test_stream__values(self):
+        threadpool = QtCore.QThreadPool()
+        received   = []
+
+        def mycallback( signalmgr ):
+            for i in range(10):
+                yield i
+
+        task = ThreadedTask( callback=mycallback )
+        task.connect_stream( lambda values: received.append( values ), size=4 )
+        task.signal('returned').connect( lambda: received.append( 'returned' ) )
+        task.start( threadpool=threadpool )
+
+        process_events_until( lambda: 'returned' in received )
+        self.assertEqual( received, [ [0,1,2,3], [4,5,6,7], [8,9], 'returned' ] )
+
+    def test_stream__slow_producer(self):
+        # a partial batch is delivered while the generator is blocked
+        threadpool = QtCore.QThreadPool()
+        release    = threading.Event()
+        received   = []
+
+        def mycallback( signalmgr ):
+            yield 1
+            release.wait( 5 )
+            yield 2
+
+        task = ThreadedTask( callback=mycallback )
+        task.connect_stream( received.extend, size=100, interval=20 )
+        start = time.time()
+        task.start( threadpool=threadpool )
+
+        process_events_until( lambda: received, timeout=2 )
+        self.assertEqual( received, [1] )
+        self.assertLess( time.time() - start, 1 )
+
+        release.set()
+        process_events_until( lambda: len(received) == 2 )
+        self.assertEqual( received, [1, 2] )
+
+    def test_stream__yielded_signal(self):
+        threadpool = QtCore.QThreadPool()
+        received   = []
+
+        def mycallback( signalmgr ):
+            yield 'a'
+            yield 'b'
+
+        task = ThreadedTask( callback=mycallback )
+        task.signal('yielded').connect( lambda value: received.append( value ) )
+        task.start( threadpool=threadpool )
+
+        process_events_until( lambda: len(received) == 2 )
+        self.assertEqual( received, ['a','b'] )
+
+    def test_stream__backpressure(self):
+        threadpool = QtCore.QThreadPool()
+        produced   = []
+        received   = []
+
+        def mycallback( signalmgr ):
+            for i in range(100):
+                produced.append( i )
+                yield i
+
+        task = ThreadedTask( callback=mycallback )
+        task.connect_stream( received.extend, size=1, max_pending=2 )
+        task.start( threadpool=threadpool )
+
+        # UI is not processing events, generator is paused
+        self.assertFalse( threadpool.waitForDone( 300 ) )
+        self.assertLessEqual( len(produced), 4 )
+
+        process_events_until( lambda: len(received) == 100 )
+        self.assertEqual( received, list(range(100)) )
+        threadpool.waitForDone()
+
+    def test_stream__abort_while_paused(self):
+        threadpool = QtCore.QThreadPool()
+        closed     = []
+
+        def mycallback( signalmgr ):
+            try:
+                while True:
+                    yield 1
+            finally:
+                closed.append( True )
+
+        task = ThreadedTask( callback=mycallback )
+        task.connect_stream( mock.Mock(), size=1, max_pending=1 )
+        task.start( threadpool=threadpool )
+        self.assertFalse( threadpool.waitForDone( 100 ) )
+
+        task.request_abort()
+        self.assertTrue( threadpool.waitForDone( 2000 ) )
+        self.assertEqual( closed, [True] )
+
+    def test_start__expiryTimeout_not_priority(self):
+        threadpool = mock.Mock( spec=QtCore.QThreadPool )
+        del threadpool.tryTake
+        task       = ThreadedTask( callback=lambda signalmgr: None )
+        task.start( expiryTimeout=2000, threadpool=threadpool )
+
+        threadpool.setExpiryTimeout.assert_called_once_with( 2000 )
+        threadpool.start.assert_called_once_with( task, TaskPriority.NORMAL )
+
+    def test_start__priority_order(self):
+        threadpool = QtCore.QThreadPool()
+        threadpool.setMaxThreadCount(1)
+        release    = threading.Event()
+        ran        = []
+
+        ThreadedTask( callback=lambda signalmgr: release.wait(5) ).start( threadpool=threadpool )
+        for name in ('background_a', 'background_b'):
+            ThreadedTask( lambda name, signalmgr: ran.append(name), None, name ).start( threadpool=threadpool, priority=TaskPriority.BACKGROUND )
+        ThreadedTask( lambda signalmgr: ran.append('interactive') ).start( threadpool=threadpool, priority=TaskPriority.INTERACTIVE )
+
+        release.set()
+        threadpool.waitForDone()
+        self.assertEqual( ran, ['interactive', 'background_a', 'background_b'] )
+
+    def test_start__priority_aging(self):
+        threadpool = QtCore.QThreadPool()
+        threadpool.setMaxThreadCount(1)
+        release    = threading.Event()
+        ran        = []
+
+        with mock.patch.object( TaskPriority, 'aging_interval', 10 ):
+            ThreadedTask( callback=lambda signalmgr: release.wait(5) ).start( threadpool=threadpool )
+            background = ThreadedTask( lambda signalmgr: ran.append('background') )
+            background.start( threadpool=threadpool, priority=TaskPriority.BACKGROUND )
+
+            # raised to NORMAL by waiting 5x aging_intervals
+            start = time.time()
+            while background._priority < TaskPriority.NORMAL  and  time.time() - start < 5:
+                QtCore.QCoreApplication.instance().processEvents()
+                time.sleep(0.005)
+
+            ThreadedTask( lambda signalmgr: ran.append('normal') ).start( threadpool=threadpool )
+            release.set()
+            threadpool.waitForDone()
+
+        self.assertEqual( ran, ['background', 'normal'] )
+
+    def test_detach(self):
+        returned = mock.Mock()
+        task     = ThreadedTask( lambda signalmgr: 1, {'progress':int} )
+        task.signal('returned').connect( returned )
+
+        with warnings.catch_warnings( record=True ) as caught:
+            warnings.simplefilter( 'always' )
+            task.detach()
+
+        self.assertEqual( [ w for w in caught if issubclass( w.category, RuntimeWarning ) ], [] )
+        self.assertFalse( task._signalmgr._is_connected('returned') )
+        task.signal('returned').emit()
+        self.assertFalse( returned.called )
+
+
+class Test_SignalChannel( unittest.TestCase ):
+    def _start(self, callback, received ):
+        threadpool = QtCore.QThreadPool()
+        task = ThreadedTask(
+            callback = callback,
+            signals  = {'add_item':int},
+        )
+        task.signal('add_item').connect( received.append )
+        task.signal('returned').connect( lambda: received.append( 'returned' ) )
+        task.signal('exception').connect( lambda: received.append( 'exception' ) )
+        task.start( threadpool=threadpool )
+        return (task, threadpool)
+
+    def test_block(self):
+        produced = []
+        received = []
+
+        def mycallback( signalmgr ):
+            add_item = signalmgr.channel( 'add_item', capacity=3 )
+            for i in range(50):
+                add_item.emit( i )
+                produced.append( i )
+
+        (task, threadpool) = self._start( mycallback, received )
+
+        # UI is not processing events, producer is blocked
+        self.assertFalse( threadpool.waitForDone( 200 ) )
+        self.assertEqual( len(produced), 3 )
+
+        process_events_until( lambda: 'returned' in received )
+        self.assertEqual( received, list(range(50)) + ['returned'] )
+
+    def test_drop_oldest(self):
+        received = []
+        channels = []
+
+        def mycallback( signalmgr ):
+            add_item = signalmgr.channel( 'add_item', capacity=3, policy=ChannelPolicy.DROP_OLDEST )
+            channels.append( add_item )
+            for i in range(10):
+                add_item.emit( i )
+
+        (task, threadpool) = self._start( mycallback, received )
+        self.assertTrue( threadpool.waitForDone( 2000 ) )
+
+        process_events_until( lambda: 'returned' in received )
+        self.assertEqual( received, [7, 8, 9, 'returned'] )
+        self.assertEqual( channels[0].dropped, 7 )
+
+    def test_coalesce(self):
+        received = []
+
+        def mycallback( signalmgr ):
+            add_item = signalmgr.channel( 'add_item', capacity=1, policy=ChannelPolicy.COALESCE )
+            for i in range(10):
+                add_item.emit( i )
+
+        (task, threadpool) = self._start( mycallback, received )
+        self.assertTrue( threadpool.waitForDone( 2000 ) )
+
+        process_events_until( lambda: 'returned' in received )
+        self.assertEqual( received, [9, 'returned'] )
+
+    def test_coalesce__key(self):
+        received = []
+
+        def mycallback( signalmgr ):
+            add_item = signalmgr.channel( 'add_item', capacity=2, policy=ChannelPolicy.COALESCE, key=lambda i: i % 2 )
+            for i in range(10):
+                add_item.emit( i )
+
+        (task, threadpool) = self._start( mycallback, received )
+        self.assertTrue( threadpool.waitForDone( 2000 ) )
+
+        process_events_until( lambda: 'returned' in received )
+        self.assertEqual( received, [8, 9, 'returned'] )
+
+    def test_abort_while_blocked(self):
+        received = []
+
+        def mycallback( signalmgr ):
+            add_item = signalmgr.channel( 'add_item', capacity=1 )
+            while True:
+                add_item.emit( 1 )
+
+        (task, threadpool) = self._start( mycallback, received )
+        self.assertFalse( threadpool.waitForDone( 100 ) )
+
+        started = time.time()
+        task.request_abort()
+        self.assertTrue( threadpool.waitForDone( 2000 ) )
+        self.assertLess( time.time() - started, 0.2 )
+
+        # undelivered items are discarded
+        process_events_until( lambda: 'exception' in received )
+        self.assertEqual( received, ['exception'] )
+
+    def test_invalid_policy(self):
+        signalmgr = SignalManagerFactory({'add_item':int})
+        self.assertRaises( RuntimeError, signalmgr.channel, 'add_item', policy='latest' )
+        self.assertRaises( RuntimeError, signalmgr.channel, 'missing' )
+
+
 
 class Test_SoloThreadedTask( unittest.TestCase ):
     def test_stop_method(self):
@@ -338,6 +762,201 @@ class Test_SoloThreadedTask( unittest.TestCase ):
         self.assertEqual( queue_finished.qsize(), 1 )
         threadpool.waitForDone()
 
+    def test_batch_connections(self):
+        threadpool = QtCore.QThreadPool()
+        recv_batch = mock.Mock()
+
+        def _callback( signalmgr=None ):
+            add_item = signalmgr.batch( 'add_item' )
+            for i in range(3):
+                add_item.emit( i )
+
+        task = SoloThreadedTask(
+            callback          = _callback,
+            signals           = {'add_item':int},
+            batch_connections = {'add_item':[recv_batch]},
+        )
+        task.start( threadpool=threadpool, wait=True )
+        threadpool.waitForDone()
+        QtCore.QCoreApplication.instance().processEvents()
+
+        recv_batch.assert_called_once_with( [(0,),(1,),(2,)] )
+
+    def test_stream_connections(self):
+        threadpool = QtCore.QThreadPool()
+        received   = []
+
+        def _callback( signalmgr=None ):
+            for i in range(3):
+                yield i
+
+        task = SoloThreadedTask(
+            callback           = _callback,
+            stream_connections = received.extend,
+        )
+        task.start( threadpool=threadpool, wait=True )
+        threadpool.waitForDone()
+        process_events_until( lambda: len(received) == 3 )
+
+        self.assertEqual( received, [0,1,2] )
+
+    def test_priority(self):
+        threadpool = QtCore.QThreadPool()
+        task       = SoloThreadedTask( callback=lambda signalmgr=None: None, priority=TaskPriority.INTERACTIVE )
+
+        with mock.patch.object( ThreadedTask, 'start', autospec=True ) as start:
+            task.start( threadpool=threadpool )
+
+        self.assertEqual( start.call_args[1]['priority'], TaskPriority.INTERACTIVE )
+
+    def test_restart_withdraws_queued(self):
+        """
+        superseded tasks that have not started never run.
+        """
+        threadpool = QtCore.QThreadPool()
+        threadpool.setMaxThreadCount(1)
+        release    = threading.Event()
+        ran        = six.moves.queue.Queue()
+
+        blocker = ThreadedTask( callback=lambda signalmgr: release.wait(5) )
+        blocker.start( threadpool=threadpool )
+
+        def _callback( i, signalmgr=None ):
+            ran.put( i )
+
+        task = SoloThreadedTask( callback=_callback )
+        for i in range(10):
+            task.start( threadpool=threadpool, i=i )
+
+        self.assertEqual( len(task._active_threads), 1 )
+
+        release.set()
+        threadpool.waitForDone()
+        self.assertEqual( ran.qsize(), 1 )
+        self.assertEqual( ran.get(), 9 )
+
+    def test_start_wait__returns_promptly(self):
+        threadpool = QtCore.QThreadPool()
+        task       = SoloThreadedTask( callback=lambda signalmgr=None: None )
+
+        start = time.time()
+        task.start( threadpool=threadpool, wait=True )
+
+        # previously polled every 50ms
+        self.assertLess( time.time() - start, 0.04 )
+        self.assertFalse( task.is_active() )
+        threadpool.waitForDone()
+
+    def test_start_wait__timeout(self):
+        threadpool = QtCore.QThreadPool()
+        release    = threading.Event()
+        task       = SoloThreadedTask( callback=lambda signalmgr=None: release.wait(5) )
+
+        self.assertRaises( TimedOut, task.start, threadpool=threadpool, wait=0.05 )
+        release.set()
+        threadpool.waitForDone()
+
+    def test_stop_wait(self):
+        threadpool = QtCore.QThreadPool()
+        started    = threading.Event()
+
+        def _callback( signalmgr=None ):
+            started.set()
+            while True:
+                signalmgr.handle_if_abort()
+                time.sleep(0.001)
+
+        task = SoloThreadedTask( callback=_callback )
+        task.start( threadpool=threadpool )
+        started.wait(5)
+
+        task.stop( wait=5 )
+        self.assertFalse( task.is_active() )
+        threadpool.waitForDone()
+
+    def test_debounce(self):
+        threadpool = QtCore.QThreadPool()
+        ran        = []
+
+        task = SoloThreadedTask(
+            callback = lambda i, signalmgr=None: ran.append( i ),
+            debounce = 50,
+        )
+        for i in range(10):
+            task.start( threadpool=threadpool, i=i )
+
+        self.assertTrue( task.is_active() )
+        self.assertEqual( ran, [] )
+
+        start = time.time()
+        while task.is_active()  and  time.time() - start < 5:
+            qapplication.processEvents()
+            time.sleep(0.005)
+        threadpool.waitForDone()
+
+        self.assertEqual( ran, [9] )
+
+    def test_debounce__coalesce(self):
+        threadpool = QtCore.QThreadPool()
+        ran        = []
+
+        task = SoloThreadedTask(
+            callback = lambda i, signalmgr=None: ran.append( i ),
+            debounce = 30,
+            coalesce = True,
+        )
+
+        # continuous starts, for longer than the debounce window
+        start = time.time()
+        i     = 0
+        while time.time() - start < 0.2:
+            task.start( threadpool=threadpool, i=i )
+            qapplication.processEvents()
+            time.sleep(0.005)
+            i += 1
+
+        while task.is_active()  and  time.time() - start < 5:
+            qapplication.processEvents()
+            time.sleep(0.005)
+        threadpool.waitForDone()
+
+        self.assertGreater( len(ran), 1 )
+        self.assertLess( len(ran), i )
+        self.assertEqual( ran[-1], i-1 )
+
+    def test_debounce__wait(self):
+        threadpool = QtCore.QThreadPool()
+        ran        = []
+
+        task = SoloThreadedTask(
+            callback = lambda i, signalmgr=None: ran.append( i ),
+            debounce = 5000,
+        )
+        task.start( threadpool=threadpool, i=1 )
+        task.start( threadpool=threadpool, wait=True, i=2 )
+
+        self.assertEqual( ran, [2] )
+        self.assertFalse( task.is_active() )
+        threadpool.waitForDone()
+
+    def test_debounce__stop(self):
+        threadpool = QtCore.QThreadPool()
+        ran        = []
+
+        task = SoloThreadedTask(
+            callback = lambda i, signalmgr=None: ran.append( i ),
+            debounce = 10,
+        )
+        task.start( threadpool=threadpool, i=1 )
+        task.stop()
+
+        time.sleep(0.05)
+        qapplication.processEvents()
+        threadpool.waitForDone()
+
+        self.assertEqual( ran, [] )
+        self.assertFalse( task.is_active() )
+
     def test_isactive(self):
         queue_finished = six.moves.queue.Queue()
         threadpool     = QtCore.QThreadPool()
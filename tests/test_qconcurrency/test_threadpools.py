@@ -0,0 +1,249 @@
+#builtin
+import threading
+import time
+#external
+import unittest
+from   Qt                      import QtCore, QtWidgets
+import six
+#internal
+from   qconcurrency.testutils   import mock, process_events_until
+from   qconcurrency.threadpools import *
+from   qconcurrency.threadpools import _threadpools, _threadpool_stats, _thread_time
+from   qconcurrency.threading_  import ThreadedTask, SoloThreadedTask
+from   qconcurrency.widgets     import ProgressBar
+from   qconcurrency             import QApplication
+
+qapplication = QApplication()
+
+
+
+class Test_ThreadPoolRegistry( unittest.TestCase ):
+    def tearDown(self):
+        for name in ('test-a', 'test-b'):
+            threadpool = _threadpools.pop( name, None )
+            if threadpool is not None:
+                _threadpool_stats.pop( id(threadpool), None )
+
+    def test_register(self):
+        threadpool = register_threadpool( 'test-a', max_threads=3, expiry_timeout=1234 )
+        self.assertIs( get_threadpool('test-a'), threadpool )
+        self.assertEqual( get_threadpool('test-a').maxThreadCount(), 3 )
+        self.assertEqual( threadpool.expiryTimeout(), 1234 )
+        self.assertIn( 'test-a', threadpool_names() )
+
+    def test_reconfigure(self):
+        threadpool = register_threadpool( 'test-a', max_threads=3 )
+        self.assertIs( register_threadpool( 'test-a', max_threads=5 ), threadpool )
+        self.assertEqual( threadpool.maxThreadCount(), 5 )
+
+    def test_defaults(self):
+        self.assertIs( get_threadpool('global'), QtCore.QThreadPool.globalInstance() )
+        self.assertEqual( get_threadpool('ui-prefetch').maxThreadCount(), 2 )
+        self.assertIsNot( get_threadpool('io'), get_threadpool('cpu') )
+
+    def test_unknown_name(self):
+        with self.assertRaises( RuntimeError ):
+            get_threadpool('test-missing')
+
+    def test_resolve(self):
+        threadpool = QtCore.QThreadPool()
+        self.assertIs( resolve_threadpool( None ), QtCore.QThreadPool.globalInstance() )
+        self.assertIs( resolve_threadpool( threadpool ), threadpool )
+        self.assertIs( resolve_threadpool( 'io' ), get_threadpool('io') )
+
+
+
+class Test_ThreadPoolSelection( unittest.TestCase ):
+    def tearDown(self):
+        threadpool = _threadpools.pop( 'test-a', None )
+        if threadpool is not None:
+            _threadpool_stats.pop( id(threadpool), None )
+
+    def test_threadedtask_by_name(self):
+        register_threadpool( 'test-a', max_threads=1 )
+        task   = ThreadedTask( lambda signalmgr=None: True )
+        future = task.start( threadpool='test-a' )
+
+        self.assertEqual( future.result( timeout=5 ), True )
+        self.assertIs( task._threadpool, get_threadpool('test-a') )
+
+    def test_solotask_by_name(self):
+        register_threadpool( 'test-a', max_threads=1 )
+        solotask = SoloThreadedTask( lambda signalmgr=None: 1, threadpool='test-a' )
+
+        with mock.patch.object( ThreadedTask, 'start', autospec=True, side_effect=ThreadedTask.start ) as start:
+            solotask.start().result( timeout=5 )
+        self.assertEqual( start.call_args[1]['threadpool'], 'test-a' )
+
+    def test_progressbar_solotask_by_name(self):
+        register_threadpool( 'test-a', max_threads=1 )
+        progressbar = ProgressBar()
+        solotask    = progressbar.new_solotask( lambda signalmgr=None: 1, threadpool='test-a' )
+        self.assertEqual( solotask._threadpool, 'test-a' )
+
+    def test_isolation(self):
+        # a busy threadpool does not delay tasks in another
+        register_threadpool( 'test-a', max_threads=1 )
+        release = threading.Event()
+
+        blocked = ThreadedTask( lambda signalmgr=None: release.wait(5) ).start( threadpool='test-a' )
+        quick   = ThreadedTask( lambda signalmgr=None: True ).start( threadpool=QtCore.QThreadPool() )
+        try:
+            self.assertTrue( quick.result( timeout=5 ) )
+            self.assertFalse( blocked.done() )
+        finally:
+            release.set()
+        blocked.result( timeout=5 )
+
+
+
+class Test_ThreadPoolStats( unittest.TestCase ):
+    def tearDown(self):
+        threadpool = _threadpools.pop( 'test-a', None )
+        if threadpool is not None:
+            _threadpool_stats.pop( id(threadpool), None )
+
+    def test_occupancy(self):
+        threadpool = register_threadpool( 'test-a', max_threads=2 )
+        release    = threading.Event()
+        running    = []
+
+        def wait( signalmgr=None ):
+            running.append(True)
+            release.wait(5)
+
+        futures = [ ThreadedTask( wait ).start( threadpool='test-a' ) for i in range(5) ]
+        process_events_until( lambda: len(running) == 2 )
+
+        stats = threadpool_stats('test-a')
+        self.assertEqual( stats['max_threads'], 2 )
+        self.assertEqual( stats['active'], 2 )
+        self.assertEqual( stats['queued'], 3 )
+        self.assertEqual( stats['occupancy'], 1.0 )
+
+        release.set()
+        threadpool.waitForDone()
+        stats = threadpool_stats('test-a')
+        self.assertEqual( (stats['submitted'], stats['completed'], stats['active'], stats['queued']), (5, 5, 0, 0) )
+        self.assertEqual( stats['peak_active'], 2 )
+        self.assertGreater( stats['avg_wait'], 0 )
+
+    def test_withdrawn(self):
+        threadpool = register_threadpool( 'test-a', max_threads=1 )
+        release    = threading.Event()
+
+        ThreadedTask( lambda signalmgr=None: release.wait(5) ).start( threadpool='test-a' )
+        task = ThreadedTask( lambda signalmgr=None: None )
+        task.start( threadpool='test-a' )
+
+        if not hasattr( threadpool, 'tryTake' ):
+            release.set()
+            self.skipTest('QThreadPool.tryTake requires Qt-5.9+')
+
+        self.assertTrue( task.withdraw() )
+        release.set()
+        threadpool.waitForDone()
+
+        stats = threadpool_stats('test-a')
+        self.assertEqual( (stats['submitted'], stats['withdrawn'], stats['completed'], stats['queued']), (2, 1, 1, 0) )
+
+    def test_all_stats(self):
+        register_threadpool( 'test-a' )
+        self.assertIn( 'test-a', threadpool_stats() )
+
+    def test_unregistered_threadpool_not_tracked(self):
+        task = ThreadedTask( lambda signalmgr=None: None )
+        task.start( threadpool=QtCore.QThreadPool() ).result( timeout=5 )
+        self.assertIsNone( task._pool_stats )
+
+
+class Test_ThreadPoolTuner( unittest.TestCase ):
+    def tearDown(self):
+        threadpool = _threadpools.pop( 'test-a', None )
+        if threadpool is not None:
+            _threadpool_stats.pop( id(threadpool), None )
+
+    def setUp(self):
+        if _thread_time is None:
+            self.skipTest('time.thread_time requires python-3.7+')
+
+    def _run_tasks(self, callback, ntasks ):
+        threadpool = get_threadpool('test-a')
+        for i in range(ntasks):
+            ThreadedTask( callback ).start( threadpool=threadpool )
+        threadpool.waitForDone()
+
+    def test_grows_for_blocking_tasks(self):
+        register_threadpool( 'test-a', max_threads=2 )
+        tuner = ThreadPoolTuner( 'test-a', max_threads=16 )
+        tuner.start()
+        tuner.stop()
+
+        self._run_tasks( lambda signalmgr=None: time.sleep(0.02), 4 )
+
+        # tasks still queued at the time of the sample
+        (completed, queued, active, wall, cpu) = tuner._stats.snapshot()
+        with mock.patch.object( tuner._stats, 'snapshot', return_value=(completed, 10, active, wall, cpu) ):
+            decision = tuner.sample()
+
+        self.assertEqual( (decision['previous_threads'], decision['threads']), (2, 3) )
+        self.assertGreater( decision['blocking'], 0.5 )
+        self.assertEqual( get_threadpool('test-a').maxThreadCount(), 3 )
+        self.assertEqual( tuner.decisions(), [ decision ] )
+        self.assertEqual( tuner.metrics()['adjustments'], 1 )
+
+    def test_no_growth_without_queue(self):
+        register_threadpool( 'test-a', max_threads=2 )
+        tuner = ThreadPoolTuner( 'test-a', max_threads=16 )
+        tuner.start()
+        tuner.stop()
+
+        self._run_tasks( lambda signalmgr=None: time.sleep(0.01), 4 )
+        self.assertIsNone( tuner.sample() )
+        self.assertEqual( get_threadpool('test-a').maxThreadCount(), 2 )
+
+    def test_shrinks_for_cpu_bound_tasks(self):
+        def spin( signalmgr=None ):
+            start = time.time()
+            while time.time() - start < 0.02:
+                pass
+
+        register_threadpool( 'test-a', max_threads=1 )
+        tuner = ThreadPoolTuner( 'test-a', min_threads=1 )
+        tuner.start()
+        tuner.stop()
+
+        self._run_tasks( spin, 3 )
+        get_threadpool('test-a').setMaxThreadCount( tuner._cores * 4 )
+
+        decision = tuner.sample()
+        self.assertLess( decision['blocking'], 0.5 )
+        self.assertEqual( decision['threads'], tuner._cores * 2 )
+
+    def test_unmeasurable_blocking(self):
+        register_threadpool( 'test-a', max_threads=2 )
+        tuner = ThreadPoolTuner( 'test-a', max_threads=16 )
+        tuner.start()
+        tuner.stop()
+
+        # a task completed, but no wall-time was measured
+        (completed, queued, active, wall, cpu) = tuner._stats.snapshot()
+        with mock.patch.object( tuner._stats, 'snapshot', return_value=(completed+1, 10, active, wall, cpu) ):
+            self.assertIsNone( tuner.sample() )
+        self.assertEqual( get_threadpool('test-a').maxThreadCount(), 2 )
+
+    def test_bounds(self):
+        register_threadpool( 'test-a', max_threads=4 )
+        tuner = ThreadPoolTuner( 'test-a', min_threads=3, max_threads=5 )
+
+        self.assertEqual( tuner._target_threads( 4, blocking=0.99, queued=100 ), 5 )
+        self.assertEqual( tuner._target_threads( 4, blocking=0.0,  queued=0 ),   3 )
+
+    def test_unregistered_threadpool(self):
+        with self.assertRaises( RuntimeError ):
+            ThreadPoolTuner( QtCore.QThreadPool() )
+
+
+
+if __name__ == '__main__':
+    unittest.main()
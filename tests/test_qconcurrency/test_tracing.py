@@ -0,0 +1,232 @@
+#builtin
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+#external
+import unittest
+from   Qt                      import QtCore, QtWidgets, QtCompat
+import six
+#internal
+from   qconcurrency.testutils   import mock, process_events_until, loop_until_abort
+from   qconcurrency.tracing     import *
+from   qconcurrency.tracing     import _TracedSignal, _max_positional_args
+from   qconcurrency.metrics     import callback_name
+from   qconcurrency.threading_  import ThreadedTask, SoloThreadedTask
+from   qconcurrency             import QApplication
+
+qapplication = QApplication()
+
+
+def _add( a, b, signalmgr=None ):
+    return a + b
+
+def _emit_batch( signalmgr=None ):
+    with signalmgr.batch('add_item') as batch:
+        for i in range(10):
+            batch.emit( i )
+
+
+
+class Test_Tracer( unittest.TestCase ):
+    def test_ring_buffer(self):
+        tracer = Tracer( capacity=10 )
+        for i in range(25):
+            tracer.instant( 'event%s' % i, 'test' )
+
+        events = tracer.events()
+        self.assertEqual( len(events), 10 )
+        self.assertEqual( events[0]['name'], 'event15' )
+
+    def test_complete_event(self):
+        tracer = Tracer()
+        tracer.complete( 'load', 'task', 10.0, 10.5, {'status':'returned'} )
+
+        event = tracer.events()[0]
+        self.assertEqual( (event['ph'], event['ts'], event['dur']), ('X', 10000000.0, 500000.0) )
+        self.assertEqual( event['args'], {'status':'returned'} )
+        self.assertEqual( event['tid'], threading.current_thread().ident )
+
+    def test_write(self):
+        tracer = Tracer()
+        tracer.instant( 'event', 'test' )
+
+        tempdir = tempfile.mkdtemp()
+        try:
+            filepath = os.path.join( tempdir, 'trace.json' )
+            tracer.write( filepath )
+            with open( filepath ) as fd:
+                data = json.load( fd )
+        finally:
+            shutil.rmtree( tempdir )
+
+        phases = [ event['ph'] for event in data['traceEvents'] ]
+        self.assertEqual( phases, ['M', 'i'] )
+        self.assertEqual( data['traceEvents'][0]['args']['name'], threading.current_thread().name )
+
+    def test_enable_disable(self):
+        tracer = enable_tracing()
+        self.assertIs( get_tracer(), tracer )
+        self.assertIs( disable_tracing(), tracer )
+        self.assertIsNone( get_tracer() )
+
+    def test_max_positional_args(self):
+        class Receiver( object ):
+            def slot(self, a, b=None ):
+                pass
+
+        self.assertEqual( _max_positional_args( lambda: None ), 0 )
+        self.assertEqual( _max_positional_args( Receiver().slot ), 2 )
+        self.assertEqual( _max_positional_args( lambda *args: None ), None )
+        self.assertEqual( _max_positional_args( [].append ), None )
+
+
+
+class Test_TaskTracing( unittest.TestCase ):
+    def setUp(self):
+        self.tracer = enable_tracing()
+        self.addCleanup( disable_tracing )
+
+    def _events(self, name ):
+        return [ event for event in self.tracer.events() if event['name'] == name ]
+
+    def test_task_events(self):
+        returned = []
+        task     = ThreadedTask( _add, {'returned':int}, a=1, b=2 )
+        task.signal('returned').connect( lambda value: returned.append( value ) )
+        task.start( threadpool=QtCore.QThreadPool() )
+        process_events_until( lambda: returned )
+
+        submit = self._events('submit')
+        self.assertEqual( [ event['ph'] for event in submit ], ['i', 's', 'f'] )
+        self.assertEqual( submit[1]['id'], submit[2]['id'] )
+
+        (run,) = self._events( callback_name(_add) )
+        self.assertEqual( run['args'], {'status':'returned'} )
+        self.assertNotEqual( run['tid'], threading.current_thread().ident )
+
+        (slot,) = [ event for event in self.tracer.events() if event['cat'] == 'ui' ]
+        self.assertTrue( slot['name'].startswith('returned: ') )
+        self.assertEqual( slot['tid'], threading.current_thread().ident )
+
+    def test_slot_receives_fewer_args(self):
+        called = []
+        task   = ThreadedTask( _add, {'returned':int}, a=1, b=2 )
+        task.signal('returned').connect( lambda: called.append(True) )
+        task.start( threadpool=QtCore.QThreadPool() )
+
+        process_events_until( lambda: called )
+        self.assertEqual( called, [True] )
+
+    def test_disconnect(self):
+        slot = mock.Mock()
+        task = ThreadedTask( _add, {'returned':int}, a=1, b=2 )
+        task.signal('returned').connect( slot )
+        task.signal('returned').disconnect( slot )
+        task.start( threadpool=QtCore.QThreadPool() ).result( timeout=5 )
+
+        process_events_until( lambda: False, timeout=0.05 )
+        self.assertFalse( slot.called )
+
+    def test_deleted_receiver_disconnected(self):
+        class Receiver( QtCore.QObject ):
+            def handle_returned(self, value):
+                received.append( value )
+
+        received = []
+        release  = threading.Event()
+        receiver = Receiver()
+        task     = ThreadedTask( lambda signalmgr=None: release.wait(5) and 1, {'returned':int} )
+        task.signal('returned').connect( receiver.handle_returned )
+        future   = task.start( threadpool=QtCore.QThreadPool() )
+
+        QtCompat.delete( receiver )
+        release.set()
+        future.result( timeout=5 )
+        process_events_until( lambda: False, timeout=0.05 )
+        self.assertEqual( received, [] )
+
+    def test_receiver_slot_traced(self):
+        class Receiver( QtCore.QObject ):
+            def handle_returned(self, value):
+                received.append( value )
+
+        received = []
+        receiver = Receiver()
+        task     = ThreadedTask( _add, {'returned':int}, a=1, b=2 )
+        task.signal('returned').connect( receiver.handle_returned )
+        task.start( threadpool=QtCore.QThreadPool() )
+        process_events_until( lambda: received )
+
+        self.assertEqual( received, [3] )
+        (slot,) = [ event for event in self.tracer.events() if event['cat'] == 'ui' ]
+        self.assertIn( 'handle_returned', slot['name'] )
+
+    def test_receiver_slots_shared(self):
+        class Receiver( QtCore.QObject ):
+            def handle_returned(self, value):
+                received.append( value )
+
+        received   = []
+        receiver   = Receiver()
+        threadpool = QtCore.QThreadPool()
+        for i in range(20):
+            task = ThreadedTask( _add, {'returned':int}, a=i, b=0 )
+            task.signal('returned').connect( receiver.handle_returned )
+            task.start( threadpool=threadpool )
+
+        process_events_until( lambda: len(received) == 20 )
+        self.assertEqual( sorted(received), list(range(20)) )
+        self.assertEqual( len(receiver.children()), 1 )
+
+    def test_abort_requested(self):
+        started = threading.Event()
+        task    = ThreadedTask( loop_until_abort, started=started )
+        future  = task.start( threadpool=QtCore.QThreadPool() )
+        started.wait(5)
+
+        with mock.patch( 'qconcurrency.threading_.logger' ):
+            task.request_abort()
+            process_events_until( future.done )
+
+        self.assertEqual( len(self._events('abort_requested')), 1 )
+        (run,) = self._events( callback_name(loop_until_abort) )
+        self.assertEqual( run['args'], {'status':'cancelled'} )
+
+    def test_mutex_wait(self):
+        started  = threading.Event()
+        solotask = SoloThreadedTask( loop_until_abort )
+
+        with mock.patch( 'qconcurrency.threading_.logger' ):
+            solotask.start( threadpool=QtCore.QThreadPool(), started=started )
+            started.wait(5)
+            started.clear()
+            future = solotask.start( threadpool=QtCore.QThreadPool(), started=started )
+            started.wait(5)
+            solotask.stop( wait=5 )
+            process_events_until( future.done )
+
+        (wait,) = self._events('mutex_wait')
+        self.assertEqual( wait['args'], {'callback': callback_name(loop_until_abort)} )
+
+    def test_batch_callbacks(self):
+        received = []
+        task     = ThreadedTask( _emit_batch, {'add_item':int} )
+        task.connect_batch( 'add_item', received.extend )
+        task.start( threadpool=QtCore.QThreadPool() )
+        process_events_until( lambda: len(received) == 10 )
+
+        (slot,) = [ event for event in self.tracer.events() if event['cat'] == 'ui' ]
+        self.assertEqual( slot['args'], {'items': 10} )
+
+    def test_disabled_signal_not_wrapped(self):
+        disable_tracing()
+        task = ThreadedTask( _add, a=1, b=2 )
+        self.assertNotIsInstance( task.signal('returned'), _TracedSignal )
+
+
+
+if __name__ == '__main__':
+    unittest.main()
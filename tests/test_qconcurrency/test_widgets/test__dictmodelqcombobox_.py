@@ -0,0 +1,23 @@
+#builtin
+#external
+import unittest
+#internal
+from   qconcurrency.testutils                    import mock
+from   qconcurrency.models                       import DictModel
+from   qconcurrency.widgets                      import DictModelQComboBox
+from   qconcurrency                              import QApplication
+
+qapplication = QApplication()
+
+
+class Test_DictModelQComboBox(unittest.TestCase):
+    def test_add_rows__single_rebuild(self):
+        model = DictModel(['name'])
+        combo = DictModelQComboBox( model )
+        model.add_row( 1, {'name':'one'} )
+
+        with mock.patch.object( combo, '_populate_combo', wraps=combo._populate_combo ) as _populate_combo:
+            model.add_rows([ (i, {'name':str(i)}) for i in range(2,52) ])
+
+        self.assertEqual( _populate_combo.call_count, 1 )
+        self.assertEqual( combo.count(), 51 )
@@ -0,0 +1,22 @@
+#builtin
+#external
+import unittest
+#internal
+from   qconcurrency.testutils                    import mock
+from   qconcurrency.models                       import DictModel
+from   qconcurrency.widgets                      import DictModelQMenu
+from   qconcurrency                              import QApplication
+
+qapplication = QApplication()
+
+
+class Test_DictModelQMenu(unittest.TestCase):
+    def test_add_rows__single_rebuild(self):
+        model = DictModel(['name'])
+        model.add_row( 1, {'name':'one'} )
+        menu  = DictModelQMenu( model, menustyle='indented' )
+
+        with mock.patch.object( menu, '_create_actions', wraps=menu._create_actions ) as _create_actions:
+            model.add_rows([ (i, {'name':str(i)}) for i in range(2,52) ])
+
+        self.assertEqual( _create_actions.call_count, 1 )
@@ -7,13 +7,21 @@ import unittest
 from   Qt                      import QtCore, QtWidgets
 import six
 #internal
-from   qconcurrency.testutils             import mock
+from   qconcurrency.testutils             import mock, process_events_until
 from   qconcurrency.widgets._progressbar_ import *
+from   qconcurrency.multiprocessing_      import ProcessPool
 from   qconcurrency                       import QApplication
 
 qapplication = QApplication()
 
 
+# callbacks run in child-processes must be importable
+
+def _set_progress( signalmgr=None ):
+    signalmgr.add_progress.emit(5)
+    signalmgr.incr_progress.emit(1)
+
+
 class Test_ProgressBar(unittest.TestCase):
     def test_progress_arithmetic(self):
 
@@ -79,6 +87,28 @@ class Test_ProgressBar(unittest.TestCase):
                 self.assertEqual( bar._progressbar.maximum(), 5 )
 
 
+    def test_new_task__processpool(self):
+
+        with mock.patch.object( ProgressBar, 'setHidden' ) as _setHidden:
+            with mock.patch.object( ProgressBar, 'reset' ) as _reset:
+                threadpool = QtCore.QThreadPool()
+
+                bar  = ProgressBar()
+                task = bar.new_task(
+                    callback = _set_progress,
+                )
+                with ProcessPool( processes=1 ) as processpool:
+                    future = task.start( threadpool=threadpool, processpool=processpool )
+                    threadpool.waitForDone()
+
+                process_events_until( future.done, timeout=10 )
+                while qapplication.hasPendingEvents():
+                    qapplication.processEvents()
+
+                self.assertEqual( future.exception(), None )
+                self.assertEqual( bar._progressbar.value(), 1 )
+                self.assertEqual( bar._progressbar.maximum(), 5 )
+
     def test_new_solotask(self):
 
         with mock.patch.object( ProgressBar, 'setHidden' ) as _setHidden:
@@ -107,3 +137,41 @@ class Test_ProgressBar(unittest.TestCase):
 
 
 
+
+    def test_completed_jobs_pruned(self):
+
+        with mock.patch.object( ProgressBar, 'setHidden' ) as _setHidden:
+            bar = ProgressBar()
+            bar.add_progress(  2, jobid='aaa' )
+            bar.add_progress(  5, jobid='bbb' )
+            bar.incr_progress( 2, jobid='aaa' )
+            bar.incr_progress( 1, jobid='bbb' )
+
+            self.assertNotIn( 'aaa', bar._progress )
+            self.assertEqual( bar._progressbar.maximum(), 5 )
+            self.assertEqual( bar._progressbar.value(),   1 )
+
+    def test_max_refresh_rate(self):
+
+        with mock.patch.object( ProgressBar, 'setHidden' ) as _setHidden:
+            bar = ProgressBar( max_refresh_rate=20 )
+            with mock.patch.object( bar, '_update_progressbar', wraps=bar._update_progressbar ) as _update:
+                # (timer is connected to the original method)
+                bar._refresh_timer.timeout.disconnect()
+                bar._refresh_timer.timeout.connect( _update )
+
+                bar.add_progress( 100, jobid='aaa' )
+                for i in range(50):
+                    bar.incr_progress( 1, jobid='aaa' )
+
+                _update.assert_not_called()
+                self.assertEqual( bar._progressbar.value(), -1 )
+
+                start = time.time()
+                while not _update.called and time.time() - start < 2:
+                    qapplication.processEvents()
+                    time.sleep(0.01)
+
+                self.assertEqual( _update.call_count, 1 )
+                self.assertEqual( bar._progressbar.maximum(), 100 )
+                self.assertEqual( bar._progressbar.value(),   50  )